@@ -118,6 +118,8 @@ class PLSQLComplexityCalculator:
             nesting_depth=parser.calculate_nesting_depth(),
             bulk_operations_count=parser.count_bulk_operations(),
             dynamic_sql_count=parser.count_dynamic_sql(),
+            # 모든 감지기 실행 후 기록
+            degraded_detectors=parser.budget.degraded_detectors,
         )
         
         return result
@@ -287,12 +289,13 @@ class PLSQLComplexityCalculator:
             score += 0.5
         
         # 10.2: 복잡한 계산 (간단한 휴리스틱: 산술 연산자 개수)
-        complex_calc_count = parser.upper_code.count('+') + parser.upper_code.count('-') + \
-                            parser.upper_code.count('*') + parser.upper_code.count('/')
+        upper_code = parser.upper_code
+        complex_calc_count = upper_code.count('+') + upper_code.count('-') + \
+                            upper_code.count('*') + upper_code.count('/')
         score += min(1.0, (complex_calc_count // 10) * 0.3)  # 10개당 0.3점
         
         # 10.3: 데이터 검증 (IF 문 개수로 추정)
-        validation_checks = parser.upper_code.count('IF ')
+        validation_checks = upper_code.count('IF ')
         score += min(0.5, validation_checks * 0.2)
         
         # 10.4: 컨텍스트 의존성
@@ -361,25 +364,26 @@ class PLSQLComplexityCalculator:
             float: MySQL 특화 제약 점수
         """
         score = 0.0
+        upper_code = parser.upper_code
         
         # 11.1: 데이터 타입 변환 이슈
-        if 'NUMBER' in parser.upper_code:
+        if 'NUMBER' in upper_code:
             score += 0.5  # NUMBER 정밀도 이슈
-        if 'CLOB' in parser.upper_code or 'BLOB' in parser.upper_code:
+        if 'CLOB' in upper_code or 'BLOB' in upper_code:
             score += 0.3
-        if 'VARCHAR2' in parser.upper_code:
+        if 'VARCHAR2' in upper_code:
             score += 0.3  # 빈 문자열 처리 차이
         
         # 11.2: 트리거 제약
         if object_type == PLSQLObjectType.TRIGGER:
-            if 'INSTEAD OF' in parser.upper_code:
+            if 'INSTEAD OF' in upper_code:
                 score += 0.5
-            if 'COMPOUND' in parser.upper_code:
+            if 'COMPOUND' in upper_code:
                 score += 0.5
         
         # 11.3: 뷰 제약
         if object_type == PLSQLObjectType.VIEW:
-            if 'UPDATE' in parser.upper_code or 'INSERT' in parser.upper_code:
+            if 'UPDATE' in upper_code or 'INSERT' in upper_code:
                 score += 0.3  # 업데이트 가능 뷰
         
         if object_type == PLSQLObjectType.MATERIALIZED_VIEW:
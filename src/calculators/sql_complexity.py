@@ -5,11 +5,15 @@ SQL 쿼리의 복잡도를 계산하는 메서드들을 제공합니다.
 """
 
 import logging
+from typing import Optional
+
 from src.oracle_complexity_analyzer import (
     TargetDatabase,
     SQLAnalysisResult,
+    SQLFeatureVector,
     ORACLE_SPECIFIC_SYNTAX,
     ORACLE_SPECIFIC_FUNCTIONS,
+    DATA_VOLUME_LENGTH_THRESHOLDS,
 )
 from src.parsers.sql_parser import SQLParser
 
@@ -20,37 +24,47 @@ logger = logging.getLogger(__name__)
 class SQLComplexityCalculator:
     """SQL 복잡도 계산 믹스인 클래스"""
     
-    def calculate_sql_complexity(self, parser: SQLParser) -> SQLAnalysisResult:
+    def calculate_sql_complexity(
+        self,
+        parser: SQLParser,
+        features: Optional[SQLFeatureVector] = None,
+    ) -> SQLAnalysisResult:
         """SQL 쿼리 복잡도 계산
         
         Requirements 12.1을 구현합니다.
+        파서에서 SQLFeatureVector를 한 번만 추출하고, 모든 카테고리 점수 계산과
+        결과 객체 생성에 같은 벡터를 사용합니다.
         
         Args:
             parser: SQL 파서 객체
+            features: 미리 추출된 지표 (None이면 parser에서 추출)
             
         Returns:
             SQLAnalysisResult: SQL 분석 결과
         """
         logger.info(f"SQL 복잡도 계산 시작 (타겟: {self.target.value})")
         
+        if features is None:
+            features = parser.extract_features()
+        
         # 각 카테고리별 점수 계산
         logger.info("구조적 복잡성 계산 중")
-        structural = self._calculate_structural_complexity(parser)
+        structural = self._calculate_structural_complexity(features)
         
         logger.info("Oracle 특화 기능 점수 계산 중")
-        oracle_specific = self._calculate_oracle_specific_score(parser)
+        oracle_specific = self._calculate_oracle_specific_score(features)
         
         logger.info("함수/표현식 점수 계산 중")
-        functions = self._calculate_functions_score(parser)
+        functions = self._calculate_functions_score(features)
         
         logger.info("데이터 볼륨 점수 계산 중")
-        data_volume = self._calculate_data_volume_score(len(parser.query))
+        data_volume = self._calculate_data_volume_score(features.query_length)
         
         logger.info("실행 복잡성 점수 계산 중")
-        execution = self._calculate_execution_complexity(parser)
+        execution = self._calculate_execution_complexity(features)
         
         logger.info("변환 난이도 점수 계산 중")
-        conversion = self._calculate_conversion_difficulty(parser)
+        conversion = self._calculate_conversion_difficulty(features)
         
         # 총점 계산
         total_score = (
@@ -83,18 +97,19 @@ class SQLComplexityCalculator:
             data_volume=data_volume,
             execution_complexity=execution,
             conversion_difficulty=conversion,
-            detected_oracle_features=parser.detect_oracle_features(),
-            detected_oracle_functions=parser.detect_oracle_functions(),
-            detected_hints=parser.count_hints(),
-            join_count=parser.count_joins(),
-            subquery_depth=parser.calculate_subquery_depth(),
-            cte_count=parser.count_ctes(),
-            set_operators_count=parser.count_set_operators(),
+            detected_oracle_features=list(features.oracle_features),
+            detected_oracle_functions=list(features.oracle_functions),
+            detected_hints=list(features.hints),
+            join_count=features.join_count,
+            subquery_depth=features.subquery_depth,
+            cte_count=features.cte_count,
+            set_operators_count=features.set_operators_count,
+            degraded_detectors=list(features.degraded_detectors),
         )
         
         return result
     
-    def _calculate_structural_complexity(self, parser: SQLParser) -> float:
+    def _calculate_structural_complexity(self, features: SQLFeatureVector) -> float:
         """구조적 복잡성 점수 계산
         
         Requirements 1.1-1.5를 구현합니다.
@@ -105,7 +120,7 @@ class SQLComplexityCalculator:
         - 1.5: 풀스캔 페널티 (MySQL만)
         
         Args:
-            parser: SQL 파서 객체
+            features: SQL 지표 벡터
             
         Returns:
             float: 구조적 복잡성 점수
@@ -114,7 +129,7 @@ class SQLComplexityCalculator:
         score = 0.0
         
         # 1.1: JOIN 점수 계산
-        join_count = parser.count_joins()
+        join_count = features.join_count
         logger.debug(f"JOIN 개수: {join_count}")
         for threshold, threshold_score in self.weights.join_thresholds:
             if join_count <= threshold:
@@ -123,7 +138,7 @@ class SQLComplexityCalculator:
                 break
         
         # 1.2: 서브쿼리 중첩 깊이 점수 계산
-        subquery_depth = parser.calculate_subquery_depth()
+        subquery_depth = features.subquery_depth
         logger.debug(f"서브쿼리 중첩 깊이: {subquery_depth}")
         if subquery_depth == 0:
             pass  # 0점
@@ -148,13 +163,13 @@ class SQLComplexityCalculator:
                 logger.debug(f"서브쿼리 점수 (MySQL): {subquery_score}")
         
         # 1.3: CTE 점수 계산
-        cte_count = parser.count_ctes()
+        cte_count = features.cte_count
         cte_score = min(self.weights.cte_max, cte_count * self.weights.cte_coefficient)
         logger.debug(f"CTE 개수: {cte_count}, 점수: {cte_score}")
         score += cte_score
         
         # 1.4: 집합 연산자 점수 계산
-        set_operators_count = parser.count_set_operators()
+        set_operators_count = features.set_operators_count
         set_score = min(
             self.weights.set_operator_max,
             set_operators_count * self.weights.set_operator_coefficient
@@ -163,7 +178,7 @@ class SQLComplexityCalculator:
         score += set_score
         
         # 1.5: 풀스캔 페널티 (MySQL만)
-        if self.target == TargetDatabase.MYSQL and parser.has_fullscan_risk():
+        if self.target == TargetDatabase.MYSQL and features.has_fullscan_risk:
             logger.debug(f"풀스캔 위험 감지, 페널티: {self.weights.fullscan_penalty}")
             score += self.weights.fullscan_penalty
         
@@ -171,7 +186,7 @@ class SQLComplexityCalculator:
         logger.debug(f"구조적 복잡성 최종 점수: {final_score}")
         return final_score
     
-    def _calculate_oracle_specific_score(self, parser: SQLParser) -> float:
+    def _calculate_oracle_specific_score(self, features: SQLFeatureVector) -> float:
         """Oracle 특화 기능 점수 계산
         
         Requirements 2.1-2.5를 구현합니다.
@@ -182,20 +197,20 @@ class SQLComplexityCalculator:
         - 2.5: 기타 Oracle 특화 문법
         
         Args:
-            parser: SQL 파서 객체
+            features: SQL 지표 벡터
             
         Returns:
             float: Oracle 특화 기능 점수
         """
         score = 0.0
-        detected_features = parser.detect_oracle_features()
+        detected_features = features.oracle_features
         
         # 2.1: CONNECT BY 계층적 쿼리 (2점)
         if 'CONNECT BY' in detected_features:
             score += 2.0
         
         # 2.2: 분석 함수 (OVER 절) - min(3, count)
-        analytic_count = parser.count_analytic_functions()
+        analytic_count = features.analytic_function_count
         score += min(3.0, analytic_count)
         
         # 2.3: PIVOT/UNPIVOT (2점)
@@ -217,7 +232,7 @@ class SQLComplexityCalculator:
         
         return min(score, 3.0)  # 최대 3.0점
     
-    def _calculate_oracle_function_score(self, parser: SQLParser) -> float:
+    def _calculate_oracle_function_score(self, features: SQLFeatureVector) -> float:
         """Oracle 특화 함수 점수 계산
         
         Requirements 3.1, 3.2를 구현합니다.
@@ -225,13 +240,13 @@ class SQLComplexityCalculator:
         - 3.2: MySQL 타겟에서 특수 집계 함수 추가 페널티
         
         Args:
-            parser: SQL 파서 객체
+            features: SQL 지표 벡터
             
         Returns:
             float: Oracle 특화 함수 점수
         """
         score = 0.0
-        detected_functions = parser.detect_oracle_functions()
+        detected_functions = features.oracle_functions
         
         # 3.1: 각 Oracle 특화 함수당 0.5점
         for func in detected_functions:
@@ -247,12 +262,12 @@ class SQLComplexityCalculator:
             if 'XMLAGG' in detected_functions:
                 score += 0.5
             # KEEP 절 감지 (간단한 문자열 검색)
-            if 'KEEP' in parser.normalized_query:
+            if features.has_keep:
                 score += 0.5
         
         return score
     
-    def _calculate_functions_score(self, parser: SQLParser) -> float:
+    def _calculate_functions_score(self, features: SQLFeatureVector) -> float:
         """함수/표현식 점수 계산
         
         Requirements 4.1-4.5를 구현합니다.
@@ -263,7 +278,7 @@ class SQLComplexityCalculator:
         - 4.5: WHERE 절 없이 COUNT(*) 사용 (MySQL만, 0.5점)
         
         Args:
-            parser: SQL 파서 객체
+            features: SQL 지표 벡터
             
         Returns:
             float: 함수/표현식 점수
@@ -271,7 +286,7 @@ class SQLComplexityCalculator:
         score = 0.0
         
         # 4.1: 집계 함수 점수
-        agg_count = parser.count_aggregate_functions()
+        agg_count = features.aggregate_function_count
         score += min(2.0, agg_count * 0.5)
         
         # 4.2: 사용자 정의 함수 점수
@@ -282,11 +297,11 @@ class SQLComplexityCalculator:
         # score += min(2.0, udf_count * 0.5)
         
         # 4.3: CASE 표현식 점수
-        case_count = parser.count_case_expressions()
+        case_count = features.case_count
         score += min(2.0, case_count * 0.5)
         
         # 4.4: 정규식 함수 점수
-        detected_functions = parser.detect_oracle_functions()
+        detected_functions = features.oracle_functions
         regex_functions = ['REGEXP_LIKE', 'REGEXP_SUBSTR', 'REGEXP_REPLACE', 'REGEXP_INSTR']
         has_regex = any(func in detected_functions for func in regex_functions)
         if has_regex:
@@ -295,7 +310,7 @@ class SQLComplexityCalculator:
         # 4.5: MySQL 타겟에서 WHERE 절 없이 COUNT(*) 사용 (0.5점 페널티)
         if self.target == TargetDatabase.MYSQL:
             # WHERE 절이 없고 COUNT(*)가 있는지 확인
-            if 'COUNT' in parser.normalized_query and 'WHERE' not in parser.normalized_query:
+            if features.has_count and not features.has_where:
                 score += 0.5
         
         # Oracle 특화 함수 점수 추가 (Requirements 3.1, 3.2)
@@ -312,7 +327,7 @@ class SQLComplexityCalculator:
             if 'XMLAGG' in detected_functions:
                 score += 0.5
             # KEEP 절 감지 (간단한 문자열 검색)
-            if 'KEEP' in parser.normalized_query:
+            if features.has_keep:
                 score += 0.5
         
         return min(score, 2.5)  # 최대 2.5점
@@ -331,14 +346,15 @@ class SQLComplexityCalculator:
             float: 데이터 볼륨 점수
         """
         # 기준 변경: 500자 미만 = small, 500-1000자 = medium/large, 1000자 이상 = xlarge
-        if query_length < 500:
+        small_limit, large_limit = DATA_VOLUME_LENGTH_THRESHOLDS
+        if query_length < small_limit:
             return self.weights.data_volume_scores['small']  # 0.3
-        elif query_length < 1000:
+        elif query_length < large_limit:
             return self.weights.data_volume_scores['large']  # PostgreSQL 0.5, MySQL 0.7
         else:
             return self.weights.data_volume_scores['xlarge']  # PostgreSQL 0.8, MySQL 1.0
     
-    def _calculate_execution_complexity(self, parser: SQLParser) -> float:
+    def _calculate_execution_complexity(self, features: SQLFeatureVector) -> float:
         """실행 계획 복잡성 점수 계산
         
         Requirements 6.1-6.7을 구현합니다.
@@ -351,15 +367,15 @@ class SQLComplexityCalculator:
         - 6.7: MySQL에서 성능 페널티 요소
         
         Args:
-            parser: SQL 파서 객체
+            features: SQL 지표 벡터
             
         Returns:
             float: 실행 복잡성 점수
         """
         score = 0.0
         
-        join_count = parser.count_joins()
-        subquery_depth = parser.calculate_subquery_depth()
+        join_count = features.join_count
+        subquery_depth = features.subquery_depth
         
         # 6.1, 6.2: 조인 깊이 페널티
         if self.target == TargetDatabase.POSTGRESQL:
@@ -370,44 +386,42 @@ class SQLComplexityCalculator:
                 score += self.weights.execution_scores['join_depth']  # 1.5
         
         # 6.3: ORDER BY
-        if 'ORDER BY' in parser.normalized_query:
+        if features.has_order_by:
             score += self.weights.execution_scores['order_by']
         
         # 6.4: GROUP BY
-        if 'GROUP BY' in parser.normalized_query:
+        if features.has_group_by:
             score += self.weights.execution_scores['group_by']
         
         # 6.5: HAVING
-        if 'HAVING' in parser.normalized_query:
+        if features.has_having:
             score += self.weights.execution_scores['having']
         
         # MySQL 전용 페널티
         if self.target == TargetDatabase.MYSQL:
             # 6.6: 파생 테이블 (min(1.0, count*0.5))
-            derived_table_count = parser.count_derived_tables()
+            derived_table_count = features.derived_table_count
             if derived_table_count > 0:
                 score += min(1.0, derived_table_count * self.weights.execution_scores['derived_table'])
             
             # 6.7: 성능 페널티 요소
-            penalties = parser.has_performance_penalties()
-            
-            if penalties.get('distinct', False):
+            if features.has_distinct:
                 score += self.weights.execution_scores['distinct']  # 0.3
             
-            if penalties.get('or_conditions', False):
+            if features.has_or_conditions:
                 score += self.weights.execution_scores['or_conditions']  # 0.3
             
-            if penalties.get('like_pattern', False):
+            if features.has_like_pattern:
                 score += self.weights.execution_scores['like_pattern']  # 0.3
             
-            if penalties.get('function_in_where', False):
+            if features.has_function_in_where:
                 score += self.weights.execution_scores['function_in_where']  # 0.5
         
         # 최대 점수 제한
         max_execution = 1.0 if self.target == TargetDatabase.POSTGRESQL else 2.5
         return min(score, max_execution)
     
-    def _calculate_conversion_difficulty(self, parser: SQLParser) -> float:
+    def _calculate_conversion_difficulty(self, features: SQLFeatureVector) -> float:
         """변환 난이도 점수 계산 (힌트 + Oracle 특화 기능 포함)
         
         SQL_COMPLEXITY_SCORE_IMPROVEMENT.md 기반 개선:
@@ -429,7 +443,7 @@ class SQLComplexityCalculator:
         - 최대 3.0점
         
         Args:
-            parser: SQL 파서 객체
+            features: SQL 지표 벡터
             
         Returns:
             float: 변환 난이도 점수 (최대 5.5점)
@@ -437,7 +451,7 @@ class SQLComplexityCalculator:
         score = 0.0
         
         # 1. 힌트 점수 계산 (상향 조정 - SQL_COMPLEXITY_SCORE_IMPROVEMENT.md 반영)
-        hints = parser.count_hints()
+        hints = features.hints
         hint_count = len(hints)
         
         if hint_count == 0:
@@ -452,7 +466,7 @@ class SQLComplexityCalculator:
         score += hint_score
         
         # 2. Oracle 특화 기능 변환 난이도 계산
-        detected_features = parser.detect_oracle_features()
+        detected_features = features.oracle_features
         
         # 변환 난이도 가중치 정의
         feature_difficulty = {
@@ -507,11 +521,11 @@ class SQLComplexityCalculator:
                 feature_score += feature_difficulty[feature]
         
         # 3. 복잡한 ROWNUM 패턴 감지 (페이징 등) - 추가 점수
-        if parser.detect_complex_rownum_pattern():
+        if features.has_complex_rownum:
             feature_score += 1.5  # 복잡한 ROWNUM 패턴은 추가 1.5점
         
         # 4. 빈 문자열 비교 패턴 감지 (Oracle NULL 처리 차이)
-        if parser.detect_empty_string_comparison():
+        if features.has_empty_string_comparison:
             feature_score += 0.5  # 빈 문자열 비교는 0.5점 추가
         
         # Oracle 특화 기능 점수는 최대 3.5점
@@ -4,10 +4,15 @@ Statspack 배치 분석 모듈
 여러 Statspack 파일을 한 번에 분석하는 기능을 제공합니다.
 """
 
+import os
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
 
+from ...utils.file_utils import select_shard
+from ...utils.metrics import MetricsRecorder, collect_stages, metrics_stage, peak_rss_bytes
+
 from ..migration_analyzer import TargetDatabase
 from .data_models import (
     BatchFileResult,
@@ -20,6 +25,7 @@ from .file_processor import FileProcessor
 from .single_analyzer import SingleFileAnalyzer
 from .trend_analyzer import TrendAnalyzer
 from .anomaly_detector import AnomalyDetector
+from .partial import partial_result_path, write_partial_result, read_partial_result
 
 
 class BatchAnalyzer:
@@ -29,18 +35,24 @@ class BatchAnalyzer:
     디렉토리 내의 여러 .out 파일을 한 번에 분석합니다.
     """
     
-    def __init__(self, directory: str):
+    def __init__(self, directory: str, shard: Optional[Tuple[int, int]] = None,
+                 metrics: Optional[MetricsRecorder] = None):
         """
         배치 분석기 초기화
         
         Args:
             directory: Statspack 파일이 있는 디렉토리 경로
+            shard: (샤드 번호, 전체 샤드 수), 지정하면 이 샤드에 배정된 파일만 분석
+            metrics: 처리량 지표 기록기, 지정하면 파일 검색 시간과 파일별 처리 시간, 크기,
+                단계별(read/parse/score) 시간을 기록 (파싱에 성공한 리포트 1개를 객체 1개로 집계)
             
         Raises:
             FileNotFoundError: 디렉토리가 존재하지 않는 경우
             NotADirectoryError: 경로가 디렉토리가 아닌 경우
         """
         self.directory = Path(directory)
+        self.shard = shard
+        self.metrics = metrics
         
         # 디렉토리 존재 확인
         if not self.directory.exists():
@@ -54,10 +66,15 @@ class BatchAnalyzer:
         """
         디렉토리에서 .out 파일 찾기
         
+        샤드가 지정되면 파일 크기 기준으로 나눈 이 샤드의 파일만 반환합니다.
+        
         Returns:
             .out 파일 경로 리스트 (정렬됨)
         """
-        return FileProcessor.find_statspack_files(self.directory)
+        out_files = FileProcessor.find_statspack_files(self.directory)
+        if self.shard is not None:
+            out_files = select_shard(out_files, self.shard, self.directory)
+        return out_files
     
     def analyze_batch(
         self, 
@@ -79,7 +96,10 @@ class BatchAnalyzer:
             BatchAnalysisResult: 배치 분석 결과
         """
         # .out 파일 찾기
-        out_files = self.find_statspack_files()
+        with metrics_stage(self.metrics, "discovery") as fields:
+            out_files = self.find_statspack_files()
+            if fields is not None:
+                fields["items"] = len(out_files)
         
         if not out_files:
             # 파일이 없어도 빈 결과 반환
@@ -96,12 +116,16 @@ class BatchAnalyzer:
         failed_count = 0
         
         # 각 파일 순차 처리
+        metrics = self.metrics
         for filepath in out_files:
-            result = SingleFileAnalyzer.analyze_file(
-                filepath, 
-                analyze_migration=analyze_migration,
-                target=target
-            )
+            if metrics is None:
+                result = SingleFileAnalyzer.analyze_file(
+                    filepath, 
+                    analyze_migration=analyze_migration,
+                    target=target
+                )
+            else:
+                result = self._analyze_file_with_metrics(metrics, filepath, analyze_migration, target)
             
             file_results.append(result)
             
@@ -125,7 +149,106 @@ class BatchAnalyzer:
             trend_analysis=trend_analysis
         )
     
-    def _analyze_trends(self, file_results) -> TrendAnalysisResult:
+    def _analyze_file_with_metrics(
+        self,
+        metrics: MetricsRecorder,
+        filepath: Path,
+        analyze_migration: bool,
+        target: Optional[TargetDatabase]
+    ) -> BatchFileResult:
+        """
+        파일 하나를 분석하고 처리 시간, 크기, 단계별 시간을 지표에 기록합니다.
+        
+        Args:
+            metrics: 처리량 지표 기록기
+            filepath: 파일 경로
+            analyze_migration: 마이그레이션 난이도 분석 포함 여부
+            target: 특정 타겟 데이터베이스
+            
+        Returns:
+            BatchFileResult: 파일 분석 결과
+        """
+        start = time.perf_counter()
+        with collect_stages() as stages:
+            result = SingleFileAnalyzer.analyze_file(
+                filepath,
+                analyze_migration=analyze_migration,
+                target=target
+            )
+        seconds = time.perf_counter() - start
+        
+        try:
+            size = os.path.getsize(filepath)
+        except OSError:
+            size = 0
+        metrics.record_file(
+            str(filepath), seconds, size=size, objects=1 if result.success else 0,
+            error=result.error_message, stages=stages, worker=os.getpid(), rss=peak_rss_bytes()
+        )
+        return result
+    
+    @staticmethod
+    def merge_partials(
+        partial_paths: List[Union[str, Path]],
+        analyze_trends: bool = False
+    ) -> BatchAnalysisResult:
+        """
+        샤드 부분 결과를 합쳐 단일 실행과 같은 배치 분석 결과를 생성합니다.
+        
+        파일 결과는 파일명 순서(단일 실행의 처리 순서)로 합치며, 추세 분석은 합친
+        결과로 다시 수행합니다.
+        
+        Args:
+            partial_paths: 모든 샤드의 부분 결과 파일 경로
+            analyze_trends: 추세 분석 포함 여부
+            
+        Returns:
+            BatchAnalysisResult: 병합된 배치 분석 결과
+            
+        Raises:
+            ValueError: 부분 결과가 없거나, 설정이 다르거나, 샤드가 누락/중복된 경우
+        """
+        if not partial_paths:
+            raise ValueError("병합할 샤드 부분 결과가 없습니다")
+        
+        partials = [(Path(path), *read_partial_result(path)) for path in partial_paths]
+        base_path, base, _ = partials[0]
+        count = base["shard"][1]
+        seen: Dict[int, Path] = {}
+        for path, header, _ in partials:
+            if (header["directory"], header["options"]) != (base["directory"], base["options"]):
+                raise ValueError(f"분석 설정이 다른 부분 결과입니다: {path} (기준: {base_path})")
+            index, shard_count = header["shard"]
+            if shard_count != count:
+                raise ValueError(f"전체 샤드 수가 다른 부분 결과입니다: {path} ({shard_count} != {count})")
+            if index in seen:
+                raise ValueError(f"샤드 {index}/{count}의 부분 결과가 중복되었습니다: {seen[index]}, {path}")
+            seen[index] = path
+        missing = [str(i) for i in range(1, count + 1) if i not in seen]
+        if missing:
+            raise ValueError(f"누락된 샤드가 있습니다: {', '.join(missing)} (전체 {count}개)")
+        
+        file_results = sorted(
+            (r for _, _, partial in partials for r in partial.file_results),
+            key=lambda r: r.filename
+        )
+        successful_count = sum(1 for r in file_results if r.success)
+        
+        trend_analysis = None
+        if analyze_trends and successful_count > 1:
+            trend_analysis = BatchAnalyzer._analyze_trends(file_results)
+        
+        return BatchAnalysisResult(
+            total_files=sum(partial.total_files for _, _, partial in partials),
+            successful_files=successful_count,
+            failed_files=len(file_results) - successful_count,
+            file_results=file_results,
+            analysis_timestamp=datetime.now().strftime("%Y%m%d_%H%M%S"),
+            trend_analysis=trend_analysis
+        )
+    
+    @staticmethod
+    def _analyze_trends(file_results) -> TrendAnalysisResult:
         """
         추세 분석 수행
         
@@ -175,5 +298,8 @@ __all__ = [
     'TrendMetrics',
     'Anomaly',
     'TrendAnalysisResult',
-    'BatchAnalysisResult'
+    'BatchAnalysisResult',
+    'partial_result_path',
+    'write_partial_result',
+    'read_partial_result'
 ]
@@ -5,9 +5,10 @@
 """
 
 from pathlib import Path
-from typing import List, Union
+from typing import List, Optional, Union
 from datetime import datetime
 
+from ...utils.file_utils import SourceFile
 from ..models import StatspackData, AWRData
 from ..logging_config import get_logger
 
@@ -38,7 +39,7 @@ class FileProcessor:
         return out_files
     
     @staticmethod
-    def detect_file_type(filepath: Path) -> str:
+    def detect_file_type(filepath: Path, source: Optional[SourceFile] = None) -> str:
         """
         파일 타입 자동 감지 (AWR vs Statspack)
         
@@ -47,6 +48,7 @@ class FileProcessor:
         
         Args:
             filepath: 파일 경로
+            source: 이미 읽은 파일 내용 (있으면 파일을 다시 읽지 않음)
             
         Returns:
             "awr" 또는 "statspack"
@@ -69,18 +71,14 @@ class FileProcessor:
         ]
         
         try:
-            # UTF-8로 시도
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read(50000)  # 처음 50KB만 읽기
-        except UnicodeDecodeError:
-            # Latin-1로 폴백
-            try:
-                with open(filepath, 'r', encoding='latin-1') as f:
-                    content = f.read(50000)
-            except Exception:
-                # 읽기 실패 시 Statspack으로 간주
-                return "statspack"
+            # 처음 50KB만 디코딩 (인코딩은 앞부분 바이트로 판별)
+            if source is not None:
+                content = source.head(50000)
+            else:
+                with SourceFile.open(filepath) as source:
+                    content = source.head(50000)
         except Exception:
+            # 읽기 실패 시 Statspack으로 간주
             return "statspack"
         
         # AWR 마커 확인
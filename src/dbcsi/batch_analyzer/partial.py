@@ -0,0 +1,174 @@
+"""
+샤드 부분 결과 모듈
+
+여러 노드에서 디렉토리를 나누어 배치 분석(--shard i/N)할 때 각 샤드의 파일별 분석
+결과를 부분 결과 파일(JSON)로 저장하고 다시 읽는 기능을 제공합니다.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from ..models import (
+    AWRData,
+    StatspackData,
+    statspack_to_dict,
+    dict_to_statspack,
+    dict_to_awr,
+    migration_complexity_to_dict,
+    dict_to_migration_complexity
+)
+from ..migration_analyzer import TargetDatabase
+from ..logging_config import get_logger
+from .data_models import BatchFileResult, BatchAnalysisResult
+
+# 로거 초기화
+logger = get_logger("batch_partial")
+
+# 부분 결과 형식 버전 (저장 구조가 바뀌면 올림)
+PARTIAL_FORMAT_VERSION = 1
+
+
+def partial_result_path(output: Union[str, Path], shard: Tuple[int, int]) -> Path:
+    """
+    샤드 부분 결과 파일 경로를 생성합니다.
+
+    Args:
+        output: 배치 리포트 출력 경로 (예: reports/awr/batch_summary.md)
+        shard: (샤드 번호, 전체 샤드 수)
+
+    Returns:
+        부분 결과 파일 경로 (예: reports/awr/batch_summary.shard-1-of-4.partial.json)
+    """
+    index, count = shard
+    output = Path(output)
+    return output.with_name(f"{output.stem}.shard-{index}-of-{count}.partial.json")
+
+
+def _file_result_to_dict(file_result: BatchFileResult) -> Dict[str, Any]:
+    """파일 분석 결과를 딕셔너리로 변환 (데이터 타입과 타임스탬프 포함)"""
+    file_dict = {
+        "filepath": file_result.filepath,
+        "filename": file_result.filename,
+        "success": file_result.success,
+        "error_message": file_result.error_message,
+        "timestamp": file_result.timestamp
+    }
+
+    if file_result.statspack_data is not None:
+        file_dict["data_type"] = "awr" if isinstance(file_result.statspack_data, AWRData) else "statspack"
+        file_dict["statspack_data"] = statspack_to_dict(file_result.statspack_data)
+
+    if file_result.migration_analysis:
+        file_dict["migration_analysis"] = {
+            target.value: migration_complexity_to_dict(complexity)
+            for target, complexity in file_result.migration_analysis.items()
+        }
+
+    return file_dict
+
+
+def _dict_to_file_result(file_dict: Dict[str, Any]) -> BatchFileResult:
+    """딕셔너리를 파일 분석 결과로 변환"""
+    statspack_data: Optional[StatspackData] = None
+    if file_dict.get("statspack_data") is not None:
+        if file_dict.get("data_type") == "awr":
+            statspack_data = dict_to_awr(file_dict["statspack_data"])
+        else:
+            statspack_data = dict_to_statspack(file_dict["statspack_data"])
+
+    migration_analysis = None
+    if file_dict.get("migration_analysis"):
+        migration_analysis = {
+            TargetDatabase(key): dict_to_migration_complexity(value)
+            for key, value in file_dict["migration_analysis"].items()
+        }
+
+    return BatchFileResult(
+        filepath=file_dict["filepath"],
+        filename=file_dict["filename"],
+        success=file_dict["success"],
+        error_message=file_dict.get("error_message"),
+        statspack_data=statspack_data,
+        migration_analysis=migration_analysis,
+        timestamp=file_dict.get("timestamp")
+    )
+
+
+def write_partial_result(
+    path: Union[str, Path],
+    batch_result: BatchAnalysisResult,
+    directory: Union[str, Path],
+    shard: Tuple[int, int],
+    options: Optional[Dict[str, Any]] = None
+) -> Path:
+    """
+    샤드의 배치 분석 결과를 부분 결과 파일로 저장합니다.
+
+    임시 파일에 기록한 뒤 최종 파일명으로 바꾸므로 중단된 샤드의 결과는 남지 않습니다.
+
+    Args:
+        path: 부분 결과 파일 경로
+        batch_result: 샤드의 배치 분석 결과
+        directory: 분석 디렉토리 경로
+        shard: (샤드 번호, 전체 샤드 수)
+        options: 분석 옵션 (병합 시 모든 샤드가 같은지 확인)
+
+    Returns:
+        저장된 부분 결과 파일 경로
+    """
+    path = Path(path)
+    payload = {
+        "_type": "BatchPartialResult",
+        "partial": PARTIAL_FORMAT_VERSION,
+        "directory": Path(directory).name,
+        "shard": list(shard),
+        "options": options or {},
+        "total_files": batch_result.total_files,
+        "file_results": [_file_result_to_dict(r) for r in batch_result.file_results]
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+    logger.info(f"샤드 부분 결과 저장: {path}")
+    return path
+
+
+def read_partial_result(path: Union[str, Path]) -> Tuple[Dict[str, Any], BatchAnalysisResult]:
+    """
+    부분 결과 파일을 읽습니다.
+
+    Args:
+        path: 부분 결과 파일 경로
+
+    Returns:
+        (실행 설정, 샤드의 배치 분석 결과)
+
+    Raises:
+        ValueError: 부분 결과 파일이 아니거나 형식 버전이 다른 경우
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            payload = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"샤드 부분 결과를 읽을 수 없습니다: {path} ({e})")
+
+    if (not isinstance(payload, dict) or payload.get("_type") != "BatchPartialResult"
+            or payload.get("partial") != PARTIAL_FORMAT_VERSION):
+        raise ValueError(f"샤드 부분 결과 파일이 아닙니다: {path}")
+
+    file_results = [_dict_to_file_result(d) for d in payload["file_results"]]
+    successful = sum(1 for r in file_results if r.success)
+    header = {key: payload[key] for key in ("directory", "shard", "options")}
+    return header, BatchAnalysisResult(
+        total_files=payload["total_files"],
+        successful_files=successful,
+        failed_files=len(file_results) - successful,
+        file_results=file_results,
+        analysis_timestamp=""
+    )
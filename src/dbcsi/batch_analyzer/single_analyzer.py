@@ -7,7 +7,8 @@
 from pathlib import Path
 from typing import Optional
 
-from ..parsers import StatspackParser, AWRParser
+from ...utils.metrics import stage_timer
+from ..parsers import StatspackParser, AWRParser, open_report_file
 from ..exceptions import StatspackParseError, StatspackFileError
 from ..migration_analyzer import MigrationAnalyzer, TargetDatabase
 from ..logging_config import get_logger
@@ -39,17 +40,23 @@ class SingleFileAnalyzer:
             BatchFileResult: 파일 분석 결과
         """
         try:
-            # 파일 타입 자동 감지 (AWR vs Statspack)
-            file_type = FileProcessor.detect_file_type(filepath)
+            # 파일을 한 번 읽어 타입 감지와 파싱에 함께 사용
+            with stage_timer("read"):
+                source = open_report_file(filepath)
             
-            # 적절한 파서 선택
-            if file_type == "awr":
-                parser = AWRParser(str(filepath))
-            else:
-                parser = StatspackParser(str(filepath))
-            
-            # 파일 파싱
-            statspack_data = parser.parse()
+            with stage_timer("parse"):
+                # 파일 타입 자동 감지 (AWR vs Statspack)
+                file_type = FileProcessor.detect_file_type(filepath, source)
+                
+                # 적절한 파서 선택 (AWRParser는 StatspackParser의 하위 클래스)
+                parser: StatspackParser
+                if file_type == "awr":
+                    parser = AWRParser(str(filepath), source)
+                else:
+                    parser = StatspackParser(str(filepath), source)
+                
+                # 파일 파싱
+                statspack_data = parser.parse()
             
             # 타임스탬프 추출 (파일명 또는 데이터에서)
             timestamp = FileProcessor.extract_timestamp(filepath, statspack_data)
@@ -57,8 +64,9 @@ class SingleFileAnalyzer:
             # 마이그레이션 분석 (선택적)
             migration_analysis = None
             if analyze_migration:
-                analyzer = MigrationAnalyzer(statspack_data)
-                migration_analysis = analyzer.analyze(target=target)
+                with stage_timer("score"):
+                    analyzer = MigrationAnalyzer(statspack_data)
+                    migration_analysis = analyzer.analyze(target=target)
             
             return BatchFileResult(
                 filepath=str(filepath),
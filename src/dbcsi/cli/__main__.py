@@ -6,22 +6,34 @@ DBCSI Statspack 결과 파일을 파싱하고 마이그레이션 난이도를 
 """
 
 import sys
+from typing import List, Optional
 
 from ..logging_config import setup_logging, get_logger
-from .argument_parser import create_parser, validate_args
-from .command_handlers import process_single_file, process_directory, process_compare
+from .argument_parser import create_parser, create_merge_parser, validate_args
+from .command_handlers import process_single_file, process_directory, process_compare, process_merge
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     """
     CLI 메인 함수
     
+    첫 인자가 'merge'이면 샤드 부분 결과 병합 명령을 실행합니다.
+    
+    Args:
+        argv: 명령줄 인자 (None이면 sys.argv[1:])
+    
     Returns:
         Exit code (0: 성공, 1: 실패)
     """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "merge":
+        args = create_merge_parser().parse_args(argv[1:])
+        setup_logging(level="INFO", console=True)
+        return process_merge(args)
+    
     # 인자 파싱
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # 로깅 설정
     log_level = "DEBUG" if hasattr(args, 'verbose') and args.verbose else "INFO"
@@ -11,6 +11,7 @@ import logging
 from typing import Optional, List
 
 from ..migration_analyzer import TargetDatabase
+from ...utils.cli_helpers import shard_argument
 
 # 로거 초기화
 logger = logging.getLogger("statspack.cli")
@@ -50,6 +51,14 @@ def create_parser() -> argparse.ArgumentParser:
   # 디렉토리 내 모든 파일 배치 분석
   %(prog)s --directory ./statspack_files/
   
+  # 여러 노드에서 디렉토리를 2개 샤드로 나누어 분석한 뒤 부분 결과 병합
+  %(prog)s -d /shared/awr --shard 1/2 --output reports/awr/batch_summary.md   # 노드 1
+  %(prog)s -d /shared/awr --shard 2/2 --output reports/awr/batch_summary.md   # 노드 2
+  %(prog)s merge reports/awr/batch_summary.shard-*-of-2.partial.json
+  
+  # 배치 분석 처리량 지표를 JSON Lines로 기록
+  %(prog)s -d /shared/awr --analyze-migration --metrics-out metrics.jsonl
+  
   # 마이그레이션 분석 포함
   %(prog)s --file sample.out --analyze-migration
   
@@ -70,7 +79,7 @@ def create_parser() -> argparse.ArgumentParser:
         help="분석할 단일 Statspack/AWR 파일 경로 (.out 파일)"
     )
     input_group.add_argument(
-        "--directory",
+        "-d", "--directory",
         type=str,
         metavar="PATH",
         help="Statspack/AWR 파일이 있는 디렉토리 경로 (모든 .out 파일 분석)"
@@ -131,6 +140,25 @@ def create_parser() -> argparse.ArgumentParser:
         help="분석에 사용할 백분위수 (기본값: 99, AWR 파일만 해당)"
     )
     
+    # 샤드 분석 옵션
+    parser.add_argument(
+        "--shard",
+        type=shard_argument,
+        metavar="I/N",
+        help="디렉토리의 파일을 크기 기준으로 N개 샤드에 나누어 I번째 샤드만 분석하고 "
+             "리포트 대신 부분 결과(<출력 파일명>.shard-I-of-N.partial.json)를 저장 "
+             "(--directory 필요, 모든 샤드의 부분 결과는 merge 명령으로 병합)"
+    )
+    
+    # 처리량 지표 기록 옵션
+    parser.add_argument(
+        "--metrics-out",
+        metavar="FILE",
+        help="배치 분석 처리량 지표를 JSON Lines로 기록 (파일 검색/읽기/파싱/마이그레이션 분석/"
+             "리포트 단계별 시간, 파일별 처리 시간·크기, 최대 메모리, 마지막 줄에 실행 요약, "
+             "--directory 필요)"
+    )
+    
     # 언어 선택 옵션
     parser.add_argument(
         "--language",
@@ -143,6 +171,50 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def create_merge_parser() -> argparse.ArgumentParser:
+    """
+    merge 명령 인자 파서를 생성합니다.
+    
+    Returns:
+        argparse.ArgumentParser: 설정된 인자 파서
+    """
+    parser = argparse.ArgumentParser(
+        prog="dbcsi-analyzer merge",
+        description="--shard로 나누어 분석한 디렉토리의 샤드 부분 결과를 합쳐 "
+                    "단일 실행과 같은 배치 리포트를 생성합니다.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예제:
+  # 4개 샤드의 부분 결과 병합 (Markdown 출력)
+  %(prog)s reports/awr/batch_summary.shard-*-of-4.partial.json
+  
+  # JSON으로 저장
+  %(prog)s reports/awr/*.partial.json --format json --output reports/awr/batch_summary.json
+        """
+    )
+    
+    parser.add_argument(
+        "partials",
+        nargs="+",
+        metavar="PARTIAL",
+        help="샤드 부분 결과 파일 (모든 샤드)"
+    )
+    parser.add_argument(
+        "--format",
+        type=str,
+        choices=["json", "markdown"],
+        default="markdown",
+        help="출력 형식 (기본값: markdown)"
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        metavar="PATH",
+        help="결과를 저장할 파일 경로 (기본값: 첫 부분 결과와 같은 디렉토리의 batch_summary 파일)"
+    )
+    return parser
+
+
 def validate_args(args: argparse.Namespace) -> None:
     """
     CLI 인자의 유효성을 검증합니다.
@@ -161,6 +233,16 @@ def validate_args(args: argparse.Namespace) -> None:
         if not args.file.endswith('.out'):
             logger.warning(f"Statspack/AWR 파일은 일반적으로 .out 확장자를 가집니다: {args.file}")
     
+    # 샤드 분석은 디렉토리 분석에만 사용
+    if getattr(args, 'shard', None) and not args.directory:
+        logger.error("--shard는 --directory와 함께 사용해야 합니다")
+        sys.exit(1)
+    
+    # 처리량 지표는 디렉토리 배치 분석에만 기록
+    if getattr(args, 'metrics_out', None) and not args.directory:
+        logger.error("--metrics-out은 --directory와 함께 사용해야 합니다")
+        sys.exit(1)
+    
     # 디렉토리 존재 확인
     if args.directory:
         if not os.path.exists(args.directory):
@@ -10,11 +10,12 @@ from pathlib import Path
 from typing import Optional, List
 import argparse
 
-from ..parsers import StatspackParser, AWRParser
+from ..parsers import StatspackParser, AWRParser, open_report_file
 from ..migration_analyzer import MigrationAnalyzer, TargetDatabase
 from ..formatters import StatspackResultFormatter, EnhancedResultFormatter
-from ..batch_analyzer import BatchAnalyzer
+from ..batch_analyzer import BatchAnalyzer, partial_result_path, write_partial_result
 from ...utils.cli_helpers import detect_file_type, generate_output_path, print_progress
+from ...utils.metrics import MetricsRecorder, metrics_stage
 from .argument_parser import get_target_databases
 
 # 로거 초기화
@@ -31,14 +32,16 @@ def detect_and_parse(filepath: str):
     Returns:
         StatspackParser 또는 AWRParser 인스턴스
     """
-    file_type = detect_file_type(filepath)
+    # 파일을 한 번 읽어 타입 감지와 파싱에 함께 사용
+    source = open_report_file(filepath)
+    file_type = detect_file_type(filepath, source)
     
     if file_type == "awr":
         logger.info("파일 타입: AWR")
-        return AWRParser(filepath)
+        return AWRParser(filepath, source)
     else:
         logger.info("파일 타입: Statspack")
-        return StatspackParser(filepath)
+        return StatspackParser(filepath, source)
 
 
 def process_single_file(args: argparse.Namespace) -> int:
@@ -143,7 +146,17 @@ def process_directory(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0: 성공, 1: 실패)
     """
+    metrics = None
     try:
+        # 처리량 지표 기록 (--metrics-out)
+        if getattr(args, 'metrics_out', None):
+            metrics = MetricsRecorder(args.metrics_out, "dbcsi-analyzer", config={
+                "directory": args.directory,
+                "analyze_migration": args.analyze_migration,
+                "target": args.target,
+                "shard": getattr(args, 'shard', None),
+            })
+        
         # 출력 경로 자동 생성 (--output이 지정되지 않은 경우)
         if not args.output:
             dir_path = Path(args.directory)
@@ -170,7 +183,8 @@ def process_directory(args: argparse.Namespace) -> int:
         
         # 배치 분석 실행
         print_progress(2, 3, "배치 분석 실행 중...")
-        batch_analyzer = BatchAnalyzer(args.directory)
+        shard = getattr(args, 'shard', None)
+        batch_analyzer = BatchAnalyzer(args.directory, shard=shard, metrics=metrics)
         target_db = get_target_databases(args.target)
         target_db = target_db[0] if target_db else None  # 단일 타겟 또는 None
         
@@ -182,32 +196,89 @@ def process_directory(args: argparse.Namespace) -> int:
         print_progress(2, 3, f"배치 분석 완료: {results.successful_files}개 성공, "
                       f"{results.failed_files}개 실패")
         
+        if shard is not None:
+            # 샤드 분석은 리포트 대신 부분 결과 저장 (merge 명령으로 병합)
+            partial_path = write_partial_result(
+                partial_result_path(args.output, shard), results, args.directory, shard,
+                options={"analyze_migration": args.analyze_migration, "target": args.target}
+            )
+            print_progress(3, 3, f"샤드 {shard[0]}/{shard[1]} 부분 결과 저장 완료: {partial_path}")
+            return 1 if results.failed_files > 0 else 0
+        
         # 결과 포맷팅
         print_progress(3, 3, "리포트 생성 중...")
+        with metrics_stage(metrics, "export"):
+            if args.format == "json":
+                output = StatspackResultFormatter.batch_to_json(results)
+            else:  # markdown
+                output = StatspackResultFormatter.batch_to_markdown(results)
+            
+            print_progress(3, 3, "리포트 생성 완료")
+            
+            # 결과 출력 또는 저장
+            if args.output:
+                # 출력 디렉토리가 없으면 생성
+                output_path = Path(args.output)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                
+                with open(args.output, 'w', encoding='utf-8') as f:
+                    f.write(output)
+                logger.info(f"✓ 결과 저장 완료: {args.output}")
+            else:
+                print(output)
+        
+        # 실패한 파일이 있으면 exit code 1 반환
+        return 1 if results.failed_files > 0 else 0
+        
+    except Exception as e:
+        logger.error(f"디렉토리 처리 중 예외 발생: {e}", exc_info=True)
+        return 1
+    finally:
+        if metrics is not None:
+            metrics.close()
+            logger.info(f"✓ 처리량 지표 저장 완료: {metrics.path}")
+
+
+def process_merge(args: argparse.Namespace) -> int:
+    """
+    샤드 부분 결과를 병합하여 배치 리포트를 생성합니다.
+    
+    Args:
+        args: merge 명령 CLI 인자
+        
+    Returns:
+        Exit code (0: 성공, 1: 실패 파일이 있거나 병합 실패)
+    """
+    try:
+        # 출력 경로 자동 생성 (--output이 지정되지 않은 경우)
+        if not args.output:
+            extension = "json" if args.format == "json" else "md"
+            args.output = str(Path(args.partials[0]).parent / f"batch_summary.{extension}")
+            logger.info(f"출력 경로 자동 설정: {args.output}")
+        
+        print_progress(1, 2, f"샤드 부분 결과 병합 중: {len(args.partials)}개 파일")
+        results = BatchAnalyzer.merge_partials(args.partials)
+        print_progress(1, 2, f"병합 완료: {results.successful_files}개 성공, "
+                      f"{results.failed_files}개 실패")
+        
+        # 결과 포맷팅
+        print_progress(2, 2, "리포트 생성 중...")
         if args.format == "json":
             output = StatspackResultFormatter.batch_to_json(results)
         else:  # markdown
             output = StatspackResultFormatter.batch_to_markdown(results)
         
-        print_progress(3, 3, "리포트 생성 완료")
-        
-        # 결과 출력 또는 저장
-        if args.output:
-            # 출력 디렉토리가 없으면 생성
-            output_path = Path(args.output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(output)
-            logger.info(f"✓ 결과 저장 완료: {args.output}")
-        else:
-            print(output)
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(output)
+        logger.info(f"✓ 결과 저장 완료: {args.output}")
         
         # 실패한 파일이 있으면 exit code 1 반환
         return 1 if results.failed_files > 0 else 0
         
     except Exception as e:
-        logger.error(f"디렉토리 처리 중 예외 발생: {e}", exc_info=True)
+        logger.error(f"샤드 부분 결과 병합 중 예외 발생: {e}", exc_info=True)
         return 1
 
 
@@ -4,7 +4,7 @@
 Statspack과 AWR 파일 파서를 제공합니다.
 """
 
-from .base_parser import BaseParser
+from .base_parser import BaseParser, open_report_file
 from .statspack_parser import StatspackParser
 from .awr_parser import AWRParser
 
@@ -12,4 +12,5 @@ __all__ = [
     "BaseParser",
     "StatspackParser",
     "AWRParser",
+    "open_report_file",
 ]
@@ -35,7 +35,7 @@ class AWRParser(StatspackParser):
         # 기본 Statspack 섹션 파싱
         statspack_data = super().parse()
         
-        # 파일 다시 읽기 (AWR 특화 섹션용)
+        # AWR 특화 섹션용 라인 (기본 파싱 시 읽은 라인 재사용)
         lines = self._read_file()
         
         # AWR 특화 섹션 파싱
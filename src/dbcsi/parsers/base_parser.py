@@ -4,15 +4,35 @@
 Statspack/AWR 파일의 공통 파싱 로직을 제공합니다.
 """
 
+import io
 from typing import List, Optional
 from pathlib import Path
 
+from ...utils.file_utils import SourceFile
 from ..exceptions import StatspackParseError, StatspackFileError
 from ..logging_config import get_logger
 
 logger = get_logger("parser.base")
 
 
+def open_report_file(filepath) -> Optional[SourceFile]:
+    """
+    리포트 파일을 한 번 읽어 SourceFile 생성
+    
+    파일 타입 감지와 파서가 같은 내용을 사용하도록 먼저 읽어 둡니다.
+    
+    Args:
+        filepath: 파일 경로 (.out 파일)
+        
+    Returns:
+        읽은 SourceFile (읽을 수 없으면 None, 오류는 파서에서 보고)
+    """
+    try:
+        return SourceFile.open(filepath)
+    except OSError:
+        return None
+
+
 class BaseParser:
     """
     기본 파서 클래스
@@ -21,18 +41,21 @@ class BaseParser:
     섹션 마커(~~BEGIN-{SECTION}~~, ~~END-{SECTION}~~)를 기반으로 파싱합니다.
     """
     
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, source: Optional[SourceFile] = None):
         """
         파서 초기화
         
         Args:
             filepath: 파일 경로 (.out 파일)
+            source: 이미 읽은 파일 내용 (None이면 파싱 시 읽음, 파서가 읽은 뒤 닫음)
             
         Raises:
             FileNotFoundError: 파일이 존재하지 않는 경우
             StatspackFileError: 경로가 디렉토리인 경우
         """
         self.filepath = Path(filepath)
+        self._source = source
+        self._lines: Optional[List[str]] = None
         
         if not self.filepath.exists():
             logger.error(f"File not found: {filepath}")
@@ -48,7 +71,9 @@ class BaseParser:
         """
         파일을 읽고 라인 리스트 반환
         
-        UTF-8 인코딩을 먼저 시도하고, 실패하면 Latin-1로 폴백합니다.
+        파일은 한 번만 읽으며(SourceFile), 인코딩은 앞부분 바이트로 판별합니다
+        (BOM, UTF-8, CP949 순서로 확인하고 모두 실패하면 Latin-1). 읽은 라인은
+        캐시되므로 AWR 파서처럼 여러 번 호출해도 파일을 다시 읽지 않습니다.
         
         Returns:
             파일의 각 라인을 담은 리스트
@@ -56,30 +81,32 @@ class BaseParser:
         Raises:
             StatspackFileError: 파일 읽기 실패 시
         """
+        if self._lines is not None:
+            return self._lines
+        
         try:
-            logger.debug(f"Attempting to read file with UTF-8 encoding: {self.filepath}")
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            logger.info(f"Successfully read file with UTF-8 encoding: {len(lines)} lines")
-            return lines
-        except UnicodeDecodeError:
-            logger.warning(f"UTF-8 decoding failed, falling back to Latin-1: {self.filepath}")
-            try:
-                with open(self.filepath, 'r', encoding='latin-1') as f:
-                    lines = f.readlines()
-                logger.info(f"Successfully read file with Latin-1 encoding: {len(lines)} lines")
-                return lines
-            except Exception as e:
-                logger.error(f"Failed to read file with both UTF-8 and Latin-1 encoding: {self.filepath}")
-                raise StatspackFileError(
-                    f"Failed to read file with UTF-8 or Latin-1 encoding: {self.filepath}"
-                ) from e
+            source = self._source or SourceFile.open(self.filepath)
+            with source:
+                lines = io.StringIO(source.text).readlines()
+            if not source.encoding.startswith('utf-8'):
+                logger.warning(f"UTF-8 decoding failed, falling back to {source.encoding}: {self.filepath}")
+            logger.info(f"Successfully read file with {source.encoding} encoding: {len(lines)} lines")
+        except UnicodeDecodeError as e:
+            logger.error(f"Failed to decode file: {self.filepath}")
+            raise StatspackFileError(
+                f"Failed to read file with UTF-8 or Latin-1 encoding: {self.filepath}"
+            ) from e
         except PermissionError as e:
             logger.error(f"Permission denied: {self.filepath}")
             raise StatspackFileError(f"Permission denied: {self.filepath}") from e
         except Exception as e:
             logger.error(f"Unexpected error reading file: {self.filepath} - {str(e)}")
             raise StatspackFileError(f"Failed to read file: {self.filepath}") from e
+        finally:
+            self._source = None
+        
+        self._lines = lines
+        return lines
     
     def _extract_section(self, lines: List[str], section_name: str) -> List[str]:
         """
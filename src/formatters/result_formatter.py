@@ -12,6 +12,7 @@ from dataclasses import asdict
 from src.oracle_complexity_analyzer import (
     SQLAnalysisResult,
     PLSQLAnalysisResult,
+    SourceRef,
     TargetDatabase,
     ComplexityLevel,
     PLSQLObjectType
@@ -38,6 +39,8 @@ class ResultFormatter:
         - Enum 타입을 문자열로 변환
         - 모든 필드 포함
         
+        원본 텍스트 대신 SourceRef만 담은 결과는 원본을 파일에서 읽어 채웁니다.
+        
         Args:
             result: SQL 또는 PL/SQL 분석 결과 객체
             
@@ -47,12 +50,18 @@ class ResultFormatter:
         # dataclass를 dict로 변환
         result_dict = asdict(result)
         
+        # 원본 소스 참조가 없으면 필드 생략 (기존 출력 형식 유지)
+        if result_dict.get('source_ref') is None:
+            result_dict.pop('source_ref', None)
+        
         # Enum 타입을 문자열로 변환
         if isinstance(result, SQLAnalysisResult):
+            result_dict['query'] = result.source_text()
             result_dict['target_database'] = result.target_database.value
             result_dict['complexity_level'] = result.complexity_level.value
             result_dict['result_type'] = 'sql'
         elif isinstance(result, PLSQLAnalysisResult):
+            result_dict['code'] = result.source_text()
             result_dict['target_database'] = result.target_database.value
             result_dict['complexity_level'] = result.complexity_level.value
             result_dict['object_type'] = result.object_type.value
@@ -104,6 +113,10 @@ class ResultFormatter:
         except ValueError as e:
             raise ValueError(f"Enum 변환 실패: {e}")
         
+        # 원본 소스 참조 복원
+        if data.get('source_ref') is not None:
+            data['source_ref'] = SourceRef(**data['source_ref'])
+        
         if actual_type == 'sql':
             return SQLAnalysisResult(**data)
         elif actual_type == 'plsql':
@@ -136,6 +149,19 @@ class ResultFormatter:
         else:
             raise ValueError(f"지원하지 않는 결과 타입: {type(result)}")
     
+    @staticmethod
+    def _append_degraded_detectors(md: list,
+                                   result: Union[SQLAnalysisResult, PLSQLAnalysisResult]) -> None:
+        """예산을 넘겨 부분 결과를 반환한 감지기 경고 추가"""
+        if not result.degraded_detectors:
+            return
+        md.append("## ⚠️ 부분 분석된 감지기\n")
+        md.append("시간/입력 크기 예산을 넘겨 일부 입력만 분석한 감지기입니다. "
+                  "해당 지표는 실제보다 낮게 계산되었을 수 있습니다.\n")
+        for detector in result.degraded_detectors:
+            md.append(f"- {detector}")
+        md.append("")
+    
     @staticmethod
     def _format_sql_markdown(result: SQLAnalysisResult) -> str:
         """SQL 분석 결과 Markdown 포맷
@@ -186,6 +212,7 @@ class ResultFormatter:
         md.append(f"- **서브쿼리 중첩 깊이**: {result.subquery_depth}")
         md.append(f"- **CTE 개수**: {result.cte_count}")
         md.append(f"- **집합 연산자 개수**: {result.set_operators_count}\n")
+        ResultFormatter._append_degraded_detectors(md, result)
         
         # 감지된 Oracle 특화 기능
         if result.detected_oracle_features:
@@ -220,7 +247,7 @@ class ResultFormatter:
         # 원본 쿼리
         md.append("## 원본 쿼리\n")
         md.append("```sql")
-        md.append(result.query)
+        md.append(result.source_text())
         md.append("```\n")
         
         return "\n".join(md)
@@ -283,6 +310,7 @@ class ResultFormatter:
         md.append(f"- **중첩 깊이**: {result.nesting_depth}")
         md.append(f"- **BULK 연산 개수**: {result.bulk_operations_count}")
         md.append(f"- **동적 SQL 개수**: {result.dynamic_sql_count}\n")
+        ResultFormatter._append_degraded_detectors(md, result)
         
         # 감지된 Oracle 특화 기능
         if result.detected_oracle_features:
@@ -310,7 +338,7 @@ class ResultFormatter:
         # 원본 코드
         md.append("## 원본 코드\n")
         md.append("```sql")
-        md.append(result.code)
+        md.append(result.source_text())
         md.append("```\n")
         
         return "\n".join(md)
@@ -326,6 +354,14 @@ class ResultFormatter:
         Returns:
             Markdown 형식의 문자열
         """
+        # SQL 스크립트(문장 단위) 분석 결과
+        if 'total_statements' in batch_result:
+            return ResultFormatter.script_to_markdown(batch_result, target_db)
+        
+        # 패키지/타입 바디(서브프로그램 단위) 분석 결과
+        if 'total_subprograms' in batch_result:
+            return ResultFormatter.subprograms_to_markdown(batch_result, target_db)
+        
         md = []
         
         # 제목
@@ -465,6 +501,14 @@ class ResultFormatter:
         Returns:
             JSON 형식의 문자열
         """
+        # SQL 스크립트(문장 단위) 분석 결과
+        if 'total_statements' in batch_result:
+            return ResultFormatter.script_to_json(batch_result)
+        
+        # 패키지/타입 바디(서브프로그램 단위) 분석 결과
+        if 'total_subprograms' in batch_result:
+            return ResultFormatter.subprograms_to_json(batch_result)
+        
         # 분석 결과 객체를 직렬화 가능한 형태로 변환
         serializable_result = {
             'total_objects': batch_result['total_objects'],
@@ -506,3 +550,279 @@ class ResultFormatter:
             })
         
         return json.dumps(serializable_result, indent=2, ensure_ascii=False)
+    
+    @staticmethod
+    def script_to_json(script_result: dict) -> str:
+        """SQL 스크립트 문장 단위 분석 결과를 JSON 형식으로 변환
+        
+        Args:
+            script_result: 스크립트 분석 결과 딕셔너리
+            
+        Returns:
+            JSON 형식의 문자열
+        """
+        serializable_result = {
+            'result_type': 'sql_script',
+            'total_statements': script_result['total_statements'],
+            'analyzed_statements': script_result['analyzed_statements'],
+            'failed_statements': script_result['failed_statements'],
+            'statistics': script_result.get('statistics', {}),
+            'summary': script_result.get('summary', {}),
+            'results': [],
+            'failed': script_result.get('failed', [])
+        }
+        
+        # 중복 제거 분석 시 형태(fingerprint)별 출현 횟수
+        if 'fingerprints' in script_result:
+            serializable_result['distinct_statements'] = script_result['distinct_statements']
+            serializable_result['fingerprints'] = script_result['fingerprints']
+        
+        # 개별 문장 결과 변환
+        for stmt_result in script_result.get('results', []):
+            stmt_json = {
+                'statement_index': stmt_result['statement_index'],
+                'statement_type': stmt_result['statement_type'],
+                'line_range': stmt_result['line_range'],
+            }
+            if 'fingerprint' in stmt_result:
+                stmt_json['fingerprint'] = stmt_result['fingerprint']
+            stmt_json['analysis'] = json.loads(ResultFormatter.to_json(stmt_result['analysis']))
+            serializable_result['results'].append(stmt_json)
+        
+        return json.dumps(serializable_result, indent=2, ensure_ascii=False)
+    
+    @staticmethod
+    def script_to_markdown(script_result: dict, target_db: str = "PostgreSQL") -> str:
+        """SQL 스크립트 문장 단위 분석 결과를 Markdown 형식으로 변환
+        
+        Args:
+            script_result: 스크립트 분석 결과 딕셔너리
+            target_db: 타겟 데이터베이스 이름
+            
+        Returns:
+            Markdown 형식의 문자열
+        """
+        md = []
+        
+        # 제목
+        md.append("# SQL 스크립트 분석 리포트\n")
+        md.append(f"**타겟 데이터베이스**: {target_db}\n")
+        
+        # 전체 요약
+        md.append("## 전체 요약\n")
+        md.append(f"- **전체 문장 수**: {script_result['total_statements']}")
+        md.append(f"- **분석 성공**: {script_result['analyzed_statements']}")
+        md.append(f"- **분석 실패**: {script_result['failed_statements']}")
+        if 'distinct_statements' in script_result:
+            md.append(f"- **고유 SQL 형태 수**: {script_result['distinct_statements']}")
+        md.append("")
+        
+        # 문장 유형별 통계
+        if script_result.get('statistics'):
+            md.append("## 문장 유형별 통계\n")
+            md.append("| 문장 유형 | 개수 |")
+            md.append("|----------|------|")
+            for stmt_type, count in sorted(script_result['statistics'].items()):
+                md.append(f"| {stmt_type} | {count} |")
+            md.append("")
+        
+        # 복잡도 요약
+        if script_result.get('summary'):
+            summary = script_result['summary']
+            md.append("## 복잡도 요약\n")
+            md.append(f"- **평균 복잡도**: {summary.get('average_score', 0):.2f}")
+            md.append(f"- **최대 복잡도**: {summary.get('max_score', 0):.2f}")
+            md.append(f"- **최소 복잡도**: {summary.get('min_score', 0):.2f}\n")
+            
+            # 복잡도 분포
+            if summary.get('complexity_distribution'):
+                dist = summary['complexity_distribution']
+                md.append("### 복잡도 분포\n")
+                md.append("| 복잡도 레벨 | 문장 수 |")
+                md.append("|------------|---------|")
+                md.append(f"| 매우 간단 (0-1) | {dist.get('very_simple', 0)} |")
+                md.append(f"| 간단 (1-3) | {dist.get('simple', 0)} |")
+                md.append(f"| 중간 (3-5) | {dist.get('moderate', 0)} |")
+                md.append(f"| 복잡 (5-7) | {dist.get('complex', 0)} |")
+                md.append(f"| 매우 복잡 (7-9) | {dist.get('very_complex', 0)} |")
+                md.append(f"| 극도로 복잡 (9-10) | {dist.get('extremely_complex', 0)} |")
+                md.append("")
+        
+        # 반복 SQL 형태 (리터럴만 다른 문장)
+        repeated = [fp for fp in script_result.get('fingerprints', []) if fp['occurrences'] > 1]
+        if repeated:
+            md.append("## 🔁 반복 SQL 형태\n")
+            md.append("| Fingerprint | 유형 | 출현 횟수 | 첫 문장 # | 정규화 점수 |")
+            md.append("|-------------|------|----------|----------|-------------|")
+            for fp in repeated[:20]:
+                score = '-' if fp['normalized_score'] is None else f"{fp['normalized_score']:.2f}"
+                md.append(
+                    f"| `{fp['fingerprint']}` | {fp['statement_type']} | {fp['occurrences']} "
+                    f"| {fp['first_statement_index']} | {score} |"
+                )
+            md.append("")
+        
+        # 개별 문장 분석 결과
+        if script_result.get('results'):
+            md.append("## 📝 개별 문장 분석 결과\n")
+            md.append("| # | 유형 | 라인 범위 | 정규화 점수 | 복잡도 레벨 | Oracle 특화 기능 |")
+            md.append("|---|------|----------|-------------|-------------|------------------|")
+            for stmt_result in script_result['results']:
+                analysis = stmt_result['analysis']
+                features = ', '.join(
+                    analysis.detected_oracle_features + analysis.detected_oracle_functions
+                ) or '-'
+                md.append(
+                    f"| {stmt_result['statement_index']} | {stmt_result['statement_type']} "
+                    f"| {stmt_result['line_range']} | {analysis.normalized_score:.2f} "
+                    f"| {analysis.complexity_level.value} | {features} |"
+                )
+            md.append("")
+        
+        # 분석 실패 문장
+        if script_result.get('failed'):
+            md.append("## ⚠️ 분석 실패 문장\n")
+            md.append("| # | 유형 | 라인 범위 | Error |")
+            md.append("|---|------|----------|-------|")
+            for failed in script_result['failed']:
+                md.append(
+                    f"| {failed['statement_index']} | {failed['statement_type']} "
+                    f"| {failed['line_range']} | {failed['error']} |"
+                )
+            md.append("")
+        
+        return "\n".join(md)
+    
+    @staticmethod
+    def subprograms_to_json(subprogram_result: dict) -> str:
+        """패키지/타입 바디 서브프로그램 단위 분석 결과를 JSON 형식으로 변환
+        
+        Args:
+            subprogram_result: 서브프로그램 분석 결과 딕셔너리
+            
+        Returns:
+            JSON 형식의 문자열
+        """
+        serializable_result = {
+            'result_type': 'plsql_subprograms',
+            'object_type': subprogram_result['object_type'],
+            'object_name': subprogram_result['object_name'],
+            'total_subprograms': subprogram_result['total_subprograms'],
+            'analyzed_subprograms': subprogram_result['analyzed_subprograms'],
+            'failed_subprograms': subprogram_result['failed_subprograms'],
+            'statistics': subprogram_result.get('statistics', {}),
+            'summary': subprogram_result.get('summary', {}),
+            'results': [],
+            'failed': subprogram_result.get('failed', [])
+        }
+        
+        # 개별 서브프로그램 결과 변환
+        for sub_result in subprogram_result.get('results', []):
+            serializable_result['results'].append({
+                'subprogram_index': sub_result['subprogram_index'],
+                'subprogram_type': sub_result['subprogram_type'],
+                'subprogram_name': sub_result['subprogram_name'],
+                'line_range': sub_result['line_range'],
+                'analysis': json.loads(ResultFormatter.to_json(sub_result['analysis']))
+            })
+        
+        return json.dumps(serializable_result, indent=2, ensure_ascii=False)
+    
+    @staticmethod
+    def subprograms_to_markdown(subprogram_result: dict, target_db: str = "PostgreSQL") -> str:
+        """패키지/타입 바디 서브프로그램 단위 분석 결과를 Markdown 형식으로 변환
+        
+        Args:
+            subprogram_result: 서브프로그램 분석 결과 딕셔너리
+            target_db: 타겟 데이터베이스 이름
+            
+        Returns:
+            Markdown 형식의 문자열
+        """
+        md = []
+        
+        # 제목
+        md.append(f"# {subprogram_result['object_type']} 서브프로그램 분석 리포트\n")
+        md.append(f"**오브젝트**: {subprogram_result['object_name']}")
+        md.append(f"**타겟 데이터베이스**: {target_db}\n")
+        
+        # 전체 요약
+        md.append("## 전체 요약\n")
+        md.append(f"- **전체 서브프로그램 수**: {subprogram_result['total_subprograms']}")
+        md.append(f"- **분석 성공**: {subprogram_result['analyzed_subprograms']}")
+        md.append(f"- **분석 실패**: {subprogram_result['failed_subprograms']}\n")
+        
+        # 서브프로그램 유형별 통계
+        if subprogram_result.get('statistics'):
+            md.append("## 서브프로그램 유형별 통계\n")
+            md.append("| 유형 | 개수 |")
+            md.append("|------|------|")
+            for sub_type, count in sorted(subprogram_result['statistics'].items()):
+                md.append(f"| {sub_type} | {count} |")
+            md.append("")
+        
+        # 바디 단위 롤업
+        if subprogram_result.get('summary'):
+            summary = subprogram_result['summary']
+            md.append("## 복잡도 롤업\n")
+            md.append(f"- **평균 복잡도**: {summary.get('average_score', 0):.2f}")
+            md.append(f"- **라인 가중 평균 복잡도**: {summary.get('weighted_average_score', 0):.2f}")
+            md.append(f"- **최대 복잡도**: {summary.get('max_score', 0):.2f}")
+            md.append(f"- **최소 복잡도**: {summary.get('min_score', 0):.2f}")
+            md.append(f"- **전체 라인 수**: {summary.get('total_lines', 0)}\n")
+            
+            # 복잡도 분포
+            if summary.get('complexity_distribution'):
+                dist = summary['complexity_distribution']
+                md.append("### 복잡도 분포\n")
+                md.append("| 복잡도 레벨 | 서브프로그램 수 |")
+                md.append("|------------|----------------|")
+                md.append(f"| 매우 간단 (0-1) | {dist.get('very_simple', 0)} |")
+                md.append(f"| 간단 (1-3) | {dist.get('simple', 0)} |")
+                md.append(f"| 중간 (3-5) | {dist.get('moderate', 0)} |")
+                md.append(f"| 복잡 (5-7) | {dist.get('complex', 0)} |")
+                md.append(f"| 매우 복잡 (7-9) | {dist.get('very_complex', 0)} |")
+                md.append(f"| 극도로 복잡 (9-10) | {dist.get('extremely_complex', 0)} |")
+                md.append("")
+            
+            # 복잡도 상위 서브프로그램
+            if summary.get('hotspots'):
+                md.append("### 🔥 복잡도 상위 서브프로그램\n")
+                md.append("| 이름 | 유형 | 라인 범위 | 정규화 점수 |")
+                md.append("|------|------|----------|-------------|")
+                for hotspot in summary['hotspots']:
+                    md.append(
+                        f"| {hotspot['subprogram_name']} | {hotspot['subprogram_type']} "
+                        f"| {hotspot['line_range']} | {hotspot['normalized_score']:.2f} |"
+                    )
+                md.append("")
+        
+        # 개별 서브프로그램 분석 결과
+        if subprogram_result.get('results'):
+            md.append("## 📝 개별 서브프로그램 분석 결과\n")
+            md.append("| # | 이름 | 유형 | 라인 범위 | 정규화 점수 | 복잡도 레벨 | Oracle 특화 기능 |")
+            md.append("|---|------|------|----------|-------------|-------------|------------------|")
+            for sub_result in subprogram_result['results']:
+                analysis = sub_result['analysis']
+                features = ', '.join(analysis.detected_oracle_features) or '-'
+                md.append(
+                    f"| {sub_result['subprogram_index']} | {sub_result['subprogram_name']} "
+                    f"| {sub_result['subprogram_type']} | {sub_result['line_range']} "
+                    f"| {analysis.normalized_score:.2f} | {analysis.complexity_level.value} "
+                    f"| {features} |"
+                )
+            md.append("")
+        
+        # 분석 실패 서브프로그램
+        if subprogram_result.get('failed'):
+            md.append("## ⚠️ 분석 실패 서브프로그램\n")
+            md.append("| # | 이름 | 라인 범위 | Error |")
+            md.append("|---|------|----------|-------|")
+            for failed in subprogram_result['failed']:
+                md.append(
+                    f"| {failed['subprogram_index']} | {failed['subprogram_name']} "
+                    f"| {failed['line_range']} | {failed['error']} |"
+                )
+            md.append("")
+        
+        return "\n".join(md)
@@ -11,15 +11,18 @@ import sys
 import os
 import json
 import logging
+import time
 from pathlib import Path
 from typing import Optional, List, Union, Dict, Any
 
 from ..dbcsi.parser import StatspackParser, AWRParser
+from ..dbcsi.parsers import open_report_file
 from ..dbcsi.models import StatspackData, AWRData
-from ..oracle_complexity_analyzer import OracleComplexityAnalyzer
+from ..oracle_complexity_analyzer import OracleComplexityAnalyzer, PLSQLAnalysisResult, SQLAnalysisResult
 from ..utils.cli_helpers import detect_file_type, print_progress
 from ..utils.file_utils import find_files_by_extension, read_file_with_encoding
 from ..utils.logging_utils import setup_cli_logging, log_progress, get_logger
+from ..utils.metrics import MetricsRecorder, collect_stages, metrics_stage, peak_rss_bytes, stage_timer
 from .integrator import AnalysisResultIntegrator
 from .decision_engine import MigrationDecisionEngine
 from .report_generator import RecommendationReportGenerator
@@ -57,6 +60,9 @@ def create_parser() -> argparse.ArgumentParser:
   
   # 레거시 방식: DBCSI 파일과 SQL 디렉토리 직접 지정
   %(prog)s --dbcsi sample.out --sql-dir ./sql_files/
+  
+  # 처리량 지표를 JSON Lines로 기록
+  %(prog)s --reports-dir reports/sample_code --metrics-out metrics.jsonl
         """
     )
     
@@ -117,6 +123,15 @@ def create_parser() -> argparse.ArgumentParser:
         help="리포트 언어 (기본값: ko)"
     )
     
+    # 처리량 지표 기록 옵션
+    parser.add_argument(
+        "--metrics-out",
+        type=str,
+        metavar="PATH",
+        help="처리량 지표를 JSON Lines로 기록 (리포트 검색/파싱/전략 결정/리포트 생성 단계별 시간, "
+             "리포트별 처리 시간·크기·객체 수, 마지막 줄에 실행 요약)"
+    )
+    
     return parser
 
 
@@ -182,6 +197,34 @@ def validate_args(args: argparse.Namespace) -> None:
 # find_reports_in_directory는 report_parser.py로 이동
 
 
+def _record_report(metrics: Optional[MetricsRecorder], path: Union[str, Path], start: float,
+                   objects: int = 0, stages: Optional[Dict[str, float]] = None,
+                   error: Optional[str] = None) -> None:
+    """
+    파일(리포트) 하나의 처리 결과를 처리량 지표에 기록합니다 (지표 기록기가 없으면 무시).
+    
+    Args:
+        metrics: 처리량 지표 기록기
+        path: 파일 경로
+        start: 처리 시작 시각 (time.perf_counter())
+        objects: 파일에서 얻은 분석 결과 수
+        stages: 단계별 시간 (None이면 처리 시간 전체를 parse 단계로 기록)
+        error: 에러 메시지 (실패한 경우)
+    """
+    if metrics is None:
+        return
+    seconds = time.perf_counter() - start
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        size = 0
+    metrics.record_file(
+        str(path), seconds, size=size, objects=objects, error=error,
+        stages=stages if stages is not None else {"parse": seconds},
+        worker=os.getpid(), rss=peak_rss_bytes()
+    )
+
+
 def parse_dbcsi_file(filepath: str) -> Optional[Union[StatspackData, AWRData]]:
     """
     DBCSI 파일을 파싱합니다.
@@ -193,14 +236,16 @@ def parse_dbcsi_file(filepath: str) -> Optional[Union[StatspackData, AWRData]]:
         StatspackData 또는 AWRData, 실패 시 None
     """
     try:
-        file_type = detect_file_type(filepath)
+        # 파일을 한 번 읽어 타입 감지와 파싱에 함께 사용
+        source = open_report_file(filepath)
+        file_type = detect_file_type(filepath, source)
         
         if file_type == "awr":
             logger.info("DBCSI 파일 타입: AWR")
-            parser = AWRParser(filepath)
+            parser = AWRParser(filepath, source)
         else:
             logger.info("DBCSI 파일 타입: Statspack")
-            parser = StatspackParser(filepath)
+            parser = StatspackParser(filepath, source)
         
         return parser.parse()
         
@@ -209,12 +254,13 @@ def parse_dbcsi_file(filepath: str) -> Optional[Union[StatspackData, AWRData]]:
         return None
 
 
-def analyze_sql_files(sql_dir: str) -> tuple:
+def analyze_sql_files(sql_dir: str, metrics: Optional[MetricsRecorder] = None) -> tuple:
     """
     SQL/PL-SQL 파일들을 분석합니다.
     
     Args:
         sql_dir: SQL 파일이 있는 디렉토리 경로
+        metrics: 처리량 지표 기록기 (선택사항, 파일 검색과 파일별 처리 시간 기록)
         
     Returns:
         (sql_results, plsql_results) 튜플
@@ -222,7 +268,10 @@ def analyze_sql_files(sql_dir: str) -> tuple:
     analyzer = OracleComplexityAnalyzer()
     
     # SQL 파일 찾기 (유틸리티 함수 사용)
-    sql_files = find_files_by_extension(Path(sql_dir), [".sql", ".pls"])
+    with metrics_stage(metrics, "discovery") as fields:
+        sql_files = find_files_by_extension(Path(sql_dir), [".sql", ".pls"])
+        if fields is not None:
+            fields["items"] = len(sql_files)
     
     if not sql_files:
         logger.warning("SQL/PL-SQL 파일을 찾을 수 없습니다")
@@ -230,35 +279,41 @@ def analyze_sql_files(sql_dir: str) -> tuple:
     
     logger.info(f"발견된 SQL/PL-SQL 파일: {len(sql_files)}개")
     
-    sql_results = []
-    plsql_results = []
+    sql_results: List[SQLAnalysisResult] = []
+    plsql_results: List[PLSQLAnalysisResult] = []
     
     for sql_file in sql_files:
-        try:
-            # 유틸리티 함수로 파일 읽기 (여러 인코딩 시도)
-            content = read_file_with_encoding(sql_file)
-            
-            # SQL 분석 (단일 결과 반환)
+        start = time.perf_counter()
+        analyzed = len(sql_results) + len(plsql_results)
+        with collect_stages() as stages:
             try:
-                sql_result = analyzer.analyze_sql(content)
-                if sql_result:
-                    sql_results.append(sql_result)
-            except Exception as e:
-                # SQL 분석 실패는 무시 (PL/SQL일 수 있음)
-                pass
-            
-            # PL/SQL 분석 (단일 결과 반환)
-            try:
-                plsql_result = analyzer.analyze_plsql(content)
-                if plsql_result:
-                    plsql_results.append(plsql_result)
-            except Exception as e:
-                # PL/SQL 분석 실패는 무시 (SQL일 수 있음)
-                pass
+                # 유틸리티 함수로 파일 읽기 (여러 인코딩 시도)
+                with stage_timer("read"):
+                    content = read_file_with_encoding(sql_file)
+                
+                # SQL 분석 (단일 결과 반환)
+                try:
+                    sql_result = analyzer.analyze_sql(content)
+                    if sql_result:
+                        sql_results.append(sql_result)
+                except Exception as e:
+                    # SQL 분석 실패는 무시 (PL/SQL일 수 있음)
+                    pass
                 
-        except Exception as e:
-            logger.warning(f"파일 읽기 실패 ({sql_file}): {e}", exc_info=True)
-            continue
+                # PL/SQL 분석 (단일 결과 반환)
+                try:
+                    plsql_result = analyzer.analyze_plsql(content)
+                    if plsql_result:
+                        plsql_results.append(plsql_result)
+                except Exception as e:
+                    # PL/SQL 분석 실패는 무시 (SQL일 수 있음)
+                    pass
+                    
+            except Exception as e:
+                logger.warning(f"파일 읽기 실패 ({sql_file}): {e}", exc_info=True)
+                _record_report(metrics, sql_file, start, stages=stages, error=str(e))
+                continue
+        _record_report(metrics, sql_file, start, len(sql_results) + len(plsql_results) - analyzed, stages)
     
     logger.info(f"분석 완료: SQL {len(sql_results)}개, PL/SQL {len(plsql_results)}개")
     
@@ -287,6 +342,16 @@ def main() -> int:
     # 인자 검증
     validate_args(args)
     
+    # 처리량 지표 기록기 (--metrics-out)
+    metrics = None
+    if getattr(args, 'metrics_out', None):
+        metrics = MetricsRecorder(args.metrics_out, "migration-recommend", config={
+            "reports_dir": args.reports_dir,
+            "dbcsi": args.dbcsi,
+            "sql_dir": args.sql_dir,
+            "format": args.format,
+        })
+    
     try:
         # reports-dir 모드
         if args.reports_dir:
@@ -298,7 +363,10 @@ def main() -> int:
             
             # 1. 리포트 파일 검색
             log_progress(logger, 1, 5, f"리포트 파일 검색 중: {args.reports_dir}")
-            reports_by_target = find_reports_by_target(args.reports_dir)
+            with metrics_stage(metrics, "discovery") as fields:
+                reports_by_target = find_reports_by_target(args.reports_dir)
+                if fields is not None:
+                    fields["items"] = sum(len(paths) for paths in reports_by_target.values())
             
             has_reports = (
                 reports_by_target['dbcsi'] or 
@@ -313,14 +381,14 @@ def main() -> int:
             log_progress(logger, 2, 5, "리포트 파일 파싱 중...")
             report_parser = ReportParser()
             
-            # 타겟별 리포트 검색
-            reports_by_target = find_reports_by_target(args.reports_dir)
-            
             # DBCSI 리포트 파싱 (메트릭만 추출)
             dbcsi_metrics = None
             if reports_by_target['dbcsi']:
                 logger.info(f"DBCSI 리포트 파싱: {reports_by_target['dbcsi'][0]}")
+                start = time.perf_counter()
                 dbcsi_metrics = report_parser.parse_dbcsi_metrics(reports_by_target['dbcsi'][0])
+                _record_report(metrics, reports_by_target['dbcsi'][0], start, 1 if dbcsi_metrics else 0,
+                               error=None if dbcsi_metrics else "DBCSI 메트릭 추출 실패")
                 if not dbcsi_metrics:
                     logger.warning("DBCSI 메트릭 추출 실패 (성능 메트릭 제외)")
             
@@ -338,6 +406,7 @@ def main() -> int:
                 logger.info(f"PostgreSQL 복잡도 리포트 파싱: {len(reports_by_target['postgresql'])}개")
                 # 요약 정보도 함께 파싱
                 for report_path in reports_by_target['postgresql']:
+                    start = time.perf_counter()
                     if report_path.endswith('.md'):
                         sql, plsql, summary = report_parser.complexity_parser.parse_plsql_complexity_markdown_with_summary(
                             report_path, "postgresql"
@@ -359,16 +428,19 @@ def main() -> int:
                         sql, plsql = report_parser.parse_sql_complexity_reports([report_path], "postgresql")
                         sql_results.extend(sql)
                         plsql_results.extend(plsql)
+                    _record_report(metrics, report_path, start, len(sql) + len(plsql))
             
-            # MySQL 복잡도 리포트 파싱
+            # MySQL 복잡도 리포트 파싱 (리포트별 처리 시간을 기록하도록 한 개씩 파싱)
             sql_results_mysql = []
             plsql_results_mysql = []
             if reports_by_target['mysql']:
                 logger.info(f"MySQL 복잡도 리포트 파싱: {len(reports_by_target['mysql'])}개")
-                sql_results_mysql, plsql_results_mysql = report_parser.parse_sql_complexity_reports(
-                    reports_by_target['mysql'],
-                    "mysql"
-                )
+                for report_path in reports_by_target['mysql']:
+                    start = time.perf_counter()
+                    sql, plsql = report_parser.parse_sql_complexity_reports([report_path], "mysql")
+                    sql_results_mysql.extend(sql)
+                    plsql_results_mysql.extend(plsql)
+                    _record_report(metrics, report_path, start, len(sql) + len(plsql))
             
             # PostgreSQL 또는 MySQL 리포트 중 하나라도 있어야 함
             has_postgresql = sql_results or plsql_results
@@ -423,31 +495,34 @@ def main() -> int:
                     dbcsi_metrics['awr_type_count'] = type_count
             
             integrator = AnalysisResultIntegrator()
-            integrated_result = integrator.integrate(
-                dbcsi_result=None,
-                sql_analysis=sql_results,
-                plsql_analysis=plsql_results,
-                dbcsi_metrics=dbcsi_metrics,
-                sql_analysis_mysql=sql_results_mysql,
-                plsql_analysis_mysql=plsql_results_mysql
-            )
+            with metrics_stage(metrics, "score", step="integrate"):
+                integrated_result = integrator.integrate(
+                    dbcsi_result=None,
+                    sql_analysis=sql_results,
+                    plsql_analysis=plsql_results,
+                    dbcsi_metrics=dbcsi_metrics,
+                    sql_analysis_mysql=sql_results_mysql,
+                    plsql_analysis_mysql=plsql_results_mysql
+                )
             log_progress(logger, 3, 5, "통합 완료")
             
             # 4. 마이그레이션 전략 결정 및 리포트 생성
             log_progress(logger, 4, 5, "마이그레이션 전략 결정 중...")
             decision_engine = MigrationDecisionEngine()
             report_generator = RecommendationReportGenerator(decision_engine)
-            recommendation = report_generator.generate_recommendation(integrated_result)
+            with metrics_stage(metrics, "score", step="decision"):
+                recommendation = report_generator.generate_recommendation(integrated_result)
             logger.info(f"추천 전략: {recommendation.recommended_strategy.value}")
             
             # 5. 리포트 포맷팅
             log_progress(logger, 5, 5, "리포트 생성 중...")
-            if args.format == "json":
-                formatter = JSONReportFormatter()
-                output = formatter.format(recommendation)
-            else:  # markdown
-                formatter = MarkdownReportFormatter()
-                output = formatter.format(recommendation, args.language)
+            with metrics_stage(metrics, "export", step="format"):
+                if args.format == "json":
+                    formatter = JSONReportFormatter()
+                    output = formatter.format(recommendation)
+                else:  # markdown
+                    formatter = MarkdownReportFormatter()
+                    output = formatter.format(recommendation, args.language)
             
             log_progress(logger, 5, 5, "리포트 생성 완료")
         
@@ -457,7 +532,10 @@ def main() -> int:
             dbcsi_result = None
             if args.dbcsi:
                 log_progress(logger, 1, 5, f"DBCSI 파일 파싱 중: {args.dbcsi}")
+                start = time.perf_counter()
                 dbcsi_result = parse_dbcsi_file(args.dbcsi)
+                _record_report(metrics, args.dbcsi, start, 1 if dbcsi_result else 0,
+                               error=None if dbcsi_result else "DBCSI 파싱 실패")
                 if dbcsi_result:
                     log_progress(logger, 1, 5, "DBCSI 파싱 완료")
                 else:
@@ -467,7 +545,7 @@ def main() -> int:
             
             # 2. SQL/PL-SQL 파일 분석
             log_progress(logger, 2, 5, f"SQL/PL-SQL 파일 분석 중: {args.sql_dir}")
-            sql_results, plsql_results = analyze_sql_files(args.sql_dir)
+            sql_results, plsql_results = analyze_sql_files(args.sql_dir, metrics)
             
             if not sql_results and not plsql_results:
                 logger.error("분석할 SQL/PL-SQL 코드가 없습니다")
@@ -478,24 +556,27 @@ def main() -> int:
             # 3. 분석 결과 통합
             log_progress(logger, 3, 5, "분석 결과 통합 중...")
             integrator = AnalysisResultIntegrator()
-            integrated_result = integrator.integrate(dbcsi_result, sql_results, plsql_results)
+            with metrics_stage(metrics, "score", step="integrate"):
+                integrated_result = integrator.integrate(dbcsi_result, sql_results, plsql_results)
             log_progress(logger, 3, 5, "통합 완료")
             
             # 4. 마이그레이션 전략 결정 및 리포트 생성
             log_progress(logger, 4, 5, "마이그레이션 전략 결정 중...")
             decision_engine = MigrationDecisionEngine()
             report_generator = RecommendationReportGenerator(decision_engine)
-            recommendation = report_generator.generate_recommendation(integrated_result)
+            with metrics_stage(metrics, "score", step="decision"):
+                recommendation = report_generator.generate_recommendation(integrated_result)
             logger.info(f"추천 전략: {recommendation.recommended_strategy.value}")
             
             # 5. 리포트 포맷팅
             log_progress(logger, 5, 5, "리포트 생성 중...")
-            if args.format == "json":
-                formatter = JSONReportFormatter()
-                output = formatter.format(recommendation)
-            else:  # markdown
-                formatter = MarkdownReportFormatter()
-                output = formatter.format(recommendation, args.language)
+            with metrics_stage(metrics, "export", step="format"):
+                if args.format == "json":
+                    formatter = JSONReportFormatter()
+                    output = formatter.format(recommendation)
+                else:  # markdown
+                    formatter = MarkdownReportFormatter()
+                    output = formatter.format(recommendation, args.language)
             
             log_progress(logger, 5, 5, "리포트 생성 완료")
         
@@ -505,8 +586,9 @@ def main() -> int:
             output_path = Path(args.output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(output)
+            with metrics_stage(metrics, "export", step="write"):
+                with open(args.output, 'w', encoding='utf-8') as f:
+                    f.write(output)
             logger.info(f"결과 저장 완료: {args.output}")
         else:
             print(output)
@@ -516,6 +598,11 @@ def main() -> int:
     except Exception as e:
         logger.error(f"처리 중 예외 발생: {e}", exc_info=True)
         return 1
+    
+    finally:
+        if metrics is not None:
+            metrics.close()
+            logger.info(f"처리량 지표 저장 완료: {args.metrics_out}")
 
 
 if __name__ == "__main__":
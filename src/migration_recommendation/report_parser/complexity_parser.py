@@ -10,9 +10,14 @@ from typing import List, Optional, Dict, Any, Tuple
 
 from ...oracle_complexity_analyzer.data_models import SQLAnalysisResult, PLSQLAnalysisResult
 from ...oracle_complexity_analyzer.enums import TargetDatabase, ComplexityLevel, PLSQLObjectType
+from .utils import iter_sections
 
 logger = logging.getLogger(__name__)
 
+# 개별 객체 섹션 헤더 (### 1. 객체명) 및 다음 섹션 경계
+_OBJECT_HEADER_RE = re.compile(r'###\s*\d+\.\s*([^\n]+)\n')
+_OBJECT_BOUNDARY_RE = re.compile(r'###\s*\d+\.|$')
+
 
 class ComplexityReportParser:
     """복잡도 리포트 파서
@@ -135,11 +140,9 @@ class ComplexityReportParser:
         """개별 객체 분석 결과 파싱"""
         results: List[PLSQLAnalysisResult] = []
         
-        object_pattern = r'###\s*\d+\.\s*([^\n]+)\n(.*?)(?=###\s*\d+\.|$)'
-        matches = re.findall(object_pattern, content, re.DOTALL)
-        
-        for obj_name, obj_content in matches:
-            obj_name = obj_name.strip()
+        for header, end in iter_sections(content, _OBJECT_HEADER_RE, _OBJECT_BOUNDARY_RE):
+            obj_name = header.group(1).strip()
+            obj_content = content[header.end():end]
             
             type_match = re.search(r'\*\*타입\*\*:\s*(\w+(?:\s+\w+)?)', obj_content)
             obj_type_str = type_match.group(1) if type_match else "PROCEDURE"
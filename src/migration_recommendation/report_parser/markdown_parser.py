@@ -10,10 +10,14 @@ from typing import List, Optional, Dict, Any, Tuple
 
 from ...oracle_complexity_analyzer.data_models import SQLAnalysisResult, PLSQLAnalysisResult
 from ...oracle_complexity_analyzer.enums import TargetDatabase, ComplexityLevel, PLSQLObjectType
-from .utils import parse_number_with_comma
+from .utils import iter_sections, parse_number_with_comma
 
 logger = logging.getLogger(__name__)
 
+# RAC 인스턴스별 섹션 헤더 (### 인스턴스 1) 및 다음 섹션 경계
+_INSTANCE_HEADER_RE = re.compile(r'###\s*인스턴스\s*\d+')
+_INSTANCE_BOUNDARY_RE = re.compile(r'###\s*인스턴스|\Z')
+
 
 class MarkdownReportParser:
     """Markdown 리포트 파서
@@ -245,8 +249,10 @@ class MarkdownReportParser:
                 break
         
         # RAC 환경에서 여러 인스턴스의 권장 SGA 중 최대값 찾기
-        instance_pattern = r'###\s*인스턴스\s*\d+.*?(?=###\s*인스턴스|\Z)'
-        instance_matches = re.findall(instance_pattern, content, re.DOTALL)
+        instance_matches = [
+            content[header.start():end]
+            for header, end in iter_sections(content, _INSTANCE_HEADER_RE, _INSTANCE_BOUNDARY_RE)
+        ]
         
         if len(instance_matches) > 1:
             max_recommended_mb = 0
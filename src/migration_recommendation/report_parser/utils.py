@@ -7,7 +7,7 @@
 import re
 import logging
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Match, Optional, Pattern, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +36,33 @@ def parse_number_with_comma(value_str: str) -> Optional[float]:
     return None
 
 
+def iter_sections(content: str, header: Pattern, boundary: Pattern) -> Iterator[Tuple[Match, int]]:
+    """헤더로 시작하는 섹션을 순서대로 반환
+    
+    `헤더(.*?)(?=경계)` (DOTALL) 정규식의 findall과 같은 구간을 선형 시간으로 찾습니다.
+    각 섹션 본문은 헤더 매칭 끝부터 다음 경계 매칭 시작까지입니다.
+    
+    Args:
+        content: 리포트 내용
+        header: 섹션 헤더 패턴
+        boundary: 섹션 끝 경계 패턴 (항상 매칭되도록 끝 앵커 포함)
+        
+    Yields:
+        (헤더 매칭, 본문 끝 위치) 튜플
+    """
+    pos = 0
+    while True:
+        header_match = header.search(content, pos)
+        if header_match is None:
+            return
+        
+        boundary_match = boundary.search(content, header_match.end())
+        end = boundary_match.start() if boundary_match else len(content)
+        yield header_match, end
+        
+        pos = max(end, header_match.start() + 1)
+
+
 def find_reports_in_directory(reports_dir: str) -> Tuple[List[str], List[str]]:
     """
     리포트 디렉토리에서 DBCSI 리포트와 SQL 복잡도 리포트를 찾습니다.
@@ -30,8 +30,10 @@ from .enums import (
 # 데이터 모델
 from .data_models import (
     SQLAnalysisResult,
+    SQLFeatureVector,
     PLSQLAnalysisResult,
     BatchAnalysisResult,
+    SourceRef,
     WeightConfig,
 )
 
@@ -45,6 +47,14 @@ from .constants import (
     PLSQL_ADVANCED_FEATURES,
     EXTERNAL_DEPENDENCIES,
     EXTERNAL_DEPENDENCY_SCORES,
+    DATA_VOLUME_LENGTH_THRESHOLDS,
+    DETECTOR_TIME_LIMIT,
+    DETECTOR_MAX_SCAN_CHARS,
+    ORACLE_SYNTAX_MATCHER,
+    ORACLE_FUNCTION_MATCHER,
+    ANALYTIC_FUNCTION_MATCHER,
+    AGGREGATE_FUNCTION_MATCHER,
+    ORACLE_HINT_MATCHER,
 )
 
 # 가중치 설정 (weights.py에서 import)
@@ -61,11 +71,18 @@ from .analyzer import OracleComplexityAnalyzer
 # 배치 분석기
 from .batch_analyzer import BatchAnalyzer
 
+# 분석 결과 캐시
+from .analysis_cache import AnalysisCache, RULES_VERSION
+
+# 원본 소스 참조
+from .source_ref import SourceIndex, slim_result
+
 # 파일 감지 유틸리티
 from .file_detector import (
     is_plsql,
     is_batch_plsql,
     detect_file_type,
+    detect_file_type_lines,
 )
 
 # 내보내기 유틸리티
@@ -91,8 +108,10 @@ __all__ = [
     "PLSQLObjectType",
     # Data Models
     "SQLAnalysisResult",
+    "SQLFeatureVector",
     "PLSQLAnalysisResult",
     "BatchAnalysisResult",
+    "SourceRef",
     "WeightConfig",
     # Constants
     "ORACLE_SPECIFIC_SYNTAX",
@@ -103,6 +122,14 @@ __all__ = [
     "PLSQL_ADVANCED_FEATURES",
     "EXTERNAL_DEPENDENCIES",
     "EXTERNAL_DEPENDENCY_SCORES",
+    "DATA_VOLUME_LENGTH_THRESHOLDS",
+    "DETECTOR_TIME_LIMIT",
+    "DETECTOR_MAX_SCAN_CHARS",
+    "ORACLE_SYNTAX_MATCHER",
+    "ORACLE_FUNCTION_MATCHER",
+    "ANALYTIC_FUNCTION_MATCHER",
+    "AGGREGATE_FUNCTION_MATCHER",
+    "ORACLE_HINT_MATCHER",
     # Weights and Scores
     "POSTGRESQL_WEIGHTS",
     "MYSQL_WEIGHTS",
@@ -111,10 +138,17 @@ __all__ = [
     # Analyzers
     "OracleComplexityAnalyzer",
     "BatchAnalyzer",
+    # Cache
+    "AnalysisCache",
+    "RULES_VERSION",
+    # Source References
+    "SourceIndex",
+    "slim_result",
     # File Detection Utilities
     "is_plsql",
     "is_batch_plsql",
     "detect_file_type",
+    "detect_file_type_lines",
     # Export Utilities
     "get_date_folder",
     "export_json",
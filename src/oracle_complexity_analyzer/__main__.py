@@ -11,16 +11,26 @@ Note:
 import sys
 import logging
 
+from typing import List, Optional
+
 from .cli import (
     create_parser,
+    create_merge_parser,
     analyze_single_file,
     analyze_directory,
+    merge_shards,
+    run_profiled,
 )
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     """CLI 메인 함수
     
+    첫 인자가 'merge'이면 샤드 부분 결과 병합 명령을 실행합니다.
+    
+    Args:
+        argv: 명령줄 인자 (None이면 sys.argv[1:])
+    
     Returns:
         int: 종료 코드 (0: 성공, 1: 실패)
     """
@@ -31,16 +41,24 @@ def main() -> int:
         handlers=[logging.StreamHandler(sys.stderr)]
     )
     
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == 'merge':
+        return merge_shards(create_merge_parser().parse_args(argv[1:]))
+    
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if args.file:
-        return analyze_single_file(args)
+        command = analyze_single_file
     elif args.directory:
-        return analyze_directory(args)
+        command = analyze_directory
     else:
         parser.print_help()
         return 1
+    
+    if args.profile:
+        return run_profiled(command, args)
+    return command(args)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,322 @@
+"""
+분석 결과 캐시 모듈
+
+소스 텍스트 해시 기반(content-addressed)으로 분석 결과를 저장하는 2단계 캐시입니다.
+- 1단계: 프로세스 내 LRU (직렬화된 결과 문자열)
+- 2단계: 출력 디렉토리의 SQLite 파일 (여러 실행/프로세스 간 공유)
+
+캐시 키에는 규칙 버전(constants.py, weights.py 내용 해시)이 포함되므로 가중치나
+감지 규칙이 바뀌면 이전 항목은 자동으로 무효화됩니다.
+"""
+
+import dataclasses
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .enums import TargetDatabase
+
+# 로거 초기화
+logger = logging.getLogger(__name__)
+
+# 캐시 저장 형식 버전 (분석 결과 구조나 점수 계산 로직이 바뀌면 올림)
+CACHE_SCHEMA_VERSION = 3
+
+# 기본 캐시 파일명 (출력 디렉토리 아래 생성)
+DEFAULT_CACHE_FILENAME = ".analysis_cache.sqlite3"
+
+# 결과 종류별 원본 소스 필드 (저장 시 비우고 조회 시 복원)
+_SOURCE_FIELDS = {'sql': 'query', 'plsql': 'code'}
+
+
+def compute_rules_version() -> str:
+    """규칙 버전 계산
+
+    constants.py와 weights.py의 내용과 CACHE_SCHEMA_VERSION을 해시합니다.
+
+    Returns:
+        str: 규칙 버전 해시 (16자리 16진수)
+    """
+    digest = hashlib.sha256(f"schema={CACHE_SCHEMA_VERSION}".encode())
+    package_dir = Path(__file__).parent
+
+    for module_name in ('constants.py', 'weights.py'):
+        try:
+            digest.update((package_dir / module_name).read_bytes())
+        except OSError:
+            # 소스 파일을 읽을 수 없는 배포 형태에서는 모듈 값으로 대체
+            from . import constants, weights
+            module = constants if module_name == 'constants.py' else weights
+            digest.update(repr(sorted(vars(module).items(), key=lambda item: item[0])).encode())
+
+    return digest.hexdigest()[:16]
+
+
+# 현재 규칙 버전 (import 시점에 한 번 계산)
+RULES_VERSION = compute_rules_version()
+
+
+class _CacheState:
+    """프로세스별 캐시 상태 (SQLite 연결과 LRU)"""
+
+    def __init__(self):
+        self.memory: "OrderedDict[str, str]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.conn: Optional[sqlite3.Connection] = None
+        self.disk_enabled = True
+
+
+# 프로세스별 공유 상태
+# 워커 프로세스로 전달(pickle)된 캐시 인스턴스들이 같은 연결과 LRU를 재사용합니다.
+_PROCESS_STATE: Dict[Tuple[int, str, str], _CacheState] = {}
+
+
+class AnalysisCache:
+    """분석 결과 캐시
+
+    키는 (규칙 버전, 결과 종류, 타겟, 소스 텍스트)의 SHA-256 해시입니다.
+    소스 텍스트는 그대로 해시하므로(길이/줄 수도 점수에 영향) 내용이 같은 소스만
+    같은 결과를 공유합니다. 결과는 ResultFormatter의 JSON 형식으로 저장되며
+    원본 소스는 저장하지 않고 조회 시 입력값으로 복원합니다.
+
+    SQLite 연결과 LRU는 프로세스별로 공유되므로 인스턴스를 워커 프로세스로
+    전달(pickle)해도 작업마다 다시 연결하지 않습니다. 디스크 캐시 오류는 분석을
+    중단시키지 않으며, 경고를 남기고 메모리 캐시만 사용합니다.
+
+    Attributes:
+        db_path: SQLite 캐시 파일 경로
+        memory_size: 프로세스 내 LRU 최대 항목 수
+        rules_version: 캐시 키에 포함되는 규칙 버전
+        hits: 캐시 적중 횟수
+        misses: 캐시 미스 횟수
+    """
+
+    def __init__(self, db_path: Union[str, Path], memory_size: int = 1024,
+                 rules_version: Optional[str] = None):
+        """AnalysisCache 초기화
+
+        Args:
+            db_path: SQLite 캐시 파일 경로
+            memory_size: 프로세스 내 LRU 최대 항목 수 (기본값: 1024)
+            rules_version: 규칙 버전 (None이면 현재 RULES_VERSION 사용)
+        """
+        self.db_path = Path(db_path)
+        self.memory_size = memory_size
+        self.rules_version = rules_version or RULES_VERSION
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def for_output_dir(cls, output_dir: Union[str, Path], **kwargs) -> 'AnalysisCache':
+        """출력 디렉토리 아래 기본 캐시 파일을 사용하는 캐시 생성
+
+        Args:
+            output_dir: 리포트 출력 디렉토리
+            **kwargs: AnalysisCache 생성자 인자
+
+        Returns:
+            AnalysisCache: 캐시 인스턴스
+        """
+        return cls(Path(output_dir) / DEFAULT_CACHE_FILENAME, **kwargs)
+
+    @property
+    def _state(self) -> _CacheState:
+        """현재 프로세스의 캐시 상태"""
+        key = (os.getpid(), str(self.db_path), self.rules_version)
+        state = _PROCESS_STATE.get(key)
+        if state is None:
+            state = _PROCESS_STATE.setdefault(key, _CacheState())
+        return state
+
+    def make_key(self, kind: str, target: TargetDatabase, source: str) -> str:
+        """캐시 키 생성
+
+        Args:
+            kind: 결과 종류 ('sql' 또는 'plsql')
+            target: 타겟 데이터베이스
+            source: 분석 대상 소스 텍스트
+
+        Returns:
+            str: SHA-256 16진수 키
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{self.rules_version}\0{kind}\0{TargetDatabase(target).value}\0".encode())
+        digest.update(source.encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
+
+    def get(self, kind: str, target: TargetDatabase, source: str) -> Optional[Any]:
+        """캐시된 분석 결과 조회
+
+        Args:
+            kind: 결과 종류 ('sql' 또는 'plsql')
+            target: 타겟 데이터베이스
+            source: 분석 대상 소스 텍스트
+
+        Returns:
+            SQLAnalysisResult 또는 PLSQLAnalysisResult (없으면 None)
+        """
+        key = self.make_key(kind, target, source)
+        state = self._state
+
+        with state.lock:
+            payload = state.memory.get(key)
+            if payload is not None:
+                state.memory.move_to_end(key)
+
+        if payload is None:
+            payload = self._disk_get(key)
+            if payload is not None:
+                self._remember(key, payload)
+
+        if payload is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return self._deserialize(kind, payload, source)
+
+    def put(self, kind: str, target: TargetDatabase, source: str, result: Any) -> None:
+        """분석 결과 저장
+
+        Args:
+            kind: 결과 종류 ('sql' 또는 'plsql')
+            target: 타겟 데이터베이스
+            source: 분석 대상 소스 텍스트
+            result: SQLAnalysisResult 또는 PLSQLAnalysisResult
+        """
+        from src.formatters.result_formatter import ResultFormatter
+
+        key = self.make_key(kind, target, source)
+        payload = ResultFormatter.to_json(
+            dataclasses.replace(result, **{_SOURCE_FIELDS[kind]: '', 'source_ref': None})
+        )
+
+        self._remember(key, payload)
+        self._disk_put(key, payload)
+
+    def clear(self) -> None:
+        """메모리 및 디스크 캐시 전체 삭제"""
+        state = self._state
+        with state.lock:
+            state.memory.clear()
+
+        conn = self._connect()
+        if conn is not None:
+            try:
+                with conn:
+                    conn.execute("DELETE FROM analysis_cache")
+            except sqlite3.Error as e:
+                self._disable_disk(e)
+
+    def close(self) -> None:
+        """현재 프로세스의 SQLite 연결 종료"""
+        state = self._state
+        if state.conn is not None:
+            state.conn.close()
+            state.conn = None
+
+    def _remember(self, key: str, payload: str) -> None:
+        """프로세스 내 LRU에 저장"""
+        if self.memory_size <= 0:
+            return
+        state = self._state
+        with state.lock:
+            state.memory[key] = payload
+            state.memory.move_to_end(key)
+            while len(state.memory) > self.memory_size:
+                state.memory.popitem(last=False)
+
+    def _deserialize(self, kind: str, payload: str, source: str) -> Any:
+        """저장된 JSON을 결과 객체로 복원 (원본 소스 필드 복원 포함)"""
+        from src.formatters.result_formatter import ResultFormatter
+
+        result = ResultFormatter.from_json(payload, kind)
+        # 파서는 앞뒤 공백을 제거한 소스를 결과에 담으므로 동일하게 복원
+        setattr(result, _SOURCE_FIELDS[kind], source.strip())
+        return result
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """SQLite 연결 (프로세스별 지연 생성)"""
+        state = self._state
+        if not state.disk_enabled:
+            return None
+        if state.conn is not None:
+            return state.conn
+
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS analysis_cache ("
+                    " key TEXT PRIMARY KEY,"
+                    " result TEXT NOT NULL,"
+                    " created_at TEXT NOT NULL)"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cache_meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)"
+                )
+                # 규칙 버전이 바뀌었으면 이전 항목 정리
+                row = conn.execute(
+                    "SELECT value FROM cache_meta WHERE name = 'rules_version'"
+                ).fetchone()
+                if row is None or row[0] != self.rules_version:
+                    conn.execute("DELETE FROM analysis_cache")
+                    conn.execute(
+                        "INSERT OR REPLACE INTO cache_meta (name, value) VALUES ('rules_version', ?)",
+                        (self.rules_version,)
+                    )
+        except (sqlite3.Error, OSError) as e:
+            self._disable_disk(e)
+            return None
+
+        state.conn = conn
+        return conn
+
+    def _disk_get(self, key: str) -> Optional[str]:
+        """SQLite 캐시 조회"""
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT result FROM analysis_cache WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._disable_disk(e)
+            return None
+        return row[0] if row else None
+
+    def _disk_put(self, key: str, payload: str) -> None:
+        """SQLite 캐시 저장"""
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO analysis_cache (key, result, created_at) VALUES (?, ?, ?)",
+                    (key, payload, datetime.now().isoformat())
+                )
+        except sqlite3.Error as e:
+            self._disable_disk(e)
+
+    def _disable_disk(self, error: Exception) -> None:
+        """디스크 캐시 비활성화 (메모리 캐시만 사용)"""
+        logger.warning(f"분석 캐시 파일을 사용할 수 없어 메모리 캐시만 사용합니다: {self.db_path} ({error})")
+        state = self._state
+        state.disk_enabled = False
+        if state.conn is not None:
+            try:
+                state.conn.close()
+            except sqlite3.Error:
+                pass
+            state.conn = None
@@ -4,19 +4,165 @@ OracleComplexityAnalyzer 메인 클래스
 Oracle SQL 및 PL/SQL 코드의 복잡도를 분석하는 메인 클래스입니다.
 """
 
+import bisect
+import collections
+import concurrent.futures
+import dataclasses
+import itertools
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Union, Optional, Dict, List, Any
+from typing import Union, Optional, Callable, Dict, Iterable, Iterator, List, Any, Tuple
 
+from src.utils.file_utils import SourceFile
+from src.utils.metrics import stage_timer
 from .enums import TargetDatabase
 from .data_models import SQLAnalysisResult, PLSQLAnalysisResult
-from .file_detector import is_plsql, is_batch_plsql
+from .source_ref import SourceIndex
+from .file_detector import is_plsql, is_batch_plsql, detect_file_type_lines
+from .analysis_cache import AnalysisCache
+from .constants import DATA_VOLUME_LENGTH_THRESHOLDS
+from .detector_profile import profile_input
 from . import export_utils
 
 # 로거 초기화
 logger = logging.getLogger(__name__)
 
+# 스크립트 병렬 분석 시 워커 작업 하나에 담는 SQL 문 수
+STATEMENT_CHUNK_SIZE = 64
+
+# 워커당 동시에 제출해 두는 SQL 문 청크 수 (스트리밍 메모리 상한)
+STATEMENT_INFLIGHT_PER_WORKER = 2
+
+# 배치 PL/SQL 파일 여부를 판단할 때 먼저 읽는 앞부분 크기 (문자 수)
+# 앞부분에서 배치 파일로 판단되면 전체를 읽지 않고 객체 단위로 스트리밍 분석
+BATCH_SNIFF_CHARS = 64 * 1024
+
+# 배치 PL/SQL 객체 병렬 분석 시 워커 작업 하나에 담는 최대 소스 크기 (문자 수)와 객체 수
+# 객체 크기 편차가 크므로 개수가 아닌 소스 크기 기준으로 묶음 (큰 객체는 단독 작업)
+BATCH_OBJECT_CHUNK_CHARS = 256 * 1024
+BATCH_OBJECT_CHUNK_SIZE = 64
+
+# 워커당 동시에 제출해 두는 배치 PL/SQL 객체 작업 수 (스트리밍 메모리 상한)
+BATCH_OBJECT_INFLIGHT_PER_WORKER = 2
+
+# 패키지 서브프로그램 병렬 분석 시 워커 작업 하나에 담는 서브프로그램 수
+SUBPROGRAM_CHUNK_SIZE = 4
+
+# 서브프로그램 분석 롤업에 표시하는 복잡도 상위 서브프로그램 수
+SUBPROGRAM_HOTSPOT_COUNT = 5
+
+# 워커 프로세스별 분석기 (문장/서브프로그램 청크 분석용)
+_worker_analyzer: Optional['OracleComplexityAnalyzer'] = None
+
+
+def _get_worker_analyzer(target: TargetDatabase,
+                         cache: Optional[AnalysisCache]) -> 'OracleComplexityAnalyzer':
+    """워커 프로세스의 분석기 반환 (프로세스별 첫 호출 시 생성)"""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = OracleComplexityAnalyzer(target, cache=cache)
+    return _worker_analyzer
+
+
+def _analyze_statement_chunk(statements: List[Any], targets: List[TargetDatabase],
+                             cache: Optional[AnalysisCache] = None
+                             ) -> List[Tuple[Any, Optional[Dict], Optional[str]]]:
+    """SQL 문 청크 분석 (병렬 처리용 워커 함수)
+    
+    Args:
+        statements: SQLStatement 리스트
+        targets: 타겟 데이터베이스 목록
+        cache: 분석 결과 캐시 (워커 프로세스의 첫 호출 시 사용)
+        
+    Returns:
+        List[tuple]: (SQLStatement, 타겟별 분석 결과 또는 None, 에러 메시지 또는 None) 리스트
+    """
+    from .batch_analyzer.worker_pool import tracked_task
+    
+    analyzer = _get_worker_analyzer(targets[0], cache)
+    outcomes = []
+    for statement in statements:
+        # 폴더 분석 풀의 시간 제한은 문장 단위로 적용
+        with tracked_task(f"{statement.index}번째 문장 ({statement.line_start}행)"):
+            outcomes.append(analyzer._analyze_statement(statement, targets))
+    return outcomes
+
+
+def _analyze_subprogram_chunk(subprograms: List[Any], targets: List[TargetDatabase],
+                              cache: Optional[AnalysisCache] = None
+                              ) -> List[Tuple[Any, Optional[Dict], Optional[str]]]:
+    """패키지 서브프로그램 청크 분석 (병렬 처리용 워커 함수)
+    
+    Args:
+        subprograms: PLSQLSubProgram 리스트
+        targets: 타겟 데이터베이스 목록
+        cache: 분석 결과 캐시 (워커 프로세스의 첫 호출 시 사용)
+        
+    Returns:
+        List[tuple]: (PLSQLSubProgram, 타겟별 분석 결과 또는 None, 에러 메시지 또는 None) 리스트
+    """
+    analyzer = _get_worker_analyzer(targets[0], cache)
+    return [analyzer._analyze_subprogram(subprogram, targets) for subprogram in subprograms]
+
+
+def _analyze_object_chunk(objects: List[Any], targets: List[TargetDatabase],
+                          cache: Optional[AnalysisCache] = None
+                          ) -> List[Tuple[Optional[Dict[TargetDatabase, PLSQLAnalysisResult]],
+                                          Optional[str]]]:
+    """배치 PL/SQL 객체 청크 분석 (병렬 처리용 워커 함수)
+    
+    부모 프로세스가 결과에 원본 참조(또는 객체 코드)를 다시 채우므로 결과의 code는 비워서 반환합니다.
+    
+    Args:
+        objects: PLSQLObject 리스트
+        targets: 타겟 데이터베이스 목록
+        cache: 분석 결과 캐시 (워커 프로세스의 첫 호출 시 사용)
+        
+    Returns:
+        List[tuple]: (타겟별 분석 결과 또는 None, 에러 메시지 또는 None) 리스트
+    """
+    from .batch_analyzer.worker_pool import tracked_task
+    
+    analyzer = _get_worker_analyzer(targets[0], cache)
+    outcomes = []
+    for obj in objects:
+        # 폴더 분석 풀의 시간 제한은 객체 단위로 적용
+        with tracked_task(".".join(filter(None, (obj.owner, obj.object_name)))):
+            _, analyses, error = analyzer._analyze_batch_object(obj, targets)
+        if analyses is not None:
+            analyses = {target: dataclasses.replace(result, code='')
+                        for target, result in analyses.items()}
+        outcomes.append((analyses, error))
+    return outcomes
+
+
+def _chunk_statements(statements: Iterable[Any]) -> Iterator[List[Any]]:
+    """SQL 문을 STATEMENT_CHUNK_SIZE개씩 묶어 순서대로 반환"""
+    chunk: List[Any] = []
+    for statement in statements:
+        chunk.append(statement)
+        if len(chunk) >= STATEMENT_CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _chunk_objects(objects: Iterable[Any]) -> Iterable[List[Any]]:
+    """배치 PL/SQL 객체를 소스 크기 기준으로 묶어 순서대로 반환"""
+    chunk: List[Any] = []
+    chunk_chars = 0
+    for obj in objects:
+        chunk.append(obj)
+        chunk_chars += len(obj.ddl_code)
+        if chunk_chars >= BATCH_OBJECT_CHUNK_CHARS or len(chunk) >= BATCH_OBJECT_CHUNK_SIZE:
+            yield chunk
+            chunk = []
+            chunk_chars = 0
+    if chunk:
+        yield chunk
+
 
 class OracleComplexityAnalyzer:
     """Oracle 복잡도 분석기 메인 클래스
@@ -33,10 +179,18 @@ class OracleComplexityAnalyzer:
         calculator: 복잡도 계산기
         guide_provider: 변환 가이드 제공자
         output_dir: 출력 디렉토리 경로
+        cache: 분석 결과 캐시 (None이면 캐시 미사용)
+        dedupe: 리터럴만 다른 SQL 문을 한 번만 분석할지 여부
+        split_subprograms: 패키지/타입 바디 파일을 프로시저·함수 단위로 분석할지 여부
+        object_filter: 배치 PL/SQL 파일에서 분석할 객체 필터 (None이면 전체)
     """
     
     def __init__(self, target_database: TargetDatabase = TargetDatabase.POSTGRESQL,
-                 output_dir: str = "reports"):
+                 output_dir: str = "reports",
+                 cache: Optional[AnalysisCache] = None,
+                 dedupe: bool = False,
+                 split_subprograms: bool = False,
+                 object_filter: Optional[Any] = None):
         """OracleComplexityAnalyzer 초기화
         
         Requirements 전체를 구현합니다.
@@ -44,9 +198,17 @@ class OracleComplexityAnalyzer:
         Args:
             target_database: 타겟 데이터베이스 (기본값: PostgreSQL)
             output_dir: 출력 디렉토리 경로 (기본값: "reports")
+            cache: 분석 결과 캐시 (기본값: None, 캐시 미사용)
+            dedupe: 리터럴만 다른 SQL 문을 형태별로 한 번만 분석 (기본값: False)
+            split_subprograms: 패키지/타입 바디를 서브프로그램 단위로 분석 (기본값: False)
+            object_filter: 배치 PL/SQL 객체 필터 (PLSQLObjectFilter, 기본값: None)
         """
         self.target = target_database
         self.output_dir = Path(output_dir)
+        self.cache = cache
+        self.dedupe = dedupe
+        self.split_subprograms = split_subprograms
+        self.object_filter = object_filter
         
         # 필요한 모듈 import (지연 import로 순환 참조 방지)
         from src.calculators import ComplexityCalculator
@@ -54,6 +216,9 @@ class OracleComplexityAnalyzer:
         
         self.calculator = ComplexityCalculator(target_database)
         self.guide_provider = ConversionGuideProvider(target_database)
+        
+        # 다중 타겟 분석용 타겟별 분석기 캐시
+        self._target_analyzers: Dict[TargetDatabase, 'OracleComplexityAnalyzer'] = {}
     
     def _get_date_folder(self) -> Path:
         """날짜 폴더 경로 생성 (reports/YYYYMMDD/)
@@ -67,6 +232,70 @@ class OracleComplexityAnalyzer:
         """
         return export_utils.get_date_folder(self.output_dir)
     
+    def for_target(self, target: TargetDatabase) -> 'OracleComplexityAnalyzer':
+        """타겟 데이터베이스별 분석기 반환
+        
+        현재 분석기의 타겟이면 자기 자신을, 다른 타겟이면 같은 출력 디렉토리를 사용하는
+        분석기를 생성(캐시)하여 반환합니다. 다중 타겟 분석에서 점수 계산과 변환 가이드만
+        타겟별로 수행하기 위해 사용됩니다.
+        
+        Args:
+            target: 타겟 데이터베이스
+            
+        Returns:
+            OracleComplexityAnalyzer: 해당 타겟의 분석기
+        """
+        if target == self.target:
+            return self
+        
+        analyzer = self._target_analyzers.get(target)
+        if analyzer is None:
+            analyzer = OracleComplexityAnalyzer(
+                target_database=target, output_dir=str(self.output_dir), cache=self.cache,
+                dedupe=self.dedupe, split_subprograms=self.split_subprograms,
+                object_filter=self.object_filter
+            )
+            self._target_analyzers[target] = analyzer
+        return analyzer
+    
+    @staticmethod
+    def _shape_key(text: str) -> Tuple[str, int]:
+        """SQL 문 중복 제거 키 생성
+        
+        리터럴에 무관한 핑거프린트와 데이터 볼륨 구간(쿼리 길이)으로 구성됩니다.
+        쿼리 길이는 점수에 반영되므로 같은 구간의 문장만 결과를 공유합니다.
+        
+        Args:
+            text: SQL 문 텍스트
+            
+        Returns:
+            Tuple[str, int]: (핑거프린트 해시, 데이터 볼륨 구간)
+        """
+        from src.parsers.sql_fingerprint import fingerprint_hash
+        
+        query = text.strip()
+        return (fingerprint_hash(query),
+                bisect.bisect_right(DATA_VOLUME_LENGTH_THRESHOLDS, len(query)))
+    
+    @staticmethod
+    def _with_source(analyses: Optional[Dict[TargetDatabase, Any]],
+                     text: str) -> Optional[Dict[TargetDatabase, Any]]:
+        """대표 문장의 타겟별 분석 결과를 다른 문장의 원본 텍스트로 복제"""
+        if analyses is None:
+            return None
+        query = text.strip()
+        return {
+            target: dataclasses.replace(result, query=query)
+            for target, result in analyses.items()
+        }
+    
+    @staticmethod
+    def _resolve_targets(targets: Optional[List[TargetDatabase]]) -> List[TargetDatabase]:
+        """분석 대상 타겟 목록 정리 (None이면 모든 타겟, 중복 제거)"""
+        if not targets:
+            return list(TargetDatabase)
+        return list(dict.fromkeys(targets))
+    
     def analyze_sql(self, query: str) -> SQLAnalysisResult:
         """SQL 쿼리 복잡도 분석
         
@@ -88,12 +317,56 @@ class OracleComplexityAnalyzer:
         if not query or not query.strip():
             raise ValueError("빈 쿼리는 분석할 수 없습니다.")
         
-        # 필요한 모듈 import
-        from src.parsers.sql_parser import SQLParser
+        return self.analyze_sql_multi(query, [self.target])[self.target]
+    
+    def analyze_sql_multi(self, query: str,
+                          targets: Optional[List[TargetDatabase]] = None
+                          ) -> Dict[TargetDatabase, SQLAnalysisResult]:
+        """SQL 쿼리를 한 번 파싱하여 여러 타겟의 복잡도 분석
+        
+        파싱과 지표 추출은 한 번만 수행하고, 타겟별 가중치로 점수만 각각 계산합니다.
+        
+        Args:
+            query: 분석할 SQL 쿼리 문자열
+            targets: 타겟 데이터베이스 목록 (None이면 모든 타겟)
+            
+        Returns:
+            Dict[TargetDatabase, SQLAnalysisResult]: 타겟별 분석 결과
+            
+        Raises:
+            ValueError: 빈 쿼리가 입력된 경우
+        """
+        if not query or not query.strip():
+            raise ValueError("빈 쿼리는 분석할 수 없습니다.")
+        
+        targets = self._resolve_targets(targets)
+        results = self._get_cached('sql', query, targets)
+        missing = [target for target in targets if target not in results]
+        
+        if missing:
+            from src.parsers.sql_parser import SQLParser
+            
+            with stage_timer('parse'):
+                parser = SQLParser(query)
+                features = parser.extract_features()
+            with stage_timer('score'):
+                for target in missing:
+                    results[target] = self.for_target(target)._score_sql(parser, features)
+                    self._put_cached('sql', query, target, results[target])
         
-        # SQL 파서 생성 및 분석
-        parser = SQLParser(query)
-        result = self.calculator.calculate_sql_complexity(parser)
+        return {target: results[target] for target in targets}
+    
+    def _score_sql(self, parser, features) -> SQLAnalysisResult:
+        """파싱된 SQL의 점수 계산 및 변환 가이드 추가 (현재 타겟 기준)
+        
+        Args:
+            parser: SQL 파서 객체
+            features: 파서에서 추출한 SQLFeatureVector
+            
+        Returns:
+            SQLAnalysisResult: SQL 분석 결과
+        """
+        result = self.calculator.calculate_sql_complexity(parser, features)
         
         # 변환 가이드 추가
         detected_features = result.detected_oracle_features + result.detected_oracle_functions
@@ -122,12 +395,85 @@ class OracleComplexityAnalyzer:
         if not code or not code.strip():
             raise ValueError("빈 코드는 분석할 수 없습니다.")
         
-        # 필요한 모듈 import
-        from src.parsers.plsql import PLSQLParser
+        return self.analyze_plsql_multi(code, [self.target])[self.target]
+    
+    def analyze_plsql_multi(self, code: str,
+                            targets: Optional[List[TargetDatabase]] = None
+                            ) -> Dict[TargetDatabase, PLSQLAnalysisResult]:
+        """PL/SQL 코드를 한 번 파싱하여 여러 타겟의 복잡도 분석
         
-        # PL/SQL 파서 생성 및 분석
-        parser = PLSQLParser(code)
+        파서의 감지 결과는 캐시되므로 감지 작업은 한 번만 수행되고,
+        타겟별 기본 점수(PLSQL_BASE_SCORES)와 가중치로 점수만 각각 계산합니다.
+        
+        Args:
+            code: 분석할 PL/SQL 코드 문자열
+            targets: 타겟 데이터베이스 목록 (None이면 모든 타겟)
+            
+        Returns:
+            Dict[TargetDatabase, PLSQLAnalysisResult]: 타겟별 분석 결과
+            
+        Raises:
+            ValueError: 빈 코드가 입력된 경우 또는 오브젝트 타입 감지 실패
+        """
+        if not code or not code.strip():
+            raise ValueError("빈 코드는 분석할 수 없습니다.")
+        
+        targets = self._resolve_targets(targets)
+        results = self._get_cached('plsql', code, targets)
+        missing = [target for target in targets if target not in results]
+        
+        if missing:
+            from src.parsers.plsql import PLSQLParser
+            
+            with stage_timer('parse'):
+                parser = PLSQLParser(code)
+            # 파서의 감지 작업은 첫 점수 계산 시 수행되므로 score 시간에 포함됨
+            with stage_timer('score'):
+                for target in missing:
+                    results[target] = self.for_target(target)._score_plsql(parser)
+                    self._put_cached('plsql', code, target, results[target])
+        
+        return {target: results[target] for target in targets}
+    
+    def _get_cached(self, kind: str, source: str,
+                    targets: List[TargetDatabase]) -> Dict[TargetDatabase, Any]:
+        """캐시에서 타겟별 분석 결과 조회
+        
+        Args:
+            kind: 결과 종류 ('sql' 또는 'plsql')
+            source: 분석 대상 소스 텍스트
+            targets: 타겟 데이터베이스 목록
+            
+        Returns:
+            Dict[TargetDatabase, Any]: 캐시에 있는 타겟의 결과만 포함
+        """
+        if self.cache is None:
+            return {}
+        
+        results = {}
+        for target in targets:
+            cached = self.cache.get(kind, target, source)
+            if cached is not None:
+                results[target] = cached
+        return results
+    
+    def _put_cached(self, kind: str, source: str, target: TargetDatabase, result: Any) -> None:
+        """분석 결과를 캐시에 저장 (캐시 미사용 시 무시)"""
+        if self.cache is not None:
+            self.cache.put(kind, target, source, result)
+    
+    def _score_plsql(self, parser) -> PLSQLAnalysisResult:
+        """파싱된 PL/SQL의 점수 계산 및 변환 가이드 추가 (현재 타겟 기준)
         
+        Args:
+            parser: PL/SQL 파서 객체
+            
+        Returns:
+            PLSQLAnalysisResult: PL/SQL 분석 결과
+            
+        Raises:
+            ValueError: 오브젝트 타입 감지 실패
+        """
         try:
             result = self.calculator.calculate_plsql_complexity(parser)
         except ValueError as e:
@@ -147,16 +493,464 @@ class OracleComplexityAnalyzer:
         
         return result
     
-    def analyze_file(self, file_path: str) -> Union[SQLAnalysisResult, PLSQLAnalysisResult]:
-        """파일에서 코드를 읽어 분석
+    def analyze_sql_script(self, content: str,
+                           max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """여러 SQL 문이 포함된 스크립트를 문장 단위로 분석
         
-        파일 내용을 읽어서 SQL 또는 PL/SQL 여부를 판단하고 적절한 분석을 수행합니다.
+        Args:
+            content: SQL 스크립트 내용
+            max_workers: 병렬 처리 워커 수 (None 또는 1이면 순차 처리)
+            
+        Returns:
+            Dict: 스크립트 분석 결과
+                - total_statements: 전체 문장 수
+                - statistics: 문장 유형별 통계
+                - results: 문장별 분석 결과 리스트
+                - summary: 파일 단위 요약 정보
+        """
+        return self.analyze_sql_script_multi(content, [self.target], max_workers)[self.target]
+    
+    def analyze_sql_script_multi(self, content: str,
+                                 targets: Optional[List[TargetDatabase]] = None,
+                                 max_workers: Optional[int] = None
+                                 ) -> Dict[TargetDatabase, Dict[str, Any]]:
+        """SQL 스크립트를 문장 단위로 분리하여 여러 타겟으로 분석
+        
+        문장은 STATEMENT_CHUNK_SIZE개씩 묶어 워커 풀에 전달하므로 큰 스크립트 하나도
+        모든 CPU 코어를 사용해 분석할 수 있습니다.
         
         Args:
-            file_path: 분석할 파일 경로
+            content: SQL 스크립트 내용
+            targets: 타겟 데이터베이스 목록 (None이면 모든 타겟)
+            max_workers: 병렬 처리 워커 수 (None 또는 1이면 순차 처리)
             
         Returns:
-            SQLAnalysisResult 또는 PLSQLAnalysisResult: 분석 결과
+            Dict[TargetDatabase, Dict]: 타겟별 스크립트 분석 결과
+        """
+        from src.parsers.sql_splitter import iter_statements
+        
+        return self._analyze_statements(iter_statements(content.splitlines(keepends=True)),
+                                        self._resolve_targets(targets), max_workers)
+    
+    def _analyze_statement(self, statement, targets: List[TargetDatabase]) -> tuple:
+        """개별 SQL 문 분석
+        
+        Args:
+            statement: SQLStatement 객체
+            targets: 타겟 데이터베이스 목록
+            
+        Returns:
+            tuple: (SQLStatement, 타겟별 분석 결과 또는 None, 에러 메시지 또는 None)
+        """
+        try:
+            with profile_input(f"{statement.index}번째 문장 ({statement.line_start}행)"):
+                return (statement, self.analyze_sql_multi(statement.text, targets), None)
+        except Exception as e:
+            logger.error(f"SQL 문 분석 실패: {statement.index}번째 문장", exc_info=True)
+            return (statement, None, str(e))
+    
+    def _analyze_statements(self, statements: Iterable[Any], targets: List[TargetDatabase],
+                            max_workers: Optional[int] = None,
+                            executor: Optional[concurrent.futures.Executor] = None
+                            ) -> Dict[TargetDatabase, Dict[str, Any]]:
+        """SQL 문 스트림 분석 및 파일 단위 집계
+        
+        문장을 하나씩 받아 통계와 중복 제거 그룹을 누적하면서 청크 단위로 분석하므로,
+        분석은 스크립트를 끝까지 분리하기 전에 시작됩니다.
+        
+        Args:
+            statements: SQLStatement 이터러블
+            targets: 타겟 데이터베이스 목록
+            max_workers: 병렬 처리 워커 수 (None 또는 1이면 순차 처리)
+            executor: 공유 워커 풀 (폴더 분석 시 BatchAnalyzer의 풀을 그대로 사용하며,
+                None이면 필요 시 max_workers 크기의 풀을 새로 생성)
+            
+        Returns:
+            Dict[TargetDatabase, Dict]: 타겟별 스크립트 분석 결과
+            (dedupe 사용 시 문장별 fingerprint와 형태별 출현 횟수 포함)
+        """
+        groups: Dict[Tuple[str, int], List[Any]] = {}
+        statistics: Dict[str, int] = {}
+        total_statements = 0
+        
+        def to_analyze(stream: Iterable[Any]) -> Iterator[Any]:
+            # 문장 유형별 통계를 읽는 시점에 누적하고,
+            # 중복 제거 시에는 형태별 대표 문장(첫 출현)만 분석
+            nonlocal total_statements
+            for statement in stream:
+                total_statements += 1
+                statement_type = statement.statement_type or 'UNKNOWN'
+                statistics[statement_type] = statistics.get(statement_type, 0) + 1
+                if self.dedupe:
+                    members = groups.setdefault(self._shape_key(statement.text), [])
+                    members.append(statement)
+                    if len(members) > 1:
+                        continue
+                yield statement
+        
+        outcomes = list(self._iter_statement_outcomes(to_analyze(statements), targets,
+                                                      max_workers, executor))
+        
+        # 대표 문장의 결과를 같은 형태의 모든 문장으로 전파
+        fingerprint_of: Dict[int, str] = {}
+        if self.dedupe:
+            fanned_out = []
+            for (fingerprint, _), members, (_, analyses, error) in zip(
+                groups.keys(), groups.values(), outcomes
+            ):
+                for i, member in enumerate(members):
+                    fingerprint_of[member.index] = fingerprint
+                    fanned_out.append(
+                        (member, analyses if i == 0 else self._with_source(analyses, member.text),
+                         error)
+                    )
+            outcomes = sorted(fanned_out, key=lambda outcome: outcome[0].index)
+        
+        script_results = {}
+        for target in targets:
+            results = []
+            failed = []
+            
+            for statement, analyses, error in outcomes:
+                entry = {
+                    'statement_index': statement.index,
+                    'statement_type': statement.statement_type,
+                    'line_range': f"{statement.line_start}-{statement.line_end}",
+                }
+                if self.dedupe:
+                    entry['fingerprint'] = fingerprint_of[statement.index]
+                if analyses is None:
+                    entry['error'] = error
+                    failed.append(entry)
+                else:
+                    entry['analysis'] = analyses[target]
+                    results.append(entry)
+            
+            script_results[target] = {
+                'total_statements': total_statements,
+                'analyzed_statements': len(results),
+                'failed_statements': len(failed),
+                'statistics': dict(statistics),
+                'results': results,
+                'failed': failed,
+                # 파일 단위 복잡도 요약
+                'summary': self._calculate_batch_complexity_summary(results)
+            }
+            if self.dedupe:
+                script_results[target]['distinct_statements'] = len(groups)
+                script_results[target]['fingerprints'] = self._summarize_fingerprints(
+                    groups, outcomes, target
+                )
+        
+        return script_results
+    
+    def _iter_statement_outcomes(self, statements: Iterable[Any], targets: List[TargetDatabase],
+                                 max_workers: Optional[int] = None,
+                                 executor: Optional[concurrent.futures.Executor] = None
+                                 ) -> Iterator[Tuple[Any, Optional[Dict], Optional[str]]]:
+        """SQL 문을 STATEMENT_CHUNK_SIZE개씩 분석하고 입력 순서대로 결과 반환
+        
+        executor가 있으면 청크를 그 풀에 제출합니다. 없으면 max_workers > 1이고 청크가
+        둘 이상일 때만 풀을 새로 만들고, 그 외에는 현재 프로세스에서 순차 분석합니다.
+        
+        Args:
+            statements: SQLStatement 이터러블
+            targets: 타겟 데이터베이스 목록
+            max_workers: 병렬 처리 워커 수 (None 또는 1이면 순차 처리)
+            executor: 공유 워커 풀 (선택사항)
+            
+        Yields:
+            tuple: (SQLStatement, 타겟별 분석 결과 또는 None, 에러 메시지 또는 None)
+        """
+        chunks: Iterator[List[Any]] = _chunk_statements(statements)
+        
+        if executor is None and max_workers and max_workers > 1:
+            head = list(itertools.islice(chunks, 2))
+            chunks = itertools.chain(head, chunks)
+            if len(head) > 1:
+                with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+                    for _, outcomes in self._iter_chunk_results(
+                        chunks, _analyze_statement_chunk, targets, pool,
+                        max_workers * STATEMENT_INFLIGHT_PER_WORKER
+                    ):
+                        yield from outcomes
+                return
+        
+        if executor is None:
+            for chunk in chunks:
+                for statement in chunk:
+                    yield self._analyze_statement(statement, targets)
+            return
+        
+        for _, outcomes in self._iter_chunk_results(
+            chunks, _analyze_statement_chunk, targets, executor,
+            max(1, max_workers or 1) * STATEMENT_INFLIGHT_PER_WORKER
+        ):
+            yield from outcomes
+    
+    def _iter_chunk_results(self, chunks: Iterable[List[Any]], task: Callable[..., list],
+                            targets: List[TargetDatabase], executor: concurrent.futures.Executor,
+                            inflight_limit: int) -> Iterator[Tuple[List[Any], list]]:
+        """청크를 워커 풀에 제출하고 입력 순서대로 (청크, 청크 분석 결과) 반환
+        
+        동시에 제출하는 청크 수를 inflight_limit개로 제한하므로 스트리밍 입력을 앞질러
+        읽지 않으며, 공유 풀의 다른 작업 사이에 끼어 실행됩니다.
+        
+        Args:
+            chunks: 청크 이터러블
+            task: 청크 작업 함수 (chunk, targets, cache) -> list
+            targets: 타겟 데이터베이스 목록
+            executor: 작업 실행기
+            inflight_limit: 동시에 제출하는 최대 청크 수
+            
+        Yields:
+            tuple: (청크, 청크 분석 결과)
+        """
+        pending: "collections.deque[Tuple[List[Any], concurrent.futures.Future]]" = collections.deque()
+        
+        for chunk in chunks:
+            pending.append((chunk, executor.submit(task, chunk, targets, self.cache)))
+            if len(pending) >= inflight_limit:
+                done_chunk, future = pending.popleft()
+                yield done_chunk, future.result()
+        
+        while pending:
+            done_chunk, future = pending.popleft()
+            yield done_chunk, future.result()
+    
+    @staticmethod
+    def _summarize_fingerprints(groups: Dict[Tuple[str, int], List[Any]],
+                                outcomes: List[tuple],
+                                target: TargetDatabase) -> List[Dict[str, Any]]:
+        """형태(fingerprint)별 출현 횟수 집계
+        
+        Args:
+            groups: 중복 제거 키별 SQLStatement 리스트
+            outcomes: 문장 순서로 정렬된 (SQLStatement, 타겟별 결과, 에러) 리스트
+            target: 점수를 표시할 타겟 데이터베이스
+            
+        Returns:
+            List[Dict]: 출현 횟수 내림차순의 형태별 요약
+                - fingerprint, statement_type, occurrences,
+                  first_statement_index, normalized_score (실패 시 None)
+        """
+        analyses_by_index = {statement.index: analyses for statement, analyses, _ in outcomes}
+        summaries: Dict[str, Dict[str, Any]] = {}
+        
+        for (fingerprint, _), members in groups.items():
+            summary = summaries.get(fingerprint)
+            if summary is None:
+                first = members[0]
+                analyses = analyses_by_index.get(first.index)
+                summary = summaries[fingerprint] = {
+                    'fingerprint': fingerprint,
+                    'statement_type': first.statement_type,
+                    'occurrences': 0,
+                    'first_statement_index': first.index,
+                    'normalized_score': (
+                        round(analyses[target].normalized_score, 2) if analyses else None
+                    ),
+                }
+            summary['occurrences'] += len(members)
+        
+        return sorted(summaries.values(), key=lambda s: (-s['occurrences'], s['first_statement_index']))
+    
+    def analyze_plsql_subprograms(self, code: str,
+                                  max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """패키지/타입 바디를 프로시저·함수 단위로 분리하여 분석
+        
+        Args:
+            code: 패키지 바디 또는 타입 바디 코드
+            max_workers: 병렬 처리 워커 수 (None 또는 1이면 순차 처리)
+            
+        Returns:
+            Dict: 서브프로그램 분석 결과
+                - object_type, object_name: 바디 종류와 이름
+                - total_subprograms: 전체 서브프로그램 수
+                - statistics: 서브프로그램 유형별 통계
+                - results: 서브프로그램별 분석 결과 리스트
+                - summary: 바디 단위 롤업 (가중 평균, 복잡도 상위 서브프로그램 포함)
+                
+        Raises:
+            ValueError: 빈 코드이거나 분리할 서브프로그램이 없는 경우
+        """
+        return self.analyze_plsql_subprograms_multi(code, [self.target], max_workers)[self.target]
+    
+    def analyze_plsql_subprograms_multi(self, code: str,
+                                        targets: Optional[List[TargetDatabase]] = None,
+                                        max_workers: Optional[int] = None
+                                        ) -> Dict[TargetDatabase, Dict[str, Any]]:
+        """패키지/타입 바디를 서브프로그램 단위로 분리하여 여러 타겟으로 분석
+        
+        서브프로그램은 SUBPROGRAM_CHUNK_SIZE개씩 묶어 워커 풀에 전달하므로 큰 패키지 하나도
+        여러 CPU 코어를 사용해 분석할 수 있습니다.
+        
+        Args:
+            code: 패키지 바디 또는 타입 바디 코드
+            targets: 타겟 데이터베이스 목록 (None이면 모든 타겟)
+            max_workers: 병렬 처리 워커 수 (None 또는 1이면 순차 처리)
+            
+        Returns:
+            Dict[TargetDatabase, Dict]: 타겟별 서브프로그램 분석 결과
+            
+        Raises:
+            ValueError: 빈 코드이거나 분리할 서브프로그램이 없는 경우
+        """
+        if not code or not code.strip():
+            raise ValueError("빈 코드는 분석할 수 없습니다.")
+        
+        from src.parsers.plsql import PLSQLParser
+        
+        parser = PLSQLParser(code)
+        container = parser.subprogram_container()
+        subprograms = parser.split_subprograms()
+        if container is None or not subprograms:
+            raise ValueError("분리할 프로시저/함수가 없습니다. 패키지 바디 또는 타입 바디만 지원합니다.")
+        
+        return self._analyze_subprograms(container, subprograms,
+                                         self._resolve_targets(targets), max_workers)
+    
+    def _analyze_subprogram(self, subprogram, targets: List[TargetDatabase]) -> tuple:
+        """개별 서브프로그램 분석
+        
+        서브프로그램 코드는 CREATE 문이 아니므로 CREATE OR REPLACE를 붙여 독립 오브젝트로
+        분석하고, 결과에는 원래 코드를 담습니다.
+        
+        Args:
+            subprogram: PLSQLSubProgram 객체
+            targets: 타겟 데이터베이스 목록
+            
+        Returns:
+            tuple: (PLSQLSubProgram, 타겟별 분석 결과 또는 None, 에러 메시지 또는 None)
+        """
+        try:
+            with profile_input(subprogram.name):
+                analyses = self.analyze_plsql_multi(f"CREATE OR REPLACE {subprogram.code}", targets)
+        except Exception as e:
+            logger.error(f"서브프로그램 분석 실패: {subprogram.name}", exc_info=True)
+            return (subprogram, None, str(e))
+        
+        return (subprogram, {
+            target: dataclasses.replace(result, code=subprogram.code)
+            for target, result in analyses.items()
+        }, None)
+    
+    def _analyze_subprograms(self, container: Tuple[str, str], subprograms: List[Any],
+                             targets: List[TargetDatabase],
+                             max_workers: Optional[int] = None
+                             ) -> Dict[TargetDatabase, Dict[str, Any]]:
+        """분리된 서브프로그램 목록 분석 및 바디 단위 롤업
+        
+        Args:
+            container: (바디 종류, 바디 이름)
+            subprograms: PLSQLSubProgram 리스트
+            targets: 타겟 데이터베이스 목록
+            max_workers: 병렬 처리 워커 수 (None 또는 1이면 순차 처리)
+            
+        Returns:
+            Dict[TargetDatabase, Dict]: 타겟별 서브프로그램 분석 결과
+        """
+        if max_workers and max_workers > 1 and len(subprograms) > 1:
+            chunks = [
+                subprograms[i:i + SUBPROGRAM_CHUNK_SIZE]
+                for i in range(0, len(subprograms), SUBPROGRAM_CHUNK_SIZE)
+            ]
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(max_workers, len(chunks))
+            ) as executor:
+                outcomes = [
+                    outcome
+                    for chunk_outcomes in executor.map(
+                        _analyze_subprogram_chunk, chunks,
+                        [targets] * len(chunks), [self.cache] * len(chunks)
+                    )
+                    for outcome in chunk_outcomes
+                ]
+        else:
+            outcomes = [self._analyze_subprogram(subprogram, targets) for subprogram in subprograms]
+        
+        # 서브프로그램 유형별 통계
+        statistics: Dict[str, int] = {}
+        for subprogram in subprograms:
+            statistics[subprogram.subprogram_type] = statistics.get(subprogram.subprogram_type, 0) + 1
+        
+        object_type, object_name = container
+        subprogram_results = {}
+        for target in targets:
+            results = []
+            failed = []
+            
+            for subprogram, analyses, error in outcomes:
+                entry = {
+                    'subprogram_index': subprogram.index,
+                    'subprogram_type': subprogram.subprogram_type,
+                    'subprogram_name': subprogram.name,
+                    'line_range': f"{subprogram.line_start}-{subprogram.line_end}",
+                }
+                if analyses is None:
+                    entry['error'] = error
+                    failed.append(entry)
+                else:
+                    entry['analysis'] = analyses[target]
+                    results.append(entry)
+            
+            subprogram_results[target] = {
+                'object_type': object_type,
+                'object_name': object_name,
+                'total_subprograms': len(subprograms),
+                'analyzed_subprograms': len(results),
+                'failed_subprograms': len(failed),
+                'statistics': dict(statistics),
+                'results': results,
+                'failed': failed,
+                # 바디 단위 롤업
+                'summary': self._calculate_subprogram_rollup(results)
+            }
+        
+        return subprogram_results
+    
+    def _calculate_subprogram_rollup(self, results: List[Dict]) -> Dict:
+        """서브프로그램 분석 결과의 바디 단위 롤업 계산
+        
+        배치 요약(평균/최대/최소/분포)에 라인 수 가중 평균과 복잡도 상위 서브프로그램을
+        추가합니다.
+        
+        Args:
+            results: 서브프로그램별 분석 결과 리스트
+            
+        Returns:
+            Dict: 롤업 정보
+        """
+        summary = self._calculate_batch_complexity_summary(results)
+        if not summary:
+            return summary
+        
+        total_lines = sum(r['analysis'].line_count for r in results)
+        summary['total_lines'] = total_lines
+        summary['weighted_average_score'] = (
+            sum(r['analysis'].normalized_score * r['analysis'].line_count for r in results)
+            / total_lines if total_lines else summary['average_score']
+        )
+        summary['hotspots'] = [
+            {
+                'subprogram_name': r['subprogram_name'],
+                'subprogram_type': r['subprogram_type'],
+                'line_range': r['line_range'],
+                'normalized_score': r['analysis'].normalized_score,
+            }
+            for r in sorted(results, key=lambda r: -r['analysis'].normalized_score)
+            [:SUBPROGRAM_HOTSPOT_COUNT]
+        ]
+        return summary
+    
+    def open_source(self, file_path: str) -> SourceFile:
+        """분석할 파일을 한 번 읽어 SourceFile 생성 (인코딩은 앞부분 바이트로 판별)
+        
+        Args:
+            file_path: 파일 경로
+            
+        Returns:
+            SourceFile: 읽은 소스 파일 (with 문으로 사용하거나 close() 호출 필요)
             
         Raises:
             FileNotFoundError: 파일이 존재하지 않는 경우
@@ -169,23 +963,154 @@ class OracleComplexityAnalyzer:
         
         # 파일 읽기
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with stage_timer('read'):
+                return SourceFile.open(file_path)
         except Exception as e:
             logger.error(f"파일 읽기 실패: {file_path}", exc_info=True)
             raise IOError(f"파일 읽기 실패: {e}")
+    
+    def _read_source_file(self, file_path: str, max_chars: Optional[int] = None) -> str:
+        """분석할 파일 읽기
+        
+        Args:
+            file_path: 파일 경로
+            max_chars: 읽을 최대 문자 수 (None이면 전체)
+            
+        Returns:
+            str: 파일 내용
+            
+        Raises:
+            FileNotFoundError: 파일이 존재하지 않는 경우
+            IOError: 파일 읽기 실패
+        """
+        with self.open_source(file_path) as source:
+            try:
+                return source.text if max_chars is None else source.head(max_chars)
+            except UnicodeDecodeError as e:
+                logger.error(f"파일 읽기 실패: {file_path}", exc_info=True)
+                raise IOError(f"파일 읽기 실패: {e}")
+    
+    def analyze_file(self, file_path: str,
+                     max_workers: Optional[int] = None,
+                     source: Optional[SourceFile] = None
+                     ) -> Union[SQLAnalysisResult, PLSQLAnalysisResult, Dict[str, Any]]:
+        """파일에서 코드를 읽어 분석
+        
+        파일 내용을 읽어서 SQL 또는 PL/SQL 여부를 판단하고 적절한 분석을 수행합니다.
+        
+        Args:
+            file_path: 분석할 파일 경로
+            max_workers: SQL 스크립트 문장/서브프로그램 단위 병렬 처리 워커 수
+                (None이면 순차 처리)
+            source: 이미 읽은 소스 파일 (None이면 파일을 읽고 분석 후 닫음)
+            
+        Returns:
+            SQLAnalysisResult 또는 PLSQLAnalysisResult: 분석 결과
+            (배치 PL/SQL 파일이면 배치 분석 결과, 여러 SQL 문이 포함된 스크립트이면
+            스크립트 분석 결과 딕셔너리, split_subprograms 사용 시 패키지/타입 바디이면
+            서브프로그램 분석 결과 딕셔너리)
+            
+        Raises:
+            FileNotFoundError: 파일이 존재하지 않는 경우
+            IOError: 파일 읽기 실패
+        """
+        return self.analyze_file_multi(file_path, [self.target], max_workers, source)[self.target]
+    
+    def analyze_file_multi(self, file_path: str,
+                           targets: Optional[List[TargetDatabase]] = None,
+                           max_workers: Optional[int] = None,
+                           source: Optional[SourceFile] = None,
+                           executor: Optional[concurrent.futures.Executor] = None
+                           ) -> Dict[TargetDatabase, Any]:
+        """파일을 한 번 읽고 파싱하여 여러 타겟의 복잡도 분석
         
-        # 배치 PL/SQL 파일 여부 확인
-        if is_batch_plsql(content):
-            return self.analyze_batch_plsql_file(file_path)
+        판별한 파일 유형('batch_plsql', 'plsql', 'sql')은 source.file_type에 기록됩니다.
+        앞부분(BATCH_SNIFF_CHARS)보다 큰 파일은 줄 단위로 디코딩하면서 유형을 판별하고,
+        배치 PL/SQL 파일과 여러 문장 SQL 스크립트는 전체 텍스트를 만들지 않고 객체/문장
+        단위로 스트리밍 분석합니다.
+        
+        Args:
+            file_path: 분석할 파일 경로
+            targets: 타겟 데이터베이스 목록 (None이면 모든 타겟)
+            max_workers: SQL 스크립트 문장/서브프로그램/배치 객체 단위 병렬 처리 워커 수
+                (None이면 순차 처리)
+            source: 이미 읽은 소스 파일 (None이면 파일을 읽고 분석 후 닫음)
+            executor: 공유 워커 풀 (지정하면 SQL 스크립트 문장과 배치 PL/SQL 객체를 청크로
+                나누어 이 풀에 제출, 폴더 분석 시 BatchAnalyzer의 풀)
+            
+        Returns:
+            Dict[TargetDatabase, Any]: 타겟별 분석 결과
+            (SQLAnalysisResult, PLSQLAnalysisResult 또는 배치/스크립트/서브프로그램 분석 결과
+            딕셔너리)
+            
+        Raises:
+            FileNotFoundError: 파일이 존재하지 않는 경우
+            IOError: 파일 읽기 실패
+        """
+        from src.parsers.sql_splitter import iter_file_statements
+        
+        if source is None:
+            with self.open_source(file_path) as source:
+                return self.analyze_file_multi(file_path, targets, max_workers, source, executor)
+        
+        try:
+            content = source.head(BATCH_SNIFF_CHARS)
+            file_type = None
+            
+            # 앞부분만 디코딩한 경우 전체를 줄 단위로 디코딩하면서 유형 판별
+            if not is_batch_plsql(content) and len(content) == BATCH_SNIFF_CHARS:
+                file_type = detect_file_type_lines(source.iter_lines())
+            
+            # 배치 PL/SQL 파일은 전체를 디코딩하지 않고 객체 단위로 스트리밍 분석
+            if file_type == 'batch_plsql' or (file_type is None and is_batch_plsql(content)):
+                source.file_type = 'batch_plsql'
+                return self.analyze_batch_plsql_file_multi(file_path, targets, max_workers,
+                                                           executor, source)
+            
+            if file_type == 'plsql':
+                content = source.text
+            elif file_type == 'sql':
+                # 여러 문장 스크립트는 줄 단위로 분리하면서 분석하므로 전체를 디코딩하지 않음
+                statements = iter_file_statements(file_path, source=source)
+                head = list(itertools.islice(statements, 2))
+                if len(head) > 1:
+                    source.file_type = 'sql'
+                    return self._analyze_statements(itertools.chain(head, statements),
+                                                    self._resolve_targets(targets),
+                                                    max_workers, executor)
+                content = source.text
+        except UnicodeDecodeError as e:
+            logger.error(f"파일 읽기 실패: {file_path}", exc_info=True)
+            raise IOError(f"파일 읽기 실패: {e}")
         
         # 파일 내용 기반으로 SQL/PL/SQL 판단
         if is_plsql(content):
-            return self.analyze_plsql(content)
-        else:
-            return self.analyze_sql(content)
+            source.file_type = 'plsql'
+            if self.split_subprograms:
+                from src.parsers.plsql import PLSQLParser
+                
+                parser = PLSQLParser(content)
+                container = parser.subprogram_container()
+                subprograms = parser.split_subprograms()
+                if container is not None and subprograms:
+                    return self._analyze_subprograms(container, subprograms,
+                                                     self._resolve_targets(targets), max_workers)
+            return self.analyze_plsql_multi(content, targets)
+        
+        source.file_type = 'sql'
+        
+        # 여러 SQL 문이 포함된 스크립트는 문장 단위로 분석
+        if file_type is None:
+            statements = iter_file_statements(file_path, source=source)
+            head = list(itertools.islice(statements, 2))
+            if len(head) > 1:
+                return self._analyze_statements(itertools.chain(head, statements),
+                                                self._resolve_targets(targets), max_workers, executor)
+        
+        return self.analyze_sql_multi(content, targets)
     
-    def analyze_batch_plsql_file(self, file_path: str) -> Dict[str, Any]:
+    def analyze_batch_plsql_file(self, file_path: str,
+                                 max_workers: Optional[int] = None) -> Dict[str, Any]:
         """배치 PL/SQL 파일 분석
         
         여러 PL/SQL 객체가 포함된 파일을 분석합니다.
@@ -193,6 +1118,7 @@ class OracleComplexityAnalyzer:
         
         Args:
             file_path: 분석할 배치 PL/SQL 파일 경로
+            max_workers: 객체 단위 병렬 처리 워커 수 (None 또는 1이면 순차 처리)
             
         Returns:
             Dict: 배치 분석 결과
@@ -205,75 +1131,244 @@ class OracleComplexityAnalyzer:
             FileNotFoundError: 파일이 존재하지 않는 경우
             IOError: 파일 읽기 실패
         """
-        from src.parsers.batch_plsql_parser import BatchPLSQLParser
+        return self.analyze_batch_plsql_file_multi(file_path, [self.target],
+                                                   max_workers)[self.target]
+    
+    def analyze_batch_plsql_file_multi(self, file_path: str,
+                                       targets: Optional[List[TargetDatabase]] = None,
+                                       max_workers: Optional[int] = None,
+                                       executor: Optional[concurrent.futures.Executor] = None,
+                                       source: Optional[SourceFile] = None
+                                       ) -> Dict[TargetDatabase, Dict[str, Any]]:
+        """배치 PL/SQL 파일을 한 번 파싱하여 여러 타겟의 복잡도 분석
         
-        # 파일 존재 여부 확인
-        file_path_obj = Path(file_path)
-        if not file_path_obj.exists():
+        파일을 줄 단위로 읽으면서 객체 헤더가 닫힐 때마다 분석하므로 메모리 사용량은
+        가장 큰 객체 하나 수준이며, 파일을 끝까지 읽기 전에 앞쪽 객체 분석이 시작됩니다.
+        결과의 객체 코드는 원본 파일의 줄 구간 참조(SourceRef)로 대체됩니다.
+        병렬 처리 시에는 객체를 소스 크기 기준 청크로 묶어 워커 풀에 전달합니다.
+        
+        object_filter가 설정되어 있으면 사이드카 바이트 오프셋 색인(BatchPLSQLIndex)을
+        사용하여 선택된 객체 구간만 읽습니다.
+        
+        Args:
+            file_path: 분석할 배치 PL/SQL 파일 경로
+            targets: 타겟 데이터베이스 목록 (None이면 모든 타겟)
+            max_workers: 객체 단위 병렬 처리 워커 수 (None 또는 1이면 순차 처리)
+            executor: 공유 워커 풀 (폴더 분석 시 BatchAnalyzer의 풀을 그대로 사용하며,
+                None이면 max_workers 크기의 풀을 새로 생성)
+            source: 이미 읽은 소스 파일 (None이면 파일을 읽고 분석 후 닫음,
+                object_filter 사용 시에는 색인의 바이트 구간만 읽으므로 사용하지 않음)
+            
+        Returns:
+            Dict[TargetDatabase, Dict]: 타겟별 배치 분석 결과
+            
+        Raises:
+            FileNotFoundError: 파일이 존재하지 않는 경우
+            IOError: 파일 읽기 실패
+        """
+        from src.parsers.batch_plsql_index import BatchPLSQLIndex
+        from src.parsers.batch_plsql_parser import iter_objects
+        
+        if self.object_filter is None and source is None:
+            with self.open_source(file_path) as source:
+                return self.analyze_batch_plsql_file_multi(file_path, targets, max_workers,
+                                                           executor, source)
+        
+        if not Path(file_path).exists():
             raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
         
-        # 파일 읽기
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            logger.error(f"배치 PL/SQL 파일 읽기 실패: {file_path}", exc_info=True)
+            if self.object_filter is None and source is not None:
+                index = SourceIndex(file_path, source.data, source.encoding)
+                return self._analyze_plsql_objects(iter_objects(source.iter_lines()), targets,
+                                                   max_workers, executor, index)
+            
+            encoding = source.encoding if source is not None else 'utf-8'
+            objects = BatchPLSQLIndex.load_or_build(file_path, encoding).iter_objects(
+                self.object_filter
+            )
+            with SourceIndex.from_file(file_path, encoding) as index:
+                return self._analyze_plsql_objects(objects, targets, max_workers,
+                                                   executor, index)
+        except (OSError, UnicodeDecodeError) as e:
+            logger.error(f"파일 읽기 실패: {file_path}", exc_info=True)
             raise IOError(f"파일 읽기 실패: {e}")
+    
+    def _analyze_batch_plsql_content(self, content: str,
+                                     targets: Optional[List[TargetDatabase]] = None,
+                                     max_workers: Optional[int] = None
+                                     ) -> Dict[TargetDatabase, Dict[str, Any]]:
+        """배치 PL/SQL 내용 분석 (객체 분리 및 파싱은 한 번, 점수는 타겟별)
         
-        # 배치 파서로 객체 분리
-        batch_parser = BatchPLSQLParser(content)
-        objects = batch_parser.parse()
+        Args:
+            content: 배치 PL/SQL 파일 내용
+            targets: 타겟 데이터베이스 목록 (None이면 모든 타겟)
+            max_workers: 객체 단위 병렬 처리 워커 수 (None 또는 1이면 순차 처리)
+            
+        Returns:
+            Dict[TargetDatabase, Dict]: 타겟별 배치 분석 결과
+        """
+        from src.parsers.batch_plsql_parser import BatchPLSQLParser
         
-        if not objects:
-            return {
-                'total_objects': 0,
-                'statistics': {},
-                'results': [],
-                'summary': {
-                    'message': '분석 가능한 PL/SQL 객체를 찾을 수 없습니다.'
-                }
-            }
+        objects = BatchPLSQLParser(content).iter_objects()
+        if self.object_filter is not None:
+            objects = (obj for obj in objects
+                       if self.object_filter.matches(obj.owner, obj.object_type, obj.object_name))
+        return self._analyze_plsql_objects(objects, targets, max_workers)
+    
+    def _analyze_plsql_objects(self, objects: Iterable[Any],
+                               targets: Optional[List[TargetDatabase]] = None,
+                               max_workers: Optional[int] = None,
+                               executor: Optional[concurrent.futures.Executor] = None,
+                               index: Optional[SourceIndex] = None
+                               ) -> Dict[TargetDatabase, Dict[str, Any]]:
+        """배치 PL/SQL 객체 스트림 분석
         
-        # 각 객체 분석
-        results = []
-        failed_objects = []
+        객체를 하나씩 받아 분석하고 결과를 받는 즉시 타겟별 집계에 더하므로 객체 목록이나
+        객체 코드 전체를 메모리에 올리지 않습니다. index를 지정하면 결과에는 객체 코드 대신
+        원본 파일의 줄 구간 참조(SourceRef)만 남기며, 코드는 리포트 출력 시 다시 읽습니다.
         
-        for obj in objects:
-            try:
-                # 개별 객체 분석
-                result = self.analyze_plsql(obj.ddl_code)
-                results.append({
-                    'owner': obj.owner,
-                    'object_type': obj.object_type,
-                    'object_name': obj.object_name,
-                    'line_range': f"{obj.line_start}-{obj.line_end}",
-                    'analysis': result
-                })
-            except Exception as e:
-                logger.error(f"PL/SQL 객체 분석 실패: {obj.object_name}", exc_info=True)
-                failed_objects.append({
+        Args:
+            objects: PLSQLObject 이터러블
+            targets: 타겟 데이터베이스 목록 (None이면 모든 타겟)
+            max_workers: 병렬 처리 워커 수 (None 또는 1이면 순차 처리)
+            executor: 공유 워커 풀 (None이면 필요 시 새로 생성)
+            index: 객체를 읽은 원본 파일의 SourceIndex (None이면 결과에 객체 코드 유지)
+            
+        Returns:
+            Dict[TargetDatabase, Dict]: 타겟별 배치 분석 결과
+        """
+        targets = self._resolve_targets(targets)
+        statistics: Dict[str, int] = {}
+        results: Dict[TargetDatabase, List[Dict[str, Any]]] = {target: [] for target in targets}
+        failed: Dict[TargetDatabase, List[Dict[str, Any]]] = {target: [] for target in targets}
+        total_objects = 0
+        
+        def counted(stream: Iterable[Any]) -> Iterator[Any]:
+            # 객체 수와 유형별 통계를 읽는 시점에 누적
+            nonlocal total_objects
+            for obj in stream:
+                total_objects += 1
+                statistics[obj.object_type] = statistics.get(obj.object_type, 0) + 1
+                yield obj
+        
+        def fold(outcomes: Iterable[Tuple[Any, Optional[Dict[TargetDatabase, PLSQLAnalysisResult]],
+                                          Optional[str]]]) -> None:
+            # 분석이 끝난 객체는 결과 항목만 남기고 바로 버림
+            for obj, analyses, error in outcomes:
+                entry = {
                     'owner': obj.owner,
                     'object_type': obj.object_type,
                     'object_name': obj.object_name,
-                    'error': str(e)
-                })
+                }
+                if analyses is None:
+                    for target in targets:
+                        failed[target].append(dict(entry, error=error))
+                    continue
+                
+                analyses = self._with_object_source(analyses, obj, index)
+                entry['line_range'] = f"{obj.line_start}-{obj.line_end}"
+                for target in targets:
+                    results[target].append(dict(entry, analysis=analyses[target]))
         
-        # 통계 계산
-        statistics = batch_parser.get_statistics()
+        if executor is not None:
+            fold(self._iter_object_outcomes(counted(objects), targets, executor, max_workers or 1))
+        elif max_workers and max_workers > 1:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+                fold(self._iter_object_outcomes(counted(objects), targets, pool, max_workers))
+        else:
+            fold(self._analyze_batch_object(obj, targets) for obj in counted(objects))
         
-        # 복잡도 요약
-        complexity_summary = self._calculate_batch_complexity_summary(results)
+        if not total_objects:
+            return {
+                target: {
+                    'total_objects': 0,
+                    'statistics': {},
+                    'results': [],
+                    'summary': {
+                        'message': '분석 가능한 PL/SQL 객체를 찾을 수 없습니다.'
+                    }
+                }
+                for target in targets
+            }
         
         return {
-            'total_objects': len(objects),
-            'analyzed_objects': len(results),
-            'failed_objects': len(failed_objects),
-            'statistics': statistics,
-            'results': results,
-            'failed': failed_objects,
-            'summary': complexity_summary
+            target: {
+                'total_objects': total_objects,
+                'analyzed_objects': len(results[target]),
+                'failed_objects': len(failed[target]),
+                'statistics': dict(statistics),
+                'results': results[target],
+                'failed': failed[target],
+                # 복잡도 요약
+                'summary': self._calculate_batch_complexity_summary(results[target])
+            }
+            for target in targets
         }
     
+    def _iter_object_outcomes(self, objects: Iterable[Any], targets: List[TargetDatabase],
+                              executor: concurrent.futures.Executor, max_workers: int
+                              ) -> Iterator[Tuple[Any,
+                                                  Optional[Dict[TargetDatabase, PLSQLAnalysisResult]],
+                                                  Optional[str]]]:
+        """배치 PL/SQL 객체를 청크 단위로 워커 풀에 제출하고 입력 순서대로 결과 반환
+        
+        동시에 제출하는 청크 수를 워커 수의 BATCH_OBJECT_INFLIGHT_PER_WORKER배로 제한하므로
+        스트리밍 입력을 앞질러 읽지 않으며, 공유 풀의 다른 작업 사이에 끼어 실행됩니다.
+        워커는 결과의 코드를 비워서 반환합니다.
+        
+        Args:
+            objects: PLSQLObject 이터러블
+            targets: 타겟 데이터베이스 목록
+            executor: 작업 실행기
+            max_workers: 워커 수 (동시 제출 청크 수 산정용)
+            
+        Yields:
+            tuple: (PLSQLObject, 타겟별 분석 결과 또는 None, 에러 메시지 또는 None)
+        """
+        for chunk, outcomes in self._iter_chunk_results(
+            _chunk_objects(objects), _analyze_object_chunk, targets, executor,
+            max(1, max_workers) * BATCH_OBJECT_INFLIGHT_PER_WORKER
+        ):
+            for obj, (analyses, error) in zip(chunk, outcomes):
+                yield (obj, analyses, error)
+    
+    @staticmethod
+    def _with_object_source(analyses: Dict[TargetDatabase, Any], obj: Any,
+                            index: Optional[SourceIndex]) -> Dict[TargetDatabase, Any]:
+        """타겟별 PL/SQL 분석 결과의 원본 코드를 객체 DDL 코드의 줄 구간 참조로 대체
+        
+        index가 없으면 참조 대신 객체 코드를 채웁니다 (파서와 동일하게 앞뒤 공백 제거).
+        """
+        if index is None:
+            code = obj.ddl_code.strip()
+            return {target: dataclasses.replace(result, code=code)
+                    for target, result in analyses.items()}
+        source_ref = index.lines(obj.code_line_start, obj.code_line_end)
+        return {target: dataclasses.replace(result, code='', source_ref=source_ref)
+                for target, result in analyses.items()}
+    
+    def _analyze_batch_object(self, obj, targets: List[TargetDatabase]
+                              ) -> Tuple[Any, Optional[Dict[TargetDatabase, PLSQLAnalysisResult]],
+                                         Optional[str]]:
+        """배치 PL/SQL 객체 하나 분석
+        
+        Args:
+            obj: PLSQLObject
+            targets: 타겟 데이터베이스 목록
+            
+        Returns:
+            tuple: (PLSQLObject, 타겟별 분석 결과 또는 None, 에러 메시지 또는 None)
+        """
+        try:
+            # 개별 객체 분석 (한 번 파싱, 타겟별 점수 계산, 캐시 사용)
+            label = ".".join(filter(None, (obj.owner, obj.object_name)))
+            with profile_input(f"{label} ({obj.line_start}행)"):
+                return (obj, self.analyze_plsql_multi(obj.ddl_code, targets), None)
+        except Exception as e:
+            logger.error(f"PL/SQL 객체 분석 실패: {obj.object_name}", exc_info=True)
+            return (obj, None, str(e))
+    
     def _calculate_batch_complexity_summary(self, results: List[Dict]) -> Dict:
         """배치 분석 결과의 복잡도 요약 계산
         
@@ -7,50 +7,171 @@ BatchAnalyzer 모듈
 
 import logging
 import concurrent.futures
+import dataclasses
 import os
+import time
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Optional, Union, Dict, Any
+from typing import Optional, Union, Dict, Any, Callable, Iterable, Iterator, List, Tuple
 
-from ..enums import ComplexityLevel
-from ..data_models import BatchAnalysisResult
-from .file_processor import FileProcessor
+from src.utils.file_utils import IgnorePatterns, SourceFile, read_head, select_shard
+from src.utils.metrics import MetricsRecorder, collect_stages, peak_rss_bytes
+from ..enums import TargetDatabase
+from ..data_models import BatchAnalysisResult, SourceRef
+from ..detector_profile import profile_input
+from ..file_detector import is_plsql, is_batch_plsql
+from ..source_ref import SourceIndex, slim_result
+from .file_processor import FileProcessor, FileStream
+from .journal import BatchJournal
+from .partial import PartialResultWriter, merge_partial_results
 from .result_aggregator import ResultAggregator
+from .result_store import ResultStore, StoredResults, StreamingAggregator
+from .scheduler import TIMINGS_FILENAME, ChunkQueue, FileTimings, iter_windows
+from .worker_pool import (
+    WORKER_CRASH_ERROR, WORKER_CRASH_RETRIES, WorkerPool, format_timeout_error, tracked_task
+)
 
 # 로거 초기화
 logger = logging.getLogger(__name__)
 
+# 워커당 동시에 제출해 두는 파일 청크 수
+FILE_INFLIGHT_PER_WORKER = 2
 
-def _process_result(result: Union[Dict[str, Any], Any], 
-                    complexity_distribution: Dict[str, int]) -> float:
-    """분석 결과 처리 (배치 PL/SQL 또는 일반 결과)
+# 부모 프로세스가 문장 청크로 나누어 공유 풀에 제출하는 SQL 스크립트의 최소 크기 (바이트)
+# (이보다 작은 스크립트는 워커 하나가 파일 단위로 분석)
+SCRIPT_STREAM_BYTES = 1024 * 1024
+
+# 워커 프로세스의 분석기 (풀 초기화 시 한 번 설정)
+_worker_analyzer = None
+
+
+def _init_worker(analyzer) -> None:
+    """워커 프로세스 초기화 (분석기를 프로세스당 한 번만 전달받음)"""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _analyze_file(analyzer, file_name: str,
+                  targets: Optional[List[TargetDatabase]] = None) -> tuple:
+    """단일 파일 분석
+    
+    파일은 한 번만 읽으며, 결과는 원본 텍스트 대신 SourceRef를 담아 반환합니다.
+    읽은 시점의 파일 크기와 수정 시각을 함께 반환하므로 저널은 분석 중 파일이 바뀌어도
+    결과와 맞는 값을 기록합니다.
+    
+    Args:
+        analyzer: OracleComplexityAnalyzer 인스턴스
+        file_name: 분석할 파일 경로
+        targets: 다중 타겟 분석의 타겟 목록 (None이면 분석기 타겟의 단일 결과)
+        
+    Returns:
+        tuple: (파일명, 분석 결과 또는 None, 에러 메시지 또는 None,
+        읽은 시점의 (크기, 수정 시각(나노초)) 또는 None)
+    """
+    try:
+        # 파일은 한 번만 읽고 분석과 SourceRef 생성에 같은 내용을 사용
+        with analyzer.open_source(file_name) as source, profile_input(file_name):
+            if targets is None:
+                result = analyzer.analyze_file(file_name, source=source)
+            else:
+                result = analyzer.analyze_file_multi(file_name, targets, source=source)
+            index = SourceIndex(file_name, source.data, source.encoding)
+            return (file_name, slim_result(result, index), None, _read_stamp(source))
+    except Exception as e:
+        logger.error(f"파일 분석 실패: {file_name}", exc_info=True)
+        return (file_name, None, str(e), None)
+
+
+def _read_stamp(source: SourceFile) -> Optional[Tuple[int, int]]:
+    """읽은 시점의 (파일 크기, 수정 시각(나노초)) (저널의 파일 변경 확인 기준)"""
+    if source.mtime_ns is None:
+        return None
+    return (source.size, source.mtime_ns)
+
+
+def _fingerprint_file(analyzer, file_name: str) -> tuple:
+    """단일 SQL 문 파일의 중복 제거 키 계산
     
     Args:
-        result: 분석 결과 (딕셔너리 또는 데이터 클래스)
-        complexity_distribution: 복잡도 분포 딕셔너리
+        analyzer: OracleComplexityAnalyzer 인스턴스
+        file_name: 파일 경로
         
     Returns:
-        float: 누적할 점수
+        tuple: (파일명, 중복 제거 키 또는 None, 원본 소스 참조 또는 None,
+        읽은 시점의 (크기, 수정 시각(나노초)) 또는 None)
+        (PL/SQL, 배치 PL/SQL, 여러 문장 스크립트, 읽기 실패 파일은 키 없음)
     """
-    total_score = 0.0
+    from src.parsers.sql_splitter import split_statements
+    
+    try:
+        with analyzer.open_source(file_name) as source:
+            content = source.text
+            if is_batch_plsql(content) or is_plsql(content) or len(split_statements(content)) > 1:
+                return (file_name, None, None, None)
+            index = SourceIndex(file_name, source.data, source.encoding)
+            return (file_name, analyzer._shape_key(content), index.whole(), _read_stamp(source))
+    except Exception:
+        # 오류는 분석 단계에서 보고
+        return (file_name, None, None, None)
+
+
+def _analyze_file_chunk(file_names: List[str],
+                        targets: Optional[List[TargetDatabase]] = None,
+                        collect_metrics: bool = False) -> List[tuple]:
+    """파일 청크 분석 (워커 프로세스 작업)
     
-    # 배치 PL/SQL 파일인 경우 딕셔너리로 반환됨
+    Args:
+        file_names: 파일 경로 목록
+        targets: 다중 타겟 분석의 타겟 목록 (None이면 분석기 타겟의 단일 결과)
+        collect_metrics: 파일별 처리량 지표(크기, 단계별 시간, 워커, 최대 메모리) 수집 여부
+    
+    Returns:
+        List[tuple]: (파일명, 분석 결과 또는 None, 에러 메시지 또는 None, 읽은 시점의
+        (크기, 수정 시각) 또는 None, 처리 시간(초), 처리량 지표 또는 None) 목록
+    """
+    outcomes = []
+    for file_name in file_names:
+        start = time.perf_counter()
+        if not collect_metrics:
+            with tracked_task(file_name):
+                outcome = _analyze_file(_worker_analyzer, file_name, targets)
+            outcomes.append(outcome + (time.perf_counter() - start, None))
+            continue
+        
+        with tracked_task(file_name), collect_stages() as stages:
+            outcome = _analyze_file(_worker_analyzer, file_name, targets)
+        try:
+            size = os.path.getsize(file_name)
+        except OSError:
+            size = 0
+        stats = {'bytes': size, 'stages': stages, 'worker': os.getpid(), 'rss': peak_rss_bytes()}
+        outcomes.append(outcome + (time.perf_counter() - start, stats))
+    return outcomes
+
+
+def _count_objects(result: Any) -> int:
+    """분석 결과의 객체 수 (SQL 문/PL/SQL 객체 1개, 스크립트는 문장 수, 배치 PL/SQL은 객체 수)"""
+    if result is None:
+        return 0
     if isinstance(result, dict):
-        # 배치 PL/SQL 결과 처리
-        for obj_result in result.get('results', []):
-            # analysis는 PLSQLAnalysisResult 객체
-            analysis = obj_result.get('analysis')
-            if analysis:
-                # 데이터 클래스 객체에서 속성 접근
-                level_name = analysis.complexity_level.value
-                complexity_distribution[level_name] += 1
-                total_score += analysis.normalized_score
-    else:
-        # 일반 SQL/PL/SQL 결과 처리
-        level_name = result.complexity_level.value
-        complexity_distribution[level_name] += 1
-        total_score += result.normalized_score
-    
-    return total_score
+        if 'total_objects' in result:
+            return result['total_objects']
+        if 'total_statements' in result:
+            return result['total_statements']
+        if 'total_subprograms' in result:
+            return result['total_subprograms']
+        # 다중 타겟 결과 (타겟: 결과)
+        return _count_objects(next(iter(result.values()), None))
+    return 1
+
+
+def _fingerprint_file_chunk(file_names: List[str]) -> List[tuple]:
+    """파일 청크 중복 제거 키 계산 (워커 프로세스 작업)"""
+    outcomes = []
+    for file_name in file_names:
+        with tracked_task(file_name):
+            outcomes.append(_fingerprint_file(_worker_analyzer, file_name))
+    return outcomes
 
 
 class BatchAnalyzer:
@@ -66,26 +187,73 @@ class BatchAnalyzer:
         max_workers: 병렬 처리 워커 수 (기본값: CPU 코어 수)
         file_processor: 파일 검색 처리기
         result_aggregator: 결과 집계 및 리포트 생성기
+        excludes: 폴더 검색 시 적용할 gitignore 형식 제외 패턴
+        shard: 분석할 샤드 (샤드 번호, 전체 샤드 수) 또는 None
+        partial_path: 샤드 분석 후 저장된 부분 결과 파일 경로
+        file_timeout: 파일 하나(배치 PL/SQL 파일은 객체 하나)의 분석 시간 제한 (초) 또는 None
+        max_tasks_per_child: 워커 프로세스 하나가 처리할 최대 청크 수 또는 None
+        metrics: 처리량 지표 기록기 또는 None
     """
     
     # 지원하는 파일 확장자 (하위 호환성을 위해 유지)
     SUPPORTED_EXTENSIONS = FileProcessor.SUPPORTED_EXTENSIONS
     
-    def __init__(self, analyzer, max_workers: Optional[int] = None):
+    def __init__(self, analyzer, max_workers: Optional[int] = None,
+                 journal: bool = False, resume: bool = False, spill_results: bool = False,
+                 excludes: Optional[IgnorePatterns] = None,
+                 shard: Optional[Tuple[int, int]] = None,
+                 file_timeout: Optional[float] = None,
+                 max_tasks_per_child: Optional[int] = None,
+                 metrics: Optional[MetricsRecorder] = None):
         """BatchAnalyzer 초기화
         
         Args:
             analyzer: OracleComplexityAnalyzer 인스턴스
             max_workers: 병렬 처리 워커 수 (None이면 CPU 코어 수 사용)
+            journal: 완료된 파일 결과를 출력 디렉토리의 저널에 기록할지 여부
+            resume: 저널에 기록된 파일 중 변경되지 않은 파일은 다시 분석하지 않음
+                (journal 포함)
+            spill_results: 파일별 결과를 메모리 대신 출력 디렉토리의 임시 SQLite 파일에
+                저장 (결과의 results는 StoredResults)
+            excludes: 폴더 검색 시 적용할 gitignore 형식 제외 패턴 (폴더 기준 상대 경로)
+            shard: (샤드 번호, 전체 샤드 수), 지정하면 검색된 파일 중 이 샤드에 배정된
+                파일만 분석하고 파일별 결과를 출력 디렉토리의 부분 결과 파일에 기록
+            file_timeout: 파일 하나의 분석 시간 제한 (초), 넘기면 워커를 강제 종료하고
+                파일을 시간 초과 실패로 기록 (배치 PL/SQL 파일은 객체 하나 기준)
+            max_tasks_per_child: 워커 프로세스 하나가 처리할 최대 청크 수, 넘기면 새
+                워커로 교체하여 메모리 증가를 제한 (Python 3.11 이상)
+            metrics: 처리량 지표 기록기, 지정하면 파일 검색 시간과 파일별 처리 시간, 크기,
+                객체 수, 단계별(read/parse/score) 시간, 워커별 최대 메모리, 큐 깊이를 기록
+            
+        Raises:
+            ValueError: file_timeout 또는 max_tasks_per_child가 양수가 아닌 경우
         """
+        if file_timeout is not None and file_timeout <= 0:
+            raise ValueError(f"파일 분석 시간 제한은 양수여야 합니다: {file_timeout}")
+        if max_tasks_per_child is not None and max_tasks_per_child <= 0:
+            raise ValueError(f"워커당 최대 작업 수는 양수여야 합니다: {max_tasks_per_child}")
+        
         self.analyzer = analyzer
-        self.max_workers = max_workers or os.cpu_count()
+        # 워커 수는 한 번만 정수로 정함 (os.cpu_count()를 알 수 없으면 1)
+        self.max_workers: int = max_workers or os.cpu_count() or 1
+        self.journal = journal or resume
+        self.resume = resume
+        self.spill_results = spill_results
+        self.excludes = excludes
+        self.shard = shard
+        self.partial_path: Optional[Path] = None
+        self.file_timeout = file_timeout
+        self.max_tasks_per_child = max_tasks_per_child
+        self.metrics = metrics
         self.source_folder_name: Optional[str] = None  # 분석 대상 폴더명 저장
         
         # 하위 모듈 초기화
         self.file_processor = FileProcessor()
         self.result_aggregator = ResultAggregator(analyzer)
         
+        if metrics is not None:
+            metrics.workers = self.max_workers
+        
         logger.info(f"BatchAnalyzer 초기화: max_workers={self.max_workers}")
     
     def find_sql_files(self, folder_path: str):
@@ -97,10 +265,23 @@ class BatchAnalyzer:
         Returns:
             List[Path]: 찾은 파일 경로 리스트
         """
-        return self.file_processor.find_sql_files(folder_path)
+        return self.file_processor.find_sql_files(folder_path, self.excludes)
+    
+    def _stream_sql_files(self, folder_path: str) -> FileStream:
+        """폴더 파일 검색 스트림 생성 (폴더 확인은 즉시 수행, 파일은 분석과 함께 검색)
+        
+        샤드를 지정하면 크기 기준 분배에 전체 파일 목록이 필요하므로 검색을 마친 뒤
+        이 샤드에 배정된 파일만 반환합니다.
+        """
+        files = self.file_processor.iter_sql_files(folder_path, self.excludes)
+        if self.metrics is not None:
+            files = self.metrics.timed_iter('discovery', files)
+        if self.shard is not None:
+            files = iter(select_shard(list(files), self.shard, folder_path))
+        return FileStream(files)
     
     def _analyze_single_file(self, file_path: Path) -> tuple:
-        """단일 파일 분석 (병렬 처리용 헬퍼 메서드)
+        """단일 파일 분석 (현재 프로세스에서 실행)
         
         Args:
             file_path: 분석할 파일 경로
@@ -108,14 +289,485 @@ class BatchAnalyzer:
         Returns:
             tuple: (파일명, 분석 결과 또는 None, 에러 메시지 또는 None)
         """
+        return _analyze_file(self.analyzer, str(file_path))[:3]
+    
+    def _fingerprint_single_file(self, file_path: Path) -> tuple:
+        """단일 SQL 문 파일의 중복 제거 키 계산 (현재 프로세스에서 실행)
+        
+        Args:
+            file_path: 파일 경로
+            
+        Returns:
+            tuple: (파일명, 중복 제거 키 또는 None, 원본 소스 참조 또는 None)
+        """
+        return _fingerprint_file(self.analyzer, str(file_path))[:3]
+    
+    def _create_aggregator(self, targets: List[TargetDatabase], multi: bool = False,
+                           folder_path: Optional[str] = None) -> StreamingAggregator:
+        """결과 집계기 생성
+        
+        spill_results면 결과를 출력 디렉토리의 임시 저장소에 기록하고, 샤드 분석이면
+        결과를 출력 디렉토리의 부분 결과 파일에도 기록합니다.
+        """
+        store = None
+        if self.spill_results:
+            store = ResultStore(self.analyzer.output_dir)
+            logger.info(f"배치 분석 결과 임시 저장소: {store.path}")
+        partial = None
+        if self.shard is not None and folder_path is not None:
+            partial = PartialResultWriter.for_run(
+                self.analyzer.output_dir, folder_path, self.analyzer, self.shard,
+                targets if multi else None
+            )
+            self.partial_path = partial.path
+        return StreamingAggregator(targets, multi, store, partial)
+    
+    def _create_executor(self) -> WorkerPool:
+        """워커 풀 생성 (분석기는 워커 초기화 시 프로세스당 한 번만 전달)
+        
+        file_timeout을 지정하면 풀이 시간 제한을 넘긴 워커를 강제 종료하며, 깨진 풀은
+        다음 제출 시 다시 만들어집니다.
+        """
+        return WorkerPool(
+            self.max_workers, initializer=_init_worker, initargs=(self.analyzer,),
+            task_timeout=self.file_timeout, max_tasks_per_child=self.max_tasks_per_child
+        )
+    
+    def _load_timings(self) -> FileTimings:
+        """이전 실행의 파일별 처리 시간 기록 로드 (분석 캐시를 쓰지 않으면 저장하지 않음)"""
+        cache = getattr(self.analyzer, 'cache', None)
+        if cache is None:
+            return FileTimings()
+        return FileTimings.load(cache.db_path.parent / TIMINGS_FILENAME)
+    
+    def _iter_chunked(self, executor: concurrent.futures.Executor, task,
+                      file_names: Iterable[str], task_args: tuple = (),
+                      timings: Optional[FileTimings] = None,
+                      on_failure: Optional[Callable[[str, str, Optional[float]], tuple]] = None
+                      ) -> Iterator[tuple]:
+        """파일 목록을 예상 비용 기준 청크로 나누어 큰 청크부터 제출하고 완료된 결과 반환
+        
+        큰 파일을 먼저 제출해 마지막에 남은 큰 파일 하나가 전체 처리 시간을 결정하지
+        않도록 하고, 작은 파일은 묶어서 제출합니다. 동시에 제출하는 청크 수는 워커 수의
+        FILE_INFLIGHT_PER_WORKER배로 제한하며, 청크가 끝날 때마다 다음 청크를 제출합니다.
+        file_names가 검색 중인 스트림이면 검색된 구간별로 청크를 구성하므로 검색이
+        끝나기 전에 분석이 시작됩니다. 워커가 모두 바쁜 동안 다음 구간을 미리 검색하고
+        대기 청크는 구간에 관계없이 비용이 큰 것부터 제출하므로, 늦게 검색된 큰 파일도
+        먼저 검색된 작은 파일보다 앞서 제출됩니다.
+        
+        on_failure를 지정하면 워커가 종료되어(시간 초과 강제 종료 포함) 깨진 청크를
+        복구합니다. 시간 초과된 파일은 실패 결과로 반환하고 나머지 파일은 다시 제출합니다.
+        시간 초과 없이 깨진 청크는 종료 원인 파일을 알 수 없으므로, 그 파일들은 다른 작업이
+        없을 때 하나씩 따로 다시 분석하고, 따로 분석하는 중에 WORKER_CRASH_RETRIES번 넘게
+        워커를 종료시킨 파일은 실패로 반환합니다.
+        
+        Args:
+            executor: 작업 실행기
+            task: 청크 작업 함수 (file_names, *task_args) -> List[tuple]
+            file_names: 파일 경로 목록 또는 이터레이터
+            task_args: task 추가 인자
+            timings: 예상 비용 계산에 사용할 처리 시간 기록 (None이면 파일 크기 기준)
+            on_failure: 실패 결과 생성 함수 (파일명, 에러 메시지, 경과 시간 또는 None) -> tuple
+                (None이면 깨진 풀의 BrokenProcessPool을 그대로 전달)
+            
+        Yields:
+            tuple: 파일별 작업 결과 (완료 순서)
+        """
+        timings = timings or FileTimings()
+        inflight_limit = self.max_workers * FILE_INFLIGHT_PER_WORKER
+        timed_out: Dict[str, float] = getattr(executor, 'timed_out', {})
+        # 제출된 작업 → (청크 파일 목록, 제출 시점의 시간 초과 작업 수, 단독 실행 여부)
+        pending: Dict[concurrent.futures.Future, Tuple[List[str], int, bool]] = {}
+        # 파일별 단독 실행 중 워커 종료(시간 초과로 깨진 풀 제외) 횟수
+        crashes: Dict[str, int] = {}
+        # 시간 초과 없이 깨진 청크에 있던 파일 (다른 작업이 없을 때 하나씩 다시 분석)
+        suspects: List[str] = []
+        
+        def submit(chunk: List[str], isolated: bool = False) -> None:
+            # 깨진 풀은 제출 시 다시 만들어짐
+            pending[executor.submit(task, chunk, *task_args)] = (chunk, len(timed_out), isolated)
+        
+        def collect(future: concurrent.futures.Future) -> Iterator[tuple]:
+            chunk, timeouts_before, isolated = pending.pop(future)
+            if self.metrics is not None:
+                self.metrics.sample_queue(len(pending))
+            try:
+                outcomes = future.result()
+            except BrokenProcessPool:
+                if on_failure is None:
+                    raise
+                yield from recover(chunk, len(timed_out) > timeouts_before, isolated, on_failure)
+            else:
+                yield from outcomes
+        
+        def recover(chunk: List[str], caused_by_timeout: bool, isolated: bool,
+                    on_failure: Callable[[str, str, Optional[float]], tuple]) -> Iterator[tuple]:
+            retry = []
+            for file_name in chunk:
+                if file_name in timed_out and self.file_timeout is not None:
+                    elapsed = timed_out[file_name]
+                    yield on_failure(file_name, format_timeout_error(elapsed, self.file_timeout), elapsed)
+                    continue
+                if caused_by_timeout:
+                    retry.append(file_name)
+                    continue
+                # 단독 실행 중 깨졌을 때만 이 파일이 워커를 종료시킨 것으로 셈
+                if isolated:
+                    crashes[file_name] = crashes.get(file_name, 0) + 1
+                if crashes.get(file_name, 0) > WORKER_CRASH_RETRIES:
+                    logger.error(f"파일 분석 실패: {file_name} ({WORKER_CRASH_ERROR})")
+                    yield on_failure(file_name, WORKER_CRASH_ERROR, None)
+                else:
+                    suspects.append(file_name)
+            if retry:
+                submit(retry)
+        
+        queue = ChunkQueue(self.max_workers)
+        windows = iter_windows(file_names, self.max_workers)
+        
+        def discover() -> bool:
+            window = next(windows, None)
+            if window is None:
+                return False
+            queue.add([(name, timings.estimate(name)) for name in window])
+            return True
+        
+        discovering = discover()
+        while queue or discovering:
+            if queue and len(pending) < inflight_limit:
+                submit(queue.pop())
+                continue
+            if discovering:
+                # 워커가 모두 바쁜 동안 다음 구간을 검색해 대기열에 추가하고
+                # (나중에 검색된 큰 파일이 남은 작은 청크보다 먼저 제출됨) 끝난 작업만 수집
+                discovering = discover()
+                done = {future for future in pending if future.done()}
+            else:
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+            for future in done:
+                yield from collect(future)
+        
+        # 복구 중 다시 제출된 청크가 있으므로 남은 작업이 없을 때까지 대기
+        while pending or suspects:
+            if not pending:
+                submit([suspects.pop(0)], isolated=True)
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                yield from collect(future)
+    
+    def _is_batch_spool(self, file_path: Path) -> bool:
+        """배치 PL/SQL 스풀(.out) 파일 여부
+        
+        앞부분 바이트만 읽어 판별하고 파일을 바로 닫으므로, 검색 중 만난 스풀 파일이
+        많아도 열린 파일이나 메모리에 남는 내용이 없습니다.
+        """
+        from ..analyzer import BATCH_SNIFF_CHARS
+        
+        if file_path.suffix.lower() != '.out':
+            return False
+        try:
+            return is_batch_plsql(read_head(file_path, BATCH_SNIFF_CHARS))
+        except (OSError, UnicodeDecodeError):
+            # 오류는 파일 단위 분석 단계에서 보고
+            return False
+    
+    def _is_large_script(self, file_path: Path) -> bool:
+        """문장 청크로 나누어 분석할 큰 SQL 스크립트 여부
+        
+        SCRIPT_STREAM_BYTES 이상인 .sql 파일 중 앞부분에 SQL 문이 둘 이상 있고 PL/SQL로
+        보이지 않는 파일입니다. 앞부분 바이트만 읽어 판별합니다.
+        """
+        from src.parsers.sql_splitter import split_statements
+        from ..analyzer import BATCH_SNIFF_CHARS
+        
+        if file_path.suffix.lower() != '.sql':
+            return False
+        try:
+            if os.path.getsize(file_path) < SCRIPT_STREAM_BYTES:
+                return False
+            head = read_head(file_path, BATCH_SNIFF_CHARS)
+        except (OSError, UnicodeDecodeError):
+            # 오류는 파일 단위 분석 단계에서 보고
+            return False
+        return (not is_batch_plsql(head) and not is_plsql(head)
+                and len(split_statements(head)) > 1)
+    
+    def _analyze_streamed_file(self, executor: concurrent.futures.Executor, file_path: Path,
+                               targets: Optional[List[TargetDatabase]] = None) -> tuple:
+        """배치 PL/SQL 파일이나 큰 SQL 스크립트를 객체/문장 청크 단위로 공유 워커 풀에서 분석
+        
+        파일 하나를 작업 하나로 보내면 객체나 문장이 많은 파일이 워커 하나를 오래
+        점유하므로, 부모 프로세스가 파일을 스트리밍하며 객체/문장 청크를 같은 풀에
+        제출합니다. 풀을 새로 만들지 않으므로 워커 수가 max_workers를 넘지 않습니다.
+        file_timeout을 지정하면 객체나 문장 하나가 시간 제한을 넘겨 워커가 종료될 때 파일
+        전체를 시간 초과 실패로 기록합니다.
+        
+        Args:
+            executor: 공유 작업 실행기
+            file_path: 배치 PL/SQL 파일 또는 SQL 스크립트 경로
+            targets: 타겟 데이터베이스 목록 (None이면 분석기 기본 타겟의 결과만 반환)
+            
+        Returns:
+            tuple: (파일명, 분석 결과 또는 None, 에러 메시지 또는 None,
+            읽은 시점의 (크기, 수정 시각) 또는 None)
+        """
         file_name = str(file_path)
+        timed_out: Dict[str, float] = getattr(executor, 'timed_out', {})
+        timeouts_before = len(timed_out)
         
         try:
-            result = self.analyzer.analyze_file(file_name)
-            return (file_name, result, None)
+            with self.analyzer.open_source(file_name) as source:
+                results = self.analyzer.analyze_file_multi(
+                    file_name, targets or [self.analyzer.target],
+                    max_workers=self.max_workers, source=source, executor=executor
+                )
+                if targets is None:
+                    results = results[self.analyzer.target]
+                index = SourceIndex(file_name, source.data, source.encoding)
+                return (file_name, slim_result(results, index), None, _read_stamp(source))
+        except BrokenProcessPool as e:
+            # 객체/문장 분석 중 시간 초과로 워커가 종료되면 파일 전체를 시간 초과로 기록
+            if len(timed_out) > timeouts_before and self.file_timeout is not None:
+                label, elapsed = list(timed_out.items())[-1]
+                detail = label if file_path.suffix.lower() == '.sql' else f"객체 {label}"
+                logger.error(f"파일 분석 시간 초과: {file_name} ({detail})")
+                error = format_timeout_error(elapsed, self.file_timeout, detail)
+                return (file_name, None, error, None)
+            logger.error(f"파일 분석 실패: {file_name}", exc_info=True)
+            return (file_name, None, str(e) or WORKER_CRASH_ERROR, None)
         except Exception as e:
             logger.error(f"파일 분석 실패: {file_name}", exc_info=True)
-            return (file_name, None, str(e))
+            return (file_name, None, str(e), None)
+    
+    def _iter_file_outcomes(self, executor: concurrent.futures.Executor, sql_files: Iterable[Path],
+                            targets: Optional[List[TargetDatabase]] = None,
+                            fingerprint_counts: Optional[Dict[str, int]] = None,
+                            file_shapes: Optional[Dict[str, str]] = None,
+                            file_stamps: Optional[Dict[str, Tuple[int, int]]] = None
+                            ) -> Iterator[Tuple[str, Any, Optional[str]]]:
+        """파일 분석 작업을 청크 단위로 제출하고 완료 순서대로 결과 반환
+        
+        분석기의 dedupe가 켜져 있으면 먼저 파일별 SQL 형태(fingerprint)를 계산하고,
+        리터럴만 다른 단일 SQL 문 파일은 대표 파일 하나만 분석한 뒤 그 결과를 같은
+        형태의 나머지 파일에 복제합니다.
+        
+        일반 파일은 예상 처리 비용이 큰 것부터 제출하고, 배치 PL/SQL 스풀(.out) 파일과
+        큰 SQL 스크립트(SCRIPT_STREAM_BYTES 이상)는 일반 파일 제출이 끝난 뒤 객체/문장
+        청크 단위로 같은 풀에 나누어 제출합니다. 파일별
+        처리 시간은 분석 캐시 옆에 기록되어 다음 실행의 예상 비용으로 사용됩니다.
+        sql_files가 검색 중인 스트림이면 파일을 검색하는 대로 제출합니다.
+        
+        Args:
+            executor: 작업 실행기 (_create_executor()로 생성한 풀)
+            sql_files: 분석할 파일 경로 목록 또는 이터레이터
+            targets: 다중 타겟 분석의 타겟 목록 (None이면 단일 타겟 결과)
+            fingerprint_counts: 형태별 파일 수를 기록할 딕셔너리 (선택사항)
+            file_shapes: 파일별 SQL 형태 키를 기록할 딕셔너리 (선택사항)
+            file_stamps: 분석에 성공한 파일별로 읽은 시점의 (크기, 수정 시각)을 기록할
+                딕셔너리 (선택사항, 결과를 반환하기 전에 기록)
+            
+        Yields:
+            tuple: (파일명, 분석 결과 또는 None, 에러 메시지 또는 None)
+        """
+        def record_stamp(file_name: str, stamp: Optional[Tuple[int, int]]) -> None:
+            if file_stamps is not None and stamp is not None:
+                file_stamps[file_name] = stamp
+        
+        # 대표 파일명 → [(같은 형태의 파일명, 원본 소스 참조, 읽은 시점의 (크기, 수정 시각))]
+        followers: Dict[str, List[Tuple[str, SourceRef, Optional[Tuple[int, int]]]]] = {}
+        to_analyze = sql_files
+        
+        if self.analyzer.dedupe:
+            representatives: Dict[Tuple[str, int], str] = {}
+            to_analyze = []
+            # 형태 계산은 검색과 함께 진행 (대표 파일 선택에 쓰도록 검색 순서 기록)
+            discovered: List[Path] = []
+            
+            def record_order(files: Iterable[Path]) -> Iterator[str]:
+                for file_path in files:
+                    discovered.append(file_path)
+                    yield str(file_path)
+            
+            fingerprints = {
+                file_name: (key, source_ref, stamp)
+                for file_name, key, source_ref, stamp in self._iter_chunked(
+                    executor, _fingerprint_file_chunk, record_order(sql_files),
+                    on_failure=lambda file_name, error, seconds: (file_name, None, None, None)
+                )
+            }
+            
+            # 대표 파일은 파일 목록 순서의 첫 파일
+            for file_path in discovered:
+                file_name = str(file_path)
+                key, source_ref, stamp = fingerprints[file_name]
+                if key is None:
+                    to_analyze.append(file_path)
+                    continue
+                if fingerprint_counts is not None:
+                    fingerprint_counts[key[0]] = fingerprint_counts.get(key[0], 0) + 1
+                if file_shapes is not None:
+                    file_shapes[file_name] = key[0]
+                representative = representatives.get(key)
+                if representative is None:
+                    representatives[key] = file_name
+                    followers[file_name] = []
+                    to_analyze.append(file_path)
+                else:
+                    followers[representative].append((file_name, source_ref, stamp))
+            
+            logger.info(f"SQL 형태 중복 제거: {len(discovered)}개 파일 중 {len(to_analyze)}개 분석")
+        
+        # 배치 PL/SQL 스풀과 큰 SQL 스크립트는 경로만 따로 모아 두고 일반 파일만 청크로 제출
+        # (분석할 때 하나씩 열어 동시에 열린 파일 수가 늘어나지 않도록 함)
+        streamed: List[Path] = []
+        # 형태 계산 중 시간 초과된 파일은 다시 분석하지 않고 실패로 반환
+        timed_out: Dict[str, float] = getattr(executor, 'timed_out', {})
+        skipped: List[str] = []
+        
+        def regular_files(files: Iterable[Path]) -> Iterator[str]:
+            for file_path in files:
+                if str(file_path) in timed_out:
+                    skipped.append(str(file_path))
+                    continue
+                if self._is_batch_spool(file_path) or self._is_large_script(file_path):
+                    streamed.append(file_path)
+                else:
+                    yield str(file_path)
+        
+        def failed_outcome(file_name: str, error: str, seconds: Optional[float]) -> tuple:
+            return (file_name, None, error, None, seconds, None)
+        
+        timings = self._load_timings()
+        for file_name, result, error, stamp, seconds, stats in self._iter_chunked(
+            executor, _analyze_file_chunk, regular_files(to_analyze),
+            (targets, self.metrics is not None), timings, on_failure=failed_outcome
+        ):
+            if seconds is not None:
+                timings.record(file_name, seconds)
+            self._record_metrics(file_name, result, error, seconds, stats)
+            record_stamp(file_name, stamp)
+            yield (file_name, result, error)
+            
+            for follower_name, source_ref, follower_stamp in followers.get(file_name, ()):
+                follower_result = None if error else self._with_source(result, source_ref)
+                self._record_metrics(follower_name, follower_result, error, deduped=True)
+                record_stamp(follower_name, follower_stamp)
+                yield (follower_name, follower_result, error)
+        timings.save()
+        
+        # 형태 계산 중 시간 초과된 파일은 시간 제한을 지정한 경우에만 생김
+        if self.file_timeout is not None:
+            for file_name in skipped:
+                error = format_timeout_error(timed_out[file_name], self.file_timeout)
+                self._record_metrics(file_name, None, error, timed_out[file_name])
+                yield (file_name, None, error)
+        
+        # 배치 PL/SQL 파일 객체 및 큰 SQL 스크립트 문장 분석 (청크를 같은 풀로 제출)
+        for file_path in streamed:
+            start = time.perf_counter()
+            file_name, result, error, stamp = self._analyze_streamed_file(executor, file_path, targets)
+            kind: Dict[str, Any] = {'script' if file_path.suffix.lower() == '.sql' else 'spool': True}
+            self._record_metrics(file_name, result, error, time.perf_counter() - start, **kind)
+            record_stamp(file_name, stamp)
+            yield (file_name, result, error)
+    
+    def _iter_journaled_outcomes(self, executor: concurrent.futures.Executor, folder_path: str,
+                                 sql_files: Iterable[Path],
+                                 targets: Optional[List[TargetDatabase]] = None,
+                                 fingerprint_counts: Optional[Dict[str, int]] = None
+                                 ) -> Iterator[Tuple[str, Any, Optional[str]]]:
+        """저널을 사용하는 파일 분석 결과 반환
+        
+        저널을 사용하지 않으면 _iter_file_outcomes()와 같습니다. 재개(resume) 시에는
+        저널에 기록된 파일은 검색되는 대로 저널 결과를 반환하고 나머지 파일만 분석하며,
+        새로 분석한 파일의 결과는 도착하는 대로 워커가 파일을 읽은 시점의 크기, 수정
+        시각과 함께 저널에 기록합니다. 실패한 파일은 기록하지 않으므로 재개 시 다시
+        분석됩니다.
+        
+        Args:
+            executor: 작업 실행기
+            folder_path: 분석 폴더 경로 (저널 선택 기준)
+            sql_files: 분석할 파일 경로 목록 또는 이터레이터
+            targets: 다중 타겟 분석의 타겟 목록 (None이면 단일 타겟 결과)
+            fingerprint_counts: 형태별 파일 수를 기록할 딕셔너리 (선택사항)
+            
+        Yields:
+            tuple: (파일명, 분석 결과 또는 None, 에러 메시지 또는 None)
+        """
+        if not self.journal:
+            yield from self._iter_file_outcomes(executor, sql_files, targets, fingerprint_counts)
+            return
+        
+        with BatchJournal.for_run(self.analyzer.output_dir, folder_path, self.analyzer, targets,
+                                  self.shard) as journal:
+            completed, shapes = journal.start(resume=self.resume)
+            
+            # 검색 중 만난 완료 파일의 결과 (분석 결과 사이에 반환)
+            resumed: List[Tuple[str, Any, Optional[str]]] = []
+            
+            def pending_files(files: Iterable[Path]) -> Iterator[Path]:
+                for file_path in files:
+                    file_name = str(file_path)
+                    if file_name not in completed:
+                        yield file_path
+                        continue
+                    if fingerprint_counts is not None and file_name in shapes:
+                        shape = shapes[file_name]
+                        fingerprint_counts[shape] = fingerprint_counts.get(shape, 0) + 1
+                    resumed.append((file_name, completed.pop(file_name), None))
+                    self._record_metrics(file_name, resumed[-1][1], None, resumed=True)
+            
+            file_shapes: Dict[str, str] = {}
+            file_stamps: Dict[str, Tuple[int, int]] = {}
+            for file_name, result, error in self._iter_file_outcomes(
+                executor, pending_files(sql_files), targets, fingerprint_counts, file_shapes,
+                file_stamps=file_stamps
+            ):
+                yield from resumed
+                resumed.clear()
+                stamp = file_stamps.pop(file_name, None)
+                if error is None and stamp is not None:
+                    journal.record(file_name, result, stamp, file_shapes.get(file_name))
+                yield (file_name, result, error)
+            yield from resumed
+    
+    def _record_metrics(self, file_name: str, result: Any, error: Optional[str],
+                        seconds: Optional[float] = None, stats: Optional[Dict[str, Any]] = None,
+                        **fields: Any) -> None:
+        """파일 처리 결과를 처리량 지표에 기록 (지표 기록기가 없으면 무시)
+        
+        Args:
+            file_name: 파일 경로
+            result: 분석 결과 (객체 수 계산용)
+            error: 에러 메시지
+            seconds: 처리 시간 (None이면 분석하지 않은 파일)
+            stats: 워커가 수집한 지표 (크기, 단계별 시간, 워커, 최대 메모리)
+            **fields: file 이벤트에 추가할 필드
+        """
+        if self.metrics is None:
+            return
+        if stats is None:
+            try:
+                size = os.path.getsize(file_name)
+            except OSError:
+                size = 0
+            stats = {'bytes': size}
+        self.metrics.record_file(
+            file_name, seconds, size=stats['bytes'], objects=_count_objects(result), error=error,
+            stages=stats.get('stages'), worker=stats.get('worker'), rss=stats.get('rss'), **fields
+        )
+    
+    def _with_source(self, result: Any, source_ref: SourceRef) -> Any:
+        """대표 파일의 분석 결과를 다른 파일의 원본 소스 참조로 복제"""
+        if isinstance(result, dict):
+            # 다중 타겟 결과 (타겟: SQLAnalysisResult)
+            return {target: self._with_source(analysis, source_ref)
+                    for target, analysis in result.items()}
+        return dataclasses.replace(result, query='', source_ref=source_ref)
     
     def analyze_folder(self, folder_path: str) -> BatchAnalysisResult:
         """폴더 내 모든 SQL/PL/SQL 파일 일괄 분석
@@ -138,11 +790,11 @@ class BatchAnalyzer:
         self.source_folder_name = Path(folder_path).name
         self.result_aggregator.source_folder_name = self.source_folder_name
         
-        # SQL/PL/SQL 파일 검색
-        sql_files = self.file_processor.find_sql_files(folder_path)
+        # SQL/PL/SQL 파일 검색 (검색된 파일부터 분석 시작)
+        sql_files = self._stream_sql_files(folder_path)
         
-        if not sql_files:
-            # 파일이 없으면 빈 결과 반환
+        if self.shard is None and sql_files.peek() is None:
+            # 파일이 없으면 빈 결과 반환 (샤드 분석은 빈 부분 결과도 기록)
             return BatchAnalysisResult(
                 total_files=0,
                 success_count=0,
@@ -150,51 +802,22 @@ class BatchAnalyzer:
                 target_database=self.analyzer.target
             )
         
-        # 결과 저장용 변수
-        results = {}
-        failed_files = {}
-        complexity_distribution = {level.value: 0 for level in ComplexityLevel}
-        total_score = 0.0
+        # 결과 집계 (분포/평균은 도착 순서대로 누적)
+        aggregator = self._create_aggregator([self.analyzer.target], folder_path=folder_path)
+        fingerprint_counts: Dict[str, int] = {}
         
         # 병렬 처리로 파일 분석
-        with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            # 모든 파일에 대해 분석 작업 제출
-            future_to_file = {
-                executor.submit(self._analyze_single_file, file_path): file_path
-                for file_path in sql_files
-            }
-            
+        with self._create_executor() as executor:
             # 완료된 작업 결과 수집
-            for future in concurrent.futures.as_completed(future_to_file):
-                file_name, result, error = future.result()
-                
-                if error:
-                    # 분석 실패
-                    failed_files[file_name] = error
-                else:
-                    # 분석 성공
-                    results[file_name] = result
-                    
-                    # 결과 처리 (배치 PL/SQL 또는 일반 결과)
-                    total_score += _process_result(result, complexity_distribution)
-        
-        # 평균 점수 계산
-        success_count = len(results)
-        average_score = total_score / success_count if success_count > 0 else 0.0
+            for file_name, result, error in self._iter_journaled_outcomes(
+                executor, folder_path, sql_files, fingerprint_counts=fingerprint_counts
+            ):
+                aggregator.add(file_name, result, error)
         
         # 배치 분석 결과 생성
-        batch_result = BatchAnalysisResult(
-            total_files=len(sql_files),
-            success_count=success_count,
-            failure_count=len(failed_files),
-            complexity_distribution=complexity_distribution,
-            average_score=average_score,
-            results=results,
-            failed_files=failed_files,
-            target_database=self.analyzer.target
-        )
+        batch_result = aggregator.build(sql_files.count, fingerprint_counts)[self.analyzer.target]
         
-        logger.info(f"배치 분석 완료: {success_count}/{len(sql_files)} 파일 성공")
+        logger.info(f"배치 분석 완료: {batch_result.success_count}/{sql_files.count} 파일 성공")
         
         return batch_result
     
@@ -222,11 +845,11 @@ class BatchAnalyzer:
         self.source_folder_name = Path(folder_path).name
         self.result_aggregator.source_folder_name = self.source_folder_name
         
-        # SQL/PL/SQL 파일 검색
-        sql_files = self.file_processor.find_sql_files(folder_path)
+        # SQL/PL/SQL 파일 검색 (검색된 파일부터 분석 시작)
+        sql_files = self._stream_sql_files(folder_path)
         
-        if not sql_files:
-            # 파일이 없으면 빈 결과 반환
+        if self.shard is None and sql_files.peek() is None:
+            # 파일이 없으면 빈 결과 반환 (샤드 분석은 빈 부분 결과도 기록)
             return BatchAnalysisResult(
                 total_files=0,
                 success_count=0,
@@ -234,11 +857,8 @@ class BatchAnalyzer:
                 target_database=self.analyzer.target
             )
         
-        # 결과 저장용 변수
-        results = {}
-        failed_files = {}
-        complexity_distribution = {level.value: 0 for level in ComplexityLevel}
-        total_score = 0.0
+        # 결과 집계 (분포/평균은 도착 순서대로 누적)
+        aggregator = self._create_aggregator([self.analyzer.target], folder_path=folder_path)
         
         # tqdm 사용 가능 여부 확인
         try:
@@ -247,19 +867,15 @@ class BatchAnalyzer:
         except ImportError:
             use_tqdm = False
         
+        fingerprint_counts: Dict[str, int] = {}
+        
         # 병렬 처리로 파일 분석
-        with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            # 모든 파일에 대해 분석 작업 제출
-            future_to_file = {
-                executor.submit(self._analyze_single_file, file_path): file_path
-                for file_path in sql_files
-            }
-            
+        with self._create_executor() as executor:
             # 진행 상황 표시 설정
             if use_tqdm:
-                # tqdm 프로그레스 바 생성
+                # tqdm 프로그레스 바 생성 (전체 파일 수는 검색이 진행되는 동안 늘어남)
                 pbar = tqdm(
-                    total=len(sql_files),
+                    total=sql_files.count,
                     desc="파일 분석",
                     unit="파일",
                     ncols=80,
@@ -267,49 +883,150 @@ class BatchAnalyzer:
                 )
             
             # 완료된 작업 결과 수집
-            for future in concurrent.futures.as_completed(future_to_file):
-                file_name, result, error = future.result()
-                
-                if error:
-                    # 분석 실패
-                    failed_files[file_name] = error
-                else:
-                    # 분석 성공
-                    results[file_name] = result
-                    
-                    # 결과 처리 (배치 PL/SQL 또는 일반 결과)
-                    total_score += _process_result(result, complexity_distribution)
+            for file_name, result, error in self._iter_journaled_outcomes(
+                executor, folder_path, sql_files, fingerprint_counts=fingerprint_counts
+            ):
+                aggregator.add(file_name, result, error)
                 
                 # 진행 상황 업데이트
                 if use_tqdm:
+                    pbar.total = sql_files.count
                     pbar.update(1)
                 elif progress_callback:
-                    progress_callback(len(results) + len(failed_files), len(sql_files))
+                    progress_callback(aggregator.processed_count, sql_files.count)
             
             # 프로그레스 바 닫기
             if use_tqdm:
                 pbar.close()
         
-        # 평균 점수 계산
-        success_count = len(results)
-        average_score = total_score / success_count if success_count > 0 else 0.0
-        
         # 배치 분석 결과 생성
-        batch_result = BatchAnalysisResult(
-            total_files=len(sql_files),
-            success_count=success_count,
-            failure_count=len(failed_files),
-            complexity_distribution=complexity_distribution,
-            average_score=average_score,
-            results=results,
-            failed_files=failed_files,
-            target_database=self.analyzer.target
-        )
+        batch_result = aggregator.build(sql_files.count, fingerprint_counts)[self.analyzer.target]
         
-        logger.info(f"배치 분석 완료 (진행 상황 표시): {success_count}/{len(sql_files)} 파일 성공")
+        logger.info(f"배치 분석 완료 (진행 상황 표시): {batch_result.success_count}/{sql_files.count} 파일 성공")
         
         return batch_result
     
+    def _analyze_single_file_multi(self, file_path: Path, targets: List[TargetDatabase]) -> tuple:
+        """단일 파일 다중 타겟 분석 (현재 프로세스에서 실행)
+        
+        파일은 한 번만 읽고 파싱하며, 점수만 타겟별로 계산합니다.
+        
+        Args:
+            file_path: 분석할 파일 경로
+            targets: 타겟 데이터베이스 목록
+            
+        Returns:
+            tuple: (파일명, 타겟별 분석 결과 또는 None, 에러 메시지 또는 None)
+        """
+        return _analyze_file(self.analyzer, str(file_path), targets)[:3]
+    
+    def analyze_folder_multi(self, folder_path: str,
+                             targets: Optional[List[TargetDatabase]] = None,
+                             show_progress: bool = False) -> Dict[TargetDatabase, BatchAnalysisResult]:
+        """폴더 내 모든 SQL/PL/SQL 파일을 여러 타겟으로 일괄 분석
+        
+        파일 검색과 파싱은 한 번만 수행하고, 타겟별 배치 분석 결과를 생성합니다.
+        
+        Args:
+            folder_path: 분석할 폴더 경로
+            targets: 타겟 데이터베이스 목록 (None이면 모든 타겟)
+            show_progress: 진행 상황 표시 여부 (tqdm 설치 시)
+            
+        Returns:
+            Dict[TargetDatabase, BatchAnalysisResult]: 타겟별 배치 분석 결과
+            
+        Raises:
+            FileNotFoundError: 폴더가 존재하지 않는 경우
+        """
+        targets = self.analyzer._resolve_targets(targets)
+        
+        # 분석 대상 폴더명 저장 (경로에서 폴더명만 추출)
+        self.source_folder_name = Path(folder_path).name
+        self.result_aggregator.source_folder_name = self.source_folder_name
+        
+        # SQL/PL/SQL 파일 검색 (검색된 파일부터 분석 시작)
+        sql_files = self._stream_sql_files(folder_path)
+        
+        if self.shard is None and sql_files.peek() is None:
+            # 파일이 없으면 빈 결과 반환 (샤드 분석은 빈 부분 결과도 기록)
+            return {
+                target: BatchAnalysisResult(
+                    total_files=0,
+                    success_count=0,
+                    failure_count=0,
+                    target_database=target
+                )
+                for target in targets
+            }
+        
+        # 타겟별 결과 집계 (분포/평균은 도착 순서대로 누적)
+        aggregator = self._create_aggregator(targets, multi=True, folder_path=folder_path)
+        
+        # tqdm 사용 가능 여부 확인
+        pbar = None
+        if show_progress:
+            try:
+                from tqdm import tqdm
+                # 전체 파일 수는 검색이 진행되는 동안 늘어남
+                pbar = tqdm(
+                    total=sql_files.count,
+                    desc="파일 분석",
+                    unit="파일",
+                    ncols=80,
+                    bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]'
+                )
+            except ImportError:
+                pbar = None
+        
+        fingerprint_counts: Dict[str, int] = {}
+        
+        # 병렬 처리로 파일 분석
+        with self._create_executor() as executor:
+            # 완료된 작업 결과 수집
+            for file_name, target_results, error in self._iter_journaled_outcomes(
+                executor, folder_path, sql_files, targets, fingerprint_counts=fingerprint_counts
+            ):
+                aggregator.add(file_name, target_results, error)
+                
+                if pbar is not None:
+                    pbar.total = sql_files.count
+                    pbar.update(1)
+        
+        if pbar is not None:
+            pbar.close()
+        
+        # 타겟별 배치 분석 결과 생성
+        batch_results = aggregator.build(sql_files.count, fingerprint_counts)
+        
+        logger.info(
+            f"다중 타겟 배치 분석 완료: {sql_files.count - len(aggregator.failed_files)}/{sql_files.count} 파일 성공, "
+            f"타겟 {len(targets)}개"
+        )
+        
+        return batch_results
+
+    def merge_partials(self, partial_paths: List[Union[str, Path]]) -> Dict[TargetDatabase, BatchAnalysisResult]:
+        """샤드 분석의 부분 결과를 합쳐 타겟별 배치 분석 결과 생성
+
+        리포트는 샤드 실행 시의 분석 대상 폴더명으로 생성되며, spill_results면 합친
+        파일별 결과를 출력 디렉토리의 임시 저장소에 기록합니다.
+
+        Args:
+            partial_paths: 모든 샤드의 부분 결과 파일 경로
+
+        Returns:
+            Dict[TargetDatabase, BatchAnalysisResult]: 타겟별 배치 분석 결과
+
+        Raises:
+            ValueError: 샤드가 누락/중복되었거나 분석 설정이 다른 부분 결과가 있는 경우
+        """
+        header, batch_results = merge_partial_results(
+            partial_paths, self.analyzer.output_dir if self.spill_results else None
+        )
+        self.source_folder_name = header['folder']
+        self.result_aggregator.source_folder_name = self.source_folder_name
+        return batch_results
+
     # 하위 호환성을 위한 메서드 위임
     def get_top_complex_files(self, batch_result: BatchAnalysisResult, top_n: int = 10):
         """복잡도가 높은 파일 Top N 추출 (하위 호환성 메서드)"""
@@ -329,4 +1046,4 @@ class BatchAnalyzer:
 
 
 # Public API
-__all__ = ['BatchAnalyzer']
+__all__ = ['BatchAnalyzer', 'StoredResults', 'merge_partial_results']
@@ -6,7 +6,9 @@ SQL/PL/SQL 파일 검색 기능을 제공합니다.
 
 import logging
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional
+
+from src.utils.file_utils import IgnorePatterns, iter_files
 
 # 로거 초기화
 logger = logging.getLogger(__name__)
@@ -43,17 +45,20 @@ class FileProcessor:
         return any(keyword in filename_lower for keyword in FileProcessor.EXCLUDED_KEYWORDS)
     
     @staticmethod
-    def find_sql_files(folder_path: str) -> List[Path]:
-        """폴더 내 SQL/PL/SQL 파일 검색
+    def iter_sql_files(folder_path: str,
+                       excludes: Optional[IgnorePatterns] = None) -> Iterator[Path]:
+        """폴더 내 SQL/PL/SQL 파일을 찾는 대로 반환
         
-        지정된 폴더와 하위 폴더에서 지원하는 확장자를 가진 파일을 모두 찾습니다.
-        .out 파일 중 AWR/Statspack 파일은 제외합니다.
+        디렉토리 트리를 한 번만 순회하며 지원하는 확장자(대소문자 구분)와 제외 패턴을
+        함께 확인합니다. .out 파일 중 AWR/Statspack 파일은 제외합니다. 폴더 확인은
+        호출 시점에 수행하고, 파일은 이름순(정렬 순서)으로 순회하면서 반환합니다.
         
         Args:
             folder_path: 검색할 폴더 경로
+            excludes: gitignore 형식 제외 패턴 (폴더 기준 상대 경로, 선택사항)
             
         Returns:
-            List[Path]: 찾은 파일 경로 리스트
+            Iterator[Path]: 찾은 파일 경로 (정렬 순서)
             
         Raises:
             FileNotFoundError: 폴더가 존재하지 않는 경우
@@ -67,18 +72,83 @@ class FileProcessor:
         if not folder.is_dir():
             raise ValueError(f"폴더가 아닙니다: {folder_path}")
         
-        # 지원하는 확장자를 가진 파일 찾기
-        sql_files: List[Path] = []
-        for ext in FileProcessor.SUPPORTED_EXTENSIONS:
-            # 재귀적으로 파일 검색 (** 패턴 사용)
-            found_files = folder.rglob(f"*{ext}")
-            
+        return (
+            file_path
+            for file_path in iter_files(folder, FileProcessor.SUPPORTED_EXTENSIONS, excludes,
+                                        case_sensitive=True)
             # .out 파일의 경우 AWR/Statspack 파일 제외
-            if ext == '.out':
-                found_files = [f for f in found_files if not FileProcessor.is_excluded_file(f)]
+            if file_path.suffix != '.out' or not FileProcessor.is_excluded_file(file_path)
+        )
+    
+    @staticmethod
+    def find_sql_files(folder_path: str,
+                       excludes: Optional[IgnorePatterns] = None) -> List[Path]:
+        """폴더 내 SQL/PL/SQL 파일 검색
+        
+        지정된 폴더와 하위 폴더에서 지원하는 확장자를 가진 파일을 모두 찾습니다.
+        .out 파일 중 AWR/Statspack 파일은 제외합니다.
+        
+        Args:
+            folder_path: 검색할 폴더 경로
+            excludes: gitignore 형식 제외 패턴 (선택사항)
+            
+        Returns:
+            List[Path]: 찾은 파일 경로 리스트
             
-            sql_files.extend(found_files)
+        Raises:
+            FileNotFoundError: 폴더가 존재하지 않는 경우
+            ValueError: 폴더가 아닌 경우
+        """
+        sql_files = list(FileProcessor.iter_sql_files(folder_path, excludes))
         
         logger.info(f"폴더 '{folder_path}'에서 {len(sql_files)}개의 SQL/PL/SQL 파일 발견")
         
-        return sorted(sql_files)
+        return sql_files
+
+
+class FileStream:
+    """검색 중인 파일 스트림
+    
+    파일 검색 이터레이터를 감싸 지금까지 반환한 파일 수를 기록합니다. 분석은 검색이
+    끝나기 전에 시작되므로 진행 상황의 전체 파일 수는 검색이 진행될수록 늘어납니다.
+    
+    Attributes:
+        count: 지금까지 반환한 파일 수
+        done: 검색 완료 여부
+    """
+    
+    def __init__(self, files: Iterator[Path]):
+        """FileStream 초기화
+        
+        Args:
+            files: 파일 경로 이터레이터
+        """
+        self._files = iter(files)
+        self._head: List[Path] = []
+        self.count = 0
+        self.done = False
+    
+    def peek(self) -> Optional[Path]:
+        """다음 파일 경로 미리 보기 (없으면 None)"""
+        if not self._head:
+            try:
+                self._head.append(next(self._files))
+            except StopIteration:
+                self.done = True
+                return None
+        return self._head[0]
+    
+    def __iter__(self) -> 'FileStream':
+        return self
+    
+    def __next__(self) -> Path:
+        if self._head:
+            file_path = self._head.pop()
+        else:
+            try:
+                file_path = next(self._files)
+            except StopIteration:
+                self.done = True
+                raise
+        self.count += 1
+        return file_path
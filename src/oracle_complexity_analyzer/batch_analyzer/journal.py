@@ -0,0 +1,272 @@
+"""
+배치 분석 저널 모듈
+
+폴더 분석 중 완료된 파일의 분석 결과를 추가 전용(append-only) JSON Lines 파일에
+기록합니다. 분석이 중단된 뒤 다시 실행할 때(--resume) 크기와 수정 시각이 같은
+파일은 저널의 결과를 그대로 사용하고 나머지 파일만 분석합니다.
+
+저널은 출력 디렉토리 아래 분석 폴더/타겟/분석 옵션별 파일(.batch_journal_<키>.jsonl)에
+저장됩니다. 첫 줄은 실행 설정(헤더)이며, 이후 줄마다 파일 하나의 결과를 담습니다.
+결과는 원본 텍스트 대신 SourceRef만 담은 형태로 저장되므로 저널 크기는 원본 크기와
+무관합니다. 중단 시 마지막 줄이 잘린 경우 해당 줄은 무시되며, 이어서 기록하기 전에
+잘린 줄을 잘라냅니다.
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import time
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO, Tuple, Union
+
+from ..analysis_cache import RULES_VERSION
+from ..data_models import PLSQLAnalysisResult, SQLAnalysisResult
+from ..enums import TargetDatabase
+
+# 로거 초기화
+logger = logging.getLogger(__name__)
+
+# 저널 형식 버전 (저장 구조가 바뀌면 올림)
+JOURNAL_FORMAT_VERSION = 1
+
+# 저널 파일명 접두사/접미사 (출력 디렉토리 아래 생성)
+JOURNAL_PREFIX = ".batch_journal_"
+JOURNAL_SUFFIX = ".jsonl"
+
+# 디스크 동기화(fsync) 간격 (초, 기록마다 flush는 항상 수행)
+JOURNAL_SYNC_SECONDS = 5.0
+
+# 잘린 마지막 줄을 찾을 때 파일 끝에서부터 읽는 블록 크기 (바이트)
+JOURNAL_TAIL_BLOCK_BYTES = 64 * 1024
+
+# 결과 데이터 클래스별 result_type
+_RESULT_TYPES = {SQLAnalysisResult: 'sql', PLSQLAnalysisResult: 'plsql'}
+
+
+def encode_result(value: Any) -> Any:
+    """분석 결과를 JSON으로 저장 가능한 값으로 변환"""
+    result_type = _RESULT_TYPES.get(type(value))
+    if result_type is not None:
+        data = dataclasses.asdict(value)
+        data['result_type'] = result_type
+        return {'$result': data}
+    if isinstance(value, dict):
+        if value and all(isinstance(key, TargetDatabase) for key in value):
+            # 타겟별 결과 딕셔너리
+            return {'$targets': {key.value: encode_result(item) for key, item in value.items()}}
+        return {key: encode_result(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode_result(item) for item in value]
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def decode_result(value: Any) -> Any:
+    """encode_result()로 변환한 값을 분석 결과로 복원"""
+    from src.formatters.result_formatter import ResultFormatter
+
+    if isinstance(value, dict):
+        if '$result' in value:
+            data = value['$result']
+            return ResultFormatter.from_json(json.dumps(data, default=_json_default), data['result_type'])
+        if '$targets' in value:
+            return {TargetDatabase(key): decode_result(item) for key, item in value['$targets'].items()}
+        return {key: decode_result(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode_result(item) for item in value]
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    """json.dumps 기본 변환 (Enum 값)"""
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"JSON으로 변환할 수 없는 값: {type(value).__name__}")
+
+
+class BatchJournal:
+    """폴더 분석 저널
+
+    Attributes:
+        path: 저널 파일 경로
+        header: 실행 설정 (폴더, 타겟, 분석 옵션, 규칙 버전)
+    """
+
+    def __init__(self, path: Union[str, Path], header: Dict[str, Any]):
+        """BatchJournal 초기화
+
+        Args:
+            path: 저널 파일 경로
+            header: 실행 설정
+        """
+        self.path = Path(path)
+        self.header = header
+        self._file: Optional[TextIO] = None
+        self._last_sync = 0.0
+
+    @classmethod
+    def for_run(cls, output_dir: Union[str, Path], folder_path: str, analyzer,
+                targets: Optional[List[TargetDatabase]] = None,
+                shard: Optional[Tuple[int, int]] = None) -> 'BatchJournal':
+        """분석 폴더/타겟/분석 옵션별 저널 생성
+
+        Args:
+            output_dir: 출력 디렉토리
+            folder_path: 분석 폴더 경로
+            analyzer: OracleComplexityAnalyzer 인스턴스 (분석 옵션)
+            targets: 다중 타겟 분석의 타겟 목록 (None이면 분석기 타겟의 단일 결과)
+            shard: 샤드 분석의 (샤드 번호, 전체 샤드 수) (샤드별로 저널을 구분)
+
+        Returns:
+            BatchJournal: 저널 (파일은 start() 호출 시 열림)
+        """
+        object_filter = getattr(analyzer, 'object_filter', None)
+        header = {
+            'journal': JOURNAL_FORMAT_VERSION,
+            'folder': os.path.abspath(folder_path),
+            'mode': 'single' if targets is None else 'multi',
+            'targets': [t.value for t in (targets or [analyzer.target])],
+            'rules_version': RULES_VERSION,
+            'dedupe': bool(getattr(analyzer, 'dedupe', False)),
+            'split_subprograms': bool(getattr(analyzer, 'split_subprograms', False)),
+            'object_filter': dataclasses.asdict(object_filter) if object_filter is not None else None,
+        }
+        if shard is not None:
+            header['shard'] = list(shard)
+        # 저널에서 읽은 헤더와 비교할 수 있도록 JSON 형태로 정규화 (튜플 → 리스트)
+        header = json.loads(json.dumps(header))
+        key = hashlib.sha256(json.dumps(header, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+        return cls(Path(output_dir) / f"{JOURNAL_PREFIX}{key}{JOURNAL_SUFFIX}", header)
+
+    def start(self, resume: bool = False) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """저널 열기
+
+        resume이면 기존 저널에서 크기와 수정 시각이 바뀌지 않은 파일의 결과를 읽고
+        이어서 기록합니다. 그렇지 않거나 기존 저널의 설정이 다르면 새 저널을 시작합니다.
+
+        Args:
+            resume: 기존 저널을 이어서 사용할지 여부
+
+        Returns:
+            Tuple[Dict[str, Any], Dict[str, str]]: (파일명: 분석 결과, 파일명: SQL 형태 키)
+        """
+        completed: Dict[str, Any] = {}
+        shapes: Dict[str, str] = {}
+
+        if resume and self.path.exists():
+            if self._load(completed, shapes):
+                logger.info(f"배치 분석 재개: {self.path} ({len(completed)}개 파일 완료)")
+            else:
+                logger.warning(f"분석 설정이 달라 기존 저널을 사용하지 않습니다: {self.path}")
+                completed.clear()
+                shapes.clear()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if completed:
+            self._drop_partial_line()
+            self._file = open(self.path, 'a', encoding='utf-8')
+            self._write({'header': self.header, 'resumed': len(completed)})
+        else:
+            self._file = open(self.path, 'w', encoding='utf-8')
+            self._write({'header': self.header})
+        self._sync()
+        return completed, shapes
+
+    def _drop_partial_line(self) -> None:
+        """중단 시 잘린 마지막 줄 제거 (이어서 기록할 레코드가 잘린 줄에 붙지 않도록)"""
+        with open(self.path, 'rb+') as f:
+            end = position = f.seek(0, os.SEEK_END)
+            while position > 0:
+                start = max(0, position - JOURNAL_TAIL_BLOCK_BYTES)
+                f.seek(start)
+                newline = f.read(position - start).rfind(b'\n')
+                if newline >= 0:
+                    if start + newline + 1 < end:
+                        logger.debug(f"저널의 잘린 마지막 줄 제거: {self.path}")
+                        f.truncate(start + newline + 1)
+                    return
+                position = start
+            f.truncate(0)
+
+    def _load(self, completed: Dict[str, Any], shapes: Dict[str, str]) -> bool:
+        """기존 저널 읽기 (설정이 다르면 False)"""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                try:
+                    record = json.loads(line)
+                    if 'header' in record:
+                        if record['header'] != self.header:
+                            return False
+                        continue
+                    file_name = record['file']
+                    size, mtime_ns = record['size'], record['mtime_ns']
+                    result = decode_result(record['result'])
+                except (ValueError, KeyError, TypeError):
+                    # 중단 시 잘린 마지막 줄 등 읽을 수 없는 줄
+                    logger.debug(f"저널 줄 무시: {self.path}:{line_no}")
+                    continue
+
+                try:
+                    stat = os.stat(file_name)
+                except OSError:
+                    continue
+                if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+                    continue
+                completed[file_name] = result
+                if record.get('shape') is not None:
+                    shapes[file_name] = record['shape']
+        return True
+
+    def record(self, file_name: str, result: Any, stamp: Tuple[int, int],
+               shape: Optional[str] = None) -> None:
+        """분석 완료 파일 기록
+
+        재개 시 변경 여부는 stamp와 비교하므로, 결과를 만든 내용을 읽은 시점의 값을
+        전달해야 합니다. (분석이 끝난 뒤 다시 stat하면 분석 중 바뀐 파일의 새 값이
+        이전 내용의 결과와 함께 기록됨)
+
+        Args:
+            file_name: 파일 경로
+            result: 분석 결과 (원본 텍스트 대신 SourceRef를 담은 결과)
+            stamp: 분석한 내용을 읽은 시점의 (파일 크기, 수정 시각(나노초))
+            shape: dedupe의 SQL 형태 키 (선택사항)
+        """
+        size, mtime_ns = stamp
+        record = {'file': file_name, 'size': size, 'mtime_ns': mtime_ns,
+                  'result': encode_result(result)}
+        if shape is not None:
+            record['shape'] = shape
+        self._write(record)
+        if time.monotonic() - self._last_sync >= JOURNAL_SYNC_SECONDS:
+            self._sync()
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        """저널 한 줄 기록"""
+        if self._file is None:
+            raise ValueError(f"저널이 열려 있지 않습니다: {self.path}")
+        self._file.write(json.dumps(record, ensure_ascii=False, default=_json_default) + '\n')
+        self._file.flush()
+
+    def _sync(self) -> None:
+        """저널 디스크 동기화"""
+        if self._file is None:
+            return
+        os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """저널 닫기"""
+        if self._file is not None:
+            self._sync()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'BatchJournal':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,280 @@
+"""
+샤드 부분 결과 모듈
+
+여러 노드에서 폴더를 나누어 분석(--shard i/N)할 때 각 샤드의 파일별 분석 결과를
+부분 결과 파일(JSON Lines)로 기록하고, 모든 샤드의 부분 결과를 합쳐 단일 노드 실행과
+같은 배치 분석 결과를 만듭니다.
+
+부분 결과 파일은 출력 디렉토리 아래 <폴더명>.shard-<i>-of-<N>.partial.jsonl로 저장됩니다.
+첫 줄은 실행 설정(헤더), 이후 줄마다 파일 하나의 결과(저널과 같은 SourceRef 형태) 또는
+에러를 담고, 마지막 줄에 샤드의 전체 파일 수와 SQL 형태별 파일 수(요약)를 기록합니다.
+기록 중에는 임시 파일에 쓰고 요약까지 기록한 뒤 최종 파일명으로 바꾸므로, 중단된 샤드의
+결과는 병합 대상에 나타나지 않습니다.
+
+결과는 원본 텍스트 대신 원본 파일 위치(SourceRef)를 담으므로, 상세 리포트를 만들려면
+병합하는 노드에서도 원본 파일을 같은 경로로 읽을 수 있어야 합니다.
+"""
+
+import dataclasses
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
+
+from ..analysis_cache import RULES_VERSION
+from ..data_models import BatchAnalysisResult
+from ..enums import TargetDatabase
+from .journal import _json_default, decode_result, encode_result
+from .result_store import ResultStore, StreamingAggregator
+
+# 로거 초기화
+logger = logging.getLogger(__name__)
+
+# 부분 결과 형식 버전 (저장 구조가 바뀌면 올림)
+PARTIAL_FORMAT_VERSION = 1
+
+# 부분 결과 파일명 접미사
+PARTIAL_SUFFIX = ".partial.jsonl"
+
+
+def partial_result_path(output_dir: Union[str, Path], folder_name: str,
+                        shard: Tuple[int, int]) -> Path:
+    """샤드 부분 결과 파일 경로 (<출력 디렉토리>/<폴더명>.shard-<i>-of-<N>.partial.jsonl)"""
+    index, count = shard
+    return Path(output_dir) / f"{folder_name or 'batch'}.shard-{index}-of-{count}{PARTIAL_SUFFIX}"
+
+
+class PartialResultWriter:
+    """샤드 부분 결과 기록기
+
+    Attributes:
+        path: 부분 결과 파일 경로 (finish() 후 생성됨)
+        header: 실행 설정 (폴더명, 샤드, 타겟, 분석 옵션, 규칙 버전)
+    """
+
+    def __init__(self, path: Union[str, Path], header: Dict[str, Any]):
+        """PartialResultWriter 초기화
+
+        Args:
+            path: 부분 결과 파일 경로
+            header: 실행 설정
+        """
+        self.path = Path(path)
+        self.header = header
+        self._temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        self._file: Optional[TextIO] = None
+
+    @classmethod
+    def for_run(cls, output_dir: Union[str, Path], folder_path: str, analyzer,
+                shard: Tuple[int, int],
+                targets: Optional[List[TargetDatabase]] = None) -> 'PartialResultWriter':
+        """샤드 실행의 부분 결과 기록기 생성
+
+        Args:
+            output_dir: 출력 디렉토리
+            folder_path: 분석 폴더 경로
+            analyzer: OracleComplexityAnalyzer 인스턴스 (분석 옵션)
+            shard: (샤드 번호, 전체 샤드 수)
+            targets: 다중 타겟 분석의 타겟 목록 (None이면 분석기 타겟의 단일 결과)
+
+        Returns:
+            PartialResultWriter: 부분 결과 기록기 (파일은 첫 기록 시 열림)
+        """
+        folder_name = Path(folder_path).name
+        object_filter = getattr(analyzer, 'object_filter', None)
+        header = {
+            'partial': PARTIAL_FORMAT_VERSION,
+            'folder': folder_name,
+            'shard': list(shard),
+            'mode': 'single' if targets is None else 'multi',
+            'targets': [t.value for t in (targets or [analyzer.target])],
+            'rules_version': RULES_VERSION,
+            'dedupe': bool(getattr(analyzer, 'dedupe', False)),
+            'split_subprograms': bool(getattr(analyzer, 'split_subprograms', False)),
+            'object_filter': dataclasses.asdict(object_filter) if object_filter is not None else None,
+        }
+        # 부분 결과에서 읽은 헤더와 비교할 수 있도록 JSON 형태로 정규화 (튜플 → 리스트)
+        header = json.loads(json.dumps(header))
+        return cls(partial_result_path(output_dir, folder_name, shard), header)
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        """부분 결과 한 줄 기록 (기록 중 예외가 나면 임시 파일을 지우고 예외를 다시 발생)"""
+        try:
+            f = self._file
+            if f is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                f = self._file = open(self._temp_path, 'w', encoding='utf-8')
+                f.write(json.dumps({'header': self.header}, ensure_ascii=False) + '\n')
+            f.write(json.dumps(record, ensure_ascii=False, default=_json_default) + '\n')
+        except BaseException:
+            self.close()
+            raise
+
+    def add(self, file_name: str, result: Any, error: Optional[str] = None) -> None:
+        """파일 분석 결과 기록
+
+        Args:
+            file_name: 파일 경로
+            result: 분석 결과 (원본 텍스트 대신 SourceRef를 담은 결과)
+            error: 에러 메시지 (있으면 실패로 기록)
+        """
+        if error:
+            self._write({'file': file_name, 'error': error})
+        else:
+            self._write({'file': file_name, 'result': encode_result(result)})
+
+    def finish(self, total_files: int, fingerprint_counts: Optional[Dict[str, int]] = None) -> Path:
+        """요약을 기록하고 부분 결과 파일 완성
+
+        Args:
+            total_files: 샤드의 전체 파일 수
+            fingerprint_counts: 샤드의 SQL 형태별 파일 수
+
+        Returns:
+            Path: 부분 결과 파일 경로
+        """
+        self._write({'summary': {'total_files': total_files,
+                                 'fingerprint_counts': dict(fingerprint_counts or {})}})
+        try:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            os.replace(self._temp_path, self.path)
+        except BaseException:
+            self.close()
+            raise
+        logger.info(f"샤드 부분 결과 저장: {self.path}")
+        return self.path
+
+    def close(self) -> None:
+        """기록 중단 (완성되지 않은 임시 파일 삭제)"""
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+        try:
+            os.remove(self._temp_path)
+        except OSError:
+            pass
+
+
+def read_partial_header(path: Union[str, Path]) -> Dict[str, Any]:
+    """부분 결과 파일의 실행 설정 읽기
+
+    Args:
+        path: 부분 결과 파일 경로
+
+    Returns:
+        Dict[str, Any]: 실행 설정
+
+    Raises:
+        ValueError: 부분 결과 파일이 아니거나 형식 버전이 다른 경우
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            header = json.loads(f.readline()).get('header')
+        except (ValueError, AttributeError):
+            header = None
+    if not isinstance(header, dict) or header.get('partial') != PARTIAL_FORMAT_VERSION:
+        raise ValueError(f"샤드 부분 결과 파일이 아닙니다: {path}")
+    return header
+
+
+def iter_partial_records(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """부분 결과 파일의 파일별 기록과 요약을 순서대로 반환
+
+    Args:
+        path: 부분 결과 파일 경로
+
+    Yields:
+        Dict[str, Any]: 파일별 기록({file, result} 또는 {file, error}) 또는 요약({summary})
+
+    Raises:
+        ValueError: 읽을 수 없는 줄이 있는 경우
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        next(f, None)
+        for line_no, line in enumerate(f, 2):
+            try:
+                yield json.loads(line)
+            except ValueError:
+                raise ValueError(f"샤드 부분 결과를 읽을 수 없습니다: {path}:{line_no}")
+
+
+def _validate_headers(headers: Sequence[Tuple[Path, Dict[str, Any]]]) -> Dict[str, Any]:
+    """부분 결과들이 같은 실행의 샤드인지 확인하고 기준 설정 반환"""
+    base_path, base = headers[0]
+    count = base['shard'][1]
+    seen: Dict[int, Path] = {}
+    for path, header in headers:
+        other = {key: value for key, value in header.items() if key != 'shard'}
+        if other != {key: value for key, value in base.items() if key != 'shard'}:
+            raise ValueError(f"분석 설정이 다른 부분 결과입니다: {path} (기준: {base_path})")
+        index, shard_count = header['shard']
+        if shard_count != count:
+            raise ValueError(f"전체 샤드 수가 다른 부분 결과입니다: {path} ({shard_count} != {count})")
+        if index in seen:
+            raise ValueError(f"샤드 {index}/{count}의 부분 결과가 중복되었습니다: {seen[index]}, {path}")
+        seen[index] = path
+
+    missing = [str(i) for i in range(1, count + 1) if i not in seen]
+    if missing:
+        raise ValueError(f"누락된 샤드가 있습니다: {', '.join(missing)} (전체 {count}개)")
+    return base
+
+
+def merge_partial_results(paths: Sequence[Union[str, Path]],
+                          store_dir: Optional[Union[str, Path]] = None
+                          ) -> Tuple[Dict[str, Any], Dict[TargetDatabase, BatchAnalysisResult]]:
+    """모든 샤드의 부분 결과를 합쳐 타겟별 배치 분석 결과 생성
+
+    파일별 결과를 단일 노드 실행과 같은 스트리밍 집계기로 다시 집계하므로 분포, 평균,
+    Top N 등은 단일 노드 실행과 같습니다. 전체 파일 수와 SQL 형태별 파일 수는 샤드별
+    요약을 합산합니다.
+
+    Args:
+        paths: 부분 결과 파일 경로 목록 (모든 샤드)
+        store_dir: 파일별 결과를 저장할 임시 저장소 디렉토리 (None이면 메모리에 보관)
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[TargetDatabase, BatchAnalysisResult]]:
+            (기준 실행 설정, 타겟별 배치 분석 결과)
+
+    Raises:
+        ValueError: 부분 결과가 없거나, 설정이 다르거나, 샤드가 누락/중복되었거나,
+            완성되지 않은 부분 결과가 있는 경우
+    """
+    if not paths:
+        raise ValueError("병합할 샤드 부분 결과가 없습니다")
+
+    headers = [(Path(path), read_partial_header(path)) for path in paths]
+    header = _validate_headers(headers)
+
+    targets = [TargetDatabase(value) for value in header['targets']]
+    store = ResultStore(store_dir) if store_dir is not None else None
+    aggregator = StreamingAggregator(targets, header['mode'] == 'multi', store)
+
+    total_files = 0
+    fingerprint_counts: Dict[str, int] = {}
+    for path, _ in sorted(headers, key=lambda item: item[1]['shard'][0]):
+        summary = None
+        for record in iter_partial_records(path):
+            if 'summary' in record:
+                summary = record['summary']
+                break
+            if 'error' in record:
+                aggregator.add(record['file'], None, record['error'])
+            else:
+                aggregator.add(record['file'], decode_result(record['result']))
+        if summary is None:
+            raise ValueError(f"완성되지 않은 샤드 부분 결과입니다: {path}")
+
+        total_files += summary['total_files']
+        for shape, count in summary['fingerprint_counts'].items():
+            fingerprint_counts[shape] = fingerprint_counts.get(shape, 0) + count
+
+    logger.info(f"샤드 부분 결과 병합: {len(headers)}개 샤드, {total_files}개 파일")
+    return header, aggregator.build(total_files, fingerprint_counts)
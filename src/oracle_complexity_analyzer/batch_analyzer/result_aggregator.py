@@ -4,13 +4,15 @@
 배치 분석 결과를 집계하고 다양한 형식의 리포트를 생성합니다.
 """
 
+import heapq
 import json
 import logging
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Any, Iterator, List, Mapping, Optional, Dict, Tuple
 
 from ..enums import TargetDatabase, ComplexityLevel
 from ..data_models import BatchAnalysisResult
+from .result_store import StoredResults, _process_result, file_report_score, file_report_type
 
 # 로거 초기화
 logger = logging.getLogger(__name__)
@@ -36,6 +38,8 @@ class ResultAggregator:
     def get_top_complex_files(batch_result: BatchAnalysisResult, top_n: int = 10) -> List[tuple]:
         """복잡도가 높은 파일 Top N 추출
         
+        전체 목록을 정렬하지 않고 크기 top_n의 힙으로 선택합니다.
+        
         Args:
             batch_result: 배치 분석 결과
             top_n: 추출할 파일 수 (기본값: 10)
@@ -43,30 +47,43 @@ class ResultAggregator:
         Returns:
             List[tuple]: (파일명, 복잡도 점수) 튜플 리스트 (점수 내림차순)
         """
-        # 파일명과 점수를 튜플로 만들어 리스트 생성
-        file_scores = []
-        for file_name, result in batch_result.results.items():
-            # 배치 PL/SQL 결과인 경우 딕셔너리
-            if isinstance(result, dict):
-                # 배치 PL/SQL 파일의 평균 점수 계산
-                results_list = result.get('results', [])
-                if results_list:
-                    total_score = sum(
-                        obj_result.get('analysis').normalized_score 
-                        for obj_result in results_list 
-                        if obj_result.get('analysis')
-                    )
-                    avg_score = total_score / len(results_list)
-                    file_scores.append((file_name, avg_score))
-            else:
-                # 일반 SQL/PL/SQL 결과
-                file_scores.append((file_name, result.normalized_score))
-        
-        # 점수 기준 내림차순 정렬
-        file_scores.sort(key=lambda x: x[1], reverse=True)
-        
-        # Top N 반환
-        return file_scores[:top_n]
+        top = heapq.nlargest(
+            top_n, ResultAggregator._iter_file_scores(batch_result.results), key=lambda x: x[1]
+        )
+        return [(file_name, score) for file_name, score, _ in top]
+    
+    @staticmethod
+    def _iter_file_scores(results: Mapping) -> Iterator[Tuple[str, float, str]]:
+        """파일별 (파일명, 리포트 점수, 복잡도 레벨) (항목이 없는 배치 파일 제외)"""
+        if isinstance(results, StoredResults):
+            # 저장소에 기록된 점수 사용 (결과 복원 없음)
+            yield from results.iter_scores()
+            return
+        for file_name, result in results.items():
+            report = file_report_score(result)
+            if report is not None:
+                yield (file_name, report[0], report[1])
+    
+    @staticmethod
+    def _sorted_file_scores(results: Mapping) -> Iterator[Tuple[str, float, str]]:
+        """파일별 (파일명, 리포트 점수, 복잡도 레벨) (점수 내림차순)"""
+        if isinstance(results, StoredResults):
+            return results.iter_scores(by_score=True)
+        return iter(sorted(ResultAggregator._iter_file_scores(results), key=lambda x: x[1], reverse=True))
+    
+    def _split_by_report_type(self, batch_result: BatchAnalysisResult) -> Dict[str, Mapping]:
+        """결과를 리포트 파일 타입별로 분류 (sql, plsql 순서, 결과가 없는 타입 제외)"""
+        results = batch_result.results
+        if isinstance(results, StoredResults):
+            # 저장 시 기록된 파일 타입 사용
+            stored_types = set(results.file_types())
+            return {file_type: results.for_file_type(file_type)
+                    for file_type in ('sql', 'plsql') if file_type in stored_types}
+        
+        by_type: Dict[str, Dict] = {'sql': {}, 'plsql': {}}
+        for file_name, result in results.items():
+            by_type[file_report_type(result)][file_name] = result
+        return {file_type: typed for file_type, typed in by_type.items() if typed}
     
     def export_batch_json(self, batch_result: BatchAnalysisResult, 
                           include_details: bool = True) -> str:
@@ -90,30 +107,13 @@ class ResultAggregator:
         Returns:
             str: 저장된 파일의 전체 경로
         """
-        from src.formatters.result_formatter import ResultFormatter
-        from ..file_detector import detect_file_type
-        
         # 타겟 데이터베이스 이름 (postgresql -> PGSQL, mysql -> MySQL)
         target_folder = "PGSQL" if batch_result.target_database == TargetDatabase.POSTGRESQL else "MySQL"
         
         # 파일 타입별로 결과를 분류
-        sql_results = {}
-        plsql_results = {}
-        
-        for file_name, result in batch_result.results.items():
-            # 파일 내용을 읽어서 타입 감지
-            try:
-                with open(file_name, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                file_type = detect_file_type(content)
-                
-                if file_type == 'sql':
-                    sql_results[file_name] = result
-                else:  # plsql 또는 batch_plsql
-                    plsql_results[file_name] = result
-            except Exception as e:
-                logger.warning(f"파일 타입 감지 실패: {file_name}, 기본값(sql) 사용")
-                sql_results[file_name] = result
+        by_type = self._split_by_report_type(batch_result)
+        sql_results = by_type.get('sql')
+        plsql_results = by_type.get('plsql')
         
         # SQL과 PL/SQL 각각 저장
         saved_files = []
@@ -133,26 +133,17 @@ class ResultAggregator:
         return ', '.join(saved_files)
     
     def _create_sub_batch_result(self, original_batch: BatchAnalysisResult, 
-                                  filtered_results: Dict, file_type: str) -> BatchAnalysisResult:
+                                  filtered_results: Mapping, file_type: str) -> BatchAnalysisResult:
         """파일 타입별로 필터링된 배치 결과 생성"""
-        # 복잡도 분포 재계산
-        complexity_distribution = {level.value: 0 for level in ComplexityLevel}
-        total_score = 0.0
-        
-        for result in filtered_results.values():
-            if isinstance(result, dict):
-                # 배치 PL/SQL 결과
-                for obj_result in result.get('results', []):
-                    analysis = obj_result.get('analysis')
-                    if analysis:
-                        level_name = analysis.complexity_level.value
-                        complexity_distribution[level_name] += 1
-                        total_score += analysis.normalized_score
-            else:
-                # 일반 SQL/PL/SQL 결과
-                level_name = result.complexity_level.value
-                complexity_distribution[level_name] += 1
-                total_score += result.normalized_score
+        if isinstance(filtered_results, StoredResults):
+            # 저장소에 기록된 파일별 분포/점수 합산 (결과 복원 없음)
+            _, total_score, complexity_distribution = filtered_results.stats()
+        else:
+            # 복잡도 분포 재계산
+            complexity_distribution = {level.value: 0 for level in ComplexityLevel}
+            total_score = 0.0
+            for result in filtered_results.values():
+                total_score += _process_result(result, complexity_distribution)
         
         success_count = len(filtered_results)
         average_score = total_score / success_count if success_count > 0 else 0.0
@@ -166,9 +157,16 @@ class ResultAggregator:
             results=filtered_results,
             failed_files={},
             target_database=original_batch.target_database,
-            analysis_time=original_batch.analysis_time
+            analysis_time=original_batch.analysis_time,
+            # 형태별 파일 수는 단일 SQL 문 파일에 대해서만 기록됨
+            fingerprint_counts=original_batch.fingerprint_counts if file_type == 'sql' else {}
         )
     
+    @staticmethod
+    def _sorted_fingerprints(batch_result: BatchAnalysisResult) -> List[tuple]:
+        """SQL 형태별 파일 수를 많은 순으로 정렬"""
+        return sorted(batch_result.fingerprint_counts.items(), key=lambda item: (-item[1], item[0]))
+    
     def _save_batch_json(self, batch_result: BatchAnalysisResult, file_type: str,
                          target_folder: str, include_details: bool) -> str:
         """파일 타입별 배치 JSON 저장"""
@@ -183,7 +181,7 @@ class ResultAggregator:
         file_path = report_folder / filename
         
         # JSON 데이터 구성
-        json_data = {
+        json_data: Dict[str, Any] = {
             "summary": {
                 "total_files": batch_result.total_files,
                 "success_count": batch_result.success_count,
@@ -201,12 +199,22 @@ class ResultAggregator:
             "failed_files": batch_result.failed_files,
         }
         
+        # 중복 제거 분석 시 SQL 형태(fingerprint)별 파일 수
+        if batch_result.fingerprint_counts:
+            json_data["fingerprints"] = [
+                {"fingerprint": fingerprint, "occurrences": count}
+                for fingerprint, count in self._sorted_fingerprints(batch_result)
+            ]
+        
         # 개별 파일 상세 결과 포함
         if include_details:
             json_data["details"] = {}
             for file_name, result in batch_result.results.items():
                 # 각 결과를 JSON으로 변환 후 다시 파싱 (dict로 변환)
-                result_json = ResultFormatter.to_json(result)
+                if isinstance(result, dict):
+                    result_json = ResultFormatter.batch_to_json(result)
+                else:
+                    result_json = ResultFormatter.to_json(result)
                 json_data["details"][file_name] = json.loads(result_json)
         
         # 파일 저장
@@ -239,30 +247,13 @@ class ResultAggregator:
         Returns:
             str: 저장된 파일의 전체 경로
         """
-        from src.formatters.result_formatter import ResultFormatter
-        from ..file_detector import detect_file_type
-        
         # 타겟 데이터베이스 이름 (postgresql -> PGSQL, mysql -> MySQL)
         target_folder = "PGSQL" if batch_result.target_database == TargetDatabase.POSTGRESQL else "MySQL"
         
         # 파일 타입별로 결과를 분류
-        sql_results = {}
-        plsql_results = {}
-        
-        for file_name, result in batch_result.results.items():
-            # 파일 내용을 읽어서 타입 감지
-            try:
-                with open(file_name, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                file_type = detect_file_type(content)
-                
-                if file_type == 'sql':
-                    sql_results[file_name] = result
-                else:  # plsql 또는 batch_plsql
-                    plsql_results[file_name] = result
-            except Exception as e:
-                logger.warning(f"파일 타입 감지 실패: {file_name}, 기본값(sql) 사용")
-                sql_results[file_name] = result
+        by_type = self._split_by_report_type(batch_result)
+        sql_results = by_type.get('sql')
+        plsql_results = by_type.get('plsql')
         
         # SQL과 PL/SQL 각각 저장
         saved_files = []
@@ -310,6 +301,9 @@ class ResultAggregator:
         lines.append(f"- **전체 파일 수**: {batch_result.total_files}\n")
         lines.append(f"- **분석 성공**: {batch_result.success_count}\n")
         lines.append(f"- **분석 실패**: {batch_result.failure_count}\n")
+        timed_out = batch_result.timed_out_files
+        if timed_out:
+            lines.append(f"  - **시간 초과**: {len(timed_out)}\n")
         lines.append(f"- **평균 복잡도 점수**: {batch_result.average_score:.2f} / 10\n")
         lines.append("\n")
         
@@ -330,34 +324,31 @@ class ResultAggregator:
         lines.append("| 순위 | 파일명 | 복잡도 점수 | 복잡도 레벨 |\n")
         lines.append("|------|--------|-------------|-------------|\n")
         
-        # 모든 파일을 복잡도 점수 기준으로 정렬
-        all_files = []
-        for file_name, result in batch_result.results.items():
-            if isinstance(result, dict):
-                # 배치 PL/SQL 결과 - 평균 점수 계산
-                results_list = result.get('results', [])
-                if results_list:
-                    total_score = sum(
-                        obj_result.get('analysis').normalized_score 
-                        for obj_result in results_list 
-                        if obj_result.get('analysis')
-                    )
-                    avg_score = total_score / len(results_list)
-                    # 첫 번째 객체의 복잡도 레벨 사용 (대표값)
-                    level = results_list[0].get('analysis').complexity_level.value if results_list else 'unknown'
-                    all_files.append((file_name, avg_score, level))
-            else:
-                # 일반 SQL/PL/SQL 결과
-                all_files.append((file_name, result.normalized_score, result.complexity_level.value))
-        
-        # 점수 기준 내림차순 정렬
-        all_files.sort(key=lambda x: x[1], reverse=True)
-        
-        for idx, (file_name, score, level) in enumerate(all_files, 1):
-            lines.append(f"| {idx} | `{file_name}` | {score:.2f} | {level} |\n")
+        # 모든 파일을 복잡도 점수 기준으로 정렬 (배치 PL/SQL 파일은 평균 점수와 첫 객체 레벨)
+        all_files = self._sorted_file_scores(batch_result.results)
+        
+        for idx, (file_name, score, level_name) in enumerate(all_files, 1):
+            lines.append(f"| {idx} | `{file_name}` | {score:.2f} | {level_name} |\n")
         
         lines.append("\n")
         
+        # 반복 SQL 형태 (리터럴만 다른 파일)
+        repeated = [
+            (fingerprint, count)
+            for fingerprint, count in self._sorted_fingerprints(batch_result) if count > 1
+        ]
+        if repeated:
+            lines.append("## 반복 SQL 형태\n")
+            lines.append(f"- **고유 SQL 형태 수**: {len(batch_result.fingerprint_counts)}\n")
+            lines.append("\n")
+            lines.append("| Fingerprint | 파일 수 |\n")
+            lines.append("|-------------|---------|\n")
+            
+            for fingerprint, count in repeated[:20]:
+                lines.append(f"| `{fingerprint}` | {count} |\n")
+            
+            lines.append("\n")
+        
         # 실패한 파일 목록
         if batch_result.failed_files:
             lines.append("## 분석 실패 파일\n")
@@ -412,7 +403,6 @@ class ResultAggregator:
             List[str]: 생성된 개별 리포트 파일 경로 리스트
         """
         from src.formatters.result_formatter import ResultFormatter
-        from ..file_detector import detect_file_type
         
         # 타겟 데이터베이스 이름 (postgresql -> PGSQL, mysql -> MySQL)
         target_folder = "PGSQL" if batch_result.target_database == TargetDatabase.POSTGRESQL else "MySQL"
@@ -426,8 +416,9 @@ class ResultAggregator:
             if isinstance(result, dict):
                 logger.info(f"배치 PL/SQL 파일 리포트 생성: {file_path}")
                 
-                # plsql 폴더에 저장
-                report_folder = self.analyzer.output_dir / (self.source_folder_name or "batch") / "plsql" / target_folder
+                # plsql 폴더에 저장 (SQL 스크립트 문장 단위 결과는 sql 폴더)
+                type_folder = file_report_type(result)
+                report_folder = self.analyzer.output_dir / (self.source_folder_name or "batch") / type_folder / target_folder
                 report_folder.mkdir(parents=True, exist_ok=True)
                 
                 # 파일명 추출
@@ -461,17 +452,8 @@ class ResultAggregator:
                 
                 continue
             
-            # 파일 타입 감지
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                file_type = detect_file_type(content)
-            except Exception as e:
-                logger.warning(f"파일 타입 감지 실패: {file_path}, 기본값(sql) 사용")
-                file_type = 'sql'
-            
-            # 파일 타입 폴더명 (sql 또는 plsql)
-            type_folder = "plsql" if file_type in ['plsql', 'batch_plsql'] else "sql"
+            # 파일 타입 폴더명 (sql 또는 plsql, 분석 시 판별한 유형을 결과 형태로 확인)
+            type_folder = file_report_type(result)
             
             # 폴더 경로 생성: reports/{분석대상폴더명}/{타입}/{타겟}/
             report_folder = self.analyzer.output_dir / (self.source_folder_name or "batch") / type_folder / target_folder
@@ -0,0 +1,454 @@
+"""
+배치 결과 스트리밍 집계 모듈
+
+폴더 분석 결과가 도착하는 대로 복잡도 분포, 평균 점수를 누적하고, 파일별 결과는
+메모리(기본) 또는 출력 디렉토리의 임시 SQLite 파일(ResultStore)에 저장합니다.
+
+ResultStore에 저장한 결과는 StoredResults(읽기 전용 Mapping)로 BatchAnalysisResult의
+results에 담기며, 리포트 생성 시 필요한 항목만 하나씩 복원합니다. 리포트용 점수,
+레벨, 분포는 별도 열로 저장되므로 Top N, 전체 파일 목록, 파일 타입별 요약은 결과를
+복원하지 않고 계산됩니다.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import weakref
+from collections.abc import ItemsView, Mapping, ValuesView
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from ..data_models import BatchAnalysisResult, PLSQLAnalysisResult
+from ..enums import ComplexityLevel, TargetDatabase
+from .journal import _json_default, decode_result, encode_result
+
+# 로거 초기화
+logger = logging.getLogger(__name__)
+
+# 임시 결과 저장소 파일명 접두사/접미사 (출력 디렉토리 아래 생성)
+STORE_PREFIX = ".batch_results_"
+STORE_SUFFIX = ".sqlite3"
+
+# 한 번에 커밋하는 결과 행 수
+STORE_COMMIT_ROWS = 1000
+
+
+def _process_result(result: Union[Dict[str, Any], Any],
+                    complexity_distribution: Dict[str, int]) -> float:
+    """분석 결과 처리 (배치 PL/SQL 또는 일반 결과)
+
+    Args:
+        result: 분석 결과 (딕셔너리 또는 데이터 클래스)
+        complexity_distribution: 복잡도 분포 딕셔너리
+
+    Returns:
+        float: 누적할 점수
+    """
+    total_score = 0.0
+
+    # 배치 PL/SQL 파일인 경우 딕셔너리로 반환됨
+    if isinstance(result, dict):
+        # 배치 PL/SQL 결과 처리
+        for obj_result in result.get('results', []):
+            # analysis는 PLSQLAnalysisResult 객체
+            analysis = obj_result.get('analysis')
+            if analysis:
+                # 데이터 클래스 객체에서 속성 접근
+                level_name = analysis.complexity_level.value
+                complexity_distribution[level_name] += 1
+                total_score += analysis.normalized_score
+    else:
+        # 일반 SQL/PL/SQL 결과 처리
+        level_name = result.complexity_level.value
+        complexity_distribution[level_name] += 1
+        total_score += result.normalized_score
+
+    return total_score
+
+
+def file_report_score(result: Any) -> Optional[Tuple[float, str]]:
+    """배치 리포트의 파일 점수와 레벨
+
+    여러 객체/문장이 포함된 파일(dict)은 평균 점수와 첫 객체의 레벨을 사용합니다.
+
+    Args:
+        result: 파일 분석 결과
+
+    Returns:
+        Optional[Tuple[float, str]]: (점수, 복잡도 레벨), 항목이 없는 파일은 None
+    """
+    if isinstance(result, dict):
+        results_list = result.get('results', [])
+        if not results_list:
+            return None
+        total_score = sum(
+            obj_result.get('analysis').normalized_score
+            for obj_result in results_list
+            if obj_result.get('analysis')
+        )
+        first = results_list[0].get('analysis')
+        return total_score / len(results_list), first.complexity_level.value if first else 'unknown'
+    return result.normalized_score, result.complexity_level.value
+
+
+def file_report_type(result: Any) -> str:
+    """리포트 파일 타입 ('sql' 또는 'plsql')
+
+    분석기가 파일을 읽을 때 판별한 유형이 결과 형태에 반영되어 있으므로 파일을 다시
+    읽지 않습니다. SQL 문 결과와 여러 문장 스크립트 결과는 'sql', PL/SQL 결과와
+    서브프로그램/배치 PL/SQL 결과는 'plsql'입니다.
+
+    Args:
+        result: 파일 분석 결과
+
+    Returns:
+        str: 'sql' 또는 'plsql'
+    """
+    if isinstance(result, dict):
+        return 'sql' if 'total_statements' in result else 'plsql'
+    return 'plsql' if isinstance(result, PLSQLAnalysisResult) else 'sql'
+
+
+def file_max_score(result: Any) -> float:
+    """콘솔 요약의 파일 점수 (여러 객체/문장이 포함된 파일은 최대 점수)"""
+    if isinstance(result, dict):
+        return result.get('summary', {}).get('max_score', 0)
+    return result.normalized_score if result else 0
+
+
+def _close_store(conn: sqlite3.Connection, path: Path) -> None:
+    """저장소 연결 종료 및 파일 삭제"""
+    try:
+        conn.close()
+    except sqlite3.Error:
+        pass
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class ResultStore:
+    """파일별 분석 결과 임시 저장소 (SQLite)
+
+    저장소 파일은 close() 호출 시 또는 객체가 정리될 때 삭제됩니다.
+
+    Attributes:
+        path: 저장소 파일 경로
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """ResultStore 초기화
+
+        Args:
+            directory: 저장소 파일을 만들 디렉토리 (보통 출력 디렉토리)
+        """
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        fd, path = tempfile.mkstemp(prefix=STORE_PREFIX, suffix=STORE_SUFFIX, dir=str(directory))
+        os.close(fd)
+        self.path = Path(path)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # 임시 데이터이므로 롤백 저널/동기화 생략
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute(
+            "CREATE TABLE results ("
+            " seq INTEGER PRIMARY KEY,"
+            " target TEXT NOT NULL,"
+            " file TEXT NOT NULL,"
+            " file_type TEXT,"
+            " score REAL,"
+            " level TEXT,"
+            " max_score REAL NOT NULL,"
+            " score_sum REAL NOT NULL,"
+            " levels TEXT NOT NULL,"
+            " payload TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX results_file ON results (target, file)")
+        self._pending = 0
+        self._indexed = False
+        self._finalizer = weakref.finalize(self, _close_store, self._conn, self.path)
+
+    def add(self, target: TargetDatabase, file_name: str,
+            result: Any) -> Tuple[float, Dict[str, int]]:
+        """파일 분석 결과 저장
+
+        Args:
+            target: 타겟 데이터베이스
+            file_name: 파일 경로
+            result: 단일 타겟 분석 결과 (리포트 파일 타입은 결과 형태로 판별)
+
+        Returns:
+            Tuple[float, Dict[str, int]]: (누적할 점수, 복잡도 레벨별 개수)
+        """
+        levels = {level.value: 0 for level in ComplexityLevel}
+        score_sum = _process_result(result, levels)
+        report = file_report_score(result)
+        self._conn.execute(
+            "INSERT INTO results (target, file, file_type, score, level, max_score, score_sum, levels, payload)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (target.value, file_name, file_report_type(result),
+             report[0] if report else None, report[1] if report else None,
+             file_max_score(result), score_sum,
+             json.dumps({name: count for name, count in levels.items() if count}),
+             json.dumps(encode_result(result), ensure_ascii=False, default=_json_default))
+        )
+        self._pending += 1
+        if self._pending >= STORE_COMMIT_ROWS:
+            self.flush()
+        return score_sum, levels
+
+    def flush(self) -> None:
+        """저장 대기 중인 행 커밋"""
+        if self._pending:
+            self._conn.commit()
+            self._pending = 0
+
+    def query(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        """조회 (저장 대기 중인 행을 먼저 커밋)"""
+        self.flush()
+        if not self._indexed:
+            # 점수 정렬 조회용 색인은 저장이 끝난 뒤 한 번만 생성
+            self._conn.execute("CREATE INDEX IF NOT EXISTS results_score ON results (target, score DESC, seq)")
+            self._indexed = True
+        return self._conn.execute(sql, params)
+
+    def close(self) -> None:
+        """저장소 닫기 및 파일 삭제"""
+        self._finalizer()
+
+
+class StoredResults(Mapping):
+    """ResultStore에 저장된 결과의 읽기 전용 Mapping (파일명: 분석 결과)
+
+    결과는 조회할 때마다 저장소에서 복원되며, 반복 순서는 저장 순서입니다.
+    """
+
+    def __init__(self, store: ResultStore, target: TargetDatabase, file_type: Optional[str] = None):
+        """StoredResults 초기화
+
+        Args:
+            store: 결과 저장소
+            target: 타겟 데이터베이스
+            file_type: 리포트 파일 타입으로 제한 (None이면 전체)
+        """
+        self.store = store
+        self.target = target
+        self.file_type = file_type
+
+    def _where(self) -> Tuple[str, tuple]:
+        """조회 조건"""
+        if self.file_type is None:
+            return "target = ?", (self.target.value,)
+        return "target = ? AND file_type = ?", (self.target.value, self.file_type)
+
+    def __getitem__(self, file_name: str) -> Any:
+        where, params = self._where()
+        row = self.store.query(
+            f"SELECT payload FROM results WHERE {where} AND file = ?", params + (file_name,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(file_name)
+        return decode_result(json.loads(row[0]))
+
+    def __iter__(self) -> Iterator[str]:
+        where, params = self._where()
+        for (file_name,) in self.store.query(f"SELECT file FROM results WHERE {where} ORDER BY seq", params):
+            yield file_name
+
+    def __len__(self) -> int:
+        where, params = self._where()
+        return self.store.query(f"SELECT COUNT(*) FROM results WHERE {where}", params).fetchone()[0]
+
+    def items(self) -> ItemsView:
+        """(파일명, 분석 결과) 뷰 (반복 시 한 번의 조회로 저장 순서대로 복원)"""
+        return _StoredItemsView(self)
+
+    def values(self) -> ValuesView:
+        """분석 결과 뷰 (반복 시 한 번의 조회로 저장 순서대로 복원)"""
+        return _StoredValuesView(self)
+
+    def _iter_items(self) -> Iterator[Tuple[str, Any]]:
+        """(파일명, 분석 결과)를 저장 순서대로 하나씩 복원"""
+        where, params = self._where()
+        for file_name, payload in self.store.query(
+            f"SELECT file, payload FROM results WHERE {where} ORDER BY seq", params
+        ):
+            yield file_name, decode_result(json.loads(payload))
+
+    def for_file_type(self, file_type: str) -> 'StoredResults':
+        """리포트 파일 타입별 결과"""
+        return StoredResults(self.store, self.target, file_type)
+
+    def file_types(self) -> List[str]:
+        """저장된 리포트 파일 타입 목록"""
+        where, params = self._where()
+        return [row[0] for row in self.store.query(
+            f"SELECT DISTINCT file_type FROM results WHERE {where}", params
+        )]
+
+    def iter_scores(self, by_score: bool = False) -> Iterator[Tuple[str, float, str]]:
+        """리포트 점수가 있는 파일의 (파일명, 점수, 레벨) (결과 복원 없음)
+
+        Args:
+            by_score: 점수 내림차순 정렬 여부 (같은 점수는 저장 순서)
+        """
+        where, params = self._where()
+        order = "score DESC, seq" if by_score else "seq"
+        yield from self.store.query(
+            f"SELECT file, score, level FROM results WHERE {where} AND score IS NOT NULL ORDER BY {order}",
+            params
+        )
+
+    def top_items(self, n: int) -> List[Tuple[str, Any]]:
+        """콘솔 요약 점수(최대 점수) 상위 n개 (파일명, 분석 결과)"""
+        where, params = self._where()
+        rows = self.store.query(
+            f"SELECT file, payload FROM results WHERE {where} ORDER BY max_score DESC, seq LIMIT ?",
+            params + (n,)
+        ).fetchall()
+        return [(file_name, decode_result(json.loads(payload))) for file_name, payload in rows]
+
+    def stats(self) -> Tuple[int, float, Dict[str, int]]:
+        """(파일 수, 점수 합계, 복잡도 레벨별 개수) (결과 복원 없음)"""
+        where, params = self._where()
+        count = 0
+        score_sum = 0.0
+        distribution = {level.value: 0 for level in ComplexityLevel}
+        for file_score_sum, levels in self.store.query(
+            f"SELECT score_sum, levels FROM results WHERE {where}", params
+        ):
+            count += 1
+            score_sum += file_score_sum
+            for name, level_count in json.loads(levels).items():
+                distribution[name] += level_count
+        return count, score_sum, distribution
+
+
+class _StoredItemsView(ItemsView):
+    """StoredResults.items() 뷰 (키마다 다시 조회하지 않고 한 번에 복원)"""
+
+    def __init__(self, results: StoredResults):
+        super().__init__(results)
+        self._results = results
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        return self._results._iter_items()
+
+
+class _StoredValuesView(ValuesView):
+    """StoredResults.values() 뷰 (키마다 다시 조회하지 않고 한 번에 복원)"""
+
+    def __init__(self, results: StoredResults):
+        super().__init__(results)
+        self._results = results
+
+    def __iter__(self) -> Iterator[Any]:
+        return (result for _, result in self._results._iter_items())
+
+
+class StreamingAggregator:
+    """폴더 분석 결과 스트리밍 집계
+
+    결과가 도착하는 대로 타겟별 복잡도 분포와 점수 합계를 누적합니다. store가 있으면
+    파일별 결과는 저장소에 기록하고 메모리에는 남기지 않습니다. partial이 있으면
+    파일별 결과를 샤드 부분 결과 파일에도 기록하고 build() 시 요약을 기록합니다.
+
+    Attributes:
+        targets: 집계 대상 타겟 목록
+        multi: 결과가 타겟별 딕셔너리인지 여부
+        store: 결과 저장소 (None이면 메모리에 보관)
+        partial: 샤드 부분 결과 기록기 (PartialResultWriter, 선택사항)
+        failed_files: 분석 실패 파일 (파일명: 에러 메시지)
+    """
+
+    def __init__(self, targets: List[TargetDatabase], multi: bool = False,
+                 store: Optional[ResultStore] = None, partial=None):
+        """StreamingAggregator 초기화
+
+        Args:
+            targets: 집계 대상 타겟 목록
+            multi: 결과가 타겟별 딕셔너리인지 여부 (False면 targets[0]의 단일 결과)
+            store: 결과 저장소 (None이면 메모리에 보관)
+            partial: 샤드 부분 결과 기록기 (PartialResultWriter, 선택사항)
+        """
+        self.targets = targets
+        self.multi = multi
+        self.store = store
+        self.partial = partial
+        self.failed_files: Dict[str, str] = {}
+        self._results: Dict[TargetDatabase, Dict[str, Any]] = {target: {} for target in targets}
+        self._distribution = {
+            target: {level.value: 0 for level in ComplexityLevel} for target in targets
+        }
+        self._total_score = {target: 0.0 for target in targets}
+        self._success_count = 0
+
+    @property
+    def processed_count(self) -> int:
+        """처리한 파일 수 (성공 + 실패)"""
+        return self._success_count + len(self.failed_files)
+
+    def add(self, file_name: str, result: Any, error: Optional[str] = None) -> None:
+        """파일 분석 결과 집계
+
+        Args:
+            file_name: 파일 경로
+            result: 분석 결과 (multi면 타겟별 결과 딕셔너리)
+            error: 에러 메시지 (있으면 실패로 집계)
+        """
+        if self.partial is not None:
+            self.partial.add(file_name, result, error)
+        if error:
+            # 분석 실패 (모든 타겟에 공통)
+            self.failed_files[file_name] = error
+            return
+
+        self._success_count += 1
+        for target in self.targets:
+            target_result = result[target] if self.multi else result
+            if self.store is None:
+                self._results[target][file_name] = target_result
+                self._total_score[target] += _process_result(target_result, self._distribution[target])
+                continue
+
+            score_sum, levels = self.store.add(target, file_name, target_result)
+            self._total_score[target] += score_sum
+            for name, count in levels.items():
+                self._distribution[target][name] += count
+
+    def build(self, total_files: int,
+              fingerprint_counts: Optional[Dict[str, int]] = None
+              ) -> Dict[TargetDatabase, BatchAnalysisResult]:
+        """타겟별 배치 분석 결과 생성
+
+        Args:
+            total_files: 전체 파일 수
+            fingerprint_counts: 형태별 파일 수 (선택사항)
+
+        Returns:
+            Dict[TargetDatabase, BatchAnalysisResult]: 타겟별 배치 분석 결과
+        """
+        if self.store is not None:
+            self.store.flush()
+        if self.partial is not None:
+            self.partial.finish(total_files, fingerprint_counts)
+
+        success_count = self._success_count
+        return {
+            target: BatchAnalysisResult(
+                total_files=total_files,
+                success_count=success_count,
+                failure_count=len(self.failed_files),
+                complexity_distribution=self._distribution[target],
+                average_score=self._total_score[target] / success_count if success_count > 0 else 0.0,
+                results=(self._results[target] if self.store is None
+                         else StoredResults(self.store, target)),
+                failed_files=dict(self.failed_files),
+                target_database=target,
+                fingerprint_counts=dict(fingerprint_counts or {})
+            )
+            for target in self.targets
+        }
@@ -0,0 +1,282 @@
+"""
+파일 작업 스케줄링 모듈
+
+폴더 분석 시 파일별 예상 처리 비용을 계산하고, 비용이 큰 작업부터(LPT, Longest
+Processing Time first) 제출되도록 파일 청크를 구성합니다. 큰 파일은 단독 청크로,
+작은 파일은 목표 비용까지 하나의 청크로 묶습니다.
+
+예상 비용은 이전 실행의 파일별 처리 시간(분석 캐시 옆의 .file_timings.json)을
+우선 사용하며, 기록이 없거나 파일이 바뀌었으면 파일 크기로 추정합니다.
+
+파일 검색과 분석이 동시에 진행되는 경우(스트림 입력) 청크는 검색된 파일 구간별로
+구성하고, 제출 대기 청크는 구간에 관계없이 비용이 큰 것부터 제출합니다.
+"""
+
+import heapq
+import itertools
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# 로거 초기화
+logger = logging.getLogger(__name__)
+
+# 처리 시간 기록 파일명 (분석 캐시 파일과 같은 디렉토리에 생성)
+TIMINGS_FILENAME = ".file_timings.json"
+
+# 처리 시간 기록 형식 버전 (저장 구조가 바뀌면 올림)
+TIMINGS_FORMAT_VERSION = 1
+
+# 처리 시간 기록 최대 항목 수 (초과 시 오래된 항목부터 제거)
+TIMINGS_MAX_ENTRIES = 100_000
+
+# 파일당 고정 처리 비용 (초, 파일 열기/파싱 준비 등)
+FILE_BASE_COST = 0.0005
+
+# 기록이 없을 때 사용하는 처리 속도 (바이트/초)
+DEFAULT_BYTES_PER_SECOND = 1024 * 1024
+
+# 파일 청크 최대 파일 수와 워커당 목표 청크 수
+FILE_CHUNK_MAX = 64
+FILE_CHUNKS_PER_WORKER = 4
+
+# 스트림 입력에서 한 번에 청크를 구성하는 최대 파일 수
+# (첫 구간은 워커 수 × FILE_CHUNKS_PER_WORKER개이며 구간마다 두 배로 늘림)
+FILE_STREAM_WINDOW = 4096
+
+
+class FileTimings:
+    """파일별 처리 시간 기록
+
+    기록은 (파일 크기, 수정 시각)이 같을 때만 예상 비용으로 사용합니다.
+    기록이 없는 파일은 기록된 파일들의 평균 처리 속도(없으면 기본값)와
+    파일 크기로 비용을 추정합니다.
+
+    Attributes:
+        path: 기록 파일 경로 (None이면 저장하지 않음)
+        entries: 파일 경로 → (크기, 수정 시각(나노초), 처리 시간(초))
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None,
+                 entries: Optional[Dict[str, Tuple[int, int, float]]] = None):
+        """FileTimings 초기화
+
+        Args:
+            path: 기록 파일 경로 (None이면 저장하지 않음)
+            entries: 기존 기록
+        """
+        self.path = Path(path) if path is not None else None
+        self.entries: Dict[str, Tuple[int, int, float]] = entries or {}
+        self._stats: Dict[str, Tuple[int, int]] = {}
+        self._bytes_per_second = self._fit_rate()
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Optional[Union[str, Path]]) -> 'FileTimings':
+        """기록 파일 로드 (없거나 손상되었으면 빈 기록)
+
+        Args:
+            path: 기록 파일 경로 (None이면 저장하지 않는 빈 기록)
+
+        Returns:
+            FileTimings: 처리 시간 기록
+        """
+        if path is None:
+            return cls()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            if payload.get('version') != TIMINGS_FORMAT_VERSION:
+                return cls(path)
+            entries = {name: (int(size), int(mtime_ns), float(seconds))
+                       for name, (size, mtime_ns, seconds) in payload.get('files', {}).items()}
+        except (OSError, ValueError, TypeError):
+            return cls(path)
+        return cls(path, entries)
+
+    def _fit_rate(self) -> float:
+        """기록된 파일들의 평균 처리 속도 (바이트/초)"""
+        total_bytes = sum(size for size, _, _ in self.entries.values())
+        total_seconds = sum(max(0.0, seconds - FILE_BASE_COST) for _, _, seconds in self.entries.values())
+        if total_bytes <= 0 or total_seconds <= 0:
+            return DEFAULT_BYTES_PER_SECOND
+        return total_bytes / total_seconds
+
+    def _stat(self, file_name: str) -> Optional[Tuple[int, int]]:
+        """파일 크기와 수정 시각 (실행 중 한 번만 조회)"""
+        stat = self._stats.get(file_name)
+        if stat is None:
+            try:
+                st = os.stat(file_name)
+            except OSError:
+                return None
+            stat = self._stats[file_name] = (st.st_size, st.st_mtime_ns)
+        return stat
+
+    def estimate(self, file_name: str) -> float:
+        """파일 예상 처리 비용 (초)
+
+        Args:
+            file_name: 파일 경로
+
+        Returns:
+            float: 예상 처리 시간 (조회할 수 없는 파일은 고정 비용)
+        """
+        stat = self._stat(file_name)
+        if stat is None:
+            return FILE_BASE_COST
+        entry = self.entries.get(file_name)
+        if entry is not None and entry[:2] == stat:
+            return entry[2]
+        return FILE_BASE_COST + stat[0] / self._bytes_per_second
+
+    def record(self, file_name: str, seconds: float) -> None:
+        """파일 처리 시간 기록
+
+        Args:
+            file_name: 파일 경로
+            seconds: 처리 시간 (초)
+        """
+        stat = self._stat(file_name)
+        if stat is None:
+            return
+        # 최근 기록이 뒤에 오도록 다시 삽입
+        self.entries.pop(file_name, None)
+        self.entries[file_name] = (stat[0], stat[1], round(seconds, 6))
+        self._dirty = True
+
+    def save(self) -> None:
+        """기록 파일 저장 (저장 경로가 없거나 변경이 없으면 생략, 실패 시 경고만 남김)"""
+        if self.path is None or not self._dirty:
+            return
+        while len(self.entries) > TIMINGS_MAX_ENTRIES:
+            del self.entries[next(iter(self.entries))]
+
+        payload = {
+            'version': TIMINGS_FORMAT_VERSION,
+            'files': {name: list(entry) for name, entry in self.entries.items()},
+        }
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"파일 처리 시간 기록을 저장할 수 없습니다: {self.path} ({e})")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+def _plan(costs: Sequence[Tuple[str, float]], workers: int) -> List[Tuple[float, List[str]]]:
+    """예상 비용 기준 (청크 비용, 파일 경로 청크) 목록 구성 (청크 비용 내림차순)"""
+    if not costs:
+        return []
+
+    ordered = sorted(costs, key=lambda item: item[1], reverse=True)
+    target = sum(cost for _, cost in ordered) / (max(1, workers) * FILE_CHUNKS_PER_WORKER)
+
+    chunks: List[Tuple[float, List[str]]] = []
+    current: List[str] = []
+    current_cost = 0.0
+    for file_name, cost in ordered:
+        if cost >= target:
+            chunks.append((cost, [file_name]))
+            continue
+        current.append(file_name)
+        current_cost += cost
+        if current_cost >= target or len(current) >= FILE_CHUNK_MAX:
+            chunks.append((current_cost, current))
+            current, current_cost = [], 0.0
+    if current:
+        chunks.append((current_cost, current))
+
+    chunks.sort(key=lambda chunk: chunk[0], reverse=True)
+    return chunks
+
+
+def plan_chunks(costs: Sequence[Tuple[str, float]], workers: int) -> List[List[str]]:
+    """예상 비용 기준으로 파일 청크 구성 (비용이 큰 청크부터)
+
+    목표 청크 비용은 전체 비용을 (워커 수 × FILE_CHUNKS_PER_WORKER)로 나눈 값입니다.
+    목표 이상인 파일은 단독 청크가 되고, 나머지 파일은 큰 것부터 목표 비용 또는
+    FILE_CHUNK_MAX개에 이를 때까지 묶습니다.
+
+    Args:
+        costs: (파일 경로, 예상 비용) 목록
+        workers: 워커 수
+
+    Returns:
+        List[List[str]]: 파일 경로 청크 목록 (청크 비용 내림차순)
+    """
+    return [files for _, files in _plan(costs, workers)]
+
+
+class ChunkQueue:
+    """제출 대기 청크 (예상 비용이 큰 청크부터 반환)
+
+    스트림 입력은 검색된 구간마다 청크를 추가합니다. 대기 청크를 구간에 관계없이
+    비용 순으로 꺼내므로, 나중에 검색된 큰 파일도 앞 구간에서 남은 작은 청크보다
+    먼저 제출됩니다.
+    """
+
+    def __init__(self, workers: int):
+        """ChunkQueue 초기화
+
+        Args:
+            workers: 워커 수 (목표 청크 비용 계산용)
+        """
+        self.workers = workers
+        self._heap: List[Tuple[float, int, List[str]]] = []
+        self._order = itertools.count()
+
+    def add(self, costs: Sequence[Tuple[str, float]]) -> None:
+        """파일 구간을 청크로 나누어 대기열에 추가
+
+        Args:
+            costs: (파일 경로, 예상 비용) 목록
+        """
+        for cost, files in _plan(costs, self.workers):
+            # 비용이 같으면 먼저 추가된 청크부터
+            heapq.heappush(self._heap, (-cost, next(self._order), files))
+
+    def pop(self) -> List[str]:
+        """예상 비용이 가장 큰 청크 꺼내기"""
+        return heapq.heappop(self._heap)[2]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+def iter_windows(file_names: Iterable[str], workers: int) -> Iterator[List[str]]:
+    """청크를 구성할 파일 구간 반환
+
+    리스트는 한 구간으로 반환합니다. 스트림(검색 중인 파일)은 첫 구간을 작게 잡아
+    검색이 끝나기 전에 분석을 시작하고, 구간 크기를 FILE_STREAM_WINDOW까지 늘려
+    작은 파일이 충분히 묶이도록 합니다.
+
+    Args:
+        file_names: 파일 경로 목록 또는 이터레이터
+        workers: 워커 수
+
+    Yields:
+        List[str]: 파일 경로 구간
+    """
+    if isinstance(file_names, list):
+        if file_names:
+            yield file_names
+        return
+
+    files = iter(file_names)
+    size = max(1, workers) * FILE_CHUNKS_PER_WORKER
+    while True:
+        window = list(itertools.islice(files, size))
+        if not window:
+            return
+        yield window
+        size = min(size * 2, FILE_STREAM_WINDOW)
@@ -0,0 +1,264 @@
+"""
+워커 풀 모듈
+
+폴더 분석에 사용하는 재시작 가능한 프로세스 워커 풀을 제공합니다.
+
+작업 시간 제한(task_timeout)을 지정하면 워커가 작업(파일 또는 배치 PL/SQL 객체)을
+시작하고 끝낼 때마다 상태 큐로 부모 프로세스에 알리고, 부모의 감시 스레드가 제한
+시간을 넘긴 작업을 실행 중인 워커를 강제 종료합니다. 워커가 종료되면
+ProcessPoolExecutor는 깨진(broken) 상태가 되어 실행 중이던 모든 작업이
+BrokenProcessPool로 끝나므로, 호출자는 시간 초과된 작업을 실패로 기록하고 나머지
+작업을 다시 제출합니다. 다음 제출 시 풀은 새 워커로 다시 만들어집니다.
+
+max_tasks_per_child를 지정하면 워커가 작업(청크)을 그 수만큼 처리한 뒤 새 프로세스로
+교체되어 장시간 분석 중 워커 메모리 증가를 제한합니다 (Python 3.11 이상, spawn 방식).
+"""
+
+import concurrent.futures
+import concurrent.futures.process
+import contextlib
+import logging
+import multiprocessing
+import multiprocessing.context
+import multiprocessing.queues
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from ..data_models import TIMEOUT_ERROR_PREFIX
+
+# 로거 초기화
+logger = logging.getLogger(__name__)
+
+# 감시 스레드가 상태 큐를 기다리는 최대 시간 (초)
+WATCHDOG_POLL_SECONDS = 0.5
+
+# 시간 초과 외의 원인으로 워커가 종료되었을 때 같은 파일을 다시 제출하는 최대 횟수
+WORKER_CRASH_RETRIES = 2
+
+# 재시도 후에도 워커가 종료된 파일의 에러 메시지
+WORKER_CRASH_ERROR = "워커 프로세스가 비정상 종료되었습니다"
+
+# 강제 종료 시그널 (SIGKILL이 없는 플랫폼은 SIGTERM)
+_KILL_SIGNAL = getattr(signal, 'SIGKILL', signal.SIGTERM)
+
+# 워커 프로세스의 작업 상태 보고 큐 (시간 제한 사용 시 풀 초기화에서 설정)
+_status_queue = None
+
+
+def format_timeout_error(elapsed: float, limit: float, label: Optional[str] = None) -> str:
+    """시간 초과 에러 메시지 생성 (BatchAnalysisResult.timed_out_files 분류 기준)
+
+    Args:
+        elapsed: 강제 종료까지 경과 시간 (초)
+        limit: 작업 시간 제한 (초)
+        label: 시간 초과된 작업 이름 (배치 PL/SQL 객체 등, 파일 자체면 None)
+
+    Returns:
+        str: 에러 메시지 (예: "시간 초과: 301.2초 경과 (제한 300초)")
+    """
+    target = f"{label} " if label else ""
+    return f"{TIMEOUT_ERROR_PREFIX}: {target}{elapsed:.1f}초 경과 (제한 {limit:g}초)"
+
+
+def _init_tracked_worker(status_queue, initializer: Optional[Callable], initargs: tuple) -> None:
+    """워커 프로세스 초기화 (상태 큐 설정 후 원래 초기화 함수 실행)"""
+    global _status_queue
+    _status_queue = status_queue
+    if initializer is not None:
+        initializer(*initargs)
+
+
+@contextlib.contextmanager
+def tracked_task(label: str) -> Iterator[None]:
+    """워커에서 작업 하나의 시작과 끝을 부모 프로세스의 감시 스레드에 보고
+
+    시간 제한을 사용하지 않는 풀(또는 부모 프로세스)에서는 아무것도 하지 않습니다.
+
+    Args:
+        label: 작업 이름 (파일 경로 등, 시간 초과 시 WorkerPool.timed_out의 키)
+    """
+    if _status_queue is None:
+        yield
+        return
+    pid = os.getpid()
+    _status_queue.put((pid, label))
+    try:
+        yield
+    finally:
+        _status_queue.put((pid, None))
+
+
+class WorkerPool(concurrent.futures.Executor):
+    """재시작 가능한 프로세스 워커 풀
+
+    concurrent.futures.Executor를 상속하므로 배치 PL/SQL 객체 분석 등 실행기를 받는 곳에
+    그대로 전달할 수 있습니다. 풀이 깨진 뒤 submit()을
+    호출하면 새 워커로 풀을 다시 만들어 제출합니다.
+
+    Attributes:
+        max_workers: 워커 수
+        task_timeout: 작업 하나의 시간 제한 (초, None이면 제한 없음)
+        max_tasks_per_child: 워커 하나가 처리할 최대 작업 수 (None이면 제한 없음)
+        timed_out: 시간 초과로 워커를 종료한 작업 이름 → 경과 시간(초)
+        restarts: 풀을 다시 만든 횟수
+    """
+
+    def __init__(self, max_workers: int, initializer: Optional[Callable] = None,
+                 initargs: tuple = (), task_timeout: Optional[float] = None,
+                 max_tasks_per_child: Optional[int] = None):
+        """WorkerPool 초기화
+
+        Args:
+            max_workers: 워커 수
+            initializer: 워커 초기화 함수
+            initargs: 워커 초기화 함수 인자
+            task_timeout: 작업 하나의 시간 제한 (초, None이면 제한 없음)
+            max_tasks_per_child: 워커 하나가 처리할 최대 작업 수 (None이면 제한 없음,
+                Python 3.11 미만에서는 경고 후 무시)
+        """
+        self.max_workers = max_workers
+        self.task_timeout = task_timeout
+        self.max_tasks_per_child = max_tasks_per_child
+        self.timed_out: Dict[str, float] = {}
+        self.restarts = 0
+        self._initializer = initializer
+        self._initargs = initargs
+        self._lock = threading.Lock()
+        self._executor: concurrent.futures.ProcessPoolExecutor
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop: Optional[threading.Event] = None
+        self._status_queue: Optional[multiprocessing.queues.Queue] = None
+
+        if max_tasks_per_child and sys.version_info < (3, 11):
+            logger.warning("max_tasks_per_child는 Python 3.11 이상에서만 지원되어 무시합니다")
+            self.max_tasks_per_child = None
+
+        self._start()
+
+    def _start(self) -> None:
+        """ProcessPoolExecutor와 감시 스레드 생성"""
+        kwargs: Dict[str, Any] = {}
+        context: multiprocessing.context.BaseContext = multiprocessing.get_context()
+        if self.max_tasks_per_child:
+            # max_tasks_per_child는 fork 방식과 함께 사용할 수 없음
+            context = multiprocessing.get_context('spawn')
+            kwargs.update(max_tasks_per_child=self.max_tasks_per_child, mp_context=context)
+
+        initializer, initargs = self._initializer, self._initargs
+        if self.task_timeout:
+            self._status_queue = context.Queue()
+            initializer, initargs = _init_tracked_worker, (self._status_queue, initializer, initargs)
+
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=initializer, initargs=initargs, **kwargs
+        )
+
+        if self.task_timeout:
+            self._stop = threading.Event()
+            self._watchdog = threading.Thread(
+                target=self._watch, args=(self._status_queue, self._stop),
+                name="WorkerPoolWatchdog", daemon=True
+            )
+            self._watchdog.start()
+
+    def _stop_watchdog(self) -> None:
+        """감시 스레드 종료 및 상태 큐 정리"""
+        if self._watchdog is not None:
+            if self._stop is not None:
+                self._stop.set()
+            self._watchdog.join()
+            self._watchdog = None
+        if self._status_queue is not None:
+            self._status_queue.close()
+            self._status_queue.join_thread()
+            self._status_queue = None
+
+    def _watch(self, status_queue, stop: threading.Event) -> None:
+        """감시 스레드: 작업 상태를 받아 제한 시간을 넘긴 작업의 워커를 강제 종료"""
+        limit = self.task_timeout
+        if not limit:
+            return
+        # 워커 PID → (작업 이름, 시작 시각)
+        running: Dict[int, Tuple[str, float]] = {}
+        wait = WATCHDOG_POLL_SECONDS
+        while not stop.is_set():
+            updates = []
+            try:
+                updates.append(status_queue.get(timeout=max(wait, 0.01)))
+            except queue.Empty:
+                pass
+            except (EOFError, OSError):
+                return
+            # 제한 시간을 확인하기 전에 이미 도착한 상태를 모두 반영
+            # (제한 직전에 끝난 작업의 워커가 다음 작업을 실행하는 중에 종료되지 않도록)
+            try:
+                while True:
+                    updates.append(status_queue.get_nowait())
+            except queue.Empty:
+                pass
+            except (EOFError, OSError):
+                return
+            for pid, label in updates:
+                if label is None:
+                    running.pop(pid, None)
+                else:
+                    running[pid] = (label, time.monotonic())
+
+            now = time.monotonic()
+            wait = WATCHDOG_POLL_SECONDS
+            for pid, (label, started) in list(running.items()):
+                elapsed = now - started
+                if elapsed >= limit:
+                    del running[pid]
+                    self._kill(pid, label, elapsed)
+                else:
+                    wait = min(wait, limit - elapsed)
+
+    def _kill(self, pid: int, label: str, elapsed: float) -> None:
+        """시간 초과 작업 기록 후 워커 강제 종료 (기록이 먼저 보이도록 종료 전에 기록)"""
+        with self._lock:
+            self.timed_out[label] = elapsed
+        logger.warning(f"작업 시간 초과로 워커 종료: {label} ({elapsed:.1f}초, 제한 {self.task_timeout:g}초)")
+        try:
+            os.kill(pid, _KILL_SIGNAL)
+        except OSError:
+            # 이미 종료된 워커
+            pass
+
+    def _restart(self) -> None:
+        """깨진 풀을 정리하고 새 워커로 다시 생성"""
+        self._stop_watchdog()
+        self._executor.shutdown(wait=True)
+        self.restarts += 1
+        logger.warning(f"워커 풀 재시작 ({self.restarts}회)")
+        self._start()
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> concurrent.futures.Future:
+        """작업 제출 (풀이 깨졌으면 다시 만든 뒤 제출)
+
+        Args:
+            fn: 작업 함수 (피클 가능해야 함)
+            *args: 작업 함수 인자
+            **kwargs: 작업 함수 키워드 인자
+
+        Returns:
+            concurrent.futures.Future: 작업 결과
+        """
+        try:
+            return self._executor.submit(fn, *args, **kwargs)
+        except concurrent.futures.process.BrokenProcessPool:
+            self._restart()
+            return self._executor.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """풀과 감시 스레드 종료 (cancel_futures는 Python 3.9 이상에서만 전달)"""
+        if cancel_futures:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+        else:
+            self._executor.shutdown(wait=wait)
+        self._stop_watchdog()
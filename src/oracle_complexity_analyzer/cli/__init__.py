@@ -4,25 +4,36 @@ Oracle Complexity Analyzer CLI 모듈
 CLI 관련 기능을 제공합니다.
 """
 
-from .parser import create_parser
-from .utils import normalize_target, is_all_targets
+from .parser import create_parser, create_merge_parser
+from .utils import normalize_target, is_all_targets, create_cache, create_object_filter
 from .console_output import (
     print_result_console,
     print_batch_result_console,
-    print_batch_analysis_summary
+    print_batch_analysis_summary,
+    print_script_result_console,
+    print_subprogram_result_console,
 )
 from .single_file import analyze_single_file, analyze_single_file_all_targets
 from .directory import analyze_directory, analyze_directory_all_targets
+from .merge import merge_shards
+from .profiling import run_profiled
 
 __all__ = [
     "create_parser",
+    "create_merge_parser",
     "normalize_target",
     "is_all_targets",
+    "create_cache",
+    "create_object_filter",
     "print_result_console",
     "print_batch_result_console",
     "print_batch_analysis_summary",
+    "print_script_result_console",
+    "print_subprogram_result_console",
     "analyze_single_file",
     "analyze_single_file_all_targets",
     "analyze_directory",
     "analyze_directory_all_targets",
+    "merge_shards",
+    "run_profiled",
 ]
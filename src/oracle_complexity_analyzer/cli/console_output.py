@@ -4,10 +4,12 @@
 분석 결과를 콘솔에 출력하는 함수들을 제공합니다.
 """
 
-from typing import Union
+import heapq
+from typing import Mapping, Union
 
 from ..enums import TargetDatabase
 from ..data_models import SQLAnalysisResult, PLSQLAnalysisResult
+from ..batch_analyzer.result_store import StoredResults, file_max_score
 
 
 def print_result_console(result: Union[SQLAnalysisResult, PLSQLAnalysisResult]) -> None:
@@ -100,6 +102,9 @@ def print_batch_analysis_summary(batch_result, target_db: TargetDatabase) -> Non
     
     if batch_result.failure_count > 0:
         print(f"\n❌ 실패한 파일: {batch_result.failure_count}개")
+        timed_out = batch_result.timed_out_files
+        if timed_out:
+            print(f"  (시간 초과: {len(timed_out)}개)")
         if batch_result.failed_files:
             for filename, error in list(batch_result.failed_files.items())[:5]:
                 print(f"  - {filename}: {error}")
@@ -148,6 +153,121 @@ def print_batch_result_console(batch_result: dict, target_db: TargetDatabase) ->
     print("\n" + "="*80 + "\n")
 
 
+def print_script_result_console(script_result: dict, target_db: TargetDatabase) -> None:
+    """SQL 스크립트 문장 단위 분석 결과를 콘솔에 출력
+    
+    Args:
+        script_result: 스크립트 분석 결과 딕셔너리
+        target_db: 타겟 데이터베이스
+    """
+    print("\n" + "="*80)
+    print("📊 SQL 스크립트 분석 결과")
+    print("="*80)
+    
+    print(f"\n타겟 데이터베이스: {target_db.value}")
+    print(f"전체 문장 수: {script_result['total_statements']}")
+    print(f"분석 성공: {script_result['analyzed_statements']}")
+    print(f"분석 실패: {script_result['failed_statements']}")
+    if 'distinct_statements' in script_result:
+        print(f"고유 SQL 형태 수: {script_result['distinct_statements']}")
+    
+    if script_result.get('statistics'):
+        print("\n📈 문장 유형별 통계:")
+        for stmt_type, count in sorted(script_result['statistics'].items()):
+            print(f"  - {stmt_type}: {count}")
+    
+    if script_result.get('summary'):
+        summary = script_result['summary']
+        print("\n🎯 복잡도 요약:")
+        print(f"  - 평균 복잡도: {summary.get('average_score', 0):.2f}")
+        print(f"  - 최대 복잡도: {summary.get('max_score', 0):.2f}")
+        print(f"  - 최소 복잡도: {summary.get('min_score', 0):.2f}")
+        
+        if summary.get('complexity_distribution'):
+            print("\n  복잡도 분포:")
+            _print_complexity_distribution(summary['complexity_distribution'])
+    
+    if script_result.get('results'):
+        sorted_results = sorted(
+            script_result['results'],
+            key=lambda x: x['analysis'].normalized_score,
+            reverse=True
+        )
+        print("\n🔥 복잡도 높은 문장 Top 5:")
+        for i, stmt in enumerate(sorted_results[:5], 1):
+            print(f"  {i}. #{stmt['statement_index']} {stmt['statement_type']} "
+                  f"(라인 {stmt['line_range']})")
+            print(f"     원점수: {stmt['analysis'].total_score:.2f}, "
+                  f"정규화: {stmt['analysis'].normalized_score:.2f}/10")
+    
+    repeated = [fp for fp in script_result.get('fingerprints', []) if fp['occurrences'] > 1]
+    if repeated:
+        print("\n🔁 반복 SQL 형태 Top 5:")
+        for fp in repeated[:5]:
+            print(f"  - {fp['fingerprint']} {fp['statement_type']}: {fp['occurrences']}회 "
+                  f"(첫 문장 #{fp['first_statement_index']})")
+    
+    if script_result.get('failed'):
+        print("\n❌ 분석 실패 문장:")
+        for item in script_result['failed'][:5]:
+            print(f"  - #{item['statement_index']} {item['statement_type']} (라인 {item['line_range']})")
+            print(f"    에러: {item['error']}")
+        if len(script_result['failed']) > 5:
+            print(f"  ... 외 {len(script_result['failed']) - 5}개")
+    
+    print("\n" + "="*80 + "\n")
+
+
+def print_subprogram_result_console(subprogram_result: dict, target_db: TargetDatabase) -> None:
+    """패키지/타입 바디 서브프로그램 단위 분석 결과를 콘솔에 출력
+    
+    Args:
+        subprogram_result: 서브프로그램 분석 결과 딕셔너리
+        target_db: 타겟 데이터베이스
+    """
+    print("\n" + "="*80)
+    print(f"📊 {subprogram_result['object_type']} 서브프로그램 분석 결과")
+    print("="*80)
+    
+    print(f"\n오브젝트: {subprogram_result['object_name']}")
+    print(f"타겟 데이터베이스: {target_db.value}")
+    print(f"전체 서브프로그램 수: {subprogram_result['total_subprograms']}")
+    print(f"분석 성공: {subprogram_result['analyzed_subprograms']}")
+    print(f"분석 실패: {subprogram_result['failed_subprograms']}")
+    
+    if subprogram_result.get('statistics'):
+        print("\n📈 서브프로그램 유형별 통계:")
+        for sub_type, count in sorted(subprogram_result['statistics'].items()):
+            print(f"  - {sub_type}: {count}")
+    
+    if subprogram_result.get('summary'):
+        summary = subprogram_result['summary']
+        print("\n🎯 복잡도 롤업:")
+        print(f"  - 평균 복잡도: {summary.get('average_score', 0):.2f}")
+        print(f"  - 라인 가중 평균 복잡도: {summary.get('weighted_average_score', 0):.2f}")
+        print(f"  - 최대 복잡도: {summary.get('max_score', 0):.2f}")
+        print(f"  - 최소 복잡도: {summary.get('min_score', 0):.2f}")
+        
+        if summary.get('complexity_distribution'):
+            print("\n  복잡도 분포:")
+            _print_complexity_distribution(summary['complexity_distribution'])
+        
+        if summary.get('hotspots'):
+            print("\n🔥 복잡도 높은 서브프로그램 Top 5:")
+            for i, hotspot in enumerate(summary['hotspots'], 1):
+                print(f"  {i}. {hotspot['subprogram_name']} ({hotspot['subprogram_type']}, "
+                      f"라인 {hotspot['line_range']}): {hotspot['normalized_score']:.2f}/10")
+    
+    if subprogram_result.get('failed'):
+        print("\n❌ 분석 실패 서브프로그램:")
+        for item in subprogram_result['failed'][:5]:
+            print(f"  - {item['subprogram_name']} (라인 {item['line_range']})")
+            print(f"    에러: {item['error']}")
+        if len(subprogram_result['failed']) > 5:
+            print(f"  ... 외 {len(subprogram_result['failed']) - 5}개")
+    
+    print("\n" + "="*80 + "\n")
+
 def _print_complexity_distribution(dist: dict) -> None:
     """복잡도 분포 출력"""
     print(f"    - 매우 간단 (0-1): {dist.get('very_simple', 0)}")
@@ -158,17 +278,19 @@ def _print_complexity_distribution(dist: dict) -> None:
     print(f"    - 극도로 복잡 (9-10): {dist.get('extremely_complex', 0)}")
 
 
-def _print_top_complex_files(results: dict) -> None:
-    """복잡도 높은 파일 Top 5 출력"""
-    sorted_results = sorted(
-        results.items(),
-        key=lambda x: x[1].normalized_score if x[1] else 0,
-        reverse=True
-    )
+def _print_top_complex_files(results: Mapping) -> None:
+    """복잡도 높은 파일 Top 5 출력 (여러 객체/문장이 포함된 파일은 최대 복잡도 사용)"""
+    if isinstance(results, StoredResults):
+        top_results = results.top_items(5)
+    else:
+        top_results = heapq.nlargest(5, results.items(), key=lambda x: file_max_score(x[1]))
     
     print("\n🔥 복잡도 높은 파일 Top 5:")
-    for i, (filename, result) in enumerate(sorted_results[:5], 1):
-        if result:
+    for i, (filename, result) in enumerate(top_results, 1):
+        if isinstance(result, dict):
+            print(f"  {i}. {filename}")
+            print(f"     최대 정규화: {file_max_score(result):.2f}/10")
+        elif result:
             print(f"  {i}. {filename}")
             print(f"     원점수: {result.total_score:.2f}, "
                   f"정규화: {result.normalized_score:.2f}/10")
@@ -5,12 +5,16 @@
 """
 
 import logging
-from typing import Any
+from typing import Any, Optional
+
+from src.utils.metrics import MetricsRecorder, metrics_stage
 
 from ..enums import TargetDatabase
 from ..analyzer import OracleComplexityAnalyzer
 from ..batch_analyzer import BatchAnalyzer
-from .utils import normalize_target, is_all_targets
+from .utils import (
+    normalize_target, is_all_targets, create_cache, create_object_filter, create_excludes, create_metrics
+)
 from .console_output import print_batch_result_console, print_batch_analysis_summary
 
 logger = logging.getLogger(__name__)
@@ -25,34 +29,50 @@ def analyze_directory(args: Any) -> int:
     Returns:
         int: 종료 코드 (0: 성공, 1: 실패)
     """
+    metrics = None
     try:
+        metrics = create_metrics(args)
+        
         # all/both 옵션인 경우 두 타겟 모두 분석
         if is_all_targets(args.target):
-            return analyze_directory_all_targets(args)
+            return analyze_directory_all_targets(args, metrics)
         
         target_db = normalize_target(args.target)
         
         analyzer = OracleComplexityAnalyzer(
             target_database=target_db,
-            output_dir=args.output_dir
+            output_dir=args.output_dir,
+            cache=create_cache(args),
+            dedupe=getattr(args, 'dedupe', False),
+            split_subprograms=getattr(args, 'split_subprograms', False),
+            object_filter=create_object_filter(args)
+        )
+        
+        batch_analyzer = BatchAnalyzer(
+            analyzer, max_workers=args.workers, journal=True, resume=getattr(args, 'resume', False),
+            spill_results=getattr(args, 'low_memory', False), excludes=create_excludes(args),
+            shard=getattr(args, 'shard', None), file_timeout=getattr(args, 'file_timeout', None),
+            max_tasks_per_child=getattr(args, 'max_tasks_per_child', None), metrics=metrics
         )
         
-        batch_analyzer = BatchAnalyzer(analyzer, max_workers=args.workers)
+        # 파일 검색은 분석과 함께 진행 (검색된 파일부터 분석 시작)
+        print(f"📁 폴더 검색 및 분석 시작: {args.directory} (워커 수: {batch_analyzer.max_workers})")
         
-        print(f"📁 폴더 검색 중: {args.directory}")
-        sql_files = batch_analyzer.find_sql_files(args.directory)
-        print(f"✅ {len(sql_files)}개 파일 발견")
+        batch_result = _run_batch_analysis(batch_analyzer, args)
         
-        if not sql_files:
-            print("⚠️  분석할 파일이 없습니다.")
+        if batch_analyzer.shard is not None:
+            _print_shard_partial(batch_analyzer, batch_result.total_files)
             return 0
         
-        print(f"\n🔄 분석 시작 (워커 수: {batch_analyzer.max_workers})")
+        if batch_result.total_files == 0:
+            print("⚠️  분석할 파일이 없습니다.")
+            return 0
         
-        batch_result = _run_batch_analysis(batch_analyzer, args)
+        print(f"✅ {batch_result.total_files}개 파일 분석 완료")
         
         _output_batch_results(batch_result, target_db, args)
-        _export_batch_reports(batch_analyzer, batch_result, args)
+        with metrics_stage(metrics, 'export', target=target_db.value):
+            _export_batch_reports(batch_analyzer, batch_result, args)
         
         return 0
         
@@ -65,20 +85,58 @@ def analyze_directory(args: Any) -> int:
     except Exception as e:
         logger.error(f"예상치 못한 에러: {e}", exc_info=True)
         return 1
+    finally:
+        if metrics is not None:
+            metrics.close()
+            print(f"✅ 처리량 지표 저장 완료: {metrics.path}")
 
 
-def analyze_directory_all_targets(args: Any) -> int:
+def analyze_directory_all_targets(args: Any, metrics: Optional[MetricsRecorder] = None) -> int:
     """폴더 일괄 분석 - 모든 타겟 (PostgreSQL + MySQL)
     
     Args:
         args: 명령줄 인자
+        metrics: 처리량 지표 기록기 (선택사항)
         
     Returns:
         int: 종료 코드 (0: 성공, 1: 실패)
     """
     targets = [TargetDatabase.POSTGRESQL, TargetDatabase.MYSQL]
     
-    print(f"📁 폴더 검색 중: {args.directory}")
+    # 파일 검색과 파싱은 한 번만 수행하고, 점수만 타겟별로 계산
+    analyzer = OracleComplexityAnalyzer(
+        target_database=targets[0],
+        output_dir=args.output_dir,
+        cache=create_cache(args),
+        dedupe=getattr(args, 'dedupe', False),
+        split_subprograms=getattr(args, 'split_subprograms', False),
+        object_filter=create_object_filter(args)
+    )
+    batch_analyzer = BatchAnalyzer(
+        analyzer, max_workers=args.workers, journal=True, resume=getattr(args, 'resume', False),
+        spill_results=getattr(args, 'low_memory', False), excludes=create_excludes(args),
+        shard=getattr(args, 'shard', None), file_timeout=getattr(args, 'file_timeout', None),
+        max_tasks_per_child=getattr(args, 'max_tasks_per_child', None), metrics=metrics
+    )
+    
+    # 파일 검색은 분석과 함께 진행 (검색된 파일부터 분석 시작)
+    print(f"📁 폴더 검색 및 분석 시작: {args.directory} (워커 수: {batch_analyzer.max_workers}, 타겟: "
+          f"{', '.join(t.value for t in targets)})")
+    
+    batch_results = batch_analyzer.analyze_folder_multi(
+        args.directory, targets, show_progress=not args.no_progress
+    )
+    
+    total_files = batch_results[targets[0]].total_files
+    if batch_analyzer.shard is not None:
+        _print_shard_partial(batch_analyzer, total_files)
+        return 0
+    
+    if total_files == 0:
+        print("⚠️  분석할 파일이 없습니다.")
+        return 0
+    
+    print(f"✅ {total_files}개 파일 분석 완료")
     
     for target_db in targets:
         print(f"\n{'='*60}")
@@ -86,26 +144,10 @@ def analyze_directory_all_targets(args: Any) -> int:
         print(f"{'='*60}")
         
         try:
-            analyzer = OracleComplexityAnalyzer(
-                target_database=target_db,
-                output_dir=args.output_dir
-            )
-            
-            batch_analyzer = BatchAnalyzer(analyzer, max_workers=args.workers)
-            
-            sql_files = batch_analyzer.find_sql_files(args.directory)
-            
-            if not sql_files:
-                print("⚠️  분석할 파일이 없습니다.")
-                continue
-            
-            print(f"✅ {len(sql_files)}개 파일 발견")
-            print(f"🔄 분석 시작 (워커 수: {batch_analyzer.max_workers})")
-            
-            batch_result = _run_batch_analysis(batch_analyzer, args)
-            
+            batch_result = batch_results[target_db]
             _output_batch_results(batch_result, target_db, args)
-            _export_batch_reports(batch_analyzer, batch_result, args)
+            with metrics_stage(metrics, 'export', target=target_db.value):
+                _export_batch_reports(batch_analyzer, batch_result, args)
                 
         except Exception as e:
             logger.error(f"{target_db.value} 분석 실패: {e}", exc_info=True)
@@ -136,6 +178,15 @@ def _run_batch_analysis(batch_analyzer: BatchAnalyzer, args: Any) -> Any:
         return batch_analyzer.analyze_folder(args.directory)
 
 
+def _print_shard_partial(batch_analyzer: BatchAnalyzer, total_files: int) -> None:
+    """샤드 분석 결과 출력 (리포트는 merge 명령으로 모든 샤드를 병합한 뒤 생성)"""
+    if batch_analyzer.shard is None:
+        return
+    index, count = batch_analyzer.shard
+    print(f"✅ 샤드 {index}/{count}: {total_files}개 파일 분석 완료")
+    print(f"✅ 부분 결과 저장 완료: {batch_analyzer.partial_path}")
+
+
 def _output_batch_results(batch_result: Any, target_db: TargetDatabase, args: Any) -> None:
     """배치 결과 콘솔 출력"""
     if args.output in ['console', 'both']:
@@ -0,0 +1,55 @@
+"""
+샤드 부분 결과 병합
+
+--shard로 나누어 분석한 폴더의 부분 결과를 합쳐 폴더 분석과 같은 리포트를 생성합니다.
+"""
+
+import logging
+from typing import Any
+
+from ..analyzer import OracleComplexityAnalyzer
+from ..batch_analyzer import BatchAnalyzer
+from .directory import _output_batch_results, _export_batch_reports
+
+logger = logging.getLogger(__name__)
+
+
+def merge_shards(args: Any) -> int:
+    """샤드 부분 결과 병합 실행
+    
+    Args:
+        args: merge 명령줄 인자
+        
+    Returns:
+        int: 종료 코드 (0: 성공, 1: 실패)
+    """
+    try:
+        # 분석기는 리포트 출력 경로와 타겟 설정에만 사용 (병합 시 파일을 다시 분석하지 않음)
+        analyzer = OracleComplexityAnalyzer(output_dir=args.output_dir)
+        batch_analyzer = BatchAnalyzer(analyzer, spill_results=getattr(args, 'low_memory', False))
+        
+        print(f"🔗 샤드 부분 결과 병합: {len(args.partials)}개 파일")
+        batch_results = batch_analyzer.merge_partials(args.partials)
+        
+        multi = len(batch_results) > 1
+        for target_db, batch_result in batch_results.items():
+            if multi:
+                print(f"\n{'='*60}")
+                print(f"🎯 타겟 데이터베이스: {target_db.value}")
+                print(f"{'='*60}")
+            _output_batch_results(batch_result, target_db, args)
+            _export_batch_reports(batch_analyzer, batch_result, args)
+        
+        total_files = next(iter(batch_results.values())).total_files
+        print(f"✅ {total_files}개 파일 병합 완료")
+        return 0
+        
+    except FileNotFoundError as e:
+        logger.error(f"파일을 찾을 수 없습니다: {e}")
+        return 1
+    except ValueError as e:
+        logger.error(f"잘못된 값: {e}")
+        return 1
+    except Exception as e:
+        logger.error(f"예상치 못한 에러: {e}", exc_info=True)
+        return 1
@@ -6,6 +6,8 @@ CLI 인자 파서
 
 import argparse
 
+from src.utils.cli_helpers import positive_float_argument, positive_int_argument, shard_argument
+
 
 def create_parser() -> argparse.ArgumentParser:
     """CLI 인자 파서 생성
@@ -37,6 +39,33 @@ def create_parser() -> argparse.ArgumentParser:
   
   # 폴더 분석 + 상세 결과 포함
   %(prog)s -d /path/to/sql/files --details
+  
+  # 중단된 폴더 분석 이어서 실행 (변경되지 않은 완료 파일은 건너뜀)
+  %(prog)s -d /path/to/sql/files --resume
+  
+  # 대규모 폴더 분석 (결과를 임시 파일에 저장하여 메모리 사용량 제한)
+  %(prog)s -d /path/to/monorepo --low-memory -o json
+  
+  # 파일 하나가 5분을 넘기면 중단하고 워커는 청크 200개마다 교체
+  %(prog)s -d /path/to/monorepo --file-timeout 300 --max-tasks-per-child 200
+  
+  # 처리량 지표를 JSON Lines로 기록 (릴리스 간 성능 비교용)
+  %(prog)s -d /path/to/monorepo --metrics-out metrics.jsonl
+  
+  # 감지기별 실행 시간 순위 출력 및 pstats 덤프 저장 (python -m pstats로 확인)
+  %(prog)s -d /path/to/slow/corpus --profile --profile-out detectors.prof
+  
+  # 백업/빌드 폴더를 제외하고 분석 (.gitignore 형식 패턴)
+  %(prog)s -d /path/to/sql/files --exclude "backup/" --exclude-from .gitignore
+  
+  # 여러 노드에서 폴더를 4개 샤드로 나누어 분석한 뒤 부분 결과 병합
+  %(prog)s -d /path/to/monorepo --shard 1/4 --output-dir /shared/reports   # 노드 1
+  ...
+  %(prog)s -d /path/to/monorepo --shard 4/4 --output-dir /shared/reports   # 노드 4
+  %(prog)s merge /shared/reports/monorepo.shard-*-of-4.partial.jsonl -o both
+  
+  # 배치 PL/SQL 파일에서 HR 소유 패키지 바디만 분석
+  %(prog)s -f ora_plsql_full.out --owner HR --object-type "PACKAGE BODY"
 
 지원 파일 확장자:
   .sql, .pls, .pkb, .pks, .prc, .fnc, .trg
@@ -110,6 +139,126 @@ def create_parser() -> argparse.ArgumentParser:
         help='진행 상황 표시 비활성화'
     )
     
+    # 분석 결과 캐시 사용 여부
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='분석 결과 캐시 비활성화 (기본: 출력 디렉토리의 캐시 파일 사용)'
+    )
+    
+    # 중단된 폴더 분석 재개
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='폴더 분석 시 출력 디렉토리의 저널에 기록된 완료 파일 중 크기/수정 시각이 '
+             '같은 파일은 다시 분석하지 않고 저널 결과를 사용'
+    )
+    
+    # 대규모 폴더 분석 시 결과를 디스크에 저장
+    parser.add_argument(
+        '--low-memory',
+        action='store_true',
+        help='폴더 분석 시 파일별 결과를 메모리에 모두 유지하지 않고 출력 디렉토리의 임시 '
+             'SQLite 파일에 저장 (분포/평균은 스트리밍 집계, 리포트 생성 시 필요한 결과만 복원)'
+    )
+    
+    # 폴더 검색 제외 패턴 (.gitignore 형식)
+    parser.add_argument(
+        '--exclude',
+        action='append',
+        metavar='PATTERN',
+        help='폴더 분석 시 제외할 경로 패턴 (.gitignore 형식, 폴더 기준 상대 경로, 반복 지정 가능, '
+             '예: "build/", "*_bak.sql", "!keep_bak.sql")'
+    )
+    parser.add_argument(
+        '--exclude-from',
+        action='append',
+        metavar='FILE',
+        help='폴더 분석 시 제외할 경로 패턴을 .gitignore 형식 파일에서 읽음 (반복 지정 가능)'
+    )
+    
+    # 여러 노드에 나누어 폴더 분석
+    parser.add_argument(
+        '--shard',
+        type=shard_argument,
+        metavar='I/N',
+        help='폴더 분석 시 검색된 파일을 크기 기준으로 N개 샤드에 나누어 I번째 샤드만 분석하고 '
+             '출력 디렉토리에 부분 결과(<폴더명>.shard-I-of-N.partial.jsonl)를 저장 '
+             '(모든 샤드의 부분 결과는 merge 명령으로 병합)'
+    )
+    
+    # 파일별 분석 시간 제한과 워커 교체 주기
+    parser.add_argument(
+        '--file-timeout',
+        type=positive_float_argument,
+        metavar='SECONDS',
+        help='폴더 분석 시 파일 하나(배치 PL/SQL 파일은 객체 하나)의 분석 시간 제한, 넘기면 '
+             '워커를 강제 종료하고 새 워커로 교체한 뒤 파일을 "시간 초과" 실패로 기록'
+    )
+    parser.add_argument(
+        '--max-tasks-per-child',
+        type=positive_int_argument,
+        metavar='N',
+        help='폴더 분석 시 워커 프로세스 하나가 파일 청크 N개를 처리하면 새 프로세스로 교체 '
+             '(메모리 증가 제한, Python 3.11 이상)'
+    )
+    
+    # 처리량 지표 기록
+    parser.add_argument(
+        '--metrics-out',
+        metavar='FILE',
+        help='폴더 분석 처리량 지표를 JSON Lines로 기록 (파일 검색/읽기/파싱/점수 계산/리포트 '
+             '단계별 시간, 파일별 처리 시간·크기·객체 수, 큐 깊이, 워커 사용률과 최대 메모리, '
+             '마지막 줄에 실행 요약)'
+    )
+    
+    # 감지기 프로파일링
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='SQLParser/PLSQLParser 감지기와 점수 계산 메서드별 실행 시간을 측정하여 '
+             '순위표 출력 및 pstats 형식 덤프 저장 (워커 포함, 분석 캐시 미사용)'
+    )
+    parser.add_argument(
+        '--profile-out',
+        metavar='FILE',
+        help='--profile 덤프 저장 경로 [기본값: <output-dir>/detector_profile.prof]'
+    )
+    
+    # 리터럴만 다른 SQL 문 중복 제거
+    parser.add_argument(
+        '--dedupe',
+        action='store_true',
+        help='리터럴/바인드 변수만 다른 SQL 문을 형태별로 한 번만 분석하고 출현 횟수를 리포트에 표시'
+    )
+    
+    # 패키지/타입 바디 서브프로그램 단위 분석
+    parser.add_argument(
+        '--split-subprograms',
+        action='store_true',
+        help='패키지/타입 바디를 프로시저·함수 단위로 나누어 병렬 분석하고 바디 단위 롤업을 리포트에 표시'
+    )
+    
+    # 배치 PL/SQL 파일 객체 필터 (바이트 오프셋 색인으로 선택된 객체만 읽음)
+    parser.add_argument(
+        '--owner',
+        action='append',
+        metavar='OWNER',
+        help='배치 PL/SQL 파일에서 지정한 소유자의 객체만 분석 (반복 지정 가능, glob 패턴 허용)'
+    )
+    parser.add_argument(
+        '--object-type',
+        action='append',
+        metavar='TYPE',
+        help='배치 PL/SQL 파일에서 지정한 타입의 객체만 분석 (예: PROCEDURE, "PACKAGE BODY")'
+    )
+    parser.add_argument(
+        '--object-name',
+        action='append',
+        metavar='NAME',
+        help='배치 PL/SQL 파일에서 지정한 이름의 객체만 분석 (반복 지정 가능, glob 패턴 허용)'
+    )
+    
     # 버전 정보
     parser.add_argument(
         '-v', '--version',
@@ -118,3 +267,56 @@ def create_parser() -> argparse.ArgumentParser:
     )
     
     return parser
+
+
+def create_merge_parser() -> argparse.ArgumentParser:
+    """merge 명령 인자 파서 생성
+    
+    Returns:
+        argparse.ArgumentParser: 설정된 인자 파서
+    """
+    parser = argparse.ArgumentParser(
+        prog='oracle-complexity-analyzer merge',
+        description='--shard로 나누어 분석한 폴더의 샤드 부분 결과를 합쳐 '
+                    '단일 노드 분석과 같은 요약/분포/Top N 리포트를 생성합니다.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+사용 예시:
+  # 4개 샤드의 부분 결과 병합 후 JSON/Markdown 리포트 생성
+  %(prog)s reports/monorepo.shard-*-of-4.partial.jsonl -o both
+        '''
+    )
+    
+    parser.add_argument(
+        'partials',
+        nargs='+',
+        metavar='PARTIAL',
+        help='샤드 부분 결과 파일 (모든 샤드)'
+    )
+    parser.add_argument(
+        '-o', '--output',
+        type=str,
+        choices=['json', 'markdown', 'both', 'console'],
+        default='console',
+        metavar='FORMAT',
+        help='출력 형식 (json, markdown, both, console) [기본값: console]'
+    )
+    parser.add_argument(
+        '--output-dir',
+        type=str,
+        default='reports',
+        metavar='DIR',
+        help='출력 디렉토리 경로 [기본값: reports]'
+    )
+    parser.add_argument(
+        '--details',
+        action='store_true',
+        help='개별 파일 상세 결과 포함'
+    )
+    parser.add_argument(
+        '--low-memory',
+        action='store_true',
+        help='병합한 파일별 결과를 메모리에 모두 유지하지 않고 출력 디렉토리의 임시 SQLite 파일에 저장'
+    )
+    
+    return parser
@@ -0,0 +1,53 @@
+"""
+감지기 프로파일링 실행
+
+--profile 지정 시 분석 명령을 감지기 프로파일링과 함께 실행하는 기능을 제공합니다.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Callable
+
+from ..detector_profile import profile_detectors, profile_input
+
+logger = logging.getLogger(__name__)
+
+# 출력 디렉토리에 저장하는 기본 덤프 파일명
+PROFILE_FILENAME = 'detector_profile.prof'
+
+
+def run_profiled(command: Callable[[Any], int], args: Any) -> int:
+    """분석 명령을 감지기 프로파일링과 함께 실행
+    
+    명령이 끝나면 감지기별 자체 시간 순위표를 출력하고 pstats 형식 덤프를 저장합니다.
+    
+    Args:
+        command: 분석 명령 함수 (analyze_single_file, analyze_directory)
+        args: 명령줄 인자
+    
+    Returns:
+        int: 분석 명령의 종료 코드
+    """
+    with profile_detectors() as profile:
+        # 단일 파일 분석은 파일 경로를 최악 입력 이름 앞에 붙임
+        with profile_input(getattr(args, 'file', None) or ''):
+            exit_code = command(args)
+    
+    if not profile.stats:
+        print("⚠️  측정된 감지기 호출이 없습니다.")
+        return exit_code
+    
+    print("\n" + "="*80)
+    print(f"⏱️  감지기 프로파일 (자체 시간 순, 프로세스 {profile.processes}개, "
+          f"감지기 합계 {profile.total_seconds:.3f}초)")
+    print("="*80)
+    print(profile.format_table())
+    
+    path = Path(args.profile_out or Path(args.output_dir) / PROFILE_FILENAME)
+    try:
+        profile.dump_stats(path)
+        print(f"\n✅ 감지기 프로파일 저장 완료: {path} (python -m pstats {path})")
+    except OSError as e:
+        logger.error(f"감지기 프로파일 저장 실패: {path} ({e})")
+    
+    return exit_code
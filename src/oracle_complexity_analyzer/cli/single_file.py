@@ -5,12 +5,18 @@
 """
 
 import logging
+import os
 from typing import Any
 
 from ..enums import TargetDatabase
 from ..analyzer import OracleComplexityAnalyzer
-from .utils import normalize_target, is_all_targets
-from .console_output import print_result_console, print_batch_result_console
+from .utils import normalize_target, is_all_targets, create_cache, create_object_filter
+from .console_output import (
+    print_result_console,
+    print_batch_result_console,
+    print_script_result_console,
+    print_subprogram_result_console,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +32,6 @@ def analyze_single_file(args: Any) -> int:
     """
     try:
         from src.formatters.result_formatter import ResultFormatter
-        from ..file_detector import detect_file_type
         
         # all/both 옵션인 경우 두 타겟 모두 분석
         if is_all_targets(args.target):
@@ -36,20 +41,42 @@ def analyze_single_file(args: Any) -> int:
         
         analyzer = OracleComplexityAnalyzer(
             target_database=target_db,
-            output_dir=args.output_dir
+            output_dir=args.output_dir,
+            cache=create_cache(args),
+            dedupe=getattr(args, 'dedupe', False),
+            split_subprograms=getattr(args, 'split_subprograms', False),
+            object_filter=create_object_filter(args)
         )
         
         print(f"📄 파일 분석 중: {args.file}")
-        result = analyzer.analyze_file(args.file)
         
-        # 파일 타입 감지
-        file_type = _detect_file_type_safe(args.file)
+        # 파일은 한 번만 읽고, 파일 타입은 분석 시 판별한 값 사용
+        with analyzer.open_source(args.file) as source:
+            result = analyzer.analyze_file(args.file, max_workers=args.workers or os.cpu_count(),
+                                           source=source)
+        file_type = source.file_type or 'sql'
         
         if isinstance(result, dict) and 'total_objects' in result:
             print_batch_result_console(result, target_db)
             _export_batch_results(analyzer, result, args, file_type)
             return 0
         
+        if isinstance(result, dict) and 'total_statements' in result:
+            if args.output in ['console', 'both']:
+                print_script_result_console(result, target_db)
+            _export_batch_results(analyzer, result, args, file_type)
+            return 0
+        
+        if isinstance(result, dict) and 'total_subprograms' in result:
+            if args.output in ['console', 'both']:
+                print_subprogram_result_console(result, target_db)
+            _export_batch_results(analyzer, result, args, file_type)
+            return 0
+        
+        if isinstance(result, dict):
+            logger.error(f"지원하지 않는 분석 결과 형식입니다: {sorted(result)}")
+            return 1
+        
         if args.output in ['console', 'both']:
             print_result_console(result)
         
@@ -77,14 +104,30 @@ def analyze_single_file_all_targets(args: Any) -> int:
     Returns:
         int: 종료 코드 (0: 성공, 1: 실패)
     """
-    from src.formatters.result_formatter import ResultFormatter
-    
     targets = [TargetDatabase.POSTGRESQL, TargetDatabase.MYSQL]
     
     print(f"📄 파일 분석 중: {args.file}")
     
-    # 파일 타입 감지
-    file_type = _detect_file_type_safe(args.file)
+    # 파일은 한 번만 읽고 파싱하며, 점수만 타겟별로 계산
+    analyzer = OracleComplexityAnalyzer(
+        target_database=targets[0],
+        output_dir=args.output_dir,
+        cache=create_cache(args),
+        dedupe=getattr(args, 'dedupe', False),
+        split_subprograms=getattr(args, 'split_subprograms', False),
+        object_filter=create_object_filter(args)
+    )
+    
+    try:
+        # 파일 타입은 분석 시 판별한 값 사용
+        with analyzer.open_source(args.file) as source:
+            results = analyzer.analyze_file_multi(
+                args.file, targets, max_workers=args.workers or os.cpu_count(), source=source
+            )
+        file_type = source.file_type or 'sql'
+    except Exception as e:
+        logger.error(f"파일 분석 실패: {e}", exc_info=True)
+        return 1
     
     for target_db in targets:
         print(f"\n{'='*60}")
@@ -92,20 +135,24 @@ def analyze_single_file_all_targets(args: Any) -> int:
         print(f"{'='*60}")
         
         try:
-            analyzer = OracleComplexityAnalyzer(
-                target_database=target_db,
-                output_dir=args.output_dir
-            )
-            
-            result = analyzer.analyze_file(args.file)
+            target_analyzer = analyzer.for_target(target_db)
+            result = results[target_db]
             
             if isinstance(result, dict) and 'total_objects' in result:
                 print_batch_result_console(result, target_db)
-                _export_batch_results(analyzer, result, args, file_type)
+                _export_batch_results(target_analyzer, result, args, file_type)
+            elif isinstance(result, dict) and 'total_statements' in result:
+                if args.output in ['console', 'both']:
+                    print_script_result_console(result, target_db)
+                _export_batch_results(target_analyzer, result, args, file_type)
+            elif isinstance(result, dict) and 'total_subprograms' in result:
+                if args.output in ['console', 'both']:
+                    print_subprogram_result_console(result, target_db)
+                _export_batch_results(target_analyzer, result, args, file_type)
             else:
                 if args.output in ['console', 'both']:
                     print_result_console(result)
-                _export_single_results(analyzer, result, args, file_type)
+                _export_single_results(target_analyzer, result, args, file_type)
                     
         except Exception as e:
             logger.error(f"{target_db.value} 분석 실패: {e}", exc_info=True)
@@ -118,19 +165,6 @@ def analyze_single_file_all_targets(args: Any) -> int:
     return 0
 
 
-def _detect_file_type_safe(file_path: str) -> str:
-    """파일 타입을 안전하게 감지"""
-    from ..file_detector import detect_file_type
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return detect_file_type(content)
-    except Exception as e:
-        logger.warning(f"파일 타입 감지 실패, 기본값(sql) 사용: {e}")
-        return 'sql'
-
-
 def _export_batch_results(
     analyzer: OracleComplexityAnalyzer, 
     result: dict, 
@@ -147,7 +181,7 @@ def _export_batch_results(
     
     if args.output in ['markdown', 'both']:
         md_output = ResultFormatter.batch_to_markdown(
-            result, analyzer.target_database.value
+            result, analyzer.target.value
         )
         md_file = analyzer.export_markdown_string(md_output, args.file, file_type)
         print(f"✅ Markdown 리포트 저장: {md_file}")
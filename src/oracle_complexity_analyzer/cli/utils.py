@@ -4,7 +4,15 @@ CLI 유틸리티 함수
 타겟 데이터베이스 변환 등 CLI에서 사용하는 유틸리티 함수를 제공합니다.
 """
 
+from typing import TYPE_CHECKING, Any, Optional
+
 from ..enums import TargetDatabase
+from ..analysis_cache import AnalysisCache
+
+if TYPE_CHECKING:
+    from src.parsers.batch_plsql_index import PLSQLObjectFilter
+    from src.utils.file_utils import IgnorePatterns
+    from src.utils.metrics import MetricsRecorder
 
 
 def normalize_target(target) -> TargetDatabase:
@@ -43,3 +51,93 @@ def is_all_targets(target: str) -> bool:
         bool: 모든 타겟 분석 여부
     """
     return target.lower() in ['all', 'both']
+
+
+def create_cache(args: Any) -> Optional[AnalysisCache]:
+    """명령줄 인자에 따라 분석 결과 캐시 생성
+    
+    캐시 파일은 출력 디렉토리 아래에 생성되며, --no-cache 지정 시 캐시를 사용하지 않습니다.
+    --profile 지정 시에도 캐시된 파일은 감지기가 실행되지 않으므로 캐시를 사용하지 않습니다.
+    
+    Args:
+        args: 명령줄 인자
+        
+    Returns:
+        AnalysisCache 또는 None (캐시 미사용)
+    """
+    if getattr(args, 'no_cache', False) or getattr(args, 'profile', False):
+        return None
+    return AnalysisCache.for_output_dir(args.output_dir)
+
+
+def create_object_filter(args: Any) -> Optional['PLSQLObjectFilter']:
+    """명령줄 인자에 따라 배치 PL/SQL 객체 필터 생성
+    
+    --owner, --object-type, --object-name 중 하나라도 지정되면 필터를 생성합니다.
+    
+    Args:
+        args: 명령줄 인자
+        
+    Returns:
+        PLSQLObjectFilter 또는 None (필터 미사용)
+    """
+    from src.parsers.batch_plsql_index import PLSQLObjectFilter
+    
+    object_filter = PLSQLObjectFilter(
+        owners=tuple(getattr(args, 'owner', None) or ()),
+        object_types=tuple(getattr(args, 'object_type', None) or ()),
+        names=tuple(getattr(args, 'object_name', None) or ()),
+    )
+    return None if object_filter.is_empty else object_filter
+
+
+def create_excludes(args: Any) -> Optional['IgnorePatterns']:
+    """명령줄 인자에 따라 폴더 검색 제외 패턴 생성
+    
+    --exclude 패턴과 --exclude-from 파일(.gitignore 형식)의 패턴을 순서대로 합칩니다.
+    
+    Args:
+        args: 명령줄 인자
+        
+    Returns:
+        IgnorePatterns 또는 None (제외 패턴 없음)
+        
+    Raises:
+        OSError: 패턴 파일을 읽을 수 없는 경우
+    """
+    from src.utils.file_utils import IgnorePatterns
+    
+    excludes = IgnorePatterns(getattr(args, 'exclude', None) or ())
+    for path in getattr(args, 'exclude_from', None) or ():
+        excludes.add_file(path)
+    return excludes if excludes else None
+
+
+def create_metrics(args: Any) -> Optional['MetricsRecorder']:
+    """명령줄 인자에 따라 처리량 지표 기록기 생성
+    
+    --metrics-out 지정 시 JSON Lines 지표 파일을 만들고 실행 설정을 run_start 이벤트로
+    기록합니다.
+    
+    Args:
+        args: 명령줄 인자
+        
+    Returns:
+        MetricsRecorder 또는 None (지표 미기록)
+    """
+    from src.utils.metrics import MetricsRecorder
+    
+    path = getattr(args, 'metrics_out', None)
+    if not path:
+        return None
+    config = {
+        'directory': getattr(args, 'directory', None),
+        'target': getattr(args, 'target', None),
+        'workers': getattr(args, 'workers', None),
+        'dedupe': getattr(args, 'dedupe', False),
+        'split_subprograms': getattr(args, 'split_subprograms', False),
+        'low_memory': getattr(args, 'low_memory', False),
+        'shard': getattr(args, 'shard', None),
+        'cache': not getattr(args, 'no_cache', False),
+    }
+    return MetricsRecorder(path, 'oracle-complexity-analyzer', config=config)
@@ -8,7 +8,7 @@ import sys
 import argparse
 import logging
 from pathlib import Path
-from src.parsers.batch_plsql_splitter import BatchPLSQLSplitter
+from src.parsers.batch_plsql_splitter import ARCHIVE_FORMATS, BatchPLSQLSplitter
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -28,6 +28,12 @@ def create_parser() -> argparse.ArgumentParser:
   # 출력 디렉토리 지정
   plsql-splitter -f input.out -o output_folder
   
+  # 개별 파일 대신 단일 zip 아카이브로 출력 (output_folder.zip)
+  plsql-splitter -f input.out -o output_folder --archive zip
+  
+  # 파일 쓰기 스레드 수 지정 (네트워크 스토리지)
+  plsql-splitter -f input.out -w 32
+  
   # 상세 로그 출력
   plsql-splitter -f input.out -v
         '''
@@ -44,6 +50,20 @@ def create_parser() -> argparse.ArgumentParser:
         help='출력 디렉토리 경로 (기본값: {입력파일명}_split)'
     )
     
+    parser.add_argument(
+        '--archive',
+        choices=list(ARCHIVE_FORMATS),
+        help='개별 파일 대신 단일 아카이브로 출력 (tar, tar.gz, zip)'
+    )
+    
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=None,
+        metavar='N',
+        help='파일 쓰기 스레드 수 (기본값: 8)'
+    )
+    
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -85,24 +105,21 @@ def main() -> int:
         # Splitter 생성 및 실행
         splitter = BatchPLSQLSplitter(str(input_file), args.output)
         
-        # 파싱
-        print(f"\n📖 파일 파싱 중...")
-        objects = splitter.parse()
+        # 파싱 및 분리 (입력 파일을 스트리밍하면서 객체 단위로 쓰기)
+        print(f"\n✂️  파일 분리 중...")
+        splitter.split_streaming(max_workers=args.workers, archive=args.archive)
         
-        if not objects:
+        if not splitter.streamed_statistics:
             logger.warning("분석 가능한 PL/SQL 객체를 찾을 수 없습니다.")
             return 1
         
-        print(f"✅ {len(objects)}개 객체 발견")
-        
-        # 분리
-        print(f"\n✂️  파일 분리 중...")
-        stats = splitter.split()
-        
         # 통계 출력
         splitter.print_statistics()
         
-        print(f"\n✅ 완료! 출력 디렉토리: {splitter.output_dir}")
+        if splitter.archive_file is not None:
+            print(f"\n✅ 완료! 출력 아카이브: {splitter.archive_file}")
+        else:
+            print(f"\n✅ 완료! 출력 디렉토리: {splitter.output_dir}")
         
         return 0
         
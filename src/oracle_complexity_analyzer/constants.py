@@ -10,6 +10,8 @@ Oracle 특화 문법, 함수, 힌트 등의 상수를 정의합니다.
   - 신규 Oracle 기능 추가 (KEEP, WITHIN GROUP, XML/JSON, Flashback 등)
 """
 
+from .keyword_matcher import KeywordMatcher
+
 # ============================================================================
 # Oracle 특화 기능/함수/힌트 상수 정의
 # Requirements 2.1-2.5, 3.1, 7.1을 구현합니다.
@@ -339,6 +341,45 @@ EXTERNAL_DEPENDENCY_SCORES = {
     'DBMS_OUTPUT': 0.2,        # 디버그 출력 → RAISE NOTICE
 }
 
+# SQL 데이터 처리 볼륨 구간 경계 (쿼리 길이, 문자 수)
+# 500자 미만 = small, 500-1000자 = large, 1000자 이상 = xlarge
+DATA_VOLUME_LENGTH_THRESHOLDS = (500, 1000)
+
+# 감지기(detector)별 스캔 예산
+# 시간 예산(초)을 넘기거나 입력 크기(문자 수)를 넘는 감지기는 부분 결과를 반환하고
+# 분석 결과의 degraded_detectors에 표시됩니다.
+DETECTOR_TIME_LIMIT = 2.0
+DETECTOR_MAX_SCAN_CHARS = 8_000_000
+
+# ============================================================================
+# 사전 컴파일된 다중 키워드 매처
+# 위 상수 테이블을 import 시점에 한 번만 컴파일하여, 쿼리당 한 번의 스캔으로
+# 모든 키워드의 위치와 개수를 얻습니다. (개별 패턴과 매칭 결과 동일)
+# ============================================================================
+
+
+def _is_word_feature(feature: str) -> bool:
+    """영숫자 또는 공백이 포함된 문법 키워드는 단어 경계를 적용
+
+    특수 문자가 포함된 키워드('(+)', 'TABLE(', 'CONNECT_BY_ROOT' 등)는 그대로 매칭합니다.
+    """
+    return feature.isalnum() or ' ' in feature
+
+
+ORACLE_SYNTAX_MATCHER = KeywordMatcher(ORACLE_SPECIFIC_SYNTAX, bounded=_is_word_feature)
+
+# 함수는 뒤에 괄호가 따라옴
+ORACLE_FUNCTION_MATCHER = KeywordMatcher(ORACLE_SPECIFIC_FUNCTIONS, suffix=r'\s*\(')
+
+# 분석 함수는 OVER 절과 함께 사용됨
+ANALYTIC_FUNCTION_MATCHER = KeywordMatcher(
+    ANALYTIC_FUNCTIONS, suffix=r'\s*\([^)]*\)\s+OVER\s*\('
+)
+
+AGGREGATE_FUNCTION_MATCHER = KeywordMatcher(AGGREGATE_FUNCTIONS, suffix=r'\s*\(')
+
+ORACLE_HINT_MATCHER = KeywordMatcher(ORACLE_HINTS)
+
 # ============================================================================
 # 가중치 설정 (WeightConfig 인스턴스)
 # ============================================================================
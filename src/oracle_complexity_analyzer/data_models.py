@@ -4,14 +4,59 @@
 분석 결과를 담는 데이터 클래스들을 정의합니다.
 """
 
+import hashlib
 from dataclasses import dataclass, field
-from typing import List, Dict, Union
+from typing import List, Dict, Mapping, Optional, Tuple, Union
 from datetime import datetime
 
 # Enum 클래스들을 enums 모듈에서 import
 from .enums import TargetDatabase, ComplexityLevel, PLSQLObjectType
 
 
+@dataclass(frozen=True)
+class SourceRef:
+    """분석 결과의 원본 소스 참조
+    
+    배치 분석 결과는 원본 텍스트 대신 이 참조만 담고, 리포트가 원본을 출력할 때만
+    파일에서 해당 바이트 구간을 다시 읽습니다.
+    
+    Attributes:
+        path: 원본 파일 경로
+        start: 시작 바이트 오프셋
+        end: 끝 바이트 오프셋 (포함하지 않음)
+        sha256: 바이트 구간의 SHA-256 해시 (분석 이후 파일 변경 감지용)
+        encoding: 파일 인코딩
+    """
+    
+    path: str
+    start: int
+    end: int
+    sha256: str
+    encoding: str = 'utf-8'
+    
+    def load(self) -> str:
+        """참조 구간의 원본 텍스트 로드
+        
+        텍스트 모드 읽기와 같이 줄바꿈을 '\\n'으로 통일하고 앞뒤 공백을 제거합니다.
+        
+        Returns:
+            str: 원본 텍스트
+            
+        Raises:
+            OSError: 파일을 읽을 수 없는 경우
+            ValueError: 분석 이후 파일 내용이 바뀐 경우
+        """
+        with open(self.path, 'rb') as f:
+            f.seek(self.start)
+            data = f.read(self.end - self.start)
+        
+        if hashlib.sha256(data).hexdigest() != self.sha256:
+            raise ValueError(f"원본 파일이 분석 이후 변경되었습니다: {self.path}")
+        
+        text = data.decode(self.encoding)
+        return text.replace('\r\n', '\n').replace('\r', '\n').strip()
+
+
 @dataclass
 class SQLAnalysisResult:
     """SQL 쿼리 분석 결과를 담는 데이터 클래스
@@ -53,6 +98,68 @@ class SQLAnalysisResult:
     
     # 변환 가이드
     conversion_guides: Dict[str, str] = field(default_factory=dict)
+    
+    # 시간/크기 예산을 넘겨 부분 결과를 반환한 감지기 ('감지기:사유')
+    degraded_detectors: List[str] = field(default_factory=list)
+    
+    # 원본 소스 참조 (배치 분석 결과는 query를 비우고 참조만 유지)
+    source_ref: Optional[SourceRef] = None
+    
+    def source_text(self) -> str:
+        """원본 쿼리 반환 (query가 비어 있으면 source_ref에서 로드)"""
+        if self.query or self.source_ref is None:
+            return self.query
+        return self.source_ref.load()
+
+
+@dataclass(frozen=True)
+class SQLFeatureVector:
+    """SQL 쿼리에서 한 번만 추출되는 복잡도 지표 묶음 (불변)
+    
+    SQLParser.extract_features()가 생성하며, 복잡도 계산기의 모든 카테고리별
+    점수 계산은 이 객체만 참조합니다. 타겟 데이터베이스와 무관한 값만 담으므로
+    하나의 벡터로 여러 타겟의 점수를 계산할 수 있습니다.
+    """
+    
+    # 입력 정보
+    query_length: int
+    
+    # 구조 지표
+    join_count: int = 0
+    subquery_depth: int = 0
+    cte_count: int = 0
+    set_operators_count: int = 0
+    case_count: int = 0
+    derived_table_count: int = 0
+    
+    # 함수 지표
+    analytic_function_count: int = 0
+    aggregate_function_count: int = 0
+    
+    # 감지된 요소 (정의 순서 유지)
+    oracle_features: Tuple[str, ...] = ()
+    oracle_functions: Tuple[str, ...] = ()
+    hints: Tuple[str, ...] = ()
+    
+    # 절/키워드 존재 여부 (정규화된 쿼리의 문자열 포함 여부)
+    has_where: bool = False
+    has_order_by: bool = False
+    has_group_by: bool = False
+    has_having: bool = False
+    has_count: bool = False
+    has_keep: bool = False
+    
+    # 실행/변환 위험 요소
+    has_fullscan_risk: bool = False
+    has_distinct: bool = False
+    has_or_conditions: bool = False
+    has_like_pattern: bool = False
+    has_function_in_where: bool = False
+    has_complex_rownum: bool = False
+    has_empty_string_comparison: bool = False
+    
+    # 시간/크기 예산을 넘겨 부분 결과를 반환한 감지기 ('감지기:사유')
+    degraded_detectors: Tuple[str, ...] = ()
 
 
 @dataclass
@@ -99,6 +206,22 @@ class PLSQLAnalysisResult:
     
     # 변환 가이드
     conversion_guides: Dict[str, str] = field(default_factory=dict)
+    
+    # 시간/크기 예산을 넘겨 부분 결과를 반환한 감지기 ('감지기:사유')
+    degraded_detectors: List[str] = field(default_factory=list)
+    
+    # 원본 소스 참조 (배치 분석 결과는 code를 비우고 참조만 유지)
+    source_ref: Optional[SourceRef] = None
+    
+    def source_text(self) -> str:
+        """원본 코드 반환 (code가 비어 있으면 source_ref에서 로드)"""
+        if self.code or self.source_ref is None:
+            return self.code
+        return self.source_ref.load()
+
+
+# 시간 초과로 실패한 파일의 에러 메시지 접두사 (BatchAnalysisResult.timed_out_files 분류 기준)
+TIMEOUT_ERROR_PREFIX = "시간 초과"
 
 
 @dataclass
@@ -117,9 +240,11 @@ class BatchAnalysisResult:
         complexity_distribution: 복잡도 레벨별 파일 분포
         average_score: 평균 복잡도 점수
         results: 개별 파일 분석 결과 리스트
-        failed_files: 실패한 파일 목록 (파일명: 에러 메시지)
+        failed_files: 실패한 파일 목록 (파일명: 에러 메시지, 시간 초과는
+            "시간 초과: <경과 시간>초 경과 (제한 <제한>초)" 형식)
         target_database: 타겟 데이터베이스
         analysis_time: 분석 시작 시간
+        fingerprint_counts: SQL 형태(fingerprint)별 파일 수 (중복 제거 분석 시)
     """
     
     # 집계 정보
@@ -133,8 +258,8 @@ class BatchAnalysisResult:
     # 평균 점수
     average_score: float = 0.0
     
-    # 개별 결과 (파일명: 분석 결과)
-    results: Dict[str, Union[SQLAnalysisResult, PLSQLAnalysisResult]] = field(default_factory=dict)
+    # 개별 결과 (파일명: 분석 결과, 디스크 저장소 사용 시 StoredResults)
+    results: Mapping[str, Union[SQLAnalysisResult, PLSQLAnalysisResult]] = field(default_factory=dict)
     
     # 실패한 파일 (파일명: 에러 메시지)
     failed_files: Dict[str, str] = field(default_factory=dict)
@@ -142,6 +267,15 @@ class BatchAnalysisResult:
     # 메타데이터
     target_database: TargetDatabase = TargetDatabase.POSTGRESQL
     analysis_time: str = field(default_factory=lambda: datetime.now().strftime("%Y%m%d_%H%M%S"))
+    
+    # SQL 형태별 파일 수 (fingerprint: 파일 수, 중복 제거 분석 시에만 기록)
+    fingerprint_counts: Dict[str, int] = field(default_factory=dict)
+    
+    @property
+    def timed_out_files(self) -> Dict[str, str]:
+        """실패한 파일 중 시간 제한을 넘겨 중단된 파일 (파일명: 에러 메시지)"""
+        return {name: error for name, error in self.failed_files.items()
+                if error.startswith(TIMEOUT_ERROR_PREFIX)}
 
 
 @dataclass
@@ -0,0 +1,338 @@
+"""
+감지기 프로파일링 모듈
+
+SQLParser/PLSQLParser 감지기와 복잡도 계산기의 _calculate_* 점수 계산 메서드별 실행
+시간을 측정합니다 (--profile).
+
+profile_detectors() 블록 안에서는 감지기 메서드를 타이머로 감싸고, 감지기별 호출 수,
+누적 시간(cumtime), 자체 시간(tottime, 다른 감지기 호출 시간 제외), 가장 오래 걸린
+호출과 그 입력(파일, 문장, 객체)을 모읍니다. 블록이 끝나면 원래 메서드로 되돌리므로
+프로파일링하지 않는 실행에는 영향이 없습니다.
+
+워커 프로세스도 같은 통계를 모읍니다. fork 방식 워커는 생성 시, spawn 방식 워커는
+이 모듈을 import할 때 프로파일링을 시작하고, 정상 종료할 때 통계를 임시 디렉토리에
+기록하면 부모 프로세스가 블록을 마칠 때 합칩니다. 시간 초과로 강제 종료된 워커의
+통계는 포함되지 않습니다.
+"""
+
+import contextlib
+import functools
+import inspect
+import json
+import logging
+import marshal
+import multiprocessing
+import multiprocessing.util
+import os
+import shutil
+import tempfile
+import time
+import types
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+# 로거 초기화
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스 통계를 기록할 디렉토리 환경 변수 (프로파일링 중에만 설정)
+PROFILE_DIR_ENV = "ORACLE_COMPLEXITY_PROFILE_DIR"
+
+# 콘솔 순위표에 출력할 감지기 수
+PROFILE_TABLE_LIMIT = 30
+
+# 순위표의 최악 입력 최대 길이 (넘으면 앞부분 생략)
+_INPUT_LABEL_WIDTH = 60
+
+# 감지기 통계 항목 인덱스: [호출 수, 자체 시간, 누적 시간, 최대 시간, 최대 시간 입력]
+_CALLS, _TOTTIME, _CUMTIME, _WORST, _WORST_INPUT = range(5)
+
+# 현재 프로세스의 감지기별 통계 (프로파일링 중이 아니면 None)
+_stats: Optional[Dict[str, list]] = None
+
+# 실행 중인 감지기 호출별 하위 감지기 시간 합계 (자체 시간 계산용)
+_children: List[float] = []
+
+# 현재 분석 중인 입력 이름 (파일 > 문장/객체 순으로 중첩)
+_inputs: List[str] = []
+
+# 감지기 이름 → pstats 위치 (파일, 줄 번호, 함수 이름)
+_locations: Dict[str, Tuple[str, int, str]] = {}
+
+# 감싼 메서드 원본 (클래스, 속성 이름, 원본 함수)
+_originals: List[Tuple[type, str, Callable]] = []
+
+
+def _detector_methods() -> Iterator[Tuple[type, str, Callable]]:
+    """프로파일링할 메서드 목록 (클래스, 속성 이름, 함수)
+    
+    SQLParser와 PLSQLParser 믹스인에 정의된 모든 메서드, 파서 생성(토큰화), 복잡도
+    계산기의 _calculate_* 메서드를 반환합니다. 프로퍼티와 정적 메서드는 제외합니다.
+    """
+    from src.calculators import PLSQLComplexityCalculator, SQLComplexityCalculator
+    from src.parsers.plsql import PLSQLParser
+    from src.parsers.plsql.base_parser import PLSQLParserBase
+    from src.parsers.sql_parser import SQLParser
+    
+    parser_classes = [SQLParser] + [
+        cls for cls in PLSQLParser.__mro__ if cls not in (PLSQLParser, PLSQLParserBase, object)
+    ]
+    for cls in parser_classes:
+        for name, value in vars(cls).items():
+            if isinstance(value, types.FunctionType) and (not name.startswith('__') or name == '__init__'):
+                yield cls, name, value
+    yield PLSQLParserBase, '__init__', vars(PLSQLParserBase)['__init__']
+    
+    for cls in (SQLComplexityCalculator, PLSQLComplexityCalculator):
+        for name, value in vars(cls).items():
+            if isinstance(value, types.FunctionType) and name.startswith('_calculate_'):
+                yield cls, name, value
+
+
+def _record(stats: Dict[str, list], name: str, elapsed: float, own: float) -> None:
+    """감지기 호출 하나 기록"""
+    entry = stats.get(name)
+    if entry is None:
+        stats[name] = [1, own, elapsed, elapsed, " > ".join(_inputs)]
+        return
+    entry[_CALLS] += 1
+    entry[_TOTTIME] += own
+    entry[_CUMTIME] += elapsed
+    if elapsed > entry[_WORST]:
+        entry[_WORST] = elapsed
+        entry[_WORST_INPUT] = " > ".join(_inputs)
+
+
+def _timed(name: str, method: Callable) -> Callable:
+    """메서드 실행 시간을 감지기 통계에 기록하는 래퍼 생성"""
+    clock = time.perf_counter
+    
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        stats = _stats
+        if stats is None:
+            return method(*args, **kwargs)
+        _children.append(0.0)
+        start = clock()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            elapsed = clock() - start
+            own = elapsed - _children.pop()
+            if _children:
+                _children[-1] += elapsed
+            _record(stats, name, elapsed, own)
+    
+    return wrapper
+
+
+def _install() -> None:
+    """감지기 메서드를 타이머 래퍼로 교체 (이미 교체했으면 무시)"""
+    if _originals:
+        return
+    for cls, attr, method in list(_detector_methods()):
+        name = f"{cls.__name__}.{attr}"
+        code = inspect.unwrap(method).__code__
+        _locations[name] = (code.co_filename, code.co_firstlineno, name)
+        _originals.append((cls, attr, method))
+        setattr(cls, attr, _timed(name, method))
+
+
+def _uninstall() -> None:
+    """감지기 메서드를 원래 메서드로 복원"""
+    while _originals:
+        cls, attr, method = _originals.pop()
+        setattr(cls, attr, method)
+
+
+def _reset() -> None:
+    """현재 프로세스의 통계 초기화 (프로파일링 시작)"""
+    global _stats
+    _stats = {}
+    _children.clear()
+    _inputs.clear()
+
+
+def _dump_worker_stats(directory: str) -> None:
+    """워커 프로세스 종료 시 통계를 디렉토리에 기록"""
+    if not _stats or not os.path.isdir(directory):
+        return
+    fd, path = tempfile.mkstemp(dir=directory, prefix=f"{os.getpid()}-", suffix=".json")
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(_stats, f)
+
+
+def _start_worker(_token: Any = None) -> None:
+    """워커 프로세스에서 프로파일링 시작 (종료 시 통계를 기록하도록 등록)
+    
+    multiprocessing이 프로세스 시작 시 호출합니다 (register_after_fork).
+    """
+    directory = os.environ.get(PROFILE_DIR_ENV)
+    if not directory:
+        return
+    _install()
+    _reset()
+    multiprocessing.util.Finalize(None, _dump_worker_stats, args=(directory,), exitpriority=0)
+
+
+class _ForkHook:
+    """fork 방식 워커의 프로파일링 시작 등록용 객체 (register_after_fork는 약한 참조 사용)"""
+
+
+@contextlib.contextmanager
+def profile_input(label: str) -> Iterator[None]:
+    """블록에서 실행되는 감지기 호출의 입력 이름 지정 (최악 입력 기록용)
+    
+    중첩하면 바깥 이름과 ' > '로 이어집니다 (예: 'a.sql > 3번째 문장 (12행)').
+    
+    Args:
+        label: 입력 이름 (파일 경로, 문장, 객체 이름 등, 빈 문자열이면 무시)
+    """
+    if _stats is None or not label:
+        yield
+        return
+    _inputs.append(label)
+    try:
+        yield
+    finally:
+        _inputs.pop()
+
+
+class DetectorProfile:
+    """감지기별 누적 실행 시간 통계
+    
+    Attributes:
+        stats: 감지기 이름 → [호출 수, 자체 시간, 누적 시간, 최대 시간, 최대 시간 입력]
+        processes: 통계를 합친 프로세스 수
+    """
+    
+    def __init__(self):
+        """DetectorProfile 초기화"""
+        self.stats: Dict[str, list] = {}
+        self.processes = 0
+    
+    def merge(self, stats: Dict[str, list]) -> None:
+        """프로세스 하나의 감지기 통계 합치기
+        
+        Args:
+            stats: 감지기 이름 → 통계 항목
+        """
+        self.processes += 1
+        for name, (calls, tottime, cumtime, worst, worst_input) in stats.items():
+            entry = self.stats.get(name)
+            if entry is None:
+                self.stats[name] = [calls, tottime, cumtime, worst, worst_input]
+                continue
+            entry[_CALLS] += calls
+            entry[_TOTTIME] += tottime
+            entry[_CUMTIME] += cumtime
+            if worst > entry[_WORST]:
+                entry[_WORST] = worst
+                entry[_WORST_INPUT] = worst_input
+    
+    @property
+    def total_seconds(self) -> float:
+        """모든 감지기의 자체 시간 합계 (초)"""
+        return sum(entry[_TOTTIME] for entry in self.stats.values())
+    
+    def ranked(self) -> List[Tuple[str, list]]:
+        """자체 시간이 긴 순서의 감지기 통계 목록"""
+        return sorted(self.stats.items(), key=lambda item: (-item[1][_TOTTIME], item[0]))
+    
+    def format_table(self, limit: Optional[int] = PROFILE_TABLE_LIMIT) -> str:
+        """감지기 순위표 생성
+        
+        Args:
+            limit: 출력할 감지기 수 (None이면 전체)
+        
+        Returns:
+            str: 자체 시간 순 순위표
+        """
+        total = self.total_seconds or 1e-12
+        lines = [
+            f"{'순위':>4}  {'감지기':<58} {'호출':>8} {'자체(s)':>9} {'비율':>6} {'누적(s)':>9} "
+            f"{'평균(ms)':>9} {'최대(ms)':>9}  최악 입력",
+        ]
+        ranked = self.ranked()
+        for rank, (name, (calls, tottime, cumtime, worst, worst_input)) in enumerate(ranked[:limit], 1):
+            if len(worst_input) > _INPUT_LABEL_WIDTH:
+                worst_input = "..." + worst_input[-(_INPUT_LABEL_WIDTH - 3):]
+            lines.append(
+                f"{rank:>4}  {name:<58} {calls:>8} {tottime:>9.3f} {tottime / total:>6.1%} {cumtime:>9.3f} "
+                f"{cumtime / calls * 1000:>9.3f} {worst * 1000:>9.3f}  {worst_input or '-'}"
+            )
+        if limit is not None and len(ranked) > limit:
+            lines.append(f"      ... 외 {len(ranked) - limit}개 감지기")
+        return "\n".join(lines)
+    
+    def dump_stats(self, path: Union[str, Path]) -> Path:
+        """pstats 호환 형식으로 저장 (pstats.Stats, snakeviz 등으로 열 수 있음)
+        
+        감지기 사이의 호출 관계는 기록하지 않습니다.
+        
+        Args:
+            path: 저장 경로
+        
+        Returns:
+            Path: 저장된 파일 경로
+        """
+        path = Path(path)
+        stats: Dict[Tuple[str, int, str], tuple] = {}
+        for name, (calls, tottime, cumtime, _, _) in self.stats.items():
+            location = _locations.get(name, ('~', 0, name))
+            stats[location] = (calls, calls, tottime, cumtime, {})
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            marshal.dump(stats, f)
+        return path
+
+
+@contextlib.contextmanager
+def profile_detectors() -> Iterator[DetectorProfile]:
+    """블록 안에서 실행되는 감지기/점수 계산 메서드의 실행 시간 측정
+    
+    블록에서 생성된 워커 프로세스의 통계도 워커가 정상 종료하면 합쳐지므로, 워커 풀은
+    블록 안에서 종료해야 합니다.
+    
+    Yields:
+        DetectorProfile: 블록이 끝나면 채워지는 감지기 통계
+    
+    Example:
+        >>> with profile_detectors() as profile:
+        ...     analyzer.analyze_sql("SELECT * FROM t")
+        >>> print(profile.format_table())
+    """
+    global _stats
+    profile = DetectorProfile()
+    directory = tempfile.mkdtemp(prefix="detector_profile_")
+    hook = _ForkHook()
+    previous_env = os.environ.get(PROFILE_DIR_ENV)
+    
+    _install()
+    _reset()
+    os.environ[PROFILE_DIR_ENV] = directory
+    multiprocessing.util.register_after_fork(hook, _start_worker)
+    try:
+        yield profile
+    finally:
+        own, _stats = _stats, None
+        del hook
+        _uninstall()
+        if previous_env is None:
+            os.environ.pop(PROFILE_DIR_ENV, None)
+        else:
+            os.environ[PROFILE_DIR_ENV] = previous_env
+        
+        if own:
+            profile.merge(own)
+        for dump in sorted(Path(directory).glob("*.json")):
+            try:
+                profile.merge(json.loads(dump.read_text(encoding='utf-8')))
+            except (OSError, ValueError) as e:
+                logger.warning(f"워커 감지기 통계를 읽을 수 없습니다: {dump} ({e})")
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+# spawn 방식 워커는 부모 프로세스의 설정을 물려받지 않고 after-fork 훅도 실행하지
+# 않으므로, 환경 변수를 물려받은 자식 프로세스에서 import될 때 바로 시작
+if os.environ.get(PROFILE_DIR_ENV) and multiprocessing.current_process().name != 'MainProcess':
+    _start_worker()
@@ -6,10 +6,37 @@ SQL, PL/SQL, 배치 PL/SQL 파일을 감지하는 기능을 제공합니다.
 
 import logging
 import re
+from typing import Iterable, List
 
 # 로거 초기화
 logger = logging.getLogger(__name__)
 
+# PL/SQL 키워드 목록 (대문자 코드에서 검색)
+PLSQL_KEYWORDS = (
+    'CREATE OR REPLACE PACKAGE',
+    'CREATE PACKAGE',
+    'CREATE OR REPLACE PROCEDURE',
+    'CREATE PROCEDURE',
+    'CREATE OR REPLACE FUNCTION',
+    'CREATE FUNCTION',
+    'CREATE OR REPLACE TRIGGER',
+    'CREATE TRIGGER',
+    'CREATE MATERIALIZED VIEW',
+    'CREATE OR REPLACE VIEW',
+    'CREATE VIEW',
+    'DECLARE',
+    'BEGIN',
+    'EXCEPTION',
+)
+
+# 배치 파일 객체 헤더 패턴
+BATCH_HEADER_RE = re.compile(r'-- Owner:\s*\w+\s*\n-- Type:\s*\w+\s*\n-- Name:\s*\w+', re.MULTILINE)
+
+# 줄 스트림 감지 시 한 번에 검사하는 줄 수와 다음 블록 앞에 이어 붙이는 줄 수
+# (객체 헤더가 블록 경계에 걸쳐도 찾을 수 있도록 함)
+DETECT_BLOCK_LINES = 4096
+DETECT_CARRY_LINES = 8
+
 
 def is_plsql(content: str) -> bool:
     """PL/SQL 여부 판단
@@ -24,28 +51,10 @@ def is_plsql(content: str) -> bool:
     """
     logger.debug("PL/SQL 여부 판단 시작")
     
-    # PL/SQL 키워드 목록
-    plsql_keywords = [
-        'CREATE OR REPLACE PACKAGE',
-        'CREATE PACKAGE',
-        'CREATE OR REPLACE PROCEDURE',
-        'CREATE PROCEDURE',
-        'CREATE OR REPLACE FUNCTION',
-        'CREATE FUNCTION',
-        'CREATE OR REPLACE TRIGGER',
-        'CREATE TRIGGER',
-        'CREATE MATERIALIZED VIEW',
-        'CREATE OR REPLACE VIEW',
-        'CREATE VIEW',
-        'DECLARE',
-        'BEGIN',
-        'EXCEPTION',
-    ]
-    
     upper_content = content.upper()
     
     # PL/SQL 키워드가 있으면 PL/SQL로 판단
-    return any(kw in upper_content for kw in plsql_keywords)
+    return any(kw in upper_content for kw in PLSQL_KEYWORDS)
 
 
 def is_batch_plsql(content: str) -> bool:
@@ -62,8 +71,7 @@ def is_batch_plsql(content: str) -> bool:
     logger.debug("배치 PL/SQL 여부 판단 시작")
     
     # 배치 파일 헤더 패턴 확인
-    header_pattern = r'-- Owner:\s*\w+\s*\n-- Type:\s*\w+\s*\n-- Name:\s*\w+'
-    matches = re.findall(header_pattern, content, re.MULTILINE)
+    matches = BATCH_HEADER_RE.findall(content)
     
     # 2개 이상의 객체 헤더가 있으면 배치 파일로 판단
     return len(matches) >= 2
@@ -84,3 +92,43 @@ def detect_file_type(content: str) -> str:
         return 'plsql'
     else:
         return 'sql'
+
+
+def detect_file_type_lines(lines: Iterable[str]) -> str:
+    """줄 스트림으로 파일 타입 자동 감지
+    
+    detect_file_type()과 같은 기준으로 판단하지만 전체 내용을 하나의 문자열로 만들지
+    않으므로, 큰 파일도 메모리 사용량이 DETECT_BLOCK_LINES줄 수준입니다. PL/SQL
+    키워드는 줄바꿈을 포함하지 않으므로 블록 단위로 검사하고, 여러 줄에 걸친 객체
+    헤더는 앞 블록의 마지막 DETECT_CARRY_LINES줄을 이어 붙여 검사합니다.
+    
+    Args:
+        lines: 줄 단위 텍스트 (줄 끝 '\\n' 포함)
+        
+    Returns:
+        str: 'batch_plsql', 'plsql', 또는 'sql'
+    """
+    headers = 0
+    plsql = False
+    carry = ''
+    block: List[str] = []
+    
+    def scan() -> bool:
+        nonlocal headers, plsql, carry
+        text = carry + ''.join(block)
+        # 앞 블록에서 이미 센 헤더(이어 붙인 부분 안에서 끝나는 헤더)는 제외
+        headers += sum(1 for match in BATCH_HEADER_RE.finditer(text) if match.end() > len(carry))
+        if not plsql:
+            upper_block = ''.join(block).upper()
+            plsql = any(kw in upper_block for kw in PLSQL_KEYWORDS)
+        carry = ''.join(block[-DETECT_CARRY_LINES:])
+        block.clear()
+        return headers >= 2
+    
+    for line in lines:
+        block.append(line)
+        if len(block) >= DETECT_BLOCK_LINES and scan():
+            return 'batch_plsql'
+    if scan():
+        return 'batch_plsql'
+    return 'plsql' if plsql else 'sql'
@@ -0,0 +1,194 @@
+"""
+다중 키워드 매처 모듈
+
+여러 키워드를 하나의 트라이(trie) 형태 정규식으로 사전 컴파일하여, 입력 텍스트를
+한 번만 스캔해 모든 키워드의 위치와 개수를 반환합니다.
+constants.py의 Oracle 기능/함수/힌트 테이블을 import 시점에 한 번만 컴파일하는 데 사용됩니다.
+"""
+
+import re
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set
+
+
+class KeywordHit(NamedTuple):
+    """키워드 매칭 결과
+
+    Attributes:
+        keyword: 매칭된 키워드
+        start: 매칭 시작 오프셋
+        end: 매칭 끝 오프셋 (exclusive, 접미 패턴 포함)
+    """
+    keyword: str
+    start: int
+    end: int
+
+
+def _build_trie_pattern(keywords: Iterable[str]) -> str:
+    """키워드 목록을 트라이 형태의 정규식으로 변환
+
+    공통 접두어를 한 번만 비교하므로 교대식(a|b|c)보다 위치당 비교 횟수가 적고,
+    탐욕적 선택으로 같은 위치에서는 긴 키워드가 먼저 시도됩니다.
+
+    Args:
+        keywords: 키워드 목록
+
+    Returns:
+        캡처 그룹이 없는 정규식 문자열
+    """
+    root: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = root
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        terminal = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if terminal:
+            body = '(?:' + body + ')?'
+        return body
+
+    return build(root)
+
+
+class KeywordMatcher:
+    """사전 컴파일된 다중 키워드 매처
+
+    모든 키워드를 트라이 정규식 하나로 합쳐 텍스트를 스캔합니다. 매칭이 발견되면 다음
+    스캔은 매칭 시작 위치 바로 뒤에서 이어지므로, 다른 키워드의 매칭 안에서 시작하는
+    키워드도 놓치지 않습니다. 같은 위치에서 접두어 관계에 있는 키워드(예: 'SAMPLE'과
+    'SAMPLE BLOCK')는 개별 패턴으로 추가 확인하므로, 결과는 키워드별로
+    re.search/re.findall을 수행한 것과 동일합니다.
+    """
+
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        suffix: str = r'\b',
+        bounded: Optional[Callable[[str], bool]] = None,
+    ):
+        """KeywordMatcher 초기화
+
+        Args:
+            keywords: 키워드 목록 (대문자 텍스트와 그대로 비교됨)
+            suffix: 단어 경계 키워드 뒤에 붙일 패턴 (기본값: 단어 경계)
+            bounded: 키워드에 단어 경계와 suffix를 적용할지 판단하는 함수.
+                     False인 키워드는 부분 문자열로 매칭됩니다. (기본값: 모두 적용)
+        """
+        self.keywords: List[str] = list(dict.fromkeys(keywords))
+        is_bounded = bounded or (lambda keyword: True)
+
+        bounded_keywords = [keyword for keyword in self.keywords if is_bounded(keyword)]
+        plain_keywords = [keyword for keyword in self.keywords if not is_bounded(keyword)]
+
+        self._patterns = {
+            keyword: re.compile(r'\b' + re.escape(keyword) + suffix)
+            for keyword in bounded_keywords
+        }
+        self._patterns.update({keyword: re.compile(re.escape(keyword)) for keyword in plain_keywords})
+
+        alternatives = []
+        if bounded_keywords:
+            alternatives.append(r'\b(' + _build_trie_pattern(bounded_keywords) + ')' + suffix)
+        if plain_keywords:
+            alternatives.append('(' + _build_trie_pattern(plain_keywords) + ')')
+        self._combined = re.compile('|'.join(alternatives)) if alternatives else None
+
+        # 같은 위치에서 함께 매칭될 수 있는 키워드 (접두어 관계)
+        self._related: Dict[str, List[str]] = {
+            keyword: [
+                other for other in self.keywords
+                if other != keyword and (keyword.startswith(other) or other.startswith(keyword))
+            ]
+            for keyword in self.keywords
+        }
+
+    def finditer(self, text: str) -> Iterator[KeywordHit]:
+        """텍스트를 한 번 스캔하여 모든 키워드 매칭을 위치 순으로 반환
+
+        서로 다른 키워드의 매칭은 겹칠 수 있습니다.
+
+        Args:
+            text: 검사할 텍스트
+
+        Yields:
+            KeywordHit
+        """
+        if self._combined is None:
+            return
+
+        search = self._combined.search
+        patterns = self._patterns
+        match = search(text)
+
+        while match:
+            start = match.start()
+            keyword = match.group(1) if match.lastindex == 1 else match.group(2)
+            yield KeywordHit(keyword, start, match.end())
+
+            for other in self._related[keyword]:
+                other_match = patterns[other].match(text, start)
+                if other_match:
+                    yield KeywordHit(other, start, other_match.end())
+
+            match = search(text, start + 1)
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        """모든 키워드 매칭 목록 반환
+
+        Args:
+            text: 검사할 텍스트
+
+        Returns:
+            KeywordHit 목록
+        """
+        return list(self.finditer(text))
+
+    def count(self, text: str) -> Dict[str, int]:
+        """키워드별 매칭 개수 반환
+
+        키워드별로 겹치지 않는 매칭만 세므로 re.findall 결과 개수와 같습니다.
+
+        Args:
+            text: 검사할 텍스트
+
+        Returns:
+            키워드 → 매칭 개수 (매칭된 키워드만 포함)
+        """
+        counts: Dict[str, int] = {}
+        last_end: Dict[str, int] = {}
+
+        for hit in self.finditer(text):
+            if hit.start < last_end.get(hit.keyword, 0):
+                continue
+            counts[hit.keyword] = counts.get(hit.keyword, 0) + 1
+            last_end[hit.keyword] = max(hit.end, hit.start + 1)
+
+        return counts
+
+    def found(self, text: str) -> Set[str]:
+        """텍스트에 존재하는 키워드 집합 반환
+
+        Args:
+            text: 검사할 텍스트
+
+        Returns:
+            감지된 키워드 집합
+        """
+        return {hit.keyword for hit in self.finditer(text)}
+
+    def detect(self, text: str) -> List[str]:
+        """텍스트에 존재하는 키워드를 정의 순서대로 반환
+
+        Args:
+            text: 검사할 텍스트
+
+        Returns:
+            감지된 키워드 목록 (생성 시 전달된 순서)
+        """
+        found = self.found(text)
+        return [keyword for keyword in self.keywords if keyword in found]
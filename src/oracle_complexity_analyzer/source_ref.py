@@ -0,0 +1,172 @@
+"""
+원본 소스 참조 모듈
+
+배치 분석 결과가 원본 텍스트 대신 (파일 경로, 바이트 구간, 해시) 참조만 담도록
+결과를 줄이는(slim) 도우미를 제공합니다. 워커 프로세스는 결과를 부모 프로세스로
+보내기 전에 소스 텍스트를 비우고 SourceRef를 채우며, 리포트가 원본을 출력할 때만
+SourceRef.load()로 해당 구간을 다시 읽습니다.
+"""
+
+import dataclasses
+import hashlib
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
+
+from .data_models import SQLAnalysisResult, PLSQLAnalysisResult, SourceRef
+
+# 결과 종류별 원본 소스 필드
+_SOURCE_FIELDS = {SQLAnalysisResult: 'query', PLSQLAnalysisResult: 'code'}
+
+# 앞뒤 공백 (bytes.strip 기본값과 동일)
+_WHITESPACE = b' \t\n\r\x0b\x0c'
+
+
+class SourceIndex:
+    """파일 바이트 구간 참조 생성기
+    
+    줄 번호를 바이트 오프셋으로 바꿀 때 줄 시작 위치 목록을 만들지 않고 마지막 위치에서
+    이어서 검색합니다. 분석 결과는 줄 순서대로 처리되므로 파일 하나당 선형 시간입니다.
+    
+    from_file()은 파일을 메모리 맵으로 열어 큰 배치 파일도 전체를 메모리에 올리지
+    않으므로 with 문으로 사용하거나 close()를 호출해야 합니다.
+    
+    Attributes:
+        path: 원본 파일 경로
+        data: 파일 내용 (바이트 또는 메모리 맵)
+        encoding: 파일 인코딩
+    """
+    
+    def __init__(self, path: Union[str, Path], data: Union[bytes, mmap.mmap],
+                 encoding: str = 'utf-8'):
+        """SourceIndex 초기화
+        
+        Args:
+            path: 원본 파일 경로
+            data: 파일 내용 (바이트 또는 메모리 맵)
+            encoding: 파일 인코딩 (기본값: utf-8)
+        """
+        self.path = str(path)
+        self.data = data
+        self.encoding = encoding
+        # 줄 검색 위치 (줄 번호, 해당 줄의 시작 바이트 오프셋)
+        self._cursor = (1, 0)
+        self._refs: Dict[Tuple[int, int], SourceRef] = {}
+    
+    @classmethod
+    def from_file(cls, path: Union[str, Path], encoding: str = 'utf-8') -> 'SourceIndex':
+        """파일을 메모리 맵으로 열어 SourceIndex 생성 (빈 파일은 빈 바이트)"""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return cls(path, b'', encoding)
+            return cls(path, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), encoding)
+    
+    def close(self) -> None:
+        """메모리 맵 닫기"""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+    
+    def __enter__(self) -> 'SourceIndex':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def ref(self, start: int, end: int) -> SourceRef:
+        """바이트 구간 참조 생성 (앞뒤 공백 제외)
+        
+        Args:
+            start: 시작 바이트 오프셋
+            end: 끝 바이트 오프셋 (포함하지 않음)
+            
+        Returns:
+            SourceRef: 원본 소스 참조
+        """
+        key = (start, end)
+        cached = self._refs.get(key)
+        if cached is not None:
+            return cached
+        
+        while start < end and self.data[start] in _WHITESPACE:
+            start += 1
+        while end > start and self.data[end - 1] in _WHITESPACE:
+            end -= 1
+        
+        source_ref = SourceRef(
+            path=self.path,
+            start=start,
+            end=end,
+            sha256=hashlib.sha256(self.data[start:end]).hexdigest(),
+            encoding=self.encoding,
+        )
+        self._refs[key] = source_ref
+        return source_ref
+    
+    def whole(self) -> SourceRef:
+        """파일 전체 참조"""
+        return self.ref(0, len(self.data))
+    
+    def lines(self, line_start: int, line_end: int) -> SourceRef:
+        """줄 범위 참조 (1부터 시작, line_end 포함)"""
+        return self.ref(self._line_offset(line_start), self._line_offset(line_end + 1))
+    
+    def _line_offset(self, line_no: int) -> int:
+        """줄 시작 바이트 오프셋 (파일 끝을 넘으면 파일 크기)"""
+        current_line, offset = self._cursor
+        if line_no < current_line:
+            current_line, offset = 1, 0
+        
+        while current_line < line_no:
+            newline = self.data.find(b'\n', offset)
+            if newline < 0:
+                return len(self.data)
+            offset = newline + 1
+            current_line += 1
+        
+        self._cursor = (current_line, offset)
+        return offset
+
+
+def _parse_line_range(line_range: str) -> Tuple[int, int]:
+    """'시작-끝' 형식의 줄 범위 파싱"""
+    start, _, end = line_range.partition('-')
+    return int(start), int(end or start)
+
+
+def slim_result(result: Any, index: SourceIndex) -> Any:
+    """분석 결과의 원본 텍스트를 SourceRef로 대체
+    
+    단일 결과는 파일 전체를, 배치/스크립트/서브프로그램 결과의 개별 항목은
+    line_range의 줄 구간을 참조합니다. 타겟별 결과 딕셔너리는 타겟마다 처리하며,
+    분석 중에 이미 참조를 채운 항목은 그대로 둡니다.
+    
+    Args:
+        result: 분석 결과 (데이터 클래스, 결과 딕셔너리 또는 타겟별 결과 딕셔너리)
+        index: 원본 파일의 SourceIndex
+        
+    Returns:
+        원본 텍스트가 제거된 분석 결과 (입력 결과는 변경하지 않음)
+    """
+    field_name = _SOURCE_FIELDS.get(type(result))
+    if field_name is not None:
+        return dataclasses.replace(result, **{field_name: '', 'source_ref': index.whole()})
+    
+    if not isinstance(result, dict):
+        return result
+    
+    if 'results' not in result:
+        # 타겟별 결과 딕셔너리
+        return {key: slim_result(value, index) for key, value in result.items()}
+    
+    entries = []
+    for entry in result['results']:
+        analysis = entry.get('analysis')
+        field_name = _SOURCE_FIELDS.get(type(analysis))
+        if field_name is not None and 'line_range' in entry and analysis.source_ref is None:
+            source_ref = index.lines(*_parse_line_range(entry['line_range']))
+            entry = dict(entry, analysis=dataclasses.replace(
+                analysis, **{field_name: '', 'source_ref': source_ref}
+            ))
+        entries.append(entry)
+    return dict(result, results=entries)
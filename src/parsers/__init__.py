@@ -5,7 +5,14 @@ Oracle SQL 및 PL/SQL 파서 모듈
 복잡도 분석에 필요한 구문 요소를 추출합니다.
 """
 
+from .sql_lexer import Token, TokenType, tokenize
 from .sql_parser import SQLParser
-from .plsql import PLSQLParser
+from .sql_splitter import SQLStatement, iter_statements, iter_file_statements, split_statements
+from .sql_fingerprint import fingerprint, fingerprint_hash
+from .plsql import PLSQLParser, PLSQLSubProgram
 
-__all__ = ['SQLParser', 'PLSQLParser']
+__all__ = [
+    'SQLParser', 'PLSQLParser', 'PLSQLSubProgram', 'Token', 'TokenType', 'tokenize',
+    'SQLStatement', 'iter_statements', 'iter_file_statements', 'split_statements',
+    'fingerprint', 'fingerprint_hash',
+]
@@ -0,0 +1,293 @@
+"""
+Batch PL/SQL Object Index
+
+배치 PL/SQL 파일(ora_plsql_full 출력)의 객체 헤더를 바이트 오프셋으로 색인하는 모듈입니다.
+
+파일을 메모리 맵으로 열어 '-- Owner:' / '-- Type:' / '-- Name:' 헤더 줄만 정규식으로
+찾으므로 DDL 본문은 디코딩하지 않습니다. 색인은 원본 파일 옆의 사이드카 파일
+(<파일명>.idx.json)에 저장되고 파일 크기와 수정 시각이 같으면 재사용되므로, 소유자/
+타입/이름 필터를 적용한 분석은 선택된 객체 구간만 읽습니다.
+
+줄 번호는 '\\n' 기준으로 계산합니다. (SQL*Plus 스풀의 '\\n' 및 '\\r\\n' 줄바꿈 지원)
+"""
+
+import fnmatch
+import io
+import json
+import logging
+import mmap
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+from .batch_plsql_parser import PLSQLObject, _extract_header_value, iter_objects
+
+# 로거 초기화
+logger = logging.getLogger(__name__)
+
+# 사이드카 색인 형식 버전 (저장 구조가 바뀌면 올림)
+INDEX_FORMAT_VERSION = 1
+
+# 사이드카 색인 파일 접미사
+INDEX_SUFFIX = '.idx.json'
+
+# 헤더 패턴 (리터럴 접두사로 시작하므로 정규식 엔진이 빠른 문자열 검색으로 후보를 찾음)
+_HEADER_RE = re.compile(rb'-- (Owner|Type|Name):[^\n]*')
+
+# 헤더 앞에 허용되는 줄 앞 공백 (BatchPLSQLParser의 strip() 후 startswith와 동일한 기준)
+_LEADING_WHITESPACE = b' \t\r\f\v'
+
+
+@dataclass
+class PLSQLObjectFilter:
+    """배치 PL/SQL 객체 필터
+
+    각 항목은 대소문자를 구분하지 않는 glob 패턴 목록이며(예: 'HR', 'PACKAGE*'),
+    비어 있는 항목은 제한하지 않습니다. 항목 간에는 AND, 항목 내에서는 OR 조건입니다.
+    """
+    owners: Tuple[str, ...] = ()
+    object_types: Tuple[str, ...] = ()
+    names: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        self.owners = tuple(pattern.upper() for pattern in self.owners or ())
+        self.object_types = tuple(pattern.upper() for pattern in self.object_types or ())
+        self.names = tuple(pattern.upper() for pattern in self.names or ())
+
+    @property
+    def is_empty(self) -> bool:
+        """제한 조건이 없는지 여부"""
+        return not (self.owners or self.object_types or self.names)
+
+    def matches(self, owner: str, object_type: str, object_name: str) -> bool:
+        """객체가 필터 조건을 만족하는지 확인
+
+        Args:
+            owner: 소유자
+            object_type: 객체 타입
+            object_name: 객체 이름
+
+        Returns:
+            bool: 조건을 만족하면 True
+        """
+        return (self._match_any(owner, self.owners)
+                and self._match_any(object_type, self.object_types)
+                and self._match_any(object_name, self.names))
+
+    @staticmethod
+    def _match_any(value: str, patterns: Tuple[str, ...]) -> bool:
+        """값이 패턴 중 하나와 일치하는지 확인 (패턴이 없으면 True)"""
+        if not patterns:
+            return True
+        value = value.upper()
+        return any(fnmatch.fnmatchcase(value, pattern) for pattern in patterns)
+
+
+@dataclass
+class PLSQLIndexEntry:
+    """배치 PL/SQL 객체 색인 항목
+
+    start/end는 '-- Owner:' 헤더 줄 시작부터 다음 헤더 줄 시작(또는 파일 끝)까지의
+    바이트 구간입니다.
+    """
+    owner: str
+    object_type: str
+    object_name: str
+    start: int
+    end: int
+    line_start: int
+
+
+class BatchPLSQLIndex:
+    """배치 PL/SQL 파일 객체 색인
+
+    Attributes:
+        path: 원본 파일 경로
+        encoding: 원본 파일 인코딩
+        size: 색인 생성 시점의 파일 크기
+        mtime_ns: 색인 생성 시점의 파일 수정 시각 (나노초)
+        entries: 객체 색인 항목 목록 (파일 순서)
+    """
+
+    def __init__(self, path: Union[str, Path], entries: List[PLSQLIndexEntry],
+                 size: int, mtime_ns: int, encoding: str = 'utf-8'):
+        """BatchPLSQLIndex 초기화
+
+        Args:
+            path: 원본 파일 경로
+            entries: 객체 색인 항목 목록
+            size: 파일 크기
+            mtime_ns: 파일 수정 시각 (나노초)
+            encoding: 파일 인코딩 (기본값: utf-8)
+        """
+        self.path = str(path)
+        self.entries = entries
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.encoding = encoding
+
+    @staticmethod
+    def sidecar_path(file_path: Union[str, Path]) -> Path:
+        """사이드카 색인 파일 경로 (<파일명>.idx.json)"""
+        file_path = Path(file_path)
+        return file_path.with_name(file_path.name + INDEX_SUFFIX)
+
+    @classmethod
+    def build(cls, file_path: Union[str, Path], encoding: str = 'utf-8') -> 'BatchPLSQLIndex':
+        """파일을 메모리 맵으로 스캔하여 색인 생성
+
+        Args:
+            file_path: 배치 PL/SQL 파일 경로
+            encoding: 파일 인코딩 (기본값: utf-8)
+
+        Returns:
+            BatchPLSQLIndex: 생성된 색인
+        """
+        with open(file_path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_size == 0:
+                return cls(file_path, [], 0, stat.st_mtime_ns, encoding)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                entries = cls._scan(data, encoding)
+        return cls(file_path, entries, stat.st_size, stat.st_mtime_ns, encoding)
+
+    @staticmethod
+    def _scan(data, encoding: str) -> List[PLSQLIndexEntry]:
+        """헤더 줄 위치를 찾아 객체 구간과 헤더 값 추출"""
+        entries: List[PLSQLIndexEntry] = []
+        line_no = 1
+        line_pos = 0
+        for match in _HEADER_RE.finditer(data):
+            # 줄 시작(앞 공백 허용)에 있는 헤더만 사용 (DDL 안의 '--' 주석 제외)
+            start = data.rfind(b'\n', 0, match.start()) + 1
+            if data[start:match.start()].strip(_LEADING_WHITESPACE):
+                continue
+            
+            prefix = match.group(1).decode('ascii') + ':'
+            value = _extract_header_value(match.group().decode(encoding, 'replace'), prefix)
+            if prefix == 'Owner:':
+                line_no += data[line_pos:start].count(b'\n')
+                line_pos = start
+                if entries:
+                    entries[-1].end = start
+                entries.append(PLSQLIndexEntry(value, '', '', start, len(data), line_no))
+            elif entries:
+                # 파서와 동일하게 객체 안의 마지막 Type/Name 헤더 값 사용
+                if prefix == 'Type:':
+                    entries[-1].object_type = value
+                else:
+                    entries[-1].object_name = value
+        return entries
+
+    @classmethod
+    def load(cls, file_path: Union[str, Path], encoding: str = 'utf-8') -> Optional['BatchPLSQLIndex']:
+        """사이드카 색인 로드 (없거나 원본 파일이 바뀌었으면 None)
+
+        Args:
+            file_path: 배치 PL/SQL 파일 경로
+            encoding: 파일 인코딩 (기본값: utf-8)
+
+        Returns:
+            Optional[BatchPLSQLIndex]: 유효한 색인 또는 None
+        """
+        try:
+            stat = os.stat(file_path)
+            with open(cls.sidecar_path(file_path), 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if (payload.get('version') != INDEX_FORMAT_VERSION
+                or payload.get('size') != stat.st_size
+                or payload.get('mtime_ns') != stat.st_mtime_ns
+                or payload.get('encoding') != encoding):
+            return None
+
+        entries = [PLSQLIndexEntry(*entry) for entry in payload.get('objects', [])]
+        return cls(file_path, entries, stat.st_size, stat.st_mtime_ns, encoding)
+
+    @classmethod
+    def load_or_build(cls, file_path: Union[str, Path], encoding: str = 'utf-8',
+                      save: bool = True) -> 'BatchPLSQLIndex':
+        """유효한 사이드카 색인이 있으면 로드하고, 없으면 생성 후 저장
+
+        Args:
+            file_path: 배치 PL/SQL 파일 경로
+            encoding: 파일 인코딩 (기본값: utf-8)
+            save: 새로 생성한 색인을 사이드카 파일로 저장할지 여부
+
+        Returns:
+            BatchPLSQLIndex: 객체 색인
+        """
+        index = cls.load(file_path, encoding)
+        if index is not None:
+            logger.debug(f"배치 PL/SQL 색인 재사용: {cls.sidecar_path(file_path)}")
+            return index
+
+        index = cls.build(file_path, encoding)
+        logger.info(f"배치 PL/SQL 색인 생성: {file_path} ({len(index.entries)}개 객체)")
+        if save:
+            index.save()
+        return index
+
+    def save(self) -> None:
+        """사이드카 색인 저장 (저장 실패 시 경고만 남김)"""
+        sidecar = self.sidecar_path(self.path)
+        payload = {
+            'version': INDEX_FORMAT_VERSION,
+            'size': self.size,
+            'mtime_ns': self.mtime_ns,
+            'encoding': self.encoding,
+            'objects': [
+                [e.owner, e.object_type, e.object_name, e.start, e.end, e.line_start]
+                for e in self.entries
+            ],
+        }
+        temp_path = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(temp_path, sidecar)
+        except OSError as e:
+            logger.warning(f"배치 PL/SQL 색인을 저장할 수 없습니다: {sidecar} ({e})")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def select(self, object_filter: Optional[PLSQLObjectFilter] = None) -> List[PLSQLIndexEntry]:
+        """필터 조건을 만족하는 색인 항목 목록
+
+        Args:
+            object_filter: 객체 필터 (None이면 전체)
+
+        Returns:
+            List[PLSQLIndexEntry]: 선택된 항목 (파일 순서)
+        """
+        if object_filter is None or object_filter.is_empty:
+            return list(self.entries)
+        return [e for e in self.entries
+                if object_filter.matches(e.owner, e.object_type, e.object_name)]
+
+    def iter_objects(self, object_filter: Optional[PLSQLObjectFilter] = None
+                     ) -> Iterator[PLSQLObject]:
+        """선택된 객체 구간만 읽어 PL/SQL 객체를 순서대로 추출
+
+        Args:
+            object_filter: 객체 필터 (None이면 전체)
+
+        Yields:
+            PLSQLObject: 추출된 PL/SQL 객체 (코드가 없는 객체는 제외)
+        """
+        selected = self.select(object_filter)
+        if not selected:
+            return
+
+        with open(self.path, 'rb') as f:
+            for entry in selected:
+                f.seek(entry.start)
+                data = f.read(entry.end - entry.start)
+                lines = io.TextIOWrapper(io.BytesIO(data), encoding=self.encoding)
+                yield from iter_objects(lines, first_line=entry.line_start)
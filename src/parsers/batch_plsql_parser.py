@@ -3,12 +3,23 @@ Batch PL/SQL Parser
 
 여러 PL/SQL 객체가 포함된 파일을 파싱하는 모듈입니다.
 ora_plsql_full.sql 스크립트의 출력 형식을 지원합니다.
+
+파일을 줄 단위로 읽으면서 다음 객체 헤더가 나오는 시점에 객체를 하나씩 반환하므로
+수 GB 크기의 스풀 파일도 메모리 사용량이 가장 큰 객체 하나 수준으로 유지되며,
+앞쪽 객체 분석을 파일을 끝까지 읽기 전에 시작할 수 있습니다.
 """
 
+import io
 import re
-from typing import List, Dict, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 from dataclasses import dataclass
 
+# 헤더 값 추출 패턴 (접두사별)
+_HEADER_VALUE_RES = {
+    prefix: re.compile(rf'{re.escape(prefix)}\s*(.+)')
+    for prefix in ('Owner:', 'Type:', 'Name:')
+}
+
 
 @dataclass
 class PLSQLObject:
@@ -19,12 +30,109 @@ class PLSQLObject:
     ddl_code: str
     line_start: int
     line_end: int
+    # DDL 코드의 첫 줄과 마지막 줄 번호 (헤더, 구분선, 뒤쪽 빈 줄 제외)
+    code_line_start: int = 0
+    code_line_end: int = 0
+
+
+def _extract_header_value(line: str, prefix: str) -> str:
+    """헤더 라인에서 값 추출 (예: '-- Owner: HR' → 'HR')"""
+    match = _HEADER_VALUE_RES[prefix].search(line)
+    if match:
+        return match.group(1).strip()
+    return ''
+
+
+def iter_objects(lines: Iterable[str], first_line: int = 1) -> Iterator[PLSQLObject]:
+    """줄 단위 입력에서 PL/SQL 객체를 순서대로 추출
+    
+    객체는 다음 '-- Owner:' 헤더를 만나거나 입력이 끝날 때 반환됩니다.
+    DDL 내부의 '--' 주석 줄은 제외하며, 코드가 없는 객체는 건너뜁니다.
+    
+    Args:
+        lines: 줄 단위 텍스트 (줄 끝의 '\\n' 포함 여부 무관)
+        first_line: 첫 줄의 줄 번호 (파일 일부 구간을 읽을 때 사용, 기본값: 1)
+        
+    Yields:
+        PLSQLObject: 추출된 PL/SQL 객체
+    """
+    current: Optional[PLSQLObject] = None
+    ddl_lines: List[str] = []
+    in_ddl = False
+    line_no = first_line - 1
+    
+    def finish(line_end: int) -> Iterator[PLSQLObject]:
+        if current is None or not ddl_lines:
+            return
+        current.ddl_code = '\n'.join(ddl_lines).strip()
+        current.line_end = line_end
+        if current.ddl_code:
+            yield current
+    
+    for line_no, line in enumerate(lines, first_line):
+        if line.endswith('\n'):
+            line = line[:-1]
+        stripped = line.strip()
+        
+        # 객체 헤더 감지
+        if stripped.startswith('-- Owner:'):
+            # 이전 객체 반환
+            yield from finish(line_no - 1)
+            
+            # 새 객체 시작
+            current = PLSQLObject(
+                owner=_extract_header_value(line, 'Owner:'),
+                object_type='',
+                object_name='',
+                ddl_code='',
+                line_start=line_no,
+                line_end=0
+            )
+            ddl_lines = []
+            in_ddl = False
+            
+        elif stripped.startswith('-- Type:') and current:
+            current.object_type = _extract_header_value(line, 'Type:')
+            
+        elif stripped.startswith('-- Name:') and current:
+            current.object_name = _extract_header_value(line, 'Name:')
+            
+        elif current and not stripped.startswith('--'):
+            # DDL 코드 수집
+            if stripped:
+                if not in_ddl:
+                    current.code_line_start = line_no
+                in_ddl = True
+                current.code_line_end = line_no
+                ddl_lines.append(line)
+            elif in_ddl:
+                # 빈 줄도 DDL 내부에서는 유지
+                ddl_lines.append(line)
+    
+    # 마지막 객체 반환
+    yield from finish(line_no)
+
+
+def iter_file_objects(file_path: str, encoding: str = 'utf-8') -> Iterator[PLSQLObject]:
+    """파일을 줄 단위로 읽으면서 PL/SQL 객체를 순서대로 추출
+    
+    Args:
+        file_path: 배치 PL/SQL 파일 경로
+        encoding: 파일 인코딩 (기본값: utf-8)
+        
+    Yields:
+        PLSQLObject: 추출된 PL/SQL 객체
+    """
+    with open(file_path, 'r', encoding=encoding) as f:
+        yield from iter_objects(f)
 
 
 class BatchPLSQLParser:
     """배치 PL/SQL 파일 파서
     
     여러 PL/SQL 객체가 연속으로 나열된 파일을 개별 객체로 분리합니다.
+    전체 내용을 문자열로 받는 API이며, 큰 파일은 iter_file_objects()로
+    스트리밍 처리합니다.
     
     지원 형식:
     -- ============================================================
@@ -44,67 +152,23 @@ class BatchPLSQLParser:
             content: 배치 PL/SQL 파일 내용
         """
         self.content = content
-        self.lines = content.split('\n')
         self.objects: List[PLSQLObject] = []
     
+    def iter_objects(self) -> Iterator[PLSQLObject]:
+        """내용에서 PL/SQL 객체를 순서대로 추출 (self.objects에 저장하지 않음)
+        
+        Yields:
+            PLSQLObject: 추출된 PL/SQL 객체
+        """
+        return iter_objects(io.StringIO(self.content))
+    
     def parse(self) -> List[PLSQLObject]:
         """파일을 파싱하여 개별 PL/SQL 객체 추출
         
         Returns:
             추출된 PL/SQL 객체 리스트
         """
-        self.objects = []
-        current_object = None
-        ddl_lines: List[str] = []
-        in_ddl = False
-        line_start = 0
-        
-        for i, line in enumerate(self.lines, 1):
-            # 객체 헤더 감지
-            if line.strip().startswith('-- Owner:'):
-                # 이전 객체 저장
-                if current_object and ddl_lines:
-                    current_object.ddl_code = '\n'.join(ddl_lines).strip()
-                    current_object.line_end = i - 1
-                    if current_object.ddl_code:
-                        self.objects.append(current_object)
-                
-                # 새 객체 시작
-                owner = self._extract_value(line, 'Owner:')
-                current_object = PLSQLObject(
-                    owner=owner,
-                    object_type='',
-                    object_name='',
-                    ddl_code='',
-                    line_start=i,
-                    line_end=0
-                )
-                ddl_lines = []
-                in_ddl = False
-                line_start = i
-                
-            elif line.strip().startswith('-- Type:') and current_object:
-                current_object.object_type = self._extract_value(line, 'Type:')
-                
-            elif line.strip().startswith('-- Name:') and current_object:
-                current_object.object_name = self._extract_value(line, 'Name:')
-                
-            elif current_object and not line.strip().startswith('--'):
-                # DDL 코드 수집
-                if line.strip():
-                    in_ddl = True
-                    ddl_lines.append(line)
-                elif in_ddl:
-                    # 빈 줄도 DDL 내부에서는 유지
-                    ddl_lines.append(line)
-        
-        # 마지막 객체 저장
-        if current_object and ddl_lines:
-            current_object.ddl_code = '\n'.join(ddl_lines).strip()
-            current_object.line_end = len(self.lines)
-            if current_object.ddl_code:
-                self.objects.append(current_object)
-        
+        self.objects = list(self.iter_objects())
         return self.objects
     
     def _extract_value(self, line: str, prefix: str) -> str:
@@ -117,10 +181,7 @@ class BatchPLSQLParser:
         Returns:
             추출된 값
         """
-        match = re.search(rf'{re.escape(prefix)}\s*(.+)', line)
-        if match:
-            return match.group(1).strip()
-        return ''
+        return _extract_header_value(line, prefix)
     
     def get_statistics(self) -> Dict[str, int]:
         """객체 통계 정보 반환
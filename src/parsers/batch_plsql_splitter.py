@@ -2,15 +2,37 @@
 Batch PL/SQL Splitter
 
 배치 PL/SQL 파일을 계정별, 타입별로 개별 SQL 파일로 분리하는 모듈입니다.
+
+split_streaming()은 대용량 파일용 모드입니다.
+- 입력 파일을 객체 단위로 스트리밍하므로 전체 내용을 메모리에 올리지 않습니다.
+- 파일명 충돌은 메모리에서 해결합니다. (파일마다 exists() 확인 없음)
+- 타입 디렉토리는 타입별로 한 번만 생성하고 기존 파일 목록도 한 번만 읽습니다.
+- 파일 쓰기는 스레드 풀에서 수행하며, 단일 아카이브(tar/zip)로 출력할 수도 있습니다.
 """
 
+import collections
+import concurrent.futures
+import io
 import logging
+import os
+import tarfile
+import time
+import zipfile
 from pathlib import Path
-from typing import Dict, List, Optional
-from .batch_plsql_parser import BatchPLSQLParser, PLSQLObject
+from typing import Dict, Iterable, List, Literal, Optional, Set, Tuple
+from .batch_plsql_parser import BatchPLSQLParser, PLSQLObject, iter_file_objects
 
 logger = logging.getLogger(__name__)
 
+# 지원하는 아카이브 형식 (형식: tarfile 쓰기 모드, zip은 None)
+ARCHIVE_FORMATS: Dict[str, Optional[Literal['w', 'w:gz']]] = {'tar': 'w', 'tar.gz': 'w:gz', 'zip': None}
+
+# 파일 쓰기 스레드 수 기본값 (네트워크 스토리지 지연을 겹치기 위한 I/O 스레드)
+DEFAULT_WRITE_WORKERS = 8
+
+# 스레드당 동시에 제출해 두는 쓰기 작업 수 (스트리밍 메모리 상한)
+WRITE_INFLIGHT_PER_WORKER = 4
+
 
 class BatchPLSQLSplitter:
     """배치 PL/SQL 파일 분리기
@@ -45,6 +67,15 @@ class BatchPLSQLSplitter:
         
         self.parser: Optional[BatchPLSQLParser] = None
         self.objects: List[PLSQLObject] = []
+        
+        # split_streaming() 결과 (객체 목록을 보관하지 않으므로 통계만 유지)
+        self.streamed_statistics: Dict[str, Dict[str, int]] = {}
+        self.archive_file: Optional[Path] = None
+        
+        # 메모리 내 파일명 충돌 해결 상태
+        # 타입 디렉토리별 사용 중인 파일명, (타입, 기본 파일명)별 다음 번호
+        self._used_names: Dict[str, Set[str]] = {}
+        self._next_suffix: Dict[Tuple[str, str], int] = {}
     
     def parse(self) -> List[PLSQLObject]:
         """배치 PL/SQL 파일 파싱
@@ -108,16 +139,7 @@ class BatchPLSQLSplitter:
             # 파일 작성
             try:
                 with open(output_file, 'w', encoding='utf-8') as f:
-                    # 헤더 주석 추가
-                    f.write(f"-- Owner: {obj.owner}\n")
-                    f.write(f"-- Type: {obj.object_type}\n")
-                    f.write(f"-- Name: {obj.object_name}\n")
-                    f.write(f"-- Source: {self.input_file.name} (Lines {obj.line_start}-{obj.line_end})\n")
-                    f.write("-- " + "=" * 60 + "\n\n")
-                    
-                    # DDL 코드 작성
-                    f.write(obj.ddl_code)
-                    f.write("\n/\n")
+                    f.write(self._render(obj))
                 
                 # 통계 업데이트 (타입별)
                 stats[obj.object_type] = stats.get(obj.object_type, 0) + 1
@@ -131,6 +153,161 @@ class BatchPLSQLSplitter:
         logger.info(f"분리 완료: {sum(stats.values())}개 파일 생성")
         return stats
     
+    def split_streaming(self, max_workers: Optional[int] = None,
+                        archive: Optional[str] = None) -> Dict[str, int]:
+        """입력 파일을 스트리밍하면서 객체를 타입별 파일 또는 아카이브로 분리
+        
+        parse()를 먼저 호출할 필요가 없으며, 출력 파일명은 split()과 같은 규칙
+        (유저명_객체명.sql, 충돌 시 _1, _2 ...)으로 정해집니다.
+        
+        Args:
+            max_workers: 파일 쓰기 스레드 수 (None이면 DEFAULT_WRITE_WORKERS)
+            archive: 아카이브 형식 ('tar', 'tar.gz', 'zip', None이면 개별 파일로 출력)
+            
+        Returns:
+            Dict[str, int]: 통계 정보 (타입별 파일 수)
+            
+        Raises:
+            FileNotFoundError: 입력 파일이 존재하지 않는 경우
+            ValueError: 지원하지 않는 아카이브 형식인 경우
+            IOError: 파일 읽기 또는 아카이브 쓰기 실패
+        """
+        if not self.input_file.exists():
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {self.input_file}")
+        if archive is not None and archive not in ARCHIVE_FORMATS:
+            raise ValueError(f"지원하지 않는 아카이브 형식: {archive} "
+                             f"(지원: {', '.join(ARCHIVE_FORMATS)})")
+        
+        self.streamed_statistics = {}
+        self._used_names = {}
+        self._next_suffix = {}
+        
+        try:
+            objects = iter_file_objects(str(self.input_file))
+            if archive is None:
+                stats = self._write_files(objects, max_workers or DEFAULT_WRITE_WORKERS)
+            else:
+                stats = self._write_archive(objects, archive)
+        except (OSError, UnicodeDecodeError) as e:
+            logger.error(f"파일 분리 실패: {self.input_file}", exc_info=True)
+            raise IOError(f"파일 분리 실패: {e}")
+        
+        logger.info(f"분리 완료: {sum(stats.values())}개 파일 생성")
+        return stats
+    
+    def archive_path(self, archive: str) -> Path:
+        """아카이브 출력 경로 (출력 디렉토리명 + 형식 확장자)"""
+        return self.output_dir.with_name(f"{self.output_dir.name}.{archive}")
+    
+    def _count_written(self, stats: Dict[str, int], object_type: str, owner: str) -> None:
+        """쓰기를 마친 객체 하나를 반환 통계와 타입별, 계정별 통계에 누적"""
+        stats[object_type] = stats.get(object_type, 0) + 1
+        owners = self.streamed_statistics.setdefault(object_type, {})
+        owners[owner] = owners.get(owner, 0) + 1
+    
+    def _write_files(self, objects: Iterable[PLSQLObject], max_workers: int) -> Dict[str, int]:
+        """객체를 타입별 디렉토리의 개별 파일로 쓰기 (스레드 풀)"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        stats: Dict[str, int] = {}
+        inflight_limit = max_workers * WRITE_INFLIGHT_PER_WORKER
+        pending: "collections.deque[Tuple[str, str, Path, concurrent.futures.Future]]" = collections.deque()
+        
+        def complete_one():
+            object_type, owner, output_file, future = pending.popleft()
+            try:
+                future.result()
+            except OSError:
+                logger.error(f"파일 작성 실패: {output_file}", exc_info=True)
+                return
+            self._count_written(stats, object_type, owner)
+            logger.debug(f"파일 생성: {output_file}")
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for obj in objects:
+                type_dir = self.output_dir / obj.object_type
+                if obj.object_type not in self._used_names:
+                    # 타입 디렉토리는 처음 나올 때 한 번만 생성하고 기존 파일명을 읽어 둠
+                    type_dir.mkdir(exist_ok=True)
+                    self._used_names[obj.object_type] = {entry.name for entry in os.scandir(type_dir)}
+                
+                output_file = type_dir / self._allocate_filename(obj)
+                pending.append((obj.object_type, obj.owner, output_file,
+                                executor.submit(self._write_file, output_file, self._render(obj))))
+                if len(pending) >= inflight_limit:
+                    complete_one()
+            
+            while pending:
+                complete_one()
+        
+        return stats
+    
+    def _write_archive(self, objects: Iterable[PLSQLObject], archive: str) -> Dict[str, int]:
+        """객체를 단일 아카이브의 타입별 경로로 쓰기"""
+        archive_file = self.archive_path(archive)
+        archive_file.parent.mkdir(parents=True, exist_ok=True)
+        self.archive_file = archive_file
+        
+        stats: Dict[str, int] = {}
+        tar_mode = ARCHIVE_FORMATS[archive]
+        
+        if tar_mode is None:
+            with zipfile.ZipFile(archive_file, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+                for obj in objects:
+                    self._used_names.setdefault(obj.object_type, set())
+                    zf.writestr(f"{obj.object_type}/{self._allocate_filename(obj)}", self._render(obj))
+                    self._count_written(stats, obj.object_type, obj.owner)
+        else:
+            # 정수 mtime이어야 멤버마다 PAX 확장 헤더가 붙지 않음
+            mtime = int(time.time())
+            with tarfile.open(archive_file, tar_mode) as tf:
+                for obj in objects:
+                    self._used_names.setdefault(obj.object_type, set())
+                    data = self._render(obj).encode('utf-8')
+                    info = tarfile.TarInfo(f"{obj.object_type}/{self._allocate_filename(obj)}")
+                    info.size = len(data)
+                    info.mtime = mtime
+                    tf.addfile(info, io.BytesIO(data))
+                    self._count_written(stats, obj.object_type, obj.owner)
+        
+        return stats
+    
+    def _allocate_filename(self, obj: PLSQLObject) -> str:
+        """메모리에서 충돌을 해결한 출력 파일명 할당 (유저명_객체명[_번호].sql)"""
+        used = self._used_names[obj.object_type]
+        base = f"{self._sanitize_filename(obj.owner)}_{self._sanitize_filename(obj.object_name)}"
+        filename = f"{base}.sql"
+        
+        if filename in used:
+            # 같은 기본 파일명의 마지막 번호부터 이어서 검색
+            key = (obj.object_type, base)
+            counter = self._next_suffix.get(key, 1)
+            while f"{base}_{counter}.sql" in used:
+                counter += 1
+            filename = f"{base}_{counter}.sql"
+            self._next_suffix[key] = counter + 1
+        
+        used.add(filename)
+        return filename
+    
+    @staticmethod
+    def _write_file(output_file: Path, text: str) -> None:
+        """파일 한 번에 쓰기 (스레드 풀 작업)"""
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(text)
+    
+    def _render(self, obj: PLSQLObject) -> str:
+        """분리 파일 내용 생성 (헤더 주석 + DDL 코드)"""
+        return (
+            f"-- Owner: {obj.owner}\n"
+            f"-- Type: {obj.object_type}\n"
+            f"-- Name: {obj.object_name}\n"
+            f"-- Source: {self.input_file.name} (Lines {obj.line_start}-{obj.line_end})\n"
+            + "-- " + "=" * 60 + "\n\n"
+            + obj.ddl_code
+            + "\n/\n"
+        )
+    
     def _sanitize_filename(self, name: str) -> str:
         """파일명으로 사용 가능하도록 문자열 정리
         
@@ -158,9 +335,12 @@ class BatchPLSQLSplitter:
             Dict[type, Dict[owner, count]]: 타입별 계정별 객체 수
             
         Raises:
-            ValueError: 파싱이 먼저 수행되지 않은 경우
+            ValueError: 파싱(또는 split_streaming())이 먼저 수행되지 않은 경우
         """
         if not self.objects:
+            if self.streamed_statistics:
+                return {obj_type: dict(owners)
+                        for obj_type, owners in self.streamed_statistics.items()}
             raise ValueError("먼저 parse()를 호출하여 파일을 파싱해야 합니다.")
         
         stats: Dict[str, Dict[str, int]] = {}
@@ -182,8 +362,11 @@ class BatchPLSQLSplitter:
         print("배치 PL/SQL 파일 분리 통계")
         print("=" * 60)
         print(f"입력 파일: {self.input_file}")
-        print(f"출력 디렉토리: {self.output_dir}/")
-        print(f"전체 객체 수: {len(self.objects)}")
+        if self.archive_file is not None:
+            print(f"출력 아카이브: {self.archive_file}")
+        else:
+            print(f"출력 디렉토리: {self.output_dir}/")
+        print(f"전체 객체 수: {sum(sum(owners.values()) for owners in stats.values())}")
         print()
         
         for obj_type, owners in sorted(stats.items()):
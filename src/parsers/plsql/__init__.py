@@ -8,7 +8,7 @@ Requirements 8.1을 구현합니다.
 from .object_detector import PLSQLObjectDetector
 from .code_analyzer import PLSQLCodeAnalyzer
 from .feature_analyzer import PLSQLFeatureAnalyzer
-from .structure_analyzer import PLSQLStructureAnalyzer
+from .structure_analyzer import PLSQLStructureAnalyzer, PLSQLSubProgram
 
 
 class PLSQLParser(
@@ -45,4 +45,4 @@ class PLSQLParser(
         super().__init__(code)
 
 
-__all__ = ['PLSQLParser']
+__all__ = ['PLSQLParser', 'PLSQLSubProgram']
@@ -2,15 +2,75 @@
 PL/SQL Parser Base
 
 PL/SQL 파서의 기본 클래스와 코드 정규화 기능을 제공합니다.
+코드는 파서 생성 시 한 번만 토큰화되며, 모든 믹스인이 같은 토큰 스트림과
+토큰 스트림에서 만든 텍스트를 공유합니다.
 """
 
+import copy
+import functools
 import re
+from typing import Any, Callable, Dict, FrozenSet, List
+
+from ..scan_budget import ScanBudget
+from ..sql_lexer import Token, TokenType, tokenize
+
+# 단어 토큰 종류
+_WORD_TYPES = (TokenType.KEYWORD, TokenType.IDENTIFIER)
+
+# 주석 토큰 종류
+_COMMENT_TYPES = (TokenType.COMMENT, TokenType.HINT)
+
+# 토큰 패턴에서 임의의 단어 하나와 매칭되는 항목
+ANY_WORD = object()
+
+# 중첩 블록을 여는 키워드
+BLOCK_KINDS = frozenset({'BEGIN', 'IF', 'LOOP', 'CASE'})
+
+# END 뒤에 와서 닫을 블록 종류를 지정하는 키워드 (END IF, END LOOP, END CASE)
+_END_QUALIFIERS = frozenset({'IF', 'LOOP', 'CASE'})
+
+
+def cached_metric(method: Callable) -> Callable:
+    """감지 메서드 결과를 파서 인스턴스별로 캐시하는 데코레이터
+    
+    같은 파서로 여러 타겟의 점수를 계산할 때 감지 작업이 한 번만 수행되도록 합니다.
+    리스트/딕셔너리 결과는 호출자가 수정해도 캐시가 바뀌지 않도록 얕은 복사본을 반환합니다.
+    
+    Args:
+        method: 인자가 없는 파서 메서드
+        
+    Returns:
+        캐시가 적용된 메서드
+    """
+    name = method.__name__
+    
+    @functools.wraps(method)
+    def wrapper(self):
+        cache = self._metric_cache
+        if name not in cache:
+            cache[name] = method(self)
+        value = cache[name]
+        if isinstance(value, (list, dict)):
+            return copy.copy(value)
+        return value
+    
+    return wrapper
 
 
 class PLSQLParserBase:
     """PL/SQL 파서 기본 클래스
     
-    코드 초기화 및 정규화 기능을 제공합니다.
+    코드 초기화, 토큰화 및 정규화 기능을 제공합니다.
+    
+    원본 코드는 입력 버퍼 하나만 보관하고, 앞뒤 공백 제거/대문자/정규화 텍스트는
+    필요할 때 만듭니다. 감지기가 공유하는 텍스트는 주석과 문자열을 치환한
+    _code_text 하나입니다.
+    
+    Attributes:
+        code: 앞뒤 공백이 제거된 원본 코드
+        upper_code: 대문자로 변환된 코드
+        tokens: 입력 코드의 토큰 목록 (주석 포함, 줄 번호 포함)
+        budget: 정규식 감지기 예산
     """
     
     def __init__(self, code: str):
@@ -19,25 +79,149 @@ class PLSQLParserBase:
         Args:
             code: 분석할 PL/SQL 코드
         """
-        self.code = code.strip()
-        self.upper_code = code.upper()
-        self._normalized_code = self._normalize_code()
+        self.budget = ScanBudget()
+        # 토큰 오프셋은 입력 코드 기준 (대문자 변환 시 길이가 바뀌는 문자가 있을 수 있음)
+        self._source = code
+        self.tokens: List[Token] = tokenize(code)
+        self._code_tokens = [token for token in self.tokens if token.type not in _COMMENT_TYPES]
+        self._word_index = self._build_word_index()
+        self._code_text = self._replace_tokens(_COMMENT_TYPES + (TokenType.STRING,))
+        self._metric_cache: Dict[str, Any] = {}
+    
+    @property
+    def code(self) -> str:
+        """앞뒤 공백이 제거된 원본 코드"""
+        return self._source.strip()
+    
+    @property
+    def upper_code(self) -> str:
+        """대문자로 변환된 원본 코드 (호출할 때마다 새로 생성)"""
+        return self._source.upper()
+    
+    @property
+    def _normalized_code(self) -> str:
+        """주석을 제거하고 공백을 하나로 통합한 코드 (호출할 때마다 새로 생성)"""
+        return self._normalize_code()
+    
+    def _build_word_index(self) -> Dict[str, List[int]]:
+        """단어별 코드 토큰 위치 색인 생성"""
+        index: Dict[str, List[int]] = {}
+        for position, token in enumerate(self._code_tokens):
+            if token.type in _WORD_TYPES:
+                index.setdefault(token.value, []).append(position)
+        return index
+    
+    def _replace_tokens(self, token_types: tuple) -> str:
+        """지정한 종류의 토큰을 치환한 코드 텍스트 생성
+        
+        주석은 공백 하나로, 문자열 리터럴은 빈 문자열('')로 치환합니다.
+        정규식 감지기가 주석이나 문자열 안의 키워드를 잘못 감지하지 않도록 사용합니다.
+        
+        Args:
+            token_types: 치환할 토큰 종류
+            
+        Returns:
+            치환된 코드 텍스트
+        """
+        parts = []
+        pos = 0
+        for token in self.tokens:
+            if token.type in token_types:
+                parts.append(self._source[pos:token.start])
+                parts.append("''" if token.type is TokenType.STRING else ' ')
+                pos = token.end
+        parts.append(self._source[pos:])
+        return ''.join(parts).upper()
     
     def _normalize_code(self) -> str:
         """코드 정규화 (공백, 줄바꿈 처리)
         
-        여러 공백을 하나로 통합하고, 주석을 제거합니다.
+        주석을 제거하고 여러 공백을 하나로 통합합니다.
         
         Returns:
             정규화된 코드 문자열
         """
-        # 한 줄 주석 제거 (-- 로 시작하는 줄)
-        code = re.sub(r'--[^\n]*', '', self.upper_code)
+        code = self._replace_tokens(_COMMENT_TYPES)
+        return re.sub(r'\s+', ' ', code).strip()
+    
+    def _has_word(self, word: str) -> bool:
+        """코드(주석/문자열 제외)에 단어가 있는지 확인"""
+        return word in self._word_index
+    
+    def _find_sequences(self, *pattern: Any) -> List[int]:
+        """연속된 토큰 패턴의 시작 위치 목록 반환
+        
+        Args:
+            *pattern: 패턴 항목 목록. 첫 항목은 단어여야 하며, 이후 항목은 토큰 값(str),
+                ANY_WORD(임의의 단어) 또는 TokenType입니다.
+            
+        Returns:
+            코드 토큰 목록에서 패턴이 시작하는 위치 목록
+        """
+        tokens = self._code_tokens
+        size = len(pattern)
+        starts = []
+        for start in self._word_index.get(pattern[0], ()):
+            if start + size > len(tokens):
+                break
+            if all(
+                _token_matches(tokens[start + offset], pattern[offset])
+                for offset in range(1, size)
+            ):
+                starts.append(start)
+        return starts
+    
+    def _count_sequences(self, *pattern: Any) -> int:
+        """연속된 토큰 패턴 개수 반환"""
+        return len(self._find_sequences(*pattern))
+    
+    def _advance_block(self, stack: List[str], position: int) -> int:
+        """코드 토큰 하나만큼 블록 스택을 갱신
         
-        # 여러 줄 주석 제거 (/* ... */)
-        code = re.sub(r'/\*.*?\*/', '', code, flags=re.DOTALL)
+        BEGIN/IF/LOOP/CASE는 블록을 열고, END IF/END LOOP/END CASE는 같은 종류의 가장
+        안쪽 블록을, END(END 이름 포함)는 가장 안쪽 블록을 닫습니다.
+        
+        Args:
+            stack: 열린 블록 키워드 스택 (제자리에서 갱신)
+            position: 처리할 코드 토큰 위치
+            
+        Returns:
+            다음에 처리할 코드 토큰 위치
+        """
+        tokens = self._code_tokens
+        token = tokens[position]
+        position += 1
+        if token.type not in _WORD_TYPES:
+            return position
         
-        # 여러 공백을 하나로 통합
-        code = re.sub(r'\s+', ' ', code)
+        if token.value == 'END':
+            following = tokens[position] if position < len(tokens) else None
+            if following is not None and following.value in _END_QUALIFIERS:
+                position += 1
+                if following.value in stack:
+                    while stack.pop() != following.value:
+                        pass
+            elif stack:
+                stack.pop()
+        elif token.value in BLOCK_KINDS:
+            stack.append(token.value)
         
-        return code.strip()
+        return position
+    
+    def _qualifier_names(self) -> FrozenSet[str]:
+        """'.' 앞에 오는 단어 집합 (패키지명.멤버 형태의 패키지명)"""
+        tokens = self._code_tokens
+        return frozenset(
+            tokens[position - 1].value
+            for position, token in enumerate(tokens)
+            if token.value == '.' and position > 0 and tokens[position - 1].type in _WORD_TYPES
+        )
+
+
+def _token_matches(token: Token, item: Any) -> bool:
+    """토큰이 패턴 항목과 일치하는지 확인"""
+    if item is ANY_WORD:
+        return token.type in _WORD_TYPES
+    if isinstance(item, TokenType):
+        return token.type is item
+    return token.value == item
@@ -5,8 +5,43 @@ PL/SQL 고급 기능 및 의존성을 분석하는 기능을 제공합니다.
 """
 
 import re
+from typing import Set
+
 from ...oracle_complexity_analyzer import PLSQLObjectType
-from .base_parser import PLSQLParserBase
+from ..scan_budget import compile_sequence, iter_sequence
+from ..sql_lexer import TokenType
+from .base_parser import ANY_WORD, PLSQLParserBase, cached_metric
+
+# 패키지 선언부: PACKAGE [BODY] name IS/AS ... (PROCEDURE|FUNCTION|BEGIN|END)
+_PACKAGE_HEADER_SEQUENCE = compile_sequence(
+    r'PACKAGE\s+(?:BODY\s+)?[\w\.]+\s+(?:IS|AS)\s+', r'PROCEDURE|FUNCTION|BEGIN|END'
+)
+
+# EXECUTE IMMEDIATE 문자열 리터럴이 시작하는 DDL
+_DDL_PREFIXES = (
+    ('CREATE', 'TABLE'),
+    ('CREATE', 'INDEX'),
+    ('DROP', 'TABLE'),
+    ('DROP', 'INDEX'),
+    ('ALTER', 'TABLE'),
+    ('TRUNCATE',),
+)
+
+# 문자열 연결(||) 뒤에 오는 DDL 키워드
+_DDL_KEYWORDS = ('CREATE', 'DROP', 'ALTER', 'TRUNCATE')
+
+# 문자열 리터럴 내부 단어
+_STRING_WORD_RE = re.compile(r'[A-Z_][A-Z0-9_$#]*')
+
+
+def _string_words(value: str) -> list:
+    """문자열 리터럴 토큰 내부의 단어 목록 (N'...', q'[...]' 형식 포함)"""
+    body = value.lstrip('N')
+    if body.startswith('Q'):
+        body = body[3:-2]
+    else:
+        body = body[1:-1]
+    return _STRING_WORD_RE.findall(body)
 
 
 class PLSQLFeatureAnalyzer(PLSQLParserBase):
@@ -15,6 +50,7 @@ class PLSQLFeatureAnalyzer(PLSQLParserBase):
     패키지 호출, DB Link, 고급 기능, 외부 의존성, 트랜잭션 제어 등을 분석합니다.
     """
     
+    @cached_metric
     def count_package_calls(self) -> int:
         """패키지 호출 개수 계산
         
@@ -29,12 +65,13 @@ class PLSQLFeatureAnalyzer(PLSQLParserBase):
         # DBMS_, UTL_ 등의 시스템 패키지도 포함
         package_call_pattern = r'\b[A-Z_][A-Z0-9_]*\.[A-Z_][A-Z0-9_]*\s*[\(;]'
         
-        matches = re.findall(package_call_pattern, self.upper_code)
+        matches = re.findall(package_call_pattern, self._code_text)
         
         # 중복 제거를 위해 set 사용 후 개수 반환
         # 하지만 요구사항은 호출 개수이므로 중복 포함
         return len(matches)
     
+    @cached_metric
     def count_dblinks(self) -> int:
         """DB Link 사용 개수 계산
         
@@ -48,10 +85,11 @@ class PLSQLFeatureAnalyzer(PLSQLParserBase):
         # 테이블명@dblink 또는 뷰명@dblink 형태
         dblink_pattern = r'@[A-Z_][A-Z0-9_\.]*'
         
-        matches = re.findall(dblink_pattern, self.upper_code)
+        matches = re.findall(dblink_pattern, self._code_text)
         
         return len(matches)
     
+    @cached_metric
     def detect_advanced_features(self) -> list:
         """고급 기능 감지
         
@@ -63,24 +101,25 @@ class PLSQLFeatureAnalyzer(PLSQLParserBase):
         """
         advanced_features = []
         
-        # 고급 기능 패턴 정의
+        # 고급 기능 토큰 패턴 정의
         feature_patterns = {
-            'PIPELINED': r'\bPIPELINED\b',
-            'REF CURSOR': r'\bREF\s+CURSOR\b',
-            'AUTONOMOUS_TRANSACTION': r'\bAUTONOMOUS_TRANSACTION\b',
-            'PRAGMA': r'\bPRAGMA\b',
-            'OBJECT TYPE': r'\bAS\s+OBJECT\b',  # CREATE TYPE ... AS OBJECT
-            'VARRAY': r'\bVARRAY\b',
-            'NESTED TABLE': r'\bTABLE\s+OF\b',  # TYPE ... IS TABLE OF
+            'PIPELINED': ('PIPELINED',),
+            'REF CURSOR': ('REF', 'CURSOR'),
+            'AUTONOMOUS_TRANSACTION': ('AUTONOMOUS_TRANSACTION',),
+            'PRAGMA': ('PRAGMA',),
+            'OBJECT TYPE': ('AS', 'OBJECT'),  # CREATE TYPE ... AS OBJECT
+            'VARRAY': ('VARRAY',),
+            'NESTED TABLE': ('TABLE', 'OF'),  # TYPE ... IS TABLE OF
         }
         
         # 각 패턴을 검사하여 감지된 기능 추가
         for feature_name, pattern in feature_patterns.items():
-            if re.search(pattern, self.upper_code):
+            if self._find_sequences(*pattern):
                 advanced_features.append(feature_name)
         
         return advanced_features
     
+    @cached_metric
     def detect_external_dependencies(self) -> list:
         """외부 의존성 감지
         
@@ -122,15 +161,15 @@ class PLSQLFeatureAnalyzer(PLSQLParserBase):
             'DBMS_UTILITY',
         ]
         
-        # 각 패키지 사용 여부 확인
+        # 각 패키지 사용 여부 확인 (패키지명.메서드명 형태)
+        qualifiers = self._qualifier_names()
         for package in external_packages:
-            # 패키지명.메서드명 형태로 사용되는지 확인
-            pattern = rf'\b{package}\.'
-            if re.search(pattern, self.upper_code):
+            if package in qualifiers:
                 external_deps.append(package)
         
         return external_deps
     
+    @cached_metric
     def has_transaction_control(self) -> dict:
         """트랜잭션 제어 감지
         
@@ -154,23 +193,24 @@ class PLSQLFeatureAnalyzer(PLSQLParserBase):
         }
         
         # SAVEPOINT 감지
-        if re.search(r'\bSAVEPOINT\s+\w+', self.upper_code):
+        if self._find_sequences('SAVEPOINT', ANY_WORD):
             transaction_control['savepoint'] = True
         
         # ROLLBACK TO SAVEPOINT 감지 (일반 ROLLBACK보다 먼저 확인)
-        if re.search(r'\bROLLBACK\s+TO\s+(?:SAVEPOINT\s+)?\w+', self.upper_code):
+        if self._find_sequences('ROLLBACK', 'TO', ANY_WORD):
             transaction_control['rollback_to_savepoint'] = True
         
         # ROLLBACK 감지
-        if re.search(r'\bROLLBACK\b', self.upper_code):
+        if self._has_word('ROLLBACK'):
             transaction_control['rollback'] = True
         
         # COMMIT 감지
-        if re.search(r'\bCOMMIT\b', self.upper_code):
+        if self._has_word('COMMIT'):
             transaction_control['commit'] = True
         
         return transaction_control
     
+    @cached_metric
     def has_package_variables(self) -> bool:
         """패키지 변수 사용 여부 감지
         
@@ -194,11 +234,10 @@ class PLSQLFeatureAnalyzer(PLSQLParserBase):
         # CREATE PACKAGE 이후, IS/AS와 END 사이에 선언
         
         # PACKAGE ... IS/AS 와 첫 번째 PROCEDURE/FUNCTION 또는 BEGIN 사이의 영역 추출
-        package_header_pattern = r'PACKAGE\s+(?:BODY\s+)?[\w\.]+\s+(?:IS|AS)\s+(.*?)(?:PROCEDURE|FUNCTION|BEGIN|END)'
-        
-        match = re.search(package_header_pattern, self.upper_code, re.DOTALL)
+        match = next(iter_sequence(self._code_text, _PACKAGE_HEADER_SEQUENCE,
+                                   self.budget, 'package_variables'), None)
         if match:
-            header_section = match.group(1)
+            header_section = self._code_text[match[0].end():match[1].start()]
             
             # 변수 선언 패턴: 식별자 데이터타입
             # 일반적인 데이터 타입: VARCHAR2, NUMBER, DATE, BOOLEAN, INTEGER 등
@@ -217,11 +256,12 @@ class PLSQLFeatureAnalyzer(PLSQLParserBase):
         ]
         
         for pattern in package_patterns:
-            if re.search(pattern, self.upper_code):
+            if re.search(pattern, self._code_text):
                 return True
         
         return False
     
+    @cached_metric
     def detect_context_dependencies(self) -> list:
         """컨텍스트 의존성 감지
         
@@ -234,23 +274,23 @@ class PLSQLFeatureAnalyzer(PLSQLParserBase):
         context_deps = []
         
         # SYS_CONTEXT 함수 사용 감지
-        if re.search(r'\bSYS_CONTEXT\s*\(', self.upper_code):
+        if self._find_sequences('SYS_CONTEXT', TokenType.LPAREN):
             context_deps.append('SYS_CONTEXT')
         
         # 세션 변수 사용 감지 (USERENV 네임스페이스)
-        if re.search(r'\bUSERENV\s*\(', self.upper_code):
+        if self._find_sequences('USERENV', TokenType.LPAREN):
             context_deps.append('USERENV')
         
         # 글로벌 임시 테이블 생성 감지
-        if re.search(r'\bCREATE\s+GLOBAL\s+TEMPORARY\s+TABLE\b', self.upper_code):
+        if self._find_sequences('CREATE', 'GLOBAL', 'TEMPORARY', 'TABLE'):
             context_deps.append('GLOBAL_TEMPORARY_TABLE')
         
         # 세션 변수 설정/조회 (DBMS_SESSION)
-        if re.search(r'\bDBMS_SESSION\b', self.upper_code):
+        if self._has_word('DBMS_SESSION'):
             context_deps.append('DBMS_SESSION')
         
         # 애플리케이션 컨텍스트 (DBMS_APPLICATION_INFO)
-        if re.search(r'\bDBMS_APPLICATION_INFO\b', self.upper_code):
+        if self._has_word('DBMS_APPLICATION_INFO'):
             context_deps.append('DBMS_APPLICATION_INFO')
         
         return context_deps
@@ -259,6 +299,7 @@ class PLSQLFeatureAnalyzer(PLSQLParserBase):
     # 신규 감지 메서드 (PLSQL_COMPLEXITY_SCORE_IMPROVEMENT.md 기반)
     # =========================================================================
     
+    @cached_metric
     def count_type_references(self) -> dict:
         """타입 참조 개수 계산 (%TYPE, %ROWTYPE)
         
@@ -266,10 +307,11 @@ class PLSQLFeatureAnalyzer(PLSQLParserBase):
             타입 참조 개수 딕셔너리 {'type': int, 'rowtype': int}
         """
         return {
-            'type': len(re.findall(r'%TYPE\b', self.upper_code)),
-            'rowtype': len(re.findall(r'%ROWTYPE\b', self.upper_code)),
+            'type': len(re.findall(r'%TYPE\b', self._code_text)),
+            'rowtype': len(re.findall(r'%ROWTYPE\b', self._code_text)),
         }
     
+    @cached_metric
     def count_user_defined_types(self) -> dict:
         """사용자 정의 타입 개수 계산 (RECORD, TABLE OF, VARRAY, INDEX BY)
         
@@ -277,36 +319,49 @@ class PLSQLFeatureAnalyzer(PLSQLParserBase):
             사용자 정의 타입 개수 딕셔너리
         """
         return {
-            'record': len(re.findall(r'\bIS\s+RECORD\b', self.upper_code)),
-            'table_of': len(re.findall(r'\bTABLE\s+OF\b', self.upper_code)),
-            'varray': len(re.findall(r'\bVARRAY\b', self.upper_code)),
-            'index_by': len(re.findall(r'\bINDEX\s+BY\b', self.upper_code)),
+            'record': self._count_sequences('IS', 'RECORD'),
+            'table_of': self._count_sequences('TABLE', 'OF'),
+            'varray': self._count_sequences('VARRAY'),
+            'index_by': self._count_sequences('INDEX', 'BY'),
         }
     
+    @cached_metric
     def count_returning_into(self) -> int:
         """RETURNING INTO 절 개수 계산
         
         Returns:
             RETURNING INTO 절 개수
         """
-        return len(re.findall(r'\bRETURNING\b.*?\bINTO\b', self.upper_code, re.DOTALL))
+        # RETURNING 뒤에 처음 나오는 INTO까지를 하나의 절로 계산
+        count = 0
+        returning = False
+        for token in self._code_tokens:
+            if token.value == 'RETURNING':
+                returning = True
+            elif token.value == 'INTO' and returning:
+                count += 1
+                returning = False
+        return count
     
+    @cached_metric
     def count_raise_application_error(self) -> int:
         """RAISE_APPLICATION_ERROR 개수 계산
         
         Returns:
             RAISE_APPLICATION_ERROR 개수
         """
-        return len(re.findall(r'\bRAISE_APPLICATION_ERROR\s*\(', self.upper_code))
+        return self._count_sequences('RAISE_APPLICATION_ERROR', TokenType.LPAREN)
     
+    @cached_metric
     def count_conditional_compilation(self) -> int:
         """조건부 컴파일 블록 개수 계산 ($IF, $ELSE, $END)
         
         Returns:
             조건부 컴파일 블록 개수
         """
-        return len(re.findall(r'\$IF\b', self.upper_code))
+        return len(re.findall(r'\$IF\b', self._code_text))
     
+    @cached_metric
     def count_dynamic_ddl(self) -> int:
         """동적 DDL 개수 계산
         
@@ -315,27 +370,37 @@ class PLSQLFeatureAnalyzer(PLSQLParserBase):
         Returns:
             동적 DDL 개수
         """
-        # EXECUTE IMMEDIATE 다음에 DDL 키워드가 있는지 확인
-        ddl_patterns = [
-            r"EXECUTE\s+IMMEDIATE\s+['\"]?\s*CREATE\s+TABLE",
-            r"EXECUTE\s+IMMEDIATE\s+['\"]?\s*CREATE\s+INDEX",
-            r"EXECUTE\s+IMMEDIATE\s+['\"]?\s*DROP\s+TABLE",
-            r"EXECUTE\s+IMMEDIATE\s+['\"]?\s*DROP\s+INDEX",
-            r"EXECUTE\s+IMMEDIATE\s+['\"]?\s*ALTER\s+TABLE",
-            r"EXECUTE\s+IMMEDIATE\s+['\"]?\s*TRUNCATE",
-            # 동적 문자열 연결로 DDL 생성하는 경우
-            r"EXECUTE\s+IMMEDIATE\s+.*?\|\|.*?CREATE",
-            r"EXECUTE\s+IMMEDIATE\s+.*?\|\|.*?DROP",
-            r"EXECUTE\s+IMMEDIATE\s+.*?\|\|.*?ALTER",
-            r"EXECUTE\s+IMMEDIATE\s+.*?\|\|.*?TRUNCATE",
-        ]
-        
+        tokens = self._code_tokens
         count = 0
-        for pattern in ddl_patterns:
-            count += len(re.findall(pattern, self.upper_code, re.IGNORECASE | re.DOTALL))
+        
+        for start in self._find_sequences('EXECUTE', 'IMMEDIATE'):
+            position = start + 2
+            
+            # EXECUTE IMMEDIATE 'CREATE TABLE ...' 형태
+            if position < len(tokens) and tokens[position].type is TokenType.STRING:
+                words = tuple(_string_words(tokens[position].value)[:2])
+                if any(words[:len(prefix)] == prefix for prefix in _DDL_PREFIXES):
+                    count += 1
+            
+            # 동적 문자열 연결로 DDL 생성하는 경우 (EXECUTE IMMEDIATE ... || ... DDL)
+            # 문장 끝(;)까지 || 뒤에 나오는 DDL 키워드를 종류별로 한 번씩 계산
+            concatenated = False
+            found: Set[str] = set()
+            while position < len(tokens) and tokens[position].type is not TokenType.SEMICOLON:
+                token = tokens[position]
+                if token.value == '||':
+                    concatenated = True
+                elif concatenated:
+                    if token.type is TokenType.STRING:
+                        found.update(word for word in _string_words(token.value) if word in _DDL_KEYWORDS)
+                    elif token.value in _DDL_KEYWORDS:
+                        found.add(token.value)
+                position += 1
+            count += len(found)
         
         return count
     
+    @cached_metric
     def detect_oracle_specific_exceptions(self) -> list:
         """Oracle 전용 예외 감지
         
@@ -367,11 +432,12 @@ class PLSQLFeatureAnalyzer(PLSQLParserBase):
         
         detected = []
         for exc in oracle_exceptions:
-            if re.search(rf'\bWHEN\s+{exc}\b', self.upper_code):
+            if self._find_sequences('WHEN', exc):
                 detected.append(exc)
         
         return detected
     
+    @cached_metric
     def has_sqlcode_sqlerrm(self) -> dict:
         """SQLCODE/SQLERRM 사용 여부 감지
         
@@ -379,6 +445,6 @@ class PLSQLFeatureAnalyzer(PLSQLParserBase):
             {'sqlcode': bool, 'sqlerrm': bool}
         """
         return {
-            'sqlcode': bool(re.search(r'\bSQLCODE\b', self.upper_code)),
-            'sqlerrm': bool(re.search(r'\bSQLERRM\b', self.upper_code)),
+            'sqlcode': self._has_word('SQLCODE'),
+            'sqlerrm': self._has_word('SQLERRM'),
         }
@@ -6,7 +6,7 @@ PL/SQL 오브젝트 타입을 감지하는 기능을 제공합니다.
 
 import re
 from ...oracle_complexity_analyzer import PLSQLObjectType
-from .base_parser import PLSQLParserBase
+from .base_parser import PLSQLParserBase, cached_metric
 
 
 class PLSQLObjectDetector(PLSQLParserBase):
@@ -21,6 +21,7 @@ class PLSQLObjectDetector(PLSQLParserBase):
     - Materialized View
     """
     
+    @cached_metric
     def detect_object_type(self) -> PLSQLObjectType:
         """오브젝트 타입 감지
         
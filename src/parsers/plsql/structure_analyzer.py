@@ -5,8 +5,49 @@ PL/SQL 코드의 구조적 요소를 분석하는 기능을 제공합니다.
 """
 
 import re
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
 from ...oracle_complexity_analyzer import PLSQLObjectType
-from .base_parser import PLSQLParserBase
+from ..scan_budget import compile_sequence, iter_sequence
+from ..sql_lexer import TokenType
+from .base_parser import PLSQLParserBase, cached_metric
+
+# 파라미터 목록: (PROCEDURE|FUNCTION) name ( ... )
+_PARAM_SECTION_SEQUENCE = compile_sequence(
+    r'(?:PROCEDURE|FUNCTION)\s+[A-Z_][A-Z0-9_]*\s*\(', r'\)'
+)
+
+# 선언부: DECLARE ... BEGIN, IS/AS ... BEGIN
+_DECLARE_SEQUENCE = compile_sequence(r'DECLARE\s+', r'\s+BEGIN')
+_IS_AS_SEQUENCE = compile_sequence(r'(?:IS|AS)\s+', r'\s+BEGIN')
+_WHITESPACE_BEGIN_RE = re.compile(r'\s\s+BEGIN')
+
+# 서브프로그램 헤더 키워드
+_SUBPROGRAM_KINDS = frozenset({'PROCEDURE', 'FUNCTION'})
+
+# 외부 구현(call spec) 서브프로그램: IS/AS LANGUAGE ..., IS/AS EXTERNAL ...
+_CALL_SPEC_KEYWORDS = frozenset({'LANGUAGE', 'EXTERNAL'})
+
+
+@dataclass
+class PLSQLSubProgram:
+    """패키지 바디 또는 타입 바디에서 분리된 프로시저/함수
+
+    Attributes:
+        index: 바디 내 서브프로그램 순번 (1부터 시작)
+        subprogram_type: 'PROCEDURE' 또는 'FUNCTION'
+        name: 서브프로그램 이름 (대문자)
+        code: PROCEDURE/FUNCTION 키워드부터 END ...;까지의 원본 코드
+        line_start: 시작 줄 번호 (1부터 시작)
+        line_end: 끝 줄 번호
+    """
+    index: int
+    subprogram_type: str
+    name: str
+    code: str
+    line_start: int
+    line_end: int
 
 
 class PLSQLStructureAnalyzer(PLSQLParserBase):
@@ -31,7 +72,7 @@ class PLSQLStructureAnalyzer(PLSQLParserBase):
         # CREATE PROCEDURE는 제외하고 패키지 내부의 PROCEDURE만 계산
         procedure_pattern = r'\bPROCEDURE\s+[A-Z_][A-Z0-9_]*\s*[\(;]'
         
-        matches = re.findall(procedure_pattern, self.upper_code)
+        matches = re.findall(procedure_pattern, self._code_text)
         
         return len(matches)
     
@@ -51,7 +92,7 @@ class PLSQLStructureAnalyzer(PLSQLParserBase):
         # CREATE FUNCTION은 제외하고 패키지 내부의 FUNCTION만 계산
         function_pattern = r'\bFUNCTION\s+[A-Z_][A-Z0-9_]*\s*[\(]'
         
-        matches = re.findall(function_pattern, self.upper_code)
+        matches = re.findall(function_pattern, self._code_text)
         
         return len(matches)
     
@@ -63,7 +104,7 @@ class PLSQLStructureAnalyzer(PLSQLParserBase):
         ]
         
         for pattern in package_patterns:
-            if re.search(pattern, self.upper_code):
+            if re.search(pattern, self._code_text):
                 return True
         
         return False
@@ -92,9 +133,11 @@ class PLSQLStructureAnalyzer(PLSQLParserBase):
         
         # PROCEDURE 또는 FUNCTION의 파라미터 부분 추출
         # 패턴: (PROCEDURE|FUNCTION) name (param1 IN type, param2 OUT type, ...)
-        param_section_pattern = r'(?:PROCEDURE|FUNCTION)\s+[A-Z_][A-Z0-9_]*\s*\((.*?)\)'
-        
-        matches = re.findall(param_section_pattern, self.upper_code, re.DOTALL)
+        matches = [
+            self._code_text[head.end():tail.start()]
+            for head, tail in iter_sequence(self._code_text, _PARAM_SECTION_SEQUENCE,
+                                            self.budget, 'parameters')
+        ]
         
         for param_section in matches:
             # 각 파라미터를 쉼표로 분리
@@ -122,6 +165,42 @@ class PLSQLStructureAnalyzer(PLSQLParserBase):
         
         return param_analysis
     
+    def _find_declaration_sections(self, sequence) -> List[str]:
+        """선언부 목록 추출
+        
+        `시작\\s+(.*?)\\s+BEGIN` (DOTALL) 정규식의 findall 결과와 같은 목록을 선형 시간으로
+        만듭니다. BEGIN이 더 이상 없으면 이후 시작 키워드에서도 매칭될 수 없으므로 종료합니다.
+        
+        Args:
+            sequence: (시작 패턴, BEGIN 패턴) 쌍
+            
+        Returns:
+            선언부 텍스트 목록
+        """
+        head_re, tail_re = sequence
+        code = self.budget.window('local_variables', self._code_text)
+        deadline = self.budget.deadline()
+        sections = []
+        pos = 0
+        
+        while not self.budget.expired('local_variables', deadline):
+            head = head_re.search(code, pos)
+            if head is None:
+                break
+            
+            tail = tail_re.search(code, head.end())
+            if tail is not None:
+                sections.append(code[head.end():tail.start()])
+                pos = tail.end()
+            elif _WHITESPACE_BEGIN_RE.match(code, head.end() - 2):
+                # 공백 2개 이상 뒤에 바로 BEGIN: 정규식은 시작 패턴의 공백을 되돌려 빈 선언부로 매칭
+                sections.append('')
+                pos = head.end() + len('BEGIN')
+            else:
+                break
+        
+        return sections
+    
     def analyze_local_variables(self) -> dict:
         """로컬 변수 분석
         
@@ -154,13 +233,10 @@ class PLSQLStructureAnalyzer(PLSQLParserBase):
         
         # DECLARE 섹션 또는 IS/AS와 BEGIN 사이의 변수 선언부 추출
         # 패턴 1: DECLARE ... BEGIN
-        declare_pattern = r'DECLARE\s+(.*?)\s+BEGIN'
         # 패턴 2: IS/AS ... BEGIN (프로시저/함수 내부)
-        is_as_pattern = r'(?:IS|AS)\s+(.*?)\s+BEGIN'
-        
         declaration_sections = []
-        declaration_sections.extend(re.findall(declare_pattern, self.upper_code, re.DOTALL))
-        declaration_sections.extend(re.findall(is_as_pattern, self.upper_code, re.DOTALL))
+        declaration_sections.extend(self._find_declaration_sections(_DECLARE_SEQUENCE))
+        declaration_sections.extend(self._find_declaration_sections(_IS_AS_SEQUENCE))
         
         for section in declaration_sections:
             # 각 줄을 분석하여 변수 선언 찾기
@@ -242,19 +318,19 @@ class PLSQLStructureAnalyzer(PLSQLParserBase):
         
         # TYPE ... IS RECORD 패턴
         record_pattern = r'\bTYPE\s+[A-Z_][A-Z0-9_]*\s+IS\s+RECORD\b'
-        type_analysis['record'] = len(re.findall(record_pattern, self.upper_code))
+        type_analysis['record'] = len(re.findall(record_pattern, self._code_text))
         
         # TYPE ... IS TABLE OF 패턴
         table_pattern = r'\bTYPE\s+[A-Z_][A-Z0-9_]*\s+IS\s+TABLE\s+OF\b'
-        type_analysis['table'] = len(re.findall(table_pattern, self.upper_code))
+        type_analysis['table'] = len(re.findall(table_pattern, self._code_text))
         
         # TYPE ... IS VARRAY 패턴
         varray_pattern = r'\bTYPE\s+[A-Z_][A-Z0-9_]*\s+IS\s+VARRAY\b'
-        type_analysis['varray'] = len(re.findall(varray_pattern, self.upper_code))
+        type_analysis['varray'] = len(re.findall(varray_pattern, self._code_text))
         
         # CREATE TYPE ... AS OBJECT 패턴
         object_pattern = r'\bCREATE\s+(?:OR\s+REPLACE\s+)?TYPE\s+[A-Z_][A-Z0-9_]*\s+AS\s+OBJECT\b'
-        type_analysis['object'] = len(re.findall(object_pattern, self.upper_code))
+        type_analysis['object'] = len(re.findall(object_pattern, self._code_text))
         
         # 전체 개수 계산
         type_analysis['total'] = (
@@ -265,3 +341,174 @@ class PLSQLStructureAnalyzer(PLSQLParserBase):
         )
         
         return type_analysis
+    
+    @cached_metric
+    def split_subprograms(self) -> List[PLSQLSubProgram]:
+        """패키지 바디/타입 바디를 최상위 프로시저와 함수로 분리
+        
+        바디 선언부의 PROCEDURE/FUNCTION 정의를 찾아 블록 구조(BEGIN ... END)를 따라
+        끝 위치를 정합니다. 전방 선언, 외부 구현(LANGUAGE/EXTERNAL), 서브프로그램 내부에
+        중첩된 프로시저/함수는 별도 항목으로 분리하지 않습니다.
+        
+        Returns:
+            서브프로그램 목록 (패키지 바디/타입 바디가 아니면 빈 목록)
+        """
+        container = self._find_body_container()
+        if container is None:
+            return []
+        
+        tokens = self._code_tokens
+        subprograms: List[PLSQLSubProgram] = []
+        position = container[2]
+        
+        while position < len(tokens):
+            token = tokens[position]
+            if token.type is not TokenType.KEYWORD:
+                position += 1
+                continue
+            if token.value in ('BEGIN', 'END'):
+                # 패키지 초기화 블록 또는 바디 끝
+                break
+            if token.value == 'CASE':
+                # 선언부 커서 쿼리의 CASE ... END
+                position = self._skip_block(position)
+                continue
+            if token.value not in _SUBPROGRAM_KINDS:
+                position += 1
+                continue
+            
+            end = self._find_subprogram_end(position)
+            if end is None:
+                break
+            last, has_body = end
+            if has_body and position + 1 < len(tokens):
+                subprograms.append(PLSQLSubProgram(
+                    index=len(subprograms) + 1,
+                    subprogram_type=token.value,
+                    name=tokens[position + 1].value,
+                    code=self._source[token.start:tokens[last].end],
+                    line_start=token.line,
+                    line_end=tokens[last].line,
+                ))
+            position = last + 1
+        
+        return subprograms
+    
+    def subprogram_container(self) -> Optional[Tuple[str, str]]:
+        """서브프로그램을 담은 바디의 종류와 이름
+        
+        Returns:
+            ('PACKAGE BODY' 또는 'TYPE BODY', 이름) (바디가 아니면 None)
+        """
+        container = self._find_body_container()
+        return None if container is None else container[:2]
+    
+    def _find_body_container(self) -> Optional[Tuple[str, str, int]]:
+        """PACKAGE BODY/TYPE BODY 헤더 탐색
+        
+        Returns:
+            (바디 종류, 이름, 헤더의 IS/AS 다음 토큰 위치) (바디가 아니면 None)
+        """
+        tokens = self._code_tokens
+        starts = sorted(
+            (start, kind)
+            for kind in ('PACKAGE', 'TYPE')
+            for start in self._find_sequences(kind, 'BODY')
+        )
+        if not starts:
+            return None
+        
+        start, kind = starts[0]
+        name_parts = []
+        position = start + 2
+        while position < len(tokens) and tokens[position].value not in ('IS', 'AS'):
+            name_parts.append(tokens[position].value)
+            position += 1
+        if position >= len(tokens):
+            return None
+        
+        return (f"{kind} BODY", ''.join(name_parts), position + 1)
+    
+    def _find_subprogram_end(self, position: int) -> Optional[Tuple[int, bool]]:
+        """서브프로그램 정의의 마지막 토큰 위치 탐색
+        
+        Args:
+            position: PROCEDURE/FUNCTION 토큰 위치
+            
+        Returns:
+            (마지막 토큰 위치, 본문 존재 여부) (구조를 해석할 수 없으면 None)
+            전방 선언과 외부 구현은 본문이 없는 것으로 반환합니다.
+        """
+        tokens = self._code_tokens
+        depth = tokens[position].depth
+        position += 1
+        
+        # 헤더: 괄호 밖의 ';'(전방 선언) 또는 IS/AS까지
+        while position < len(tokens):
+            token = tokens[position]
+            if token.depth == depth:
+                if token.type is TokenType.SEMICOLON:
+                    return (position, False)
+                if token.value in ('IS', 'AS') and token.type is TokenType.KEYWORD:
+                    break
+            position += 1
+        else:
+            return None
+        position += 1
+        
+        if position < len(tokens) and tokens[position].value in _CALL_SPEC_KEYWORDS:
+            while position < len(tokens) and tokens[position].type is not TokenType.SEMICOLON:
+                position += 1
+            return (min(position, len(tokens) - 1), False)
+        
+        # 선언부: 중첩 서브프로그램은 건너뛰고 본문의 BEGIN까지
+        while position < len(tokens):
+            token = tokens[position]
+            if token.type is not TokenType.KEYWORD:
+                position += 1
+            elif token.value == 'BEGIN':
+                break
+            elif token.value == 'END':
+                return None
+            elif token.value == 'CASE':
+                position = self._skip_block(position)
+            elif token.value in _SUBPROGRAM_KINDS:
+                nested = self._find_subprogram_end(position)
+                if nested is None:
+                    return None
+                position = nested[0] + 1
+            else:
+                position += 1
+        else:
+            return None
+        
+        # 본문: BEGIN 블록이 닫힐 때까지
+        position = self._skip_block(position)
+        if position > len(tokens):
+            return None
+        
+        # END 뒤의 이름과 ';'
+        if position < len(tokens) and tokens[position].type in (TokenType.IDENTIFIER,
+                                                               TokenType.QUOTED_IDENTIFIER):
+            position += 1
+        if position < len(tokens) and tokens[position].type is TokenType.SEMICOLON:
+            return (position, True)
+        return (position - 1, True)
+    
+    def _skip_block(self, position: int) -> int:
+        """position에서 열리는 블록을 닫는 END 다음 위치 반환
+        
+        Args:
+            position: BEGIN/CASE 등 블록을 여는 토큰 위치
+            
+        Returns:
+            블록을 닫는 END(END IF 등 포함) 다음 토큰 위치 (닫히지 않으면 토큰 수 + 1)
+        """
+        tokens = self._code_tokens
+        stack: List[str] = []
+        while position < len(tokens):
+            opened = len(stack)
+            position = self._advance_block(stack, position)
+            if opened and not stack:
+                return position
+        return len(tokens) + 1
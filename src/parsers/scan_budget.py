@@ -0,0 +1,158 @@
+"""
+Detector Scan Budget
+
+감지기(detector)용 선형 시간 스캔 도우미와 감지기별 시간/입력 크기 예산을 제공합니다.
+
+`A.*?B` (DOTALL) 형태의 정규식은 B가 없는 입력에서 A가 나올 때마다 입력 끝까지
+다시 스캔하므로 큰 입력에서는 입력 크기의 제곱에 비례하는 시간이 걸립니다.
+이 모듈의 도우미는 각 패턴을 직전 매칭의 끝에서부터 한 번씩만 검색하므로 입력 크기에
+선형입니다. (A의 매칭 끝 위치가 시작 위치마다 하나로 정해지는 패턴에서 findall/search와
+같은 결과)
+
+예산을 넘긴 감지기는 멈추지 않고 그때까지의 결과(또는 입력 앞부분만 스캔한 결과)를
+반환하며, ScanBudget에 기록되어 분석 결과의 degraded_detectors로 표시됩니다.
+"""
+
+import re
+import time
+from typing import Dict, Iterator, List, Match, Optional, Pattern, Sequence, Tuple
+
+# 예산 초과 사유
+REASON_TIME = 'time'
+REASON_SIZE = 'size'
+
+
+class ScanBudget:
+    """감지기별 시간/입력 크기 예산
+
+    파서 인스턴스마다 하나씩 생성되며, 예산을 넘긴 감지기 이름과 사유를 기록합니다.
+
+    Attributes:
+        time_limit: 감지기 하나의 시간 예산 (초)
+        max_chars: 감지기 하나가 스캔하는 최대 입력 크기 (문자 수)
+        degraded: 예산을 넘긴 감지기 (감지기 이름: 사유)
+    """
+
+    def __init__(self, time_limit: Optional[float] = None, max_chars: Optional[int] = None):
+        """ScanBudget 초기화
+
+        Args:
+            time_limit: 시간 예산 (None이면 DETECTOR_TIME_LIMIT)
+            max_chars: 최대 입력 크기 (None이면 DETECTOR_MAX_SCAN_CHARS)
+        """
+        from src.oracle_complexity_analyzer import DETECTOR_MAX_SCAN_CHARS, DETECTOR_TIME_LIMIT
+
+        self.time_limit = DETECTOR_TIME_LIMIT if time_limit is None else time_limit
+        self.max_chars = DETECTOR_MAX_SCAN_CHARS if max_chars is None else max_chars
+        self.degraded: Dict[str, str] = {}
+
+    @property
+    def degraded_detectors(self) -> List[str]:
+        """예산을 넘긴 감지기 목록 ('감지기:사유' 형식, 이름순)"""
+        return [f"{name}:{reason}" for name, reason in sorted(self.degraded.items())]
+
+    def flag(self, name: str, reason: str) -> None:
+        """감지기를 예산 초과로 표시"""
+        self.degraded.setdefault(name, reason)
+
+    def window(self, name: str, text: str) -> str:
+        """입력 크기 예산 적용 (초과 시 앞부분만 반환하고 표시)"""
+        if len(text) > self.max_chars:
+            self.flag(name, REASON_SIZE)
+            return text[:self.max_chars]
+        return text
+
+    def deadline(self) -> float:
+        """지금부터 시간 예산이 끝나는 시각"""
+        return time.perf_counter() + self.time_limit
+
+    def expired(self, name: str, deadline: float) -> bool:
+        """시간 예산 초과 여부 확인 (초과 시 표시)"""
+        if time.perf_counter() > deadline:
+            self.flag(name, REASON_TIME)
+            return True
+        return False
+
+
+def iter_sequence(text: str, patterns: Sequence[Pattern], budget: Optional[ScanBudget] = None,
+                  name: str = '') -> Iterator[Tuple[Match, ...]]:
+    """`P1.*?P2.*?...` (DOTALL)의 겹치지 않는 매칭을 선형 시간으로 순회
+
+    각 패턴은 직전 패턴 매칭의 끝에서부터 검색합니다. 어느 패턴이든 찾지 못하면
+    이후 위치에서도 전체 매칭이 불가능하므로 즉시 종료합니다.
+
+    Args:
+        text: 검색 대상 텍스트
+        patterns: 순서대로 나타나야 하는 컴파일된 패턴 목록
+        budget: 감지기 예산 (None이면 예산 미적용)
+        name: 예산 초과 시 기록할 감지기 이름
+
+    Yields:
+        Tuple[Match, ...]: 패턴별 매칭 객체
+    """
+    deadline = None
+    if budget is not None:
+        text = budget.window(name, text)
+        deadline = budget.deadline()
+
+    pos = 0
+    while pos <= len(text):
+        matches = []
+        for pattern in patterns:
+            match = pattern.search(text, pos)
+            if match is None:
+                return
+            matches.append(match)
+            pos = match.end()
+
+        yield tuple(matches)
+
+        # 빈 매칭 무한 반복 방지
+        if pos == matches[0].start():
+            pos += 1
+        if budget is not None and deadline is not None and budget.expired(name, deadline):
+            return
+
+
+def count_sequence(text: str, patterns: Sequence[Pattern], budget: Optional[ScanBudget] = None,
+                   name: str = '') -> int:
+    """`P1.*?P2.*?...` (DOTALL)의 겹치지 않는 매칭 개수 (re.findall 개수와 동일)"""
+    return sum(1 for _ in iter_sequence(text, patterns, budget, name))
+
+
+def has_sequence(text: str, patterns: Sequence[Pattern], budget: Optional[ScanBudget] = None,
+                 name: str = '') -> bool:
+    """`P1.*?P2.*?...` (DOTALL) 매칭 존재 여부 (re.search 결과와 동일)"""
+    return next(iter_sequence(text, patterns, budget, name), None) is not None
+
+
+def strip_block_comments(text: str) -> str:
+    """여러 줄 주석(/* ... */) 제거
+
+    re.sub(r'/\\*.*?\\*/', '', text, flags=re.DOTALL)과 같은 결과를 선형 시간으로 만듭니다.
+    닫히지 않은 주석은 그대로 남깁니다.
+
+    Args:
+        text: 원본 텍스트
+
+    Returns:
+        str: 주석이 제거된 텍스트
+    """
+    parts = []
+    pos = 0
+    while True:
+        start = text.find('/*', pos)
+        if start < 0:
+            break
+        end = text.find('*/', start + 2)
+        if end < 0:
+            break
+        parts.append(text[pos:start])
+        pos = end + 2
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+def compile_sequence(*patterns: str, flags: int = 0) -> Tuple[Pattern, ...]:
+    """iter_sequence용 패턴 목록 컴파일"""
+    return tuple(re.compile(pattern, flags) for pattern in patterns)
@@ -0,0 +1,89 @@
+"""
+SQL Fingerprint
+
+리터럴만 다른 SQL 문을 같은 형태로 묶기 위한 핑거프린트 모듈입니다.
+토큰 스트림에서 리터럴과 바인드 변수를 자리표시자(?)로 바꾸고, 리터럴로만 구성된
+IN 목록은 하나의 자리표시자로 접습니다. 주석은 제거하고 힌트는 유지합니다.
+
+복잡도 점수에 영향을 주는 리터럴 형태는 구분하여 유지합니다.
+- 빈 문자열 ('')  : 빈 문자열 비교 감지
+- '%...%' 문자열 : LIKE 양방향 와일드카드 감지
+"""
+
+import hashlib
+from typing import List
+
+from .sql_lexer import TokenType, tokenize
+
+# 자리표시자
+_PLACEHOLDER = '?'
+_LIST_PLACEHOLDER = '?+'
+_LIKE_PLACEHOLDER = "'%?%'"
+_EMPTY_STRING = "''"
+
+
+def _literal_shape(token_type: TokenType, value: str) -> str:
+    """리터럴 토큰의 형태 반환"""
+    if token_type is TokenType.STRING:
+        if value in (_EMPTY_STRING, "N''"):
+            return _EMPTY_STRING
+        if (value.startswith("'%") and value.endswith("%'") and len(value) > 4
+                and "'" not in value[2:-2]):
+            return _LIKE_PLACEHOLDER
+    return _PLACEHOLDER
+
+
+def fingerprint(text: str) -> str:
+    """리터럴에 무관한 SQL 형태 문자열 생성
+
+    Args:
+        text: SQL 문 텍스트
+
+    Returns:
+        str: 공백 하나로 구분된 정규화 토큰 문자열
+    """
+    shape: List[str] = []
+    # 여는 괄호의 출력 위치 (IN 목록 접기용)
+    open_parens: List[int] = []
+
+    for token in tokenize(text):
+        token_type = token.type
+
+        if token_type is TokenType.COMMENT:
+            continue
+
+        if token_type in (TokenType.STRING, TokenType.NUMBER, TokenType.BIND):
+            shape.append(_literal_shape(token_type, token.value))
+        elif token_type is TokenType.HINT:
+            shape.append(' '.join(token.value.split()))
+        elif token_type is TokenType.LPAREN:
+            open_parens.append(len(shape))
+            shape.append('(')
+        elif token_type is TokenType.RPAREN:
+            start = open_parens.pop() if open_parens else None
+            # IN ( ?, ?, ... ) → IN ( ?+ )
+            if start is not None and start > 0 and shape[start - 1] == 'IN':
+                items = shape[start + 1:]
+                if items and all(
+                    item == (_PLACEHOLDER if i % 2 == 0 else ',')
+                    for i, item in enumerate(items)
+                ):
+                    del shape[start + 1:]
+                    shape.append(_LIST_PLACEHOLDER)
+            shape.append(')')
+        else:
+            shape.append(token.value)
+
+    return ' '.join(shape)
+
+
+def fingerprint_hash(text: str) -> str:
+    """SQL 핑거프린트 해시 생성
+
+    Args:
+        text: SQL 문 텍스트
+
+    Returns:
+        str: fingerprint() 결과의 SHA-1 해시 (16자리 16진수)
+    """
+    return hashlib.sha1(fingerprint(text).encode('utf-8')).hexdigest()[:16]
@@ -0,0 +1,169 @@
+"""
+SQL Lexer
+
+Oracle SQL/PL-SQL 소스를 한 번의 순차 스캔으로 토큰 스트림으로 변환하는 모듈입니다.
+문자열 리터럴(q-quote 포함), 인용 식별자, 주석, 힌트를 정확히 구분하므로
+파서의 구조 분석기들이 정규식 재스캔 없이 토큰 목록만 순회하여 동작할 수 있습니다.
+"""
+
+import re
+from enum import Enum
+from typing import List, NamedTuple
+
+
+class TokenType(Enum):
+    """토큰 종류"""
+    KEYWORD = "keyword"
+    IDENTIFIER = "identifier"
+    QUOTED_IDENTIFIER = "quoted_identifier"
+    STRING = "string"
+    NUMBER = "number"
+    BIND = "bind"
+    COMMENT = "comment"
+    HINT = "hint"
+    LPAREN = "lparen"
+    RPAREN = "rparen"
+    COMMA = "comma"
+    SEMICOLON = "semicolon"
+    OPERATOR = "operator"
+
+
+class Token(NamedTuple):
+    """토큰
+
+    Attributes:
+        type: 토큰 종류
+        value: 대문자로 정규화된 토큰 텍스트
+        start: 원본 문자열 내 시작 오프셋
+        end: 원본 문자열 내 끝 오프셋 (exclusive)
+        line: 토큰이 시작하는 줄 번호 (1부터 시작)
+        depth: 괄호 깊이 (여는/닫는 괄호는 바깥쪽 깊이를 가짐)
+    """
+    type: TokenType
+    value: str
+    start: int
+    end: int
+    line: int
+    depth: int
+
+
+# 구조 분석에 사용되는 SQL 예약어
+# 이 목록에 없는 단어는 IDENTIFIER로 분류됩니다.
+SQL_KEYWORDS = frozenset({
+    'ALL', 'ALTER', 'AND', 'ANY', 'AS', 'ASC', 'BEGIN', 'BETWEEN', 'BY',
+    'CASE', 'CHECK', 'CONNECT', 'CREATE', 'CROSS', 'CURSOR', 'DECLARE',
+    'DEFAULT', 'DELETE', 'DESC', 'DISTINCT', 'DROP', 'ELSE', 'ELSIF', 'END',
+    'EXCEPT', 'EXCEPTION', 'EXISTS', 'FETCH', 'FOR', 'FROM', 'FULL',
+    'FUNCTION', 'GROUP', 'HAVING', 'IF', 'IN', 'INNER', 'INSERT', 'INTERSECT',
+    'INTO', 'IS', 'JOIN', 'LEFT', 'LIKE', 'LOOP', 'MERGE', 'MINUS', 'MODEL',
+    'NATURAL', 'NOT', 'NULL', 'OF', 'OFFSET', 'ON', 'OR', 'ORDER', 'OUTER',
+    'PACKAGE', 'PIVOT', 'PRIOR', 'PROCEDURE', 'RETURN', 'RETURNING', 'RIGHT',
+    'SELECT', 'SET', 'START', 'TABLE', 'THEN', 'TRIGGER', 'TYPE', 'UNION',
+    'UNPIVOT', 'UPDATE', 'USING', 'VALUES', 'VIEW', 'WHEN', 'WHERE', 'WHILE',
+    'WINDOW', 'WITH',
+})
+
+
+# 토큰 패턴 (순서가 중요함: 주석/문자열이 단어보다 먼저 매칭되어야 함)
+_TOKEN_PATTERNS = [
+    ('ws', r'\s+'),
+    ('hint', r'/\*\+.*?(?:\*/|\Z)|--\+[^\n]*'),
+    ('comment', r'/\*.*?(?:\*/|\Z)|--[^\n]*'),
+    # Oracle q-quote 리터럴: q'[...]', q'{...}', q'<...>', q'(...)', q'!...!'
+    ('string', r"[Nn]?[Qq]'(?:\[.*?(?:\]'|\Z)|\{.*?(?:\}'|\Z)|<.*?(?:>'|\Z)"
+               r"|\(.*?(?:\)'|\Z)|(?P<qd>[^\s\[{<(]).*?(?:(?P=qd)'|\Z))"),
+    ('string', r"[Nn]?'[^']*(?:''[^']*)*(?:'|\Z)"),
+    ('quoted_identifier', r'"[^"]*(?:"|\Z)'),
+    # PL/SQL 범위 연산자(1..10)의 '.'은 숫자에 포함하지 않음
+    ('number', r'\d+(?:\.(?!\.)\d*)?(?:[Ee][+-]?\d+)?|\.\d+(?:[Ee][+-]?\d+)?'),
+    ('bind', r':(?:[\w$#]+|"[^"]*")'),
+    ('word', r'[^\W\d][\w$#]*'),
+    ('lparen', r'\('),
+    ('rparen', r'\)'),
+    ('comma', r','),
+    ('semicolon', r';'),
+    ('operator', r'\|\||<=|>=|<>|!=|\^=|:=|=>|\.\.|\*\*|.'),
+]
+
+_TOKEN_RE = re.compile(
+    '|'.join(f'(?P<{kind}{i}>{pattern})' for i, (kind, pattern) in enumerate(_TOKEN_PATTERNS)),
+    re.DOTALL,
+)
+
+# 그룹 이름 → 토큰 종류 매핑 (q-quote 구분자 그룹은 제외)
+_GROUP_KINDS = {f'{kind}{i}': kind for i, (kind, _) in enumerate(_TOKEN_PATTERNS)}
+
+_SIMPLE_TYPES = {
+    'hint': TokenType.HINT,
+    'comment': TokenType.COMMENT,
+    'string': TokenType.STRING,
+    'quoted_identifier': TokenType.QUOTED_IDENTIFIER,
+    'number': TokenType.NUMBER,
+    'bind': TokenType.BIND,
+    'comma': TokenType.COMMA,
+    'semicolon': TokenType.SEMICOLON,
+    'operator': TokenType.OPERATOR,
+}
+
+# 여러 줄에 걸칠 수 있는 토큰 종류
+_MULTILINE_KINDS = frozenset({'ws', 'hint', 'comment', 'string', 'quoted_identifier'})
+
+
+def tokenize(text: str) -> List[Token]:
+    """SQL 텍스트를 토큰 목록으로 변환
+
+    공백은 토큰으로 만들지 않으며, 각 토큰에는 줄 번호와 괄호 깊이가 기록됩니다.
+    닫히지 않은 문자열/주석은 입력 끝까지를 하나의 토큰으로 처리합니다.
+
+    Args:
+        text: 토큰화할 SQL 또는 PL/SQL 텍스트
+
+    Returns:
+        토큰 목록 (원본 순서)
+    """
+    tokens: List[Token] = []
+    append = tokens.append
+    line = 1
+    depth = 0
+
+    for match in _TOKEN_RE.finditer(text):
+        kind = _GROUP_KINDS[match.lastgroup] if match.lastgroup in _GROUP_KINDS else 'string'
+        start, end = match.span()
+
+        if kind == 'ws':
+            line += text.count('\n', start, end)
+            continue
+
+        value = match.group().upper()
+
+        if kind == 'word':
+            token_type = TokenType.KEYWORD if value in SQL_KEYWORDS else TokenType.IDENTIFIER
+            append(Token(token_type, value, start, end, line, depth))
+        elif kind == 'lparen':
+            append(Token(TokenType.LPAREN, value, start, end, line, depth))
+            depth += 1
+        elif kind == 'rparen':
+            if depth > 0:
+                depth -= 1
+            append(Token(TokenType.RPAREN, value, start, end, line, depth))
+        else:
+            append(Token(_SIMPLE_TYPES[kind], value, start, end, line, depth))
+            if kind in _MULTILINE_KINDS:
+                line += text.count('\n', start, end)
+
+    return tokens
+
+
+def code_tokens(tokens: List[Token]) -> List[Token]:
+    """주석과 힌트를 제외한 코드 토큰만 반환
+
+    Args:
+        tokens: tokenize()가 반환한 토큰 목록
+
+    Returns:
+        주석/힌트가 제거된 토큰 목록
+    """
+    return [
+        token for token in tokens
+        if token.type is not TokenType.COMMENT and token.type is not TokenType.HINT
+    ]
@@ -6,13 +6,58 @@ Requirements 1.1-1.5, 2.1-2.5, 3.1, 7.1-7.5를 구현합니다.
 """
 
 import re
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict, NamedTuple, Optional
+
+from .sql_lexer import Token, TokenType, tokenize, code_tokens
+from .scan_budget import ScanBudget, compile_sequence, has_sequence
+
+if TYPE_CHECKING:
+    from src.oracle_complexity_analyzer.data_models import SQLFeatureVector
+
+
+# FROM 절을 같은 괄호 깊이에서 끝내는 키워드
+_FROM_CLAUSE_TERMINATORS = frozenset({
+    'WHERE', 'GROUP', 'ORDER', 'HAVING', 'UNION', 'INTERSECT', 'MINUS', 'EXCEPT',
+    'CONNECT', 'START', 'MODEL', 'WINDOW', 'FETCH', 'OFFSET', 'FOR', 'RETURNING',
+    'SELECT', 'SET', 'VALUES',
+})
+
+# 집합 연산자 키워드 (UNION ALL은 UNION 하나로 카운팅)
+_SET_OPERATORS = frozenset({'UNION', 'INTERSECT', 'MINUS', 'EXCEPT'})
+
+# CTE 정의 목록 뒤에 오는 메인 문장 시작 키워드
+_MAIN_STATEMENT_KEYWORDS = frozenset({'SELECT', 'INSERT', 'UPDATE', 'DELETE', 'MERGE'})
+
+# 서브쿼리를 시작하는 키워드
+_SUBQUERY_START_KEYWORDS = frozenset({'SELECT', 'WITH'})
+
+# WHERE 절 시작과 끝 (GROUP BY / ORDER BY / HAVING 또는 쿼리 끝)
+_WHERE_RE = re.compile(r'\bWHERE\s+')
+_WHERE_END_RE = re.compile(r'\bGROUP\s+BY\b|\bORDER\s+BY\b|\bHAVING\b|$')
+
+# 복잡한 ROWNUM 패턴 (`A.*?B` 정규식을 선형 스캔용 패턴 쌍으로 분리)
+# 페이징: ROWNUM rnum FROM ( ... WHERE ROWNUM
+_ROWNUM_PAGING_SEQUENCE = compile_sequence(r'ROWNUM\s+\w+\s+FROM\s*\(', r'WHERE\s+ROWNUM')
+# 별칭 필터링: ROWNUM [AS] rnum ... WHERE rnum >
+# (별칭 \w+는 최소 한 글자만 매칭해도 결과가 같으므로 끝 위치가 가장 앞인 형태 사용)
+_ROWNUM_ALIAS_SEQUENCE = compile_sequence(r'ROWNUM\s+\w', r'WHERE\s+\w+\s*[>]')
+
+
+class _StructureCounts(NamedTuple):
+    """토큰 스캔 한 번으로 계산되는 구조 지표"""
+    joins: int
+    subquery_depth: int
+    ctes: int
+    set_operators: int
+    case_expressions: int
+    derived_tables: int
 
 
 class SQLParser:
     """SQL 쿼리 파싱 및 구문 요소 추출
     
     Oracle SQL 쿼리를 분석하여 복잡도 계산에 필요한 다양한 구문 요소를 추출합니다.
+    쿼리는 생성 시점에 한 번만 토큰화되며, 구조 분석기들은 토큰 목록을 순회합니다.
     """
     
     def __init__(self, query: str):
@@ -22,40 +67,223 @@ class SQLParser:
             query: 분석할 SQL 쿼리 문자열
         """
         self.query = query.strip()
-        self.upper_query = query.strip().upper()
+        self.tokens: List[Token] = tokenize(self.query)
+        self.code_tokens: List[Token] = code_tokens(self.tokens)
         self.normalized_query = self._normalize_query()
+        self.budget = ScanBudget()
+        self._structure: Optional[_StructureCounts] = None
+        self._features: Optional['SQLFeatureVector'] = None
+    
+    @property
+    def upper_query(self) -> str:
+        """대문자로 변환된 쿼리 (호출할 때마다 새로 생성)"""
+        return self.query.upper()
     
     def _normalize_query(self) -> str:
         """쿼리 정규화 (공백, 줄바꿈 처리)
         
         Requirements 1.1-1.5를 위한 전처리 작업입니다.
-        - 여러 공백을 하나로 통합
-        - 줄바꿈을 공백으로 변환
-        - 탭을 공백으로 변환
+        토큰 스트림에서 다시 조립하므로 문자열 리터럴 내부의 '--', '/*'는
+        주석으로 오인되지 않습니다.
+        - 토큰 사이의 공백/줄바꿈/탭/주석을 공백 하나로 통합
         - 주석 제거 (-- 및 /* */)
+        - 대문자 변환
         
         Returns:
             정규화된 쿼리 문자열
         """
-        # 원본 쿼리의 대문자 버전으로 시작
-        normalized = self.upper_query
+        parts = []
+        prev_end = None
         
-        # 한 줄 주석 제거 (-- 주석)
-        normalized = re.sub(r'--[^\n]*', ' ', normalized)
+        for token in self.code_tokens:
+            if prev_end is not None and token.start > prev_end:
+                parts.append(' ')
+            parts.append(token.value)
+            prev_end = token.end
         
-        # 여러 줄 주석 제거 (/* */ 주석)
-        normalized = re.sub(r'/\*.*?\*/', ' ', normalized, flags=re.DOTALL)
+        return ''.join(parts)
+    
+    def _get_structure(self) -> _StructureCounts:
+        """구조 지표 반환 (최초 호출 시 한 번만 계산)
         
-        # 줄바꿈과 탭을 공백으로 변환
-        normalized = normalized.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
+        Returns:
+            구조 지표
+        """
+        if self._structure is None:
+            self._structure = self._scan_structure()
+        return self._structure
+    
+    def _scan_structure(self) -> _StructureCounts:
+        """토큰 목록을 한 번 순회하여 구조 지표 계산
         
-        # 여러 공백을 하나로 통합
-        normalized = re.sub(r'\s+', ' ', normalized)
+        JOIN, 서브쿼리 깊이, CTE, 집합 연산자, CASE, 파생 테이블을 함께 계산합니다.
+        FROM 절과 CTE 목록은 괄호 깊이별로 추적하므로 중첩 서브쿼리 내부의
+        쉼표나 AS는 바깥 절에 섞이지 않습니다.
         
-        # 앞뒤 공백 제거
-        normalized = normalized.strip()
+        Returns:
+            구조 지표
+        """
+        tokens = self.code_tokens
+        token_count = len(tokens)
+        
+        joins = 0
+        ctes = 0
+        set_operators = 0
+        case_expressions = 0
+        derived_tables = 0
+        
+        from_depths = set()     # FROM 절을 읽는 중인 괄호 깊이
+        cte_depths = set()      # CTE 정의 목록을 읽는 중인 괄호 깊이
+        paren_stack = []        # 각 여는 괄호가 서브쿼리를 시작했는지 여부
+        subquery_depth = 0
+        max_subquery_depth = 0
+        prev = None
+        
+        for i, token in enumerate(tokens):
+            token_type = token.type
+            value = token.value
+            depth = token.depth
+            
+            if token_type is TokenType.LPAREN:
+                nxt = tokens[i + 1] if i + 1 < token_count else None
+                is_cte_body = (
+                    depth in cte_depths
+                    and prev is not None and prev.type is TokenType.KEYWORD and prev.value == 'AS'
+                )
+                is_subquery = (
+                    not is_cte_body
+                    and nxt is not None and nxt.type is TokenType.KEYWORD
+                    and nxt.value in _SUBQUERY_START_KEYWORDS
+                )
+                paren_stack.append(is_subquery)
+                if is_cte_body:
+                    ctes += 1
+                elif is_subquery:
+                    subquery_depth += 1
+                    max_subquery_depth = max(max_subquery_depth, subquery_depth)
+                    if depth in from_depths:
+                        derived_tables += 1
+            
+            elif token_type is TokenType.RPAREN:
+                if paren_stack and paren_stack.pop():
+                    subquery_depth -= 1
+                from_depths.discard(depth + 1)
+                cte_depths.discard(depth + 1)
+            
+            elif token_type is TokenType.COMMA:
+                # FROM 절의 쉼표 = 암시적 JOIN
+                if depth in from_depths:
+                    joins += 1
+            
+            elif token_type is TokenType.SEMICOLON:
+                from_depths.clear()
+                cte_depths.clear()
+            
+            elif token_type is TokenType.KEYWORD:
+                if value == 'FROM':
+                    from_depths.add(depth)
+                elif value in _FROM_CLAUSE_TERMINATORS:
+                    from_depths.discard(depth)
+                
+                if value == 'JOIN':
+                    # LEFT OUTER JOIN 등도 JOIN 키워드 하나로 카운팅
+                    joins += 1
+                elif value in _SET_OPERATORS:
+                    set_operators += 1
+                elif value == 'CASE':
+                    if prev is None or prev.value != 'END':
+                        case_expressions += 1
+                elif value == 'WITH':
+                    if self._starts_cte_list(tokens, i):
+                        cte_depths.add(depth)
+                elif value in _MAIN_STATEMENT_KEYWORDS:
+                    cte_depths.discard(depth)
+            
+            prev = token
+        
+        return _StructureCounts(
+            joins=joins,
+            subquery_depth=max_subquery_depth,
+            ctes=ctes,
+            set_operators=set_operators,
+            case_expressions=case_expressions,
+            derived_tables=derived_tables,
+        )
+    
+    @staticmethod
+    def _starts_cte_list(tokens: List[Token], index: int) -> bool:
+        """WITH 키워드가 CTE 정의 목록을 시작하는지 확인
+        
+        'WITH 이름 AS (' 또는 'WITH 이름 (컬럼 목록) AS (' 형태만 CTE로 판단하며,
+        START WITH, WITH READ ONLY, WITH TIME ZONE 등은 제외합니다.
+        
+        Args:
+            tokens: 코드 토큰 목록
+            index: WITH 토큰의 위치
+            
+        Returns:
+            CTE 목록 시작 여부
+        """
+        if index + 2 >= len(tokens):
+            return False
         
-        return normalized
+        name = tokens[index + 1]
+        if name.type not in (TokenType.IDENTIFIER, TokenType.QUOTED_IDENTIFIER):
+            return False
+        
+        following = tokens[index + 2]
+        return following.type is TokenType.LPAREN or (
+            following.type is TokenType.KEYWORD and following.value == 'AS'
+        )
+    
+    def extract_features(self) -> 'SQLFeatureVector':
+        """복잡도 계산에 필요한 모든 지표를 한 번에 추출
+        
+        각 감지 메서드를 한 번씩만 호출하여 불변 SQLFeatureVector를 생성합니다.
+        결과는 캐시되므로 여러 타겟의 점수 계산에 재사용할 수 있습니다.
+        
+        Returns:
+            SQLFeatureVector: 추출된 지표 묶음
+        """
+        if self._features is not None:
+            return self._features
+        
+        from src.oracle_complexity_analyzer import SQLFeatureVector
+        
+        structure = self._get_structure()
+        penalties = self.has_performance_penalties()
+        normalized = self.normalized_query
+        
+        self._features = SQLFeatureVector(
+            query_length=len(self.query),
+            join_count=structure.joins,
+            subquery_depth=structure.subquery_depth,
+            cte_count=structure.ctes,
+            set_operators_count=structure.set_operators,
+            case_count=structure.case_expressions,
+            derived_table_count=structure.derived_tables,
+            analytic_function_count=self.count_analytic_functions(),
+            aggregate_function_count=self.count_aggregate_functions(),
+            oracle_features=tuple(self.detect_oracle_features()),
+            oracle_functions=tuple(self.detect_oracle_functions()),
+            hints=tuple(self.count_hints()),
+            has_where='WHERE' in normalized,
+            has_order_by='ORDER BY' in normalized,
+            has_group_by='GROUP BY' in normalized,
+            has_having='HAVING' in normalized,
+            has_count='COUNT' in normalized,
+            has_keep='KEEP' in normalized,
+            has_fullscan_risk=self.has_fullscan_risk(),
+            has_distinct=penalties['distinct'],
+            has_or_conditions=penalties['or_conditions'],
+            has_like_pattern=penalties['like_pattern'],
+            has_function_in_where=penalties['function_in_where'],
+            has_complex_rownum=self.detect_complex_rownum_pattern(),
+            has_empty_string_comparison=self.detect_empty_string_comparison(),
+            # 모든 감지기 실행 후 기록
+            degraded_detectors=tuple(self.budget.degraded_detectors),
+        )
+        return self._features
     
     def count_joins(self) -> int:
         """JOIN 개수 계산 (명시적 + 암시적)
@@ -67,78 +295,19 @@ class SQLParser:
         Returns:
             총 JOIN 개수
         """
-        join_count = 0
-        
-        # 명시적 JOIN 개수 계산
-        # JOIN 키워드 자체를 세되, 중복 카운팅 방지
-        # LEFT OUTER JOIN, RIGHT OUTER JOIN 등은 하나의 JOIN으로 카운팅
-        join_patterns = [
-            r'\bINNER\s+JOIN\b',
-            r'\bLEFT\s+(?:OUTER\s+)?JOIN\b',
-            r'\bRIGHT\s+(?:OUTER\s+)?JOIN\b',
-            r'\bFULL\s+(?:OUTER\s+)?JOIN\b',
-            r'\bCROSS\s+JOIN\b',
-        ]
-        
-        for pattern in join_patterns:
-            matches = re.findall(pattern, self.normalized_query)
-            join_count += len(matches)
-        
-        # 단순 JOIN (위의 패턴에 매칭되지 않은 경우만)
-        # INNER, LEFT, RIGHT, FULL, CROSS가 앞에 없는 JOIN만 카운팅
-        simple_join_pattern = r'(?<!INNER\s)(?<!LEFT\s)(?<!RIGHT\s)(?<!FULL\s)(?<!CROSS\s)(?<!OUTER\s)\bJOIN\b'
-        simple_joins = re.findall(simple_join_pattern, self.normalized_query)
-        join_count += len(simple_joins)
-        
-        # 암시적 JOIN 개수 계산 (FROM 절의 쉼표)
-        # FROM 절 추출
-        from_match = re.search(r'\bFROM\s+(.*?)(?:\bWHERE\b|\bGROUP\s+BY\b|\bORDER\s+BY\b|\bHAVING\b|\bUNION\b|\bINTERSECT\b|\bMINUS\b|$)', 
-                               self.normalized_query, re.DOTALL)
-        
-        if from_match:
-            from_clause = from_match.group(1)
-            # 서브쿼리 내부의 쉼표는 제외하기 위해 괄호 내부 제거
-            from_clause_no_subquery = re.sub(r'\([^)]*\)', '', from_clause)
-            # 쉼표 개수 세기 (쉼표 개수 = 암시적 JOIN 개수)
-            comma_count = from_clause_no_subquery.count(',')
-            join_count += comma_count
-        
-        return join_count
+        return self._get_structure().joins
     
     def calculate_subquery_depth(self) -> int:
         """서브쿼리 중첩 깊이 계산
         
         Requirements 1.2를 구현합니다.
-        SELECT 문의 중첩 깊이를 계산합니다.
+        '(SELECT' 또는 '(WITH'로 시작하는 괄호의 중첩 깊이를 계산합니다.
+        CTE 본문과 집합 연산자로 연결된 최상위 SELECT는 서브쿼리로 보지 않습니다.
         
         Returns:
             서브쿼리 중첩 깊이 (0 = 서브쿼리 없음)
         """
-        max_depth = 0
-        current_depth = 0
-        
-        # SELECT 키워드를 기준으로 깊이 추적
-        i = 0
-        while i < len(self.normalized_query):
-            # SELECT 발견 시 깊이 증가
-            if self.normalized_query[i:i+6] == 'SELECT':
-                current_depth += 1
-                max_depth = max(max_depth, current_depth)
-                i += 6
-            # 괄호 열림 - 서브쿼리 시작 가능성
-            elif self.normalized_query[i] == '(':
-                i += 1
-            # 괄호 닫힘 - 서브쿼리 종료 가능성
-            elif self.normalized_query[i] == ')':
-                # 이전에 SELECT가 있었다면 깊이 감소
-                if current_depth > 0:
-                    current_depth -= 1
-                i += 1
-            else:
-                i += 1
-        
-        # 최상위 SELECT는 서브쿼리가 아니므로 1을 빼줌
-        return max(0, max_depth - 1)
+        return self._get_structure().subquery_depth
     
     def count_ctes(self) -> int:
         """CTE(WITH 절) 개수 계산
@@ -149,50 +318,7 @@ class SQLParser:
         Returns:
             CTE 개수
         """
-        cte_count = 0
-        
-        # WITH 절이 있는지 확인
-        if not re.search(r'\bWITH\b', self.normalized_query):
-            return 0
-        
-        # WITH 절 전체를 찾기 (WITH부터 메인 SELECT 전까지)
-        # CTE 정의는 "이름 AS (" 패턴을 따름
-        # 괄호 깊이를 추적하여 메인 SELECT를 찾음
-        with_start = self.normalized_query.find('WITH')
-        if with_start == -1:
-            return 0
-        
-        # WITH 다음부터 시작
-        i = with_start + 4
-        paren_depth = 0
-        in_cte_definition = False
-        
-        while i < len(self.normalized_query):
-            # SELECT를 만났고 괄호 밖이면 메인 SELECT
-            if self.normalized_query[i:i+6] == 'SELECT' and paren_depth == 0:
-                break
-            
-            # AS ( 패턴을 찾으면 CTE 정의 시작
-            if self.normalized_query[i:i+2] == 'AS' and i + 2 < len(self.normalized_query):
-                # AS 다음 공백 건너뛰기
-                j = i + 2
-                while j < len(self.normalized_query) and self.normalized_query[j] == ' ':
-                    j += 1
-                # 괄호가 나오면 CTE 정의
-                if j < len(self.normalized_query) and self.normalized_query[j] == '(':
-                    cte_count += 1
-                    in_cte_definition = True
-            
-            if self.normalized_query[i] == '(':
-                paren_depth += 1
-            elif self.normalized_query[i] == ')':
-                paren_depth -= 1
-                if paren_depth == 0:
-                    in_cte_definition = False
-            
-            i += 1
-        
-        return cte_count
+        return self._get_structure().ctes
     
     def count_set_operators(self) -> int:
         """집합 연산자(UNION/INTERSECT/MINUS) 개수 계산
@@ -202,48 +328,20 @@ class SQLParser:
         Returns:
             집합 연산자 개수
         """
-        set_operator_count = 0
-        
-        # UNION (ALL 포함)
-        set_operator_count += len(re.findall(r'\bUNION\s+ALL\b', self.normalized_query))
-        set_operator_count += len(re.findall(r'\bUNION\b(?!\s+ALL)', self.normalized_query))
-        
-        # INTERSECT
-        set_operator_count += len(re.findall(r'\bINTERSECT\b', self.normalized_query))
-        
-        # MINUS (Oracle) 또는 EXCEPT (표준 SQL)
-        set_operator_count += len(re.findall(r'\bMINUS\b', self.normalized_query))
-        set_operator_count += len(re.findall(r'\bEXCEPT\b', self.normalized_query))
-        
-        return set_operator_count
+        return self._get_structure().set_operators
     
     def detect_oracle_features(self) -> List[str]:
         """Oracle 특화 기능 감지
         
         Requirements 2.1-2.5를 구현합니다.
-        ORACLE_SPECIFIC_SYNTAX에 정의된 기능들을 감지합니다.
+        ORACLE_SPECIFIC_SYNTAX에 정의된 기능들을 사전 컴파일된 매처로 한 번에 감지합니다.
         
         Returns:
             감지된 Oracle 특화 기능 목록
         """
-        from src.oracle_complexity_analyzer import ORACLE_SPECIFIC_SYNTAX
+        from src.oracle_complexity_analyzer import ORACLE_SYNTAX_MATCHER
         
-        detected_features = []
-        
-        for feature in ORACLE_SPECIFIC_SYNTAX.keys():
-            # 특수 문자 이스케이프
-            escaped_feature = re.escape(feature)
-            
-            # 단어 경계를 고려한 패턴 (특수 문자 제외)
-            if feature.isalnum() or ' ' in feature:
-                pattern = r'\b' + escaped_feature + r'\b'
-            else:
-                pattern = escaped_feature
-            
-            if re.search(pattern, self.normalized_query):
-                detected_features.append(feature)
-        
-        return detected_features
+        return ORACLE_SYNTAX_MATCHER.detect(self.normalized_query)
     
     def detect_oracle_functions(self) -> List[str]:
         """Oracle 특화 함수 감지
@@ -254,18 +352,9 @@ class SQLParser:
         Returns:
             감지된 Oracle 특화 함수 목록
         """
-        from src.oracle_complexity_analyzer import ORACLE_SPECIFIC_FUNCTIONS
-        
-        detected_functions = []
-        
-        for function in ORACLE_SPECIFIC_FUNCTIONS.keys():
-            # 함수는 뒤에 괄호가 따라옴
-            pattern = r'\b' + re.escape(function) + r'\s*\('
-            
-            if re.search(pattern, self.normalized_query):
-                detected_functions.append(function)
+        from src.oracle_complexity_analyzer import ORACLE_FUNCTION_MATCHER
         
-        return detected_functions
+        return ORACLE_FUNCTION_MATCHER.detect(self.normalized_query)
     
     def count_hints(self) -> List[str]:
         """힌트 감지 및 개수 계산
@@ -276,22 +365,40 @@ class SQLParser:
         Returns:
             감지된 힌트 목록
         """
-        from src.oracle_complexity_analyzer import ORACLE_HINTS
+        from src.oracle_complexity_analyzer import ORACLE_HINT_MATCHER
         
         detected_hints = []
         
-        # 힌트 블록 찾기 (/*+ ... */)
-        hint_blocks = re.findall(r'/\*\+\s*(.*?)\s*\*/', self.upper_query, re.DOTALL)
-        
-        for hint_block in hint_blocks:
+        # 힌트 블록 찾기 (/*+ ... */, --+ ...)
+        for token in self.tokens:
+            if token.type is not TokenType.HINT:
+                continue
+            
             # 각 힌트 블록 내에서 정의된 힌트 찾기
-            for hint in ORACLE_HINTS:
-                if re.search(r'\b' + re.escape(hint) + r'\b', hint_block):
-                    if hint not in detected_hints:
-                        detected_hints.append(hint)
+            hint_block = self._strip_hint_markers(token.value)
+            for hint in ORACLE_HINT_MATCHER.detect(hint_block):
+                if hint not in detected_hints:
+                    detected_hints.append(hint)
         
         return detected_hints
     
+    @staticmethod
+    def _strip_hint_markers(hint: str) -> str:
+        """힌트 토큰에서 주석 기호를 제거
+        
+        Args:
+            hint: 힌트 토큰 값 ('/*+ ... */' 또는 '--+ ...')
+            
+        Returns:
+            힌트 본문
+        """
+        if hint.startswith('--+'):
+            return hint[3:].strip()
+        body = hint[3:]
+        if body.endswith('*/'):
+            body = body[:-2]
+        return body.strip()
+    
     def count_analytic_functions(self) -> int:
         """분석 함수(OVER 절) 개수 계산
         
@@ -300,17 +407,9 @@ class SQLParser:
         Returns:
             분석 함수 개수
         """
-        from src.oracle_complexity_analyzer import ANALYTIC_FUNCTIONS
-        
-        analytic_count = 0
+        from src.oracle_complexity_analyzer import ANALYTIC_FUNCTION_MATCHER
         
-        for function in ANALYTIC_FUNCTIONS:
-            # 분석 함수는 OVER 절과 함께 사용됨
-            pattern = r'\b' + re.escape(function) + r'\s*\([^)]*\)\s+OVER\s*\('
-            matches = re.findall(pattern, self.normalized_query)
-            analytic_count += len(matches)
-        
-        return analytic_count
+        return sum(ANALYTIC_FUNCTION_MATCHER.count(self.normalized_query).values())
     
     def count_aggregate_functions(self) -> int:
         """집계 함수 개수 계산
@@ -320,17 +419,9 @@ class SQLParser:
         Returns:
             집계 함수 개수
         """
-        from src.oracle_complexity_analyzer import AGGREGATE_FUNCTIONS
-        
-        aggregate_count = 0
-        
-        for function in AGGREGATE_FUNCTIONS:
-            # 집계 함수는 괄호와 함께 사용됨 (단, OVER 절이 없는 경우만)
-            pattern = r'\b' + re.escape(function) + r'\s*\('
-            matches = re.findall(pattern, self.normalized_query)
-            aggregate_count += len(matches)
+        from src.oracle_complexity_analyzer import AGGREGATE_FUNCTION_MATCHER
         
-        return aggregate_count
+        return sum(AGGREGATE_FUNCTION_MATCHER.count(self.normalized_query).values())
     
     def count_case_expressions(self) -> int:
         """CASE 표현식 개수 계산
@@ -340,10 +431,7 @@ class SQLParser:
         Returns:
             CASE 표현식 개수
         """
-        # CASE ... END 패턴 찾기
-        case_count = len(re.findall(r'\bCASE\b', self.normalized_query))
-        
-        return case_count
+        return self._get_structure().case_expressions
     
     def has_fullscan_risk(self) -> bool:
         """풀스캔 위험 여부 판단 (WHERE 절 없음 등)
@@ -365,17 +453,12 @@ class SQLParser:
         """파생 테이블 개수 계산
         
         Requirements 6.6을 구현합니다.
-        FROM 절의 서브쿼리를 파생 테이블로 간주합니다.
+        FROM 절(JOIN 대상 포함)의 서브쿼리를 파생 테이블로 간주합니다.
         
         Returns:
             파생 테이블 개수
         """
-        # FROM 절 내의 서브쿼리 (SELECT) 개수
-        # FROM ... (SELECT ...) 패턴
-        pattern = r'\bFROM\s+[^(]*\(\s*SELECT\b'
-        derived_count = len(re.findall(pattern, self.normalized_query))
-        
-        return derived_count
+        return self._get_structure().derived_tables
     
     def has_performance_penalties(self) -> Dict[str, bool]:
         """성능 페널티 요소 감지 (DISTINCT, OR 조건 등)
@@ -396,10 +479,8 @@ class SQLParser:
         penalties['distinct'] = bool(re.search(r'\bDISTINCT\b', self.normalized_query))
         
         # OR 조건 3개 이상
-        where_match = re.search(r'\bWHERE\s+(.*?)(?:\bGROUP\s+BY\b|\bORDER\s+BY\b|\bHAVING\b|$)', 
-                               self.normalized_query, re.DOTALL)
-        if where_match:
-            where_clause = where_match.group(1)
+        where_clause = self._extract_where_clause()
+        if where_clause is not None:
             or_count = len(re.findall(r'\bOR\b', where_clause))
             penalties['or_conditions'] = or_count >= 3
             
@@ -412,6 +493,22 @@ class SQLParser:
         
         return penalties
     
+    def _extract_where_clause(self) -> Optional[str]:
+        """첫 WHERE 절 본문 추출 (다음 GROUP BY/ORDER BY/HAVING 또는 쿼리 끝까지)
+        
+        Returns:
+            WHERE 절 본문 (WHERE 절이 없으면 None)
+        """
+        normalized = self.normalized_query
+        where_match = _WHERE_RE.search(normalized)
+        if where_match is None:
+            return None
+        
+        # `$` 대안이 항상 매칭되므로 끝 위치는 반드시 존재
+        end_match = _WHERE_END_RE.search(normalized, where_match.end())
+        end = end_match.start() if end_match is not None else len(normalized)
+        return normalized[where_match.end():end]
+    
     def detect_complex_rownum_pattern(self) -> bool:
         """복잡한 ROWNUM 패턴 감지 (페이징 등)
         
@@ -424,14 +521,14 @@ class SQLParser:
         """
         # 패턴 1: 중첩 서브쿼리에서 ROWNUM 사용 (페이징)
         # SELECT * FROM (SELECT a.*, ROWNUM rnum FROM (...) a WHERE ROWNUM <= 20) WHERE rnum > 10
-        paging_pattern = r'ROWNUM\s+\w+\s+FROM\s*\(.*?WHERE\s+ROWNUM'
-        if re.search(paging_pattern, self.normalized_query, re.DOTALL):
+        if has_sequence(self.normalized_query, _ROWNUM_PAGING_SEQUENCE,
+                        self.budget, 'complex_rownum_paging'):
             return True
         
         # 패턴 2: ROWNUM을 별칭으로 사용하고 외부에서 필터링
         # WHERE rnum > N 또는 WHERE rnum >= N 패턴
-        alias_pattern = r'ROWNUM\s+(?:AS\s+)?\w+.*?WHERE\s+\w+\s*[>]'
-        if re.search(alias_pattern, self.normalized_query, re.DOTALL):
+        if has_sequence(self.normalized_query, _ROWNUM_ALIAS_SEQUENCE,
+                        self.budget, 'complex_rownum_alias'):
             return True
         
         # 패턴 3: 두 개 이상의 ROWNUM 사용
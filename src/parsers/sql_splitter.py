@@ -0,0 +1,225 @@
+"""
+SQL Statement Splitter
+
+여러 SQL 문이 포함된 스크립트 파일을 개별 문장으로 분리하는 모듈입니다.
+파일을 줄 단위로 읽으면서 문장을 하나씩 반환하므로 큰 스크립트도 전체를 메모리에
+올리지 않고 처리할 수 있습니다.
+
+지원하는 구분자:
+- ';' : 일반 SQL 문 종료
+- '/' : 단독 줄의 슬래시 (SQL*Plus 버퍼 실행, PL/SQL 블록 종료)
+
+문자열 리터럴(q-quote 포함), 인용 식별자, 주석 안의 구분자는 무시합니다.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from src.utils.file_utils import SourceFile
+
+
+@dataclass
+class SQLStatement:
+    """스크립트에서 분리된 개별 SQL 문
+
+    Attributes:
+        index: 스크립트 내 문장 순번 (1부터 시작)
+        statement_type: 문장의 첫 키워드 (예: SELECT, INSERT, CREATE)
+        text: 구분자를 제외한 문장 텍스트
+        line_start: 시작 줄 번호 (1부터 시작)
+        line_end: 끝 줄 번호
+    """
+    index: int
+    statement_type: str
+    text: str
+    line_start: int
+    line_end: int
+
+
+# 일반 상태에서 다음 특수 토큰 검색 (주석, 문자열, 인용 식별자, 세미콜론)
+_NORMAL_RE = re.compile(r"--|/\*|(?<![\w$#])[Nn]?[Qq]'|'|\"|;")
+
+# q-quote 여는 구분자 → 닫는 구분자
+_Q_CLOSERS = {'[': ']', '{': '}', '<': '>', '(': ')'}
+
+# ';'로 끝나지 않는 PL/SQL 블록 시작 패턴 (단독 '/'로만 종료)
+_BLOCK_START_RE = re.compile(
+    r'^(?:DECLARE|BEGIN|CREATE\s+(?:OR\s+REPLACE\s+)?(?:(?:NON)?EDITIONABLE\s+)?'
+    r'(?:PROCEDURE|FUNCTION|PACKAGE|TRIGGER|TYPE|LIBRARY|JAVA))\b'
+)
+
+_FIRST_WORD_RE = re.compile(r'[A-Z_][A-Z0-9_$#]*')
+
+# 문장 유형 판단에 사용하는 앞부분 코드 길이
+_HEAD_LENGTH = 120
+
+_NORMAL, _LINE_COMMENT, _BLOCK_COMMENT, _STRING, _QUOTE, _IDENT = range(6)
+
+
+def iter_statements(lines: Iterable[str]) -> Iterator[SQLStatement]:
+    """줄 단위 입력에서 SQL 문을 순서대로 추출
+
+    Args:
+        lines: 줄 단위 텍스트 (줄바꿈 포함 여부 무관)
+
+    Yields:
+        SQLStatement: 분리된 SQL 문 (주석/공백만 있는 문장은 제외)
+    """
+    state = _NORMAL
+    q_closer = ''
+    parts: List[str] = []
+    head: List[str] = []
+    head_length = 0
+    has_code = False
+    line_start = 0
+    last_line = 0
+    line_no = 0
+    index = 0
+
+    def emit(line_end: int) -> Iterator[SQLStatement]:
+        nonlocal index
+        if not has_code:
+            return
+        text = ''.join(parts).strip()
+        if text:
+            index += 1
+            match = _FIRST_WORD_RE.search(''.join(head).upper())
+            yield SQLStatement(
+                index=index,
+                statement_type=match.group() if match else '',
+                text=text,
+                line_start=line_start,
+                line_end=line_end,
+            )
+
+    def in_block() -> bool:
+        return bool(_BLOCK_START_RE.match(''.join(head).lstrip().upper()))
+
+    for line_no, line in enumerate(lines, 1):
+        # 단독 '/' 줄: 현재 문장 종료 (문자열/주석 내부 제외)
+        if state in (_NORMAL, _LINE_COMMENT) and line.strip() == '/':
+            state = _NORMAL
+            yield from emit(last_line)
+            parts, head, head_length, has_code = [], [], 0, False
+            continue
+
+        if state == _LINE_COMMENT:
+            state = _NORMAL
+
+        pos = 0
+        segment_start = 0
+        length = len(line)
+
+        while pos < length:
+            if state == _NORMAL:
+                match = _NORMAL_RE.search(line, pos)
+                code = line[pos:match.start() if match else length]
+                if code.strip():
+                    if not has_code:
+                        has_code = True
+                        line_start = line_no
+                    if head_length < _HEAD_LENGTH:
+                        head.append(code)
+                        head_length += len(code)
+                if not match:
+                    break
+
+                token = match.group()
+                pos = match.end()
+                if token == ';':
+                    if has_code and in_block():
+                        continue
+                    parts.append(line[segment_start:match.start()])
+                    yield from emit(line_no)
+                    parts, head, head_length, has_code = [], [], 0, False
+                    segment_start = pos
+                    continue
+
+                if not has_code and token not in ('--', '/*'):
+                    has_code = True
+                    line_start = line_no
+                if token == '--':
+                    state = _LINE_COMMENT
+                    break
+                if token == '/*':
+                    state = _BLOCK_COMMENT
+                elif token == '"':
+                    state = _IDENT
+                elif token == "'":
+                    state = _STRING
+                else:
+                    # q-quote: 다음 문자가 구분자
+                    if pos >= length:
+                        state = _STRING
+                        continue
+                    opener = line[pos]
+                    q_closer = _Q_CLOSERS.get(opener, opener) + "'"
+                    state = _QUOTE
+                    pos += 1
+            elif state == _BLOCK_COMMENT:
+                end = line.find('*/', pos)
+                if end < 0:
+                    break
+                pos = end + 2
+                state = _NORMAL
+            elif state == _STRING:
+                end = line.find("'", pos)
+                if end < 0:
+                    break
+                if line.startswith("''", end):
+                    pos = end + 2
+                    continue
+                pos = end + 1
+                state = _NORMAL
+            elif state == _QUOTE:
+                end = line.find(q_closer, pos)
+                if end < 0:
+                    break
+                pos = end + 2
+                state = _NORMAL
+            else:
+                end = line.find('"', pos)
+                if end < 0:
+                    break
+                pos = end + 1
+                state = _NORMAL
+
+        rest = line[segment_start:]
+        parts.append(rest if rest.endswith('\n') else rest + '\n')
+        if has_code and rest.strip():
+            last_line = line_no
+
+    yield from emit(last_line)
+
+
+def iter_file_statements(file_path: str, encoding: str = 'utf-8',
+                         source: Optional['SourceFile'] = None) -> Iterator[SQLStatement]:
+    """파일을 줄 단위로 읽으면서 SQL 문을 순서대로 추출
+
+    Args:
+        file_path: SQL 스크립트 파일 경로
+        encoding: 파일 인코딩 (기본값: utf-8, source를 지정하면 source의 인코딩 사용)
+        source: 이미 읽은 소스 파일 (지정하면 파일을 다시 열지 않고 줄 단위로 디코딩)
+
+    Yields:
+        SQLStatement: 분리된 SQL 문
+    """
+    if source is not None:
+        yield from iter_statements(source.iter_lines())
+        return
+    with open(file_path, 'r', encoding=encoding) as f:
+        yield from iter_statements(f)
+
+
+def split_statements(text: str) -> List[SQLStatement]:
+    """SQL 스크립트 텍스트를 개별 문장 목록으로 분리
+
+    Args:
+        text: SQL 스크립트 텍스트
+
+    Returns:
+        분리된 SQL 문 목록
+    """
+    return list(iter_statements(text.splitlines(keepends=True)))
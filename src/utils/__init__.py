@@ -7,16 +7,44 @@ Modules:
     cli_helpers: CLI 관련 헬퍼 함수들
     file_utils: 파일 처리 유틸리티
     logging_utils: 로깅 설정 및 유틸리티
+    metrics: 배치 실행 처리량 지표 기록 (--metrics-out)
 """
 
-from .cli_helpers import detect_file_type, generate_output_path, print_progress
-from .file_utils import find_files_by_extension, read_file_with_encoding
+from .cli_helpers import (
+    detect_file_type,
+    generate_output_path,
+    positive_float_argument,
+    positive_int_argument,
+    print_progress,
+    shard_argument,
+)
+from .file_utils import (
+    IgnorePatterns,
+    SourceFile,
+    detect_encoding,
+    find_files_by_extension,
+    iter_files,
+    parse_shard,
+    read_file_with_encoding,
+    read_head,
+    select_shard,
+)
 
 __version__ = "1.0.0"
 __all__ = [
     "detect_file_type",
     "generate_output_path",
+    "positive_float_argument",
+    "positive_int_argument",
     "print_progress",
+    "shard_argument",
+    "IgnorePatterns",
+    "SourceFile",
+    "detect_encoding",
     "find_files_by_extension",
+    "iter_files",
+    "parse_shard",
     "read_file_with_encoding",
+    "read_head",
+    "select_shard",
 ]
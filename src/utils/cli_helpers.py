@@ -4,11 +4,14 @@ CLI 헬퍼 함수 모듈
 CLI 도구에서 공통으로 사용되는 유틸리티 함수들을 제공합니다.
 """
 
+import argparse
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
+from .file_utils import SourceFile, parse_shard
 
-def detect_file_type(filepath: str) -> str:
+
+def detect_file_type(filepath: str, source: Optional[SourceFile] = None) -> str:
     """
     파일 타입을 자동으로 감지합니다 (AWR vs Statspack).
     
@@ -25,6 +28,7 @@ def detect_file_type(filepath: str) -> str:
     
     Args:
         filepath: 분석할 파일 경로
+        source: 이미 읽은 파일 내용 (있으면 파일을 다시 읽지 않음)
         
     Returns:
         "awr" 또는 "statspack"
@@ -53,14 +57,12 @@ def detect_file_type(filepath: str) -> str:
     ]
     
     try:
-        # UTF-8로 시도
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read(50000)  # 처음 50KB만 읽기 (성능 최적화)
-        except UnicodeDecodeError:
-            # Latin-1로 폴백
-            with open(filepath, 'r', encoding='latin-1') as f:
-                content = f.read(50000)
+        # 처음 50KB만 디코딩 (인코딩은 앞부분 바이트로 판별)
+        if source is not None:
+            content = source.head(50000)
+        else:
+            with SourceFile.open(filepath) as source:
+                content = source.head(50000)
         
         # AWR 마커가 하나라도 있으면 AWR 파일
         for marker in awr_markers:
@@ -125,3 +127,70 @@ def print_progress(step: int, total: int, message: str) -> None:
     """
     import sys
     print(f"[{step}/{total}] {message}", file=sys.stderr)
+
+
+def shard_argument(value: str) -> Tuple[int, int]:
+    """
+    --shard 인자 값을 (샤드 번호, 전체 샤드 수)로 변환합니다 (argparse type).
+    
+    Args:
+        value: 'i/N' 형식 문자열
+        
+    Returns:
+        (샤드 번호, 전체 샤드 수)
+        
+    Raises:
+        argparse.ArgumentTypeError: 형식이 잘못된 경우
+        
+    Example:
+        >>> shard_argument("2/4")
+        (2, 4)
+    """
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def positive_float_argument(value: str) -> float:
+    """
+    양수 실수 인자 값을 변환합니다 (argparse type, 예: --file-timeout).
+    
+    Args:
+        value: 숫자 문자열
+        
+    Returns:
+        양수 실수
+        
+    Raises:
+        argparse.ArgumentTypeError: 숫자가 아니거나 양수가 아닌 경우
+    """
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"숫자가 아닙니다: {value}")
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"양수여야 합니다: {value}")
+    return number
+
+
+def positive_int_argument(value: str) -> int:
+    """
+    양의 정수 인자 값을 변환합니다 (argparse type, 예: --max-tasks-per-child).
+    
+    Args:
+        value: 정수 문자열
+        
+    Returns:
+        양의 정수
+        
+    Raises:
+        argparse.ArgumentTypeError: 정수가 아니거나 양수가 아닌 경우
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수가 아닙니다: {value}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"양수여야 합니다: {value}")
+    return number
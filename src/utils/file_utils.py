@@ -4,8 +4,224 @@
 이 모듈은 파일 검색, 읽기 등 파일 처리와 관련된 유틸리티 함수들을 제공합니다.
 """
 
+import codecs
+import hashlib
+import heapq
+import io
+import logging
+import mmap
+import os
+import re
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Pattern, Sequence, Tuple, Union
+
+# 로거 초기화
+logger = logging.getLogger(__name__)
+
+# 인코딩 판별 시 검사하는 파일 앞부분 크기 (바이트)
+ENCODING_SNIFF_BYTES = 64 * 1024
+
+# BOM이 없을 때 판별을 시도하는 인코딩 순서 (latin-1은 항상 성공하므로 마지막)
+SNIFF_ENCODINGS = ('utf-8', 'cp949', 'latin-1')
+
+# 이 크기 이상의 파일은 메모리 맵으로 열어 전체를 메모리에 복사하지 않음 (바이트)
+MMAP_THRESHOLD = 1024 * 1024
+
+# 줄 단위 디코딩 시 한 번에 디코딩하는 블록 크기 (바이트)
+LINE_BLOCK_BYTES = 1024 * 1024
+
+# 샤드 분배 시 파일당 고정 비용 (바이트 환산, 작은 파일이 많은 샤드의 열기/파싱 준비 비용)
+SHARD_FILE_OVERHEAD_BYTES = 4096
+
+
+class IgnorePatterns:
+    """gitignore 형식 제외 패턴
+    
+    패턴은 검색 시작 디렉토리 기준 상대 경로('/' 구분)와 비교하며, 다음 규칙을 따릅니다.
+    
+    - 빈 줄과 '#'으로 시작하는 줄은 무시
+    - '!'로 시작하면 앞에서 제외된 경로를 다시 포함 (제외된 디렉토리 안은 탐색하지 않음)
+    - '/'로 끝나면 디렉토리만 일치
+    - 중간이나 앞에 '/'가 있으면 시작 디렉토리 기준, 없으면 모든 깊이의 이름과 비교
+    - '*', '?', '[...]'는 '/'를 넘지 않고, '**'는 여러 단계의 디렉토리와 일치
+    - 여러 패턴이 일치하면 마지막 패턴이 적용됨
+    
+    Example:
+        >>> excludes = IgnorePatterns(["build/", "*.bak.sql", "!keep.bak.sql"])
+        >>> excludes.matches("src/build", is_dir=True)
+        True
+    """
+    
+    def __init__(self, patterns: Iterable[str] = ()):
+        """IgnorePatterns 초기화
+        
+        Args:
+            patterns: gitignore 형식 패턴 목록
+        """
+        # (정규식, 다시 포함 여부, 디렉토리 전용 여부)
+        self._rules: List[Tuple[Pattern, bool, bool]] = []
+        for pattern in patterns:
+            self.add(pattern)
+    
+    def __bool__(self) -> bool:
+        return bool(self._rules)
+    
+    def add(self, pattern: str) -> None:
+        """패턴 추가 (빈 줄과 주석은 무시)
+        
+        Args:
+            pattern: gitignore 형식 패턴
+        """
+        pattern = pattern.rstrip('\r\n')
+        if not pattern.endswith('\\ '):
+            pattern = pattern.rstrip()
+        if not pattern or pattern.startswith('#'):
+            return
+        
+        negate = pattern.startswith('!')
+        if negate:
+            pattern = pattern[1:]
+        elif pattern.startswith(('\\!', '\\#')):
+            pattern = pattern[1:]
+        
+        dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+        if not pattern:
+            return
+        
+        anchored = '/' in pattern
+        regex = self._translate(pattern.lstrip('/'))
+        if not anchored:
+            regex = '(?:.*/)?' + regex
+        self._rules.append((re.compile(regex), negate, dir_only))
+    
+    def add_file(self, path: Union[str, Path]) -> None:
+        """패턴 파일(.gitignore 형식)의 패턴 추가
+        
+        Args:
+            path: 패턴 파일 경로
+            
+        Raises:
+            OSError: 파일을 읽을 수 없는 경우
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                self.add(line)
+    
+    @staticmethod
+    def _translate(pattern: str) -> str:
+        """glob 패턴을 정규식으로 변환 ('*'/'?'/'[...]'는 '/'를 넘지 않음)"""
+        parts: List[str] = []
+        i, n = 0, len(pattern)
+        while i < n:
+            # 경로 구성 요소 전체가 '**'인 경우
+            if (pattern.startswith('**', i) and (i == 0 or pattern[i - 1] == '/')
+                    and (i + 2 == n or pattern[i + 2] == '/')):
+                if i + 2 == n:
+                    parts.append('.*')
+                    i += 2
+                else:
+                    parts.append('(?:.*/)?')
+                    i += 3
+                continue
+            
+            char = pattern[i]
+            if char == '*':
+                parts.append('[^/]*')
+            elif char == '?':
+                parts.append('[^/]')
+            elif char == '[':
+                end = pattern.find(']', i + 2)
+                if end == -1:
+                    parts.append(re.escape(char))
+                else:
+                    body = pattern[i + 1:end]
+                    if body.startswith('!'):
+                        body = '^' + body[1:]
+                    parts.append('[' + body.replace('\\', '\\\\') + ']')
+                    i = end + 1
+                    continue
+            elif char == '\\' and i + 1 < n:
+                parts.append(re.escape(pattern[i + 1]))
+                i += 2
+                continue
+            else:
+                parts.append(re.escape(char))
+            i += 1
+        return ''.join(parts)
+    
+    def matches(self, relative_path: str, is_dir: bool = False) -> bool:
+        """경로가 제외 대상인지 확인
+        
+        Args:
+            relative_path: 검색 시작 디렉토리 기준 상대 경로 ('/' 구분)
+            is_dir: 디렉토리 여부
+            
+        Returns:
+            bool: 제외 대상이면 True
+        """
+        excluded = False
+        for regex, negate, dir_only in self._rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.fullmatch(relative_path):
+                excluded = not negate
+        return excluded
+
+
+def iter_files(
+    directory: Union[str, Path],
+    extensions: Iterable[str],
+    excludes: Optional[IgnorePatterns] = None,
+    case_sensitive: bool = False
+) -> Iterator[Path]:
+    """확장자로 파일을 찾으며 발견하는 대로 반환
+    
+    os.scandir로 디렉토리 트리를 한 번만 순회하며, 확장자와 제외 패턴을 같은 순회에서
+    확인합니다. 제외된 디렉토리 안은 탐색하지 않고, 심볼릭 링크 디렉토리는 따라가지
+    않습니다. 각 디렉토리의 항목을 이름순으로 순회하므로 반환 순서는 전체 결과를
+    정렬한 순서와 같습니다.
+    
+    Args:
+        directory: 검색할 디렉토리 경로
+        extensions: 확장자 목록 (예: ['.sql', '.pls'], 점 포함)
+        excludes: 제외 패턴 (선택사항)
+        case_sensitive: 확장자 대소문자 구분 여부 (기본값: False)
+        
+    Yields:
+        Path: 찾은 파일 경로
+    """
+    suffixes = tuple(ext if case_sensitive else ext.lower() for ext in extensions)
+    
+    def walk(path: str, relative: str) -> Iterator[Path]:
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            # 권한이 없거나 탐색 중 삭제된 디렉토리
+            logger.debug(f"디렉토리를 읽을 수 없습니다: {path} ({e})")
+            return
+        
+        for entry in entries:
+            relative_path = relative + entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False
+            if excludes and excludes.matches(relative_path, is_dir):
+                continue
+            if is_dir:
+                yield from walk(entry.path, relative_path + '/')
+                continue
+            
+            name = entry.name if case_sensitive else entry.name.lower()
+            try:
+                if name.endswith(suffixes) and entry.is_file():
+                    yield Path(entry.path)
+            except OSError:
+                continue
+    
+    yield from walk(os.fspath(directory), '')
 
 
 def find_files_by_extension(
@@ -46,22 +262,72 @@ def find_files_by_extension(
     if not extensions:
         raise ValueError("확장자 리스트가 비어있습니다")
     
-    # 확장자 정규화 (소문자로 변환)
-    normalized_extensions = [ext.lower() for ext in extensions]
+    # 한 번의 디렉토리 순회로 검색 (대소문자 구분 없이, 정렬된 순서로 반환됨)
+    return list(iter_files(directory, extensions))
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """'i/N' 형식의 샤드 지정 파싱
+    
+    Args:
+        value: 샤드 지정 문자열 (1부터 시작하는 번호, 예: '2/8')
+        
+    Returns:
+        Tuple[int, int]: (샤드 번호, 전체 샤드 수)
+        
+    Raises:
+        ValueError: 형식이 잘못되었거나 1 <= i <= N을 만족하지 않는 경우
+    """
+    match = re.fullmatch(r'\s*(\d+)\s*/\s*(\d+)\s*', value or '')
+    if not match:
+        raise ValueError(f"샤드는 'i/N' 형식이어야 합니다: {value!r}")
+    index, count = int(match.group(1)), int(match.group(2))
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"샤드 번호는 1부터 {count}까지여야 합니다: {value!r}")
+    return index, count
+
+
+def select_shard(
+    files: Sequence[Path],
+    shard: Tuple[int, int],
+    root: Union[str, Path]
+) -> List[Path]:
+    """파일 목록에서 샤드에 배정된 파일 선택
+    
+    파일 크기(+ SHARD_FILE_OVERHEAD_BYTES)가 큰 파일부터 누적 크기가 가장 작은 샤드에
+    배정합니다. 크기가 같은 파일은 root 기준 상대 경로의 해시 순서로 배정하므로, 같은
+    파일 집합이면 노드마다 마운트 경로나 검색 순서가 달라도 배정 결과가 같습니다.
     
-    # 파일 검색
-    found_files: List[Path] = []
+    Args:
+        files: 전체 파일 경로 목록
+        shard: (샤드 번호, 전체 샤드 수), 번호는 1부터 시작
+        root: 상대 경로 계산 기준 디렉토리
+        
+    Returns:
+        List[Path]: 샤드에 배정된 파일 (files 순서 유지)
+    """
+    index, count = shard
+    if count == 1:
+        return list(files)
     
-    # 재귀적으로 모든 파일 검색
-    for item in directory.rglob("*"):
-        if item.is_file():
-            # 파일 확장자 확인 (대소문자 구분 없이)
-            file_extension = item.suffix.lower()
-            if file_extension in normalized_extensions:
-                found_files.append(item)
+    def cost(file_path: Path) -> Tuple[int, str]:
+        try:
+            size = os.stat(file_path).st_size
+        except OSError:
+            size = 0
+        relative = Path(os.path.relpath(file_path, root)).as_posix()
+        digest = hashlib.sha256(relative.encode('utf-8', 'surrogateescape')).hexdigest()
+        return -(size + SHARD_FILE_OVERHEAD_BYTES), digest
     
-    # 파일명으로 정렬하여 반환
-    return sorted(found_files)
+    keys = [cost(file_path) for file_path in files]
+    # (누적 크기, 샤드 번호) 힙 (누적 크기가 같으면 번호가 작은 샤드에 배정)
+    loads = [(0, i) for i in range(count)]
+    selected = [False] * len(files)
+    for position in sorted(range(len(files)), key=keys.__getitem__):
+        load, least = heapq.heappop(loads)
+        heapq.heappush(loads, (load - keys[position][0], least))
+        selected[position] = least == index - 1
+    return [file_path for file_path, chosen in zip(files, selected) if chosen]
 
 
 def read_file_with_encoding(
@@ -70,7 +336,7 @@ def read_file_with_encoding(
 ) -> str:
     """여러 인코딩으로 파일 읽기 시도
     
-    지정된 인코딩 리스트를 순서대로 시도하여 파일을 읽습니다.
+    파일을 한 번 읽고 지정된 인코딩 리스트를 순서대로 시도하여 디코딩합니다.
     첫 번째로 성공한 인코딩으로 파일 내용을 반환합니다.
     
     Args:
@@ -101,12 +367,12 @@ def read_file_with_encoding(
     if not filepath.is_file():
         raise ValueError(f"파일이 아닙니다: {filepath}")
     
-    # 각 인코딩으로 시도
+    # 파일은 한 번만 읽고 각 인코딩으로 디코딩 시도
+    data = filepath.read_bytes()
     last_error = None
     for encoding in encodings:
         try:
-            with open(filepath, 'r', encoding=encoding) as f:
-                return f.read()
+            return _translate_newlines(data.decode(encoding))
         except (UnicodeDecodeError, LookupError) as e:
             last_error = e
             continue
@@ -117,3 +383,258 @@ def read_file_with_encoding(
         f"시도한 인코딩: {encodings}\n"
         f"마지막 오류: {last_error}"
     )
+
+
+def _translate_newlines(text: str) -> str:
+    """텍스트 모드 읽기와 같이 줄바꿈을 '\\n'으로 통일"""
+    if '\r' not in text:
+        return text
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def detect_encoding(prefix: bytes) -> str:
+    """파일 앞부분 바이트로 인코딩 판별
+    
+    UTF-8 BOM이 있으면 'utf-8-sig'를 반환합니다. BOM이 없으면 SNIFF_ENCODINGS를
+    순서대로 시도하며, 앞부분 끝에서 잘린 멀티바이트 문자는 오류로 보지 않습니다.
+    
+    Args:
+        prefix: 파일 앞부분 바이트 (ENCODING_SNIFF_BYTES 정도면 충분)
+        
+    Returns:
+        str: 인코딩 이름 ('utf-8-sig', 'utf-8', 'cp949' 또는 'latin-1')
+        
+    Example:
+        >>> detect_encoding('SELECT \'한글\' FROM dual'.encode('cp949'))
+        'cp949'
+    """
+    if prefix.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    
+    for encoding in SNIFF_ENCODINGS:
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(prefix, final=False)
+        except UnicodeDecodeError:
+            continue
+        return encoding
+    return SNIFF_ENCODINGS[-1]
+
+
+class SourceFile:
+    """한 번만 읽는 소스 파일
+    
+    파일을 바이트로 한 번 읽고(MMAP_THRESHOLD 이상이면 메모리 맵) 앞부분으로 인코딩을
+    판별합니다. 분석 파이프라인은 같은 SourceFile에서 앞부분(head), 전체 텍스트(text),
+    줄 스트림(iter_lines)과 원본 바이트(data)를 가져오므로 파일을 다시 열지 않습니다.
+    
+    텍스트는 텍스트 모드 읽기와 같이 줄바꿈을 '\\n'으로 통일합니다. 판별한 인코딩으로
+    전체를 디코딩할 수 없으면 SNIFF_ENCODINGS의 다음 인코딩으로 다시 디코딩하고
+    encoding을 갱신합니다.
+    
+    메모리 맵을 사용할 수 있으므로 with 문으로 사용하거나 close()를 호출해야 합니다.
+    
+    Attributes:
+        path: 파일 경로
+        data: 파일 내용 (바이트 또는 메모리 맵)
+        encoding: 판별한 인코딩
+        size: 파일 크기 (바이트)
+        mtime_ns: 파일 수정 시각 (나노초)
+        file_type: 파이프라인에서 판별한 파일 유형 (판별 전 None)
+        
+    Example:
+        >>> with SourceFile.open("sample.sql") as source:
+        ...     print(source.encoding, len(source.text))
+        utf-8 1234
+    """
+    
+    def __init__(self, path: Union[str, Path], data: Union[bytes, mmap.mmap], encoding: str,
+                 size: Optional[int] = None, mtime_ns: Optional[int] = None):
+        """SourceFile 초기화
+        
+        Args:
+            path: 파일 경로
+            data: 파일 내용 (바이트 또는 메모리 맵)
+            encoding: 파일 인코딩
+            size: 파일 크기 (None이면 data 길이)
+            mtime_ns: 파일 수정 시각 (나노초)
+        """
+        self.path = str(path)
+        self.data = data
+        self.encoding = encoding
+        self.size = len(data) if size is None else size
+        self.mtime_ns = mtime_ns
+        self.file_type: Optional[str] = None
+        self._text: Optional[str] = None
+    
+    @classmethod
+    def open(cls, path: Union[str, Path], encoding: Optional[str] = None) -> 'SourceFile':
+        """파일을 한 번 읽어 SourceFile 생성
+        
+        Args:
+            path: 파일 경로
+            encoding: 파일 인코딩 (None이면 앞부분 바이트로 판별)
+            
+        Returns:
+            SourceFile: 읽은 소스 파일
+            
+        Raises:
+            OSError: 파일을 읽을 수 없는 경우
+        """
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            data: Union[bytes, mmap.mmap]
+            if stat.st_size >= MMAP_THRESHOLD:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                data = f.read()
+        if encoding is None:
+            encoding = detect_encoding(data[:ENCODING_SNIFF_BYTES])
+        return cls(path, data, encoding, stat.st_size, stat.st_mtime_ns)
+    
+    @property
+    def text(self) -> str:
+        """전체 텍스트 (처음 접근할 때 한 번만 디코딩)
+        
+        Raises:
+            UnicodeDecodeError: 어떤 인코딩으로도 디코딩할 수 없는 경우
+        """
+        if self._text is None:
+            self._text = _translate_newlines(self._decode())
+        return self._text
+    
+    def _candidate_encodings(self) -> List[str]:
+        """디코딩 후보 인코딩 (판별한 인코딩, 이어서 SNIFF_ENCODINGS의 나머지 후보)"""
+        candidates = [self.encoding]
+        if self.encoding in SNIFF_ENCODINGS:
+            candidates += SNIFF_ENCODINGS[SNIFF_ENCODINGS.index(self.encoding) + 1:]
+        return candidates
+    
+    def _use_encoding(self, encoding: str) -> None:
+        """재판별한 인코딩 기록"""
+        if encoding != self.encoding:
+            logger.debug(f"인코딩 재판별: {self.path} ({self.encoding} → {encoding})")
+            self.encoding = encoding
+    
+    def _decode(self) -> str:
+        """전체 바이트 디코딩 (실패하면 다음 후보 인코딩으로 재시도)
+        
+        Raises:
+            UnicodeDecodeError: 마지막 후보 인코딩으로도 디코딩할 수 없는 경우
+        """
+        *fallbacks, last = self._candidate_encodings()
+        with memoryview(self.data) as view:
+            for encoding in fallbacks:
+                try:
+                    text = str(view, encoding)
+                except UnicodeDecodeError:
+                    continue
+                self._use_encoding(encoding)
+                return text
+            text = str(view, last)
+        self._use_encoding(last)
+        return text
+    
+    def head(self, max_chars: int) -> str:
+        """앞부분 텍스트 (최대 max_chars 문자, 전체를 디코딩하지 않음)
+        
+        Args:
+            max_chars: 최대 문자 수
+            
+        Returns:
+            str: 앞부분 텍스트
+        """
+        if self._text is not None or self.size <= max_chars:
+            return self.text[:max_chars]
+        
+        # 한 문자는 최대 4바이트 ('\\r\\n'은 2바이트에 한 문자)
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(self.encoding)(), translate=True
+        )
+        try:
+            return decoder.decode(self.data[:max_chars * 4], final=False)[:max_chars]
+        except UnicodeDecodeError:
+            return self.text[:max_chars]
+    
+    def iter_lines(self) -> Iterator[str]:
+        """줄 단위 텍스트 스트림 (줄 끝 '\\n' 포함, LINE_BLOCK_BYTES씩 디코딩)
+        
+        전체 텍스트를 만들지 않으므로 큰 배치 파일도 메모리 사용량이 블록 크기 수준입니다.
+        
+        Yields:
+            str: 한 줄
+            
+        Raises:
+            UnicodeDecodeError: 어떤 후보 인코딩으로도 디코딩할 수 없는 경우
+        """
+        if self._text is not None:
+            yield from io.StringIO(self._text)
+            return
+        
+        # 디코딩에 실패하면 다음 후보 인코딩으로 처음부터 다시 읽고 이미 내보낸 줄은 건너뜀
+        # (후보 인코딩 모두 '\n' 바이트가 줄바꿈에만 쓰이므로 줄 경계가 같음)
+        *fallbacks, last = self._candidate_encodings()
+        emitted = 0
+        for encoding in fallbacks:
+            try:
+                for number, line in enumerate(self._iter_decoded_lines(encoding)):
+                    if number >= emitted:
+                        emitted += 1
+                        yield line
+            except UnicodeDecodeError:
+                continue
+            self._use_encoding(encoding)
+            return
+        self._use_encoding(last)
+        for number, line in enumerate(self._iter_decoded_lines(last)):
+            if number >= emitted:
+                yield line
+    
+    def _iter_decoded_lines(self, encoding: str) -> Iterator[str]:
+        """지정한 인코딩으로 LINE_BLOCK_BYTES씩 디코딩한 줄 스트림"""
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(encoding)(), translate=True
+        )
+        pending = ''
+        for start in range(0, self.size, LINE_BLOCK_BYTES):
+            pending += decoder.decode(self.data[start:start + LINE_BLOCK_BYTES])
+            last_newline = pending.rfind('\n')
+            if last_newline < 0:
+                continue
+            yield from io.StringIO(pending[:last_newline + 1])
+            pending = pending[last_newline + 1:]
+        pending += decoder.decode(b'', final=True)
+        if pending:
+            yield pending
+    
+    def close(self) -> None:
+        """메모리 맵 닫기"""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+    
+    def __enter__(self) -> 'SourceFile':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_head(path: Union[str, Path], max_chars: int) -> str:
+    """파일 앞부분 텍스트 (앞부분 바이트만 읽어 디코딩, 최대 max_chars 문자)
+    
+    파일 유형 판별처럼 앞부분만 필요할 때 사용하며, 파일을 열어 둔 채로 남기지 않습니다.
+    인코딩 판별과 줄바꿈 통일은 SourceFile.head()와 같습니다.
+    
+    Args:
+        path: 파일 경로
+        max_chars: 최대 문자 수
+        
+    Returns:
+        str: 앞부분 텍스트
+        
+    Raises:
+        OSError: 파일을 읽을 수 없는 경우
+    """
+    # 한 문자는 최대 4바이트
+    with open(path, 'rb') as f:
+        prefix = f.read(max_chars * 4)
+    return SourceFile(path, prefix, detect_encoding(prefix[:ENCODING_SNIFF_BYTES])).head(max_chars)
@@ -0,0 +1,377 @@
+"""
+처리량 지표 모듈
+
+배치 실행(폴더 분석, DBCSI 배치 분석, 마이그레이션 추천)의 처리량 지표를 JSON Lines
+이벤트 스트림으로 기록합니다 (--metrics-out).
+
+이벤트는 한 줄에 하나씩 기록되며 event 필드로 구분합니다:
+    run_start: 도구 이름, 시작 시각, 실행 설정
+    stage: 단계(discovery, read, parse, score, export) 하나의 소요 시간과 처리 항목 수
+    file: 파일 하나의 처리 시간, 바이트 수, 객체 수, 단계별 시간, 워커, 큐 깊이
+    summary: 실행 전체 요약 (마지막 줄)
+
+요약의 처리 속도(files/s, bytes/s, objects/s)는 실행 시작부터 마지막 파일 처리까지의
+시간 기준이며, 단계별 시간 중 read/parse/score는 모든 워커의 시간을 합한 값입니다.
+"""
+
+import bisect
+import contextlib
+import json
+import os
+import sys
+import time
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, TextIO, Union
+
+# 지표 형식 버전 (이벤트 구조가 바뀌면 올림)
+METRICS_FORMAT_VERSION = 1
+
+# 파일별 처리 시간 히스토그램 구간 상한 (초, 마지막 구간은 상한 없음)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+# 현재 프로세스의 단계별 누적 시간 (collect_stages() 안에서만 기록)
+_stage_totals: Optional[Dict[str, float]] = None
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    현재 프로세스의 최대 상주 메모리(peak RSS)를 반환합니다.
+    
+    Returns:
+        최대 상주 메모리 (바이트), 측정할 수 없는 플랫폼(Windows)이면 None
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@contextlib.contextmanager
+def stage_timer(name: str) -> Iterator[None]:
+    """
+    블록 실행 시간을 현재 프로세스의 단계별 누적 시간에 더합니다.
+    
+    collect_stages() 밖에서는 시간을 재지 않으므로 지표를 기록하지 않는 실행에는
+    영향이 거의 없습니다.
+    
+    Args:
+        name: 단계 이름 (read, parse, score 등)
+    """
+    totals = _stage_totals
+    if totals is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        totals[name] = totals.get(name, 0.0) + time.perf_counter() - start
+
+
+@contextlib.contextmanager
+def collect_stages() -> Iterator[Dict[str, float]]:
+    """
+    블록 안에서 stage_timer()로 측정한 단계별 시간을 모읍니다.
+    
+    Yields:
+        단계 이름 → 누적 시간(초) 딕셔너리 (블록이 끝날 때까지 갱신됨)
+    
+    Example:
+        >>> with collect_stages() as stages:
+        ...     with stage_timer("parse"):
+        ...         pass
+        >>> sorted(stages)
+        ['parse']
+    """
+    global _stage_totals
+    previous = _stage_totals
+    totals: Dict[str, float] = {}
+    _stage_totals = totals
+    try:
+        yield totals
+    finally:
+        _stage_totals = previous
+
+
+def metrics_stage(metrics: Optional["MetricsRecorder"], name: str, **fields: Any):
+    """
+    지표 기록기가 있으면 단계 시간을 기록하는 컨텍스트를 반환합니다.
+    
+    Args:
+        metrics: 지표 기록기 (None이면 아무것도 하지 않음)
+        name: 단계 이름
+        **fields: stage 이벤트에 추가할 필드
+    
+    Returns:
+        컨텍스트 관리자
+    """
+    if metrics is None:
+        return contextlib.nullcontext()
+    return metrics.stage(name, **fields)
+
+
+class MetricsRecorder:
+    """
+    배치 실행 처리량 지표 기록기
+    
+    Attributes:
+        path: 지표 파일 경로
+        tool: 도구 이름
+        workers: 워커 수 (워커 사용률 계산 기준)
+    """
+    
+    def __init__(self, path: Union[str, Path], tool: str, workers: int = 1,
+                 config: Optional[Dict[str, Any]] = None):
+        """
+        지표 기록기를 초기화하고 run_start 이벤트를 기록합니다.
+        
+        Args:
+            path: 지표 파일 경로 (JSON Lines, 기존 파일은 덮어씀)
+            tool: 도구 이름
+            workers: 워커 수
+            config: run_start 이벤트에 기록할 실행 설정
+        """
+        self.path = Path(path)
+        self.tool = tool
+        self.workers = workers
+        self._start = time.perf_counter()
+        self._last_file = self._start
+        self._files = 0
+        self._failed = 0
+        self._bytes = 0
+        self._objects = 0
+        self._latencies = array("d")
+        self._stages: Dict[str, Dict[str, float]] = {}
+        self._busy: Dict[int, float] = {}
+        self._worker_rss: Dict[int, int] = {}
+        self._queue_depth = 0
+        self._queue_samples = 0
+        self._queue_total = 0
+        self._queue_max = 0
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: Optional[TextIO] = open(self.path, "w", encoding="utf-8")
+        self._write({
+            "event": "run_start",
+            "version": METRICS_FORMAT_VERSION,
+            "tool": tool,
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "pid": os.getpid(),
+            "config": config or {},
+        })
+    
+    def _write(self, event: Dict[str, Any]) -> None:
+        """이벤트 한 줄 기록 (닫힌 뒤에는 무시)"""
+        if self._file is None:
+            return
+        self._file.write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
+    
+    def _elapsed(self) -> float:
+        """실행 시작 후 경과 시간 (초)"""
+        return time.perf_counter() - self._start
+    
+    def add_stage(self, name: str, seconds: float, items: int = 0) -> None:
+        """
+        단계 시간을 누적합니다 (이벤트는 기록하지 않음).
+        
+        Args:
+            name: 단계 이름
+            seconds: 소요 시간 (초)
+            items: 처리 항목 수
+        """
+        totals = self._stages.setdefault(name, {"seconds": 0.0, "items": 0})
+        totals["seconds"] += seconds
+        totals["items"] += items
+    
+    @contextlib.contextmanager
+    def stage(self, name: str, **fields: Any) -> Iterator[Dict[str, Any]]:
+        """
+        블록을 단계 하나로 측정하여 stage 이벤트를 기록합니다.
+        
+        Args:
+            name: 단계 이름
+            **fields: stage 이벤트에 추가할 필드
+        
+        Yields:
+            이벤트 필드 딕셔너리 (블록 안에서 items 등을 채울 수 있음)
+        """
+        start = time.perf_counter()
+        try:
+            yield fields
+        finally:
+            seconds = time.perf_counter() - start
+            self.add_stage(name, seconds, fields.get("items", 0))
+            self._write({"event": "stage", "stage": name, "at": round(self._elapsed(), 6),
+                         "seconds": round(seconds, 6), **fields})
+    
+    def timed_iter(self, name: str, items: Iterable[Any]) -> Iterator[Any]:
+        """
+        항목을 꺼내는 데 걸린 시간을 단계 시간으로 측정하며 항목을 그대로 반환합니다.
+        
+        파일 검색처럼 다른 작업과 번갈아 진행되는 단계에 사용하며, 모든 항목을 꺼내면
+        stage 이벤트를 기록합니다.
+        
+        Args:
+            name: 단계 이름
+            items: 원본 이터러블
+        
+        Yields:
+            원본 항목
+        """
+        iterator = iter(items)
+        seconds = 0.0
+        count = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                seconds += time.perf_counter() - start
+                break
+            seconds += time.perf_counter() - start
+            count += 1
+            yield item
+        self.add_stage(name, seconds, count)
+        self._write({"event": "stage", "stage": name, "at": round(self._elapsed(), 6),
+                     "seconds": round(seconds, 6), "items": count})
+    
+    def sample_queue(self, depth: int) -> None:
+        """
+        작업 큐 깊이(제출 후 완료되지 않은 작업 수)를 기록합니다.
+        
+        Args:
+            depth: 큐 깊이
+        """
+        self._queue_depth = depth
+        self._queue_samples += 1
+        self._queue_total += depth
+        self._queue_max = max(self._queue_max, depth)
+    
+    def record_file(self, file_name: str, seconds: Optional[float] = None, size: int = 0,
+                    objects: int = 0, error: Optional[str] = None,
+                    stages: Optional[Dict[str, float]] = None, worker: Optional[int] = None,
+                    rss: Optional[int] = None, **fields: Any) -> None:
+        """
+        파일 하나의 처리 결과를 기록합니다.
+        
+        Args:
+            file_name: 파일 경로
+            seconds: 처리 시간 (초, None이면 분석하지 않은 파일로 지연 시간 통계에서 제외)
+            size: 파일 크기 (바이트)
+            objects: 분석한 객체 수 (SQL 문, PL/SQL 객체 등)
+            error: 에러 메시지 (실패한 경우)
+            stages: 단계별 시간 (초)
+            worker: 처리한 워커 프로세스 ID
+            rss: 워커의 최대 상주 메모리 (바이트)
+            **fields: file 이벤트에 추가할 필드 (deduped, resumed 등)
+        """
+        self._files += 1
+        self._bytes += size
+        self._objects += objects
+        self._last_file = time.perf_counter()
+        if error:
+            self._failed += 1
+        if seconds is not None:
+            self._latencies.append(seconds)
+            if worker is not None:
+                self._busy[worker] = self._busy.get(worker, 0.0) + seconds
+        for name, stage_seconds in (stages or {}).items():
+            self.add_stage(name, stage_seconds, 1)
+        if worker is not None and rss is not None:
+            self._worker_rss[worker] = max(self._worker_rss.get(worker, 0), rss)
+        
+        event: Dict[str, Any] = {"event": "file", "file": file_name, "at": round(self._elapsed(), 6),
+                                 "seconds": None if seconds is None else round(seconds, 6),
+                                 "bytes": size, "objects": objects, "ok": not error}
+        if error:
+            event["error"] = error
+        if stages:
+            event["stages"] = {name: round(value, 6) for name, value in stages.items()}
+        if worker is not None:
+            event["worker"] = worker
+        if self._queue_samples:
+            event["queue_depth"] = self._queue_depth
+        event.update(fields)
+        self._write(event)
+    
+    def _latency_summary(self) -> Dict[str, Any]:
+        """파일별 처리 시간 통계와 히스토그램"""
+        counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        for seconds in self._latencies:
+            counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        summary: Dict[str, Any] = {"count": len(self._latencies)}
+        if self._latencies:
+            ordered = sorted(self._latencies)
+            
+            def percentile(p: float) -> float:
+                return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 6)
+            
+            summary.update(mean=round(sum(ordered) / len(ordered), 6), p50=percentile(0.5),
+                           p90=percentile(0.9), p99=percentile(0.99), max=round(ordered[-1], 6))
+        summary["histogram"] = {"le": list(LATENCY_BUCKETS) + [None], "counts": counts}
+        return summary
+    
+    def summary(self) -> Dict[str, Any]:
+        """
+        실행 전체 요약을 계산합니다.
+        
+        Returns:
+            summary 이벤트 딕셔너리
+        """
+        wall = self._elapsed()
+        window = max(self._last_file - self._start, 1e-9)
+        busy = sum(self._busy.values())
+        return {
+            "event": "summary",
+            "tool": self.tool,
+            "wall_seconds": round(wall, 6),
+            "processing_seconds": round(window, 6),
+            "files": self._files,
+            "failed_files": self._failed,
+            "bytes": self._bytes,
+            "objects": self._objects,
+            "files_per_second": round(self._files / window, 3),
+            "bytes_per_second": round(self._bytes / window, 3),
+            "objects_per_second": round(self._objects / window, 3),
+            "latency": self._latency_summary(),
+            "stages": {name: {"seconds": round(totals["seconds"], 6), "items": totals["items"]}
+                       for name, totals in self._stages.items()},
+            "queue_depth": {
+                "max": self._queue_max,
+                "mean": round(self._queue_total / self._queue_samples, 3) if self._queue_samples else 0,
+            },
+            "workers": {
+                "count": self.workers,
+                "busy_seconds": round(busy, 6),
+                "utilization": round(min(1.0, busy / (max(1, self.workers) * window)), 4),
+                "peak_rss_bytes": {str(pid): rss for pid, rss in sorted(self._worker_rss.items())},
+            },
+            "peak_rss_bytes": peak_rss_bytes(),
+        }
+    
+    def close(self) -> Dict[str, Any]:
+        """
+        summary 이벤트를 기록하고 지표 파일을 닫습니다 (여러 번 호출해도 한 번만 기록).
+        
+        Returns:
+            summary 이벤트 딕셔너리 (이미 닫혔으면 빈 딕셔너리)
+        """
+        if self._file is None:
+            return {}
+        summary = self.summary()
+        self._write(summary)
+        self._file.close()
+        self._file = None
+        return summary
+    
+    def __enter__(self) -> "MetricsRecorder":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
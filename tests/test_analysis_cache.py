@@ -0,0 +1,142 @@
+"""
+AnalysisCache 테스트
+
+내용 기반 키, 디스크 영속성, LRU, 규칙 버전 무효화, 분석기 연동을 검증합니다.
+"""
+
+import pickle
+
+import pytest
+
+from src.oracle_complexity_analyzer import (
+    AnalysisCache,
+    BatchAnalyzer,
+    OracleComplexityAnalyzer,
+    TargetDatabase,
+)
+
+
+QUERY = "SELECT NVL(name, 'x'), ROWNUM FROM employees CONNECT BY PRIOR id = manager_id"
+
+PLSQL_CODE = """
+CREATE OR REPLACE PROCEDURE p IS
+BEGIN
+    DBMS_OUTPUT.PUT_LINE('x');
+END;
+"""
+
+
+class TestAnalysisCache:
+    """AnalysisCache 기본 기능 테스트"""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """캐시 파일 경로"""
+        return tmp_path / "cache.sqlite3"
+
+    def test_round_trip(self, db_path):
+        """저장한 결과가 동일하게 복원되는지 테스트"""
+        cache = AnalysisCache(db_path)
+        result = OracleComplexityAnalyzer().analyze_sql(QUERY)
+
+        cache.put('sql', TargetDatabase.POSTGRESQL, QUERY, result)
+
+        assert cache.get('sql', TargetDatabase.POSTGRESQL, QUERY) == result
+        assert cache.get('sql', TargetDatabase.MYSQL, QUERY) is None
+        assert cache.get('sql', TargetDatabase.POSTGRESQL, QUERY + " ") is None
+
+    def test_persists_on_disk(self, db_path):
+        """메모리 캐시 없이도 디스크에서 조회되는지 테스트"""
+        result = OracleComplexityAnalyzer().analyze_plsql(PLSQL_CODE)
+        AnalysisCache(db_path, memory_size=0).put('plsql', TargetDatabase.POSTGRESQL, PLSQL_CODE, result)
+
+        restored = AnalysisCache(db_path, memory_size=0).get(
+            'plsql', TargetDatabase.POSTGRESQL, PLSQL_CODE
+        )
+
+        assert restored == result
+
+    def test_rules_version_invalidates(self, db_path):
+        """규칙 버전이 바뀌면 이전 항목이 무효화되는지 테스트"""
+        result = OracleComplexityAnalyzer().analyze_sql(QUERY)
+        AnalysisCache(db_path, rules_version="v1").put('sql', TargetDatabase.POSTGRESQL, QUERY, result)
+
+        cache = AnalysisCache(db_path, memory_size=0, rules_version="v2")
+
+        assert cache.get('sql', TargetDatabase.POSTGRESQL, QUERY) is None
+
+    def test_lru_eviction(self, db_path):
+        """LRU 최대 크기 초과 시 오래된 항목이 제거되는지 테스트"""
+        cache = AnalysisCache(db_path, memory_size=2)
+        cache._disable_disk(RuntimeError("test"))
+        analyzer = OracleComplexityAnalyzer()
+        queries = ["SELECT 1 FROM a", "SELECT 2 FROM b", "SELECT 3 FROM c"]
+
+        for query in queries:
+            cache.put('sql', TargetDatabase.POSTGRESQL, query, analyzer.analyze_sql(query))
+
+        assert cache.get('sql', TargetDatabase.POSTGRESQL, queries[0]) is None
+        assert cache.get('sql', TargetDatabase.POSTGRESQL, queries[2]) is not None
+
+    def test_picklable(self, db_path):
+        """워커 프로세스 전달용 pickle 테스트"""
+        cache = AnalysisCache(db_path)
+        cache.put('sql', TargetDatabase.POSTGRESQL, QUERY, OracleComplexityAnalyzer().analyze_sql(QUERY))
+
+        restored = pickle.loads(pickle.dumps(cache))
+
+        assert restored.get('sql', TargetDatabase.POSTGRESQL, QUERY) is not None
+
+
+class TestAnalyzerWithCache:
+    """분석기 캐시 연동 테스트"""
+
+    def test_cache_hit_skips_parsing(self, tmp_path, monkeypatch):
+        """캐시 적중 시 파싱 없이 같은 결과를 반환하는지 테스트"""
+        cache = AnalysisCache.for_output_dir(tmp_path)
+        expected = OracleComplexityAnalyzer(cache=cache).analyze_sql_multi(QUERY)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("캐시 적중 시 파서가 호출되면 안 됩니다")
+
+        monkeypatch.setattr("src.parsers.sql_parser.SQLParser.__init__", fail)
+        results = OracleComplexityAnalyzer(cache=cache).analyze_sql_multi(QUERY)
+
+        assert results == expected
+
+    def test_batch_plsql_objects_cached(self, tmp_path):
+        """배치 PL/SQL 파일의 객체별 결과가 캐시되는지 테스트"""
+        batch_file = tmp_path / "objects.out"
+        batch_file.write_text(
+            "-- ============================================================\n"
+            "-- Owner: HR\n-- Type: PROCEDURE\n-- Name: P\n"
+            "-- ============================================================\n"
+            f"{PLSQL_CODE}\n/\n",
+            encoding="utf-8",
+        )
+        cache = AnalysisCache.for_output_dir(tmp_path)
+        first = OracleComplexityAnalyzer(cache=cache).analyze_batch_plsql_file(str(batch_file))
+
+        hits_before = cache.hits
+        second = OracleComplexityAnalyzer(cache=cache).analyze_batch_plsql_file(str(batch_file))
+
+        assert cache.hits == hits_before + first['analyzed_objects']
+        assert second['summary'] == first['summary']
+
+    def test_batch_analyzer_uses_cache(self, tmp_path):
+        """BatchAnalyzer 반복 실행 시 캐시 결과가 동일한지 테스트"""
+        source_dir = tmp_path / "src"
+        source_dir.mkdir()
+        (source_dir / "a.sql").write_text(QUERY, encoding="utf-8")
+        (source_dir / "b.sql").write_text(PLSQL_CODE, encoding="utf-8")
+        cache = AnalysisCache.for_output_dir(tmp_path / "reports")
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "reports"), cache=cache)
+
+        first = BatchAnalyzer(analyzer, max_workers=2).analyze_folder(str(source_dir))
+        assert AnalysisCache.for_output_dir(tmp_path / "reports", memory_size=0).get(
+            'sql', TargetDatabase.POSTGRESQL, QUERY
+        ) is not None
+
+        second = BatchAnalyzer(analyzer, max_workers=2).analyze_folder(str(source_dir))
+        assert second.average_score == first.average_score
+        assert second.complexity_distribution == first.complexity_distribution
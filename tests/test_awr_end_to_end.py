@@ -37,6 +37,26 @@ class TestAWREndToEnd:
         yield temp_dir
         shutil.rmtree(temp_dir)
     
+    def test_detect_and_parse_reads_file_once(self, sample_awr_file, monkeypatch):
+        """파일 타입 감지와 AWR 파싱(기본 + AWR 특화 섹션)이 파일을 한 번만 읽는지 테스트"""
+        from src.dbcsi.cli.command_handlers import detect_and_parse
+        from src.utils.file_utils import SourceFile
+        
+        opened = []
+        real_open = SourceFile.open.__func__
+        
+        def spy_open(cls, path, encoding=None):
+            opened.append(str(path))
+            return real_open(cls, path, encoding)
+        
+        monkeypatch.setattr(SourceFile, "open", classmethod(spy_open))
+        parser = detect_and_parse(sample_awr_file)
+        awr_data = parser.parse()
+        
+        assert opened == [sample_awr_file]
+        assert awr_data.os_info.db_name == "ORA12C"
+        assert len(awr_data.iostat_functions) > 0
+    
     def test_awr_full_pipeline(self, sample_awr_file):
         """
         AWR 전체 파이프라인 테스트
@@ -5,6 +5,8 @@ Requirements:
 - 전체: 폴더 일괄 분석 및 병렬 처리 테스트
 """
 
+import json
+import sys
 import pytest
 import tempfile
 import shutil
@@ -38,6 +40,17 @@ class TestBatchAnalyzer:
         """BatchAnalyzer 인스턴스 생성"""
         return BatchAnalyzer(analyzer, max_workers=2)
     
+    def test_max_workers_resolved_once(self, analyzer, temp_folder, monkeypatch):
+        """워커 수를 알 수 없어도 초기화 시 정수로 정해지는지 테스트"""
+        monkeypatch.setattr("os.cpu_count", lambda: None)
+        (Path(temp_folder) / "q.sql").write_text("SELECT 1 FROM dual")
+        
+        batch_analyzer = BatchAnalyzer(analyzer)
+        result = batch_analyzer.analyze_folder(temp_folder)
+        
+        assert batch_analyzer.max_workers == 1
+        assert result.success_count == 1
+    
     def test_find_sql_files_empty_folder(self, batch_analyzer, temp_folder):
         """빈 폴더에서 파일 검색 테스트"""
         files = batch_analyzer.find_sql_files(temp_folder)
@@ -65,6 +78,49 @@ class TestBatchAnalyzer:
         assert len(files) == 4
         assert all(f.suffix in BatchAnalyzer.SUPPORTED_EXTENSIONS for f in files)
     
+    def test_analyze_folder_non_utf8_sources(self, tmp_path):
+        """CP949/Latin-1 파일을 한 번 읽어 분석하고 원본 참조도 같은 인코딩을 사용하는지 테스트"""
+        folder = tmp_path / "src"
+        folder.mkdir()
+        (folder / "proc.sql").write_bytes(
+            "CREATE OR REPLACE PROCEDURE p IS\nBEGIN\n  -- 한글 주석\n  NULL;\nEND;\n/\n".encode("cp949")
+        )
+        (folder / "query.sql").write_bytes("SELECT 'café' FROM dual".encode("latin-1"))
+        (folder / "objects.out").write_bytes("".join(
+            f"-- Owner: HR\n-- Type: PROCEDURE\n-- Name: P{i}\n"
+            f"CREATE OR REPLACE PROCEDURE p{i} IS\nBEGIN\n  -- 한글 {i}\n  NULL;\nEND;\n/\n"
+            for i in range(2)
+        ).encode("cp949"))
+        
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "out"))
+        result = BatchAnalyzer(analyzer, max_workers=1).analyze_folder(str(folder))
+        
+        assert result.failed_files == {}
+        proc = result.results[str(folder / "proc.sql")]
+        assert proc.source_ref.encoding == "cp949"
+        assert "한글 주석" in proc.source_ref.load()
+        assert result.results[str(folder / "query.sql")].source_ref.load() == "SELECT 'café' FROM dual"
+        spool = result.results[str(folder / "objects.out")]
+        assert "한글 1" in spool["results"][1]["analysis"].source_ref.load()
+    
+    def test_find_sql_files_excludes(self, tmp_path):
+        """gitignore 형식 제외 패턴 적용 테스트"""
+        from src.utils.file_utils import IgnorePatterns
+        
+        for rel in ["a.sql", "backup/old.sql", "sub/b.pks", "sub/b_bak.pks", "awr_report.out"]:
+            path = tmp_path / "src" / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("SELECT 1 FROM dual;")
+        
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "out"))
+        batch = BatchAnalyzer(analyzer, max_workers=1,
+                              excludes=IgnorePatterns(["backup/", "*_bak.pks"]))
+        
+        files = batch.find_sql_files(str(tmp_path / "src"))
+        
+        assert [f.relative_to(tmp_path / "src").as_posix() for f in files] == ["a.sql", "sub/b.pks"]
+        assert batch.analyze_folder(str(tmp_path / "src")).total_files == 2
+    
     def test_find_sql_files_recursive(self, batch_analyzer, temp_folder):
         """하위 폴더 재귀 검색 테스트"""
         # 하위 폴더 생성
@@ -253,6 +309,1090 @@ class TestBatchAnalyzer:
         assert isinstance(result.target_database, TargetDatabase)
         assert isinstance(result.analysis_time, str)
 
+    
+    def test_analyze_folder_multi(self, batch_analyzer, temp_folder):
+        """다중 타겟 폴더 분석 결과가 타겟별 단일 분석과 같은지 테스트"""
+        (Path(temp_folder) / "query.sql").write_text(
+            "SELECT NVL(name, 'x'), ROWNUM FROM users WHERE id = 1;"
+        )
+        (Path(temp_folder) / "proc.pls").write_text(
+            "CREATE OR REPLACE PROCEDURE p IS BEGIN NULL; END;"
+        )
+        
+        results = batch_analyzer.analyze_folder_multi(temp_folder)
+        
+        assert set(results) == set(TargetDatabase)
+        for target, batch_result in results.items():
+            expected = BatchAnalyzer(
+                OracleComplexityAnalyzer(target), max_workers=2
+            ).analyze_folder(temp_folder)
+            assert batch_result.target_database == target
+            assert batch_result.total_files == expected.total_files
+            assert batch_result.success_count == expected.success_count
+            assert batch_result.average_score == pytest.approx(expected.average_score)
+            assert batch_result.complexity_distribution == expected.complexity_distribution
+    
+    def test_analyze_folder_multi_empty(self, batch_analyzer, temp_folder):
+        """빈 폴더 다중 타겟 분석 테스트"""
+        results = batch_analyzer.analyze_folder_multi(temp_folder, [TargetDatabase.MYSQL])
+        
+        assert list(results) == [TargetDatabase.MYSQL]
+        assert results[TargetDatabase.MYSQL].total_files == 0
+    
+    def test_analyze_folder_dedupe(self, temp_folder):
+        """리터럴만 다른 SQL 파일 중복 제거 분석 결과가 개별 분석과 같은지 테스트"""
+        for i in range(4):
+            (Path(temp_folder) / f"q{i}.sql").write_text(
+                f"SELECT NVL(name, 'x{i}') FROM users WHERE id IN ({i}, {i + 1}) AND ROWNUM < {i}"
+            )
+        (Path(temp_folder) / "other.sql").write_text("SELECT a FROM t WHERE b = ''")
+        
+        expected = BatchAnalyzer(OracleComplexityAnalyzer(), max_workers=2).analyze_folder(temp_folder)
+        result = BatchAnalyzer(
+            OracleComplexityAnalyzer(dedupe=True), max_workers=2
+        ).analyze_folder(temp_folder)
+        
+        assert result.results == expected.results
+        assert sorted(result.fingerprint_counts.values()) == [1, 4]
+        assert expected.fingerprint_counts == {}
+    
+    def test_analyze_folder_batch_spool_shares_pool(self, temp_folder, monkeypatch):
+        """배치 PL/SQL 파일 객체가 폴더 분석 풀 하나에서 분석되는지 테스트"""
+        import concurrent.futures
+        
+        objects = "".join(
+            "-- Owner: HR\n-- Type: PROCEDURE\n"
+            f"-- Name: P{i}\n"
+            f"CREATE OR REPLACE PROCEDURE p{i} IS\nBEGIN\n  NULL;\nEND;\n/\n"
+            for i in range(5)
+        )
+        (Path(temp_folder) / "objects.out").write_text(objects)
+        (Path(temp_folder) / "q.sql").write_text("SELECT NVL(a, 0) FROM t")
+        analyzer = OracleComplexityAnalyzer()
+        expected = analyzer.analyze_batch_plsql_file(str(Path(temp_folder) / "objects.out"))
+        
+        pools = []
+        original = concurrent.futures.ProcessPoolExecutor
+        
+        def counting_pool(*args, **kwargs):
+            pools.append(kwargs.get('max_workers'))
+            return original(*args, **kwargs)
+        
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", counting_pool)
+        result = BatchAnalyzer(analyzer, max_workers=2).analyze_folder(temp_folder)
+        
+        assert pools == [2]
+        assert result.success_count == 2
+        spool = result.results[str(Path(temp_folder) / "objects.out")]
+        assert spool['total_objects'] == 5
+        assert spool['summary'] == expected['summary']
+        assert sum(result.complexity_distribution.values()) == 6
+    
+    def test_batch_spools_are_opened_one_at_a_time(self, temp_folder, monkeypatch):
+        """검색 중 판별한 배치 PL/SQL 스풀을 열어 두지 않고 분석할 때 하나씩 여는지 테스트"""
+        objects = "".join(
+            f"-- Owner: HR\n-- Type: PROCEDURE\n-- Name: P{i}\n"
+            f"CREATE OR REPLACE PROCEDURE p{i} IS\nBEGIN\n  NULL;\nEND;\n/\n"
+            for i in range(2)
+        )
+        for i in range(4):
+            (Path(temp_folder) / f"objects{i}.out").write_text(objects)
+        (Path(temp_folder) / "q.sql").write_text("SELECT NVL(a, 0) FROM t")
+        
+        # 부모 프로세스에서 연 소스 파일 수 (워커는 fork된 별도 복사본에 기록)
+        open_sources = []
+        peak = []
+        original = OracleComplexityAnalyzer.open_source
+        
+        def tracking_open(self, file_path):
+            source = original(self, file_path)
+            close = source.close
+            
+            def tracking_close():
+                if source in open_sources:
+                    open_sources.remove(source)
+                close()
+            
+            source.close = tracking_close
+            open_sources.append(source)
+            peak.append(len(open_sources))
+            return source
+        
+        monkeypatch.setattr(OracleComplexityAnalyzer, "open_source", tracking_open)
+        result = BatchAnalyzer(OracleComplexityAnalyzer(), max_workers=2).analyze_folder(temp_folder)
+        
+        assert result.success_count == 5
+        assert max(peak) == 1
+        assert open_sources == []
+
+    def test_large_script_statements_go_to_shared_pool(self, temp_folder, monkeypatch):
+        """큰 SQL 스크립트는 부모 프로세스가 문장 청크로 나누어 공유 풀에 제출하는지 테스트"""
+        from src.oracle_complexity_analyzer import analyzer as analyzer_module
+        from src.oracle_complexity_analyzer import batch_analyzer as batch_module
+
+        monkeypatch.setattr(batch_module, "SCRIPT_STREAM_BYTES", 1)
+        monkeypatch.setattr(analyzer_module, "STATEMENT_CHUNK_SIZE", 2)
+        script = Path(temp_folder) / "script.sql"
+        script.write_text("".join(f"SELECT NVL(a, {i}) FROM t;\n" for i in range(7)))
+        (Path(temp_folder) / "q.sql").write_text("SELECT NVL(a, 0) FROM t")
+
+        # 부모 프로세스에서 제출한 청크 작업
+        submitted = []
+        original = OracleComplexityAnalyzer._iter_chunk_results
+
+        def spy(self, chunks, task, *args, **kwargs):
+            def recorded(stream):
+                for chunk in stream:
+                    submitted.append((task.__name__, len(chunk)))
+                    yield chunk
+            return original(self, recorded(chunks), task, *args, **kwargs)
+
+        monkeypatch.setattr(OracleComplexityAnalyzer, "_iter_chunk_results", spy)
+        analyzer = OracleComplexityAnalyzer()
+        result = BatchAnalyzer(analyzer, max_workers=2).analyze_folder(temp_folder)
+
+        assert submitted == [("_analyze_statement_chunk", 2)] * 3 + [("_analyze_statement_chunk", 1)]
+        script_result = result.results[str(script)]
+        expected = analyzer.analyze_file(str(script))
+        assert script_result['total_statements'] == 7
+        assert [r['analysis'].normalized_score for r in script_result['results']] == \
+            [r['analysis'].normalized_score for r in expected['results']]
+        assert script_result['results'][0]['analysis'].source_text().startswith("SELECT NVL(a, 0) FROM t")
+
+    def test_analyze_folder_many_small_files_chunked(self, temp_folder, monkeypatch):
+        """작은 파일이 많을 때 청크 단위 분석 결과가 파일별 분석과 같은지 테스트"""
+        from src.oracle_complexity_analyzer.batch_analyzer import scheduler
+        
+        monkeypatch.setattr(scheduler, "FILE_CHUNK_MAX", 3)
+        for i in range(25):
+            (Path(temp_folder) / f"q{i:02d}.sql").write_text(f"SELECT NVL(a, {i}) FROM t{i}")
+        (Path(temp_folder) / "bad.sql").write_bytes(b"\xff\xfe\x00bad")
+        analyzer = OracleComplexityAnalyzer()
+        batch = BatchAnalyzer(analyzer, max_workers=2)
+        
+        result = batch.analyze_folder(temp_folder)
+        
+        assert result.total_files == 26
+        assert result.success_count + result.failure_count == 26
+        for i in (0, 12, 24):
+            file_name = str(Path(temp_folder) / f"q{i:02d}.sql")
+            assert result.results[file_name] == batch._analyze_single_file(Path(file_name))[1]
+    
+    @pytest.mark.parametrize("max_workers", [2, None])
+    def test_chunked_dispatch_bounds_inflight(self, analyzer, max_workers, monkeypatch):
+        """청크 제출 수가 워커당 FILE_INFLIGHT_PER_WORKER배로 제한되는지 테스트 (기본 워커 수 포함)"""
+        import concurrent.futures
+        import threading
+        from src.oracle_complexity_analyzer.batch_analyzer import FILE_INFLIGHT_PER_WORKER
+        
+        monkeypatch.setattr("os.cpu_count", lambda: 3)
+        batch_analyzer = BatchAnalyzer(analyzer, max_workers=max_workers)
+        lock = threading.Lock()
+        state = {'inflight': 0, 'peak': 0}
+        
+        def task(chunk):
+            with lock:
+                state['inflight'] -= 1
+            return [(name, None, None) for name in chunk]
+        
+        class CountingExecutor(concurrent.futures.ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                with lock:
+                    state['inflight'] += 1
+                    state['peak'] = max(state['peak'], state['inflight'])
+                return super().submit(fn, *args, **kwargs)
+        
+        file_names = [f"f{i}.sql" for i in range(2000)]
+        with CountingExecutor(max_workers=2) as executor:
+            outcomes = list(batch_analyzer._iter_chunked(executor, task, file_names))
+        
+        assert sorted(name for name, _, _ in outcomes) == sorted(file_names)
+        assert batch_analyzer.max_workers == (max_workers or 3)
+        assert state['peak'] <= batch_analyzer.max_workers * FILE_INFLIGHT_PER_WORKER
+    
+    def test_chunked_dispatch_submits_late_large_file_first(self, batch_analyzer, tmp_path):
+        """검색 스트림 끝에서 발견된 큰 파일이 앞 구간의 남은 작은 청크보다 먼저 제출되는지 테스트"""
+        import concurrent.futures
+        import threading
+        
+        released = threading.Event()
+        submitted = []
+        
+        small = []
+        for i in range(60):
+            path = tmp_path / f"q{i:02d}.sql"
+            path.write_text(f"SELECT {i} FROM dual")
+            small.append(str(path))
+        big = tmp_path / "zz_big.sql"
+        big.write_text("SELECT 1 FROM dual\n" * 50000)
+        
+        def stream():
+            yield from small
+            yield str(big)
+            # 검색이 끝날 때까지 워커가 모두 바쁜 상태 유지
+            released.set()
+        
+        def task(chunk):
+            released.wait(5)
+            return [(name, None, None) for name in chunk]
+        
+        class RecordingExecutor(concurrent.futures.ThreadPoolExecutor):
+            def submit(self, fn, chunk, *args, **kwargs):
+                submitted.append((released.is_set(), chunk))
+                return super().submit(fn, chunk, *args, **kwargs)
+        
+        with RecordingExecutor(max_workers=2) as executor:
+            outcomes = list(batch_analyzer._iter_chunked(executor, task, stream()))
+        
+        assert sorted(name for name, _, _ in outcomes) == sorted(small + [str(big)])
+        # 첫 구간에서 남은 작은 청크보다 큰 파일을 먼저 제출
+        after_discovery = [chunk for done, chunk in submitted if done]
+        assert after_discovery[0] == [str(big)]
+        assert any(set(chunk) & set(small[:8]) for chunk in after_discovery[1:])
+    
+    def test_analyze_folder_records_timings(self, temp_folder):
+        """분석 캐시 사용 시 파일별 처리 시간을 기록하는지 테스트"""
+        from src.oracle_complexity_analyzer import AnalysisCache
+        from src.oracle_complexity_analyzer.batch_analyzer.scheduler import TIMINGS_FILENAME, FileTimings
+        
+        source = Path(temp_folder) / "src"
+        source.mkdir()
+        for i in range(3):
+            (source / f"q{i}.sql").write_text(f"SELECT NVL(a, {i}) FROM t")
+        cache = AnalysisCache.for_output_dir(Path(temp_folder) / "out")
+        analyzer = OracleComplexityAnalyzer(output_dir=str(Path(temp_folder) / "out"), cache=cache)
+        
+        BatchAnalyzer(analyzer, max_workers=2).analyze_folder(str(source))
+        
+        timings = FileTimings.load(Path(temp_folder) / "out" / TIMINGS_FILENAME)
+        assert sorted(timings.entries) == sorted(str(f) for f in source.glob("*.sql"))
+        recorded = str(source / "q0.sql")
+        assert timings.estimate(recorded) == timings.entries[recorded][2]
+
+
+class TestFileScheduler:
+    """파일 작업 스케줄링 테스트"""
+    
+    def test_plan_chunks_largest_first(self):
+        """큰 파일은 단독 청크로 먼저, 작은 파일은 묶어서 배치하는지 테스트"""
+        from src.oracle_complexity_analyzer.batch_analyzer.scheduler import plan_chunks
+        
+        costs = [(f"small{i}.sql", 0.01) for i in range(40)] + [("big.sql", 5.0), ("mid.sql", 1.0)]
+        
+        chunks = plan_chunks(costs, workers=2)
+        
+        assert chunks[0] == ["big.sql"]
+        assert chunks[1] == ["mid.sql"]
+        assert len(chunks) == 3
+        assert sorted(chunks[2]) == sorted(f"small{i}.sql" for i in range(40))
+        assert plan_chunks([], workers=2) == []
+    
+    def test_plan_chunks_respects_chunk_max(self, monkeypatch):
+        """작은 파일 청크가 FILE_CHUNK_MAX개를 넘지 않는지 테스트"""
+        from src.oracle_complexity_analyzer.batch_analyzer import scheduler
+        
+        monkeypatch.setattr(scheduler, "FILE_CHUNK_MAX", 4)
+        costs = [(f"f{i}.sql", 1.0) for i in range(30)]
+        
+        chunks = scheduler.plan_chunks(costs, workers=1)
+        
+        assert [len(chunk) for chunk in chunks] == [4] * 7 + [2]
+    
+    def test_timings_estimate_and_invalidation(self, tmp_path):
+        """처리 시간 기록 저장/로드 및 파일 변경 시 크기 기반 추정 테스트"""
+        import os
+        from src.oracle_complexity_analyzer.batch_analyzer.scheduler import FileTimings
+        
+        big = tmp_path / "big.sql"
+        small = tmp_path / "small.sql"
+        big.write_text("SELECT 1 FROM dual\n" * 5000)
+        small.write_text("SELECT 1 FROM dual")
+        timings_path = tmp_path / "timings.json"
+        
+        # 기록이 없으면 크기 기준
+        timings = FileTimings.load(timings_path)
+        assert timings.estimate(str(big)) > timings.estimate(str(small))
+        
+        # 기록이 있으면 이전 처리 시간 사용
+        timings.record(str(small), 3.0)
+        timings.save()
+        reloaded = FileTimings.load(timings_path)
+        assert reloaded.estimate(str(small)) == 3.0
+        
+        # 파일이 바뀌면 기록 무시
+        small.write_text("SELECT 2 FROM dual WHERE 1 = 1")
+        os.utime(small, ns=(0, 1))
+        assert FileTimings.load(timings_path).estimate(str(small)) != 3.0
+    
+    def test_iter_windows_streams(self, monkeypatch):
+        """스트림 입력은 작은 구간부터 두 배씩 나누고 리스트는 한 구간으로 반환하는지 테스트"""
+        import itertools
+        from src.oracle_complexity_analyzer.batch_analyzer import scheduler
+        
+        monkeypatch.setattr(scheduler, "FILE_STREAM_WINDOW", 32)
+        
+        # 끝나지 않는 스트림에서도 첫 구간을 바로 반환
+        windows = scheduler.iter_windows(map(str, itertools.count()), workers=2)
+        assert [len(next(windows)) for _ in range(4)] == [8, 16, 32, 32]
+        
+        files = [f"f{i}.sql" for i in range(100)]
+        assert list(scheduler.iter_windows(files, workers=2)) == [files]
+        assert list(scheduler.iter_windows(iter(files), workers=2))[-1] == files[88:]
+        assert list(scheduler.iter_windows([], workers=2)) == []
+
+
+
+class TestBatchJournal:
+    """폴더 분석 저널 및 재개 테스트"""
+    
+    @pytest.fixture
+    def source(self, tmp_path):
+        """분석 대상 폴더 (SQL 문, 여러 문장 스크립트, PL/SQL)"""
+        folder = tmp_path / "src"
+        folder.mkdir()
+        (folder / "q1.sql").write_text("SELECT NVL(a, 1) FROM t WHERE b = 1")
+        (folder / "q2.sql").write_text("SELECT NVL(a, 2) FROM t WHERE b = 2")
+        (folder / "script.sql").write_text("SELECT 1 FROM dual;\nSELECT DECODE(a, 1, 2) FROM t;\n")
+        (folder / "proc.sql").write_text(
+            "CREATE OR REPLACE PROCEDURE p IS\nBEGIN\n  UPDATE t SET a = NVL(a, 0);\nEND;\n/\n"
+        )
+        return folder
+    
+    def _spy_pending(self, monkeypatch):
+        """재개 시 새로 분석하는 파일 목록 기록"""
+        pending = []
+        original = BatchAnalyzer._iter_file_outcomes
+        
+        def spy(self, executor, sql_files, *args, **kwargs):
+            # 파일 목록은 검색 중인 스트림이므로 기록 후 리스트로 전달
+            sql_files = list(sql_files)
+            pending.extend(Path(f).name for f in sql_files)
+            return original(self, executor, sql_files, *args, **kwargs)
+        
+        monkeypatch.setattr(BatchAnalyzer, "_iter_file_outcomes", spy)
+        return pending
+    
+    def test_resume_skips_unchanged_files(self, source, tmp_path, monkeypatch):
+        """재개 시 변경되지 않은 파일은 저널 결과를 사용하는지 테스트"""
+        import os
+        
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "out"))
+        first = BatchAnalyzer(analyzer, max_workers=2, journal=True).analyze_folder(str(source))
+        
+        (source / "q2.sql").write_text("SELECT NVL(a, 22) FROM t WHERE b = 2")
+        os.utime(source / "q2.sql", ns=(0, 1))
+        pending = self._spy_pending(monkeypatch)
+        resumed = BatchAnalyzer(analyzer, max_workers=2, resume=True).analyze_folder(str(source))
+        
+        assert pending == ["q2.sql"]
+        assert resumed.success_count == first.success_count == 4
+        assert resumed.complexity_distribution == first.complexity_distribution
+        for name in ("q1.sql", "script.sql", "proc.sql"):
+            assert resumed.results[str(source / name)] == first.results[str(source / name)]
+    
+    def test_file_changed_during_analysis_is_reanalyzed(self, source, tmp_path, monkeypatch):
+        """분석 중 바뀐 파일은 읽은 시점의 크기/수정 시각으로 기록되어 재개 시 다시 분석되는지 테스트"""
+        import os
+        import src.oracle_complexity_analyzer.batch_analyzer as batch_module
+        
+        original = batch_module._analyze_file
+        
+        def edit_after_read(analyzer, file_name, targets=None):
+            outcome = original(analyzer, file_name, targets)
+            if Path(file_name).name == "q2.sql":
+                Path(file_name).write_text("SELECT NVL(a, 22) FROM t WHERE b = 2")
+                os.utime(file_name, ns=(0, 1))
+            return outcome
+        
+        monkeypatch.setattr(batch_module, "_analyze_file", edit_after_read)
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "out"))
+        BatchAnalyzer(analyzer, max_workers=2, journal=True).analyze_folder(str(source))
+        monkeypatch.undo()
+        
+        pending = self._spy_pending(monkeypatch)
+        BatchAnalyzer(analyzer, max_workers=2, resume=True).analyze_folder(str(source))
+        
+        assert pending == ["q2.sql"]
+    
+    def test_resume_multi_target_with_truncated_journal(self, source, tmp_path, monkeypatch):
+        """다중 타겟 결과 복원 및 잘린 마지막 줄 무시 테스트"""
+        from src.oracle_complexity_analyzer.batch_analyzer.journal import BatchJournal
+        
+        targets = [TargetDatabase.POSTGRESQL, TargetDatabase.MYSQL]
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "out"))
+        first = BatchAnalyzer(analyzer, max_workers=2, journal=True).analyze_folder_multi(
+            str(source), targets
+        )
+        
+        # 마지막 기록이 쓰는 도중 중단된 상태
+        journal_path = BatchJournal.for_run(tmp_path / "out", str(source), analyzer, targets).path
+        lines = journal_path.read_text(encoding="utf-8").splitlines(keepends=True)
+        journal_path.write_text("".join(lines[:-1]) + lines[-1][:20], encoding="utf-8")
+        
+        pending = self._spy_pending(monkeypatch)
+        resumed = BatchAnalyzer(analyzer, max_workers=2, resume=True).analyze_folder_multi(
+            str(source), targets
+        )
+        
+        assert len(pending) == 1
+        for target in targets:
+            assert resumed[target].results == first[target].results
+            assert resumed[target].average_score == pytest.approx(first[target].average_score)
+        
+        # 잘린 줄은 잘라낸 뒤 이어서 기록하므로 다시 분석한 파일도 다음 재개 때 복원됨
+        assert all(json.loads(line) for line in journal_path.read_text(encoding="utf-8").splitlines())
+        pending.clear()
+        BatchAnalyzer(analyzer, max_workers=2, resume=True).analyze_folder_multi(str(source), targets)
+        assert pending == []
+    
+    def test_drop_partial_line_reads_tail_blocks(self, tmp_path, monkeypatch):
+        """잘린 마지막 줄이 읽기 블록보다 길어도 마지막 줄바꿈까지 잘라내는지 테스트"""
+        from src.oracle_complexity_analyzer.batch_analyzer import journal as journal_module
+        
+        monkeypatch.setattr(journal_module, "JOURNAL_TAIL_BLOCK_BYTES", 4)
+        path = tmp_path / "journal.jsonl"
+        journal = journal_module.BatchJournal(path, {})
+        
+        path.write_bytes(b'{"a": 1}\n{"b": 2}\n{"c": 3, "d"')
+        journal._drop_partial_line()
+        assert path.read_bytes() == b'{"a": 1}\n{"b": 2}\n'
+        
+        journal._drop_partial_line()
+        assert path.read_bytes() == b'{"a": 1}\n{"b": 2}\n'
+        
+        path.write_bytes(b'{"a": 1')
+        journal._drop_partial_line()
+        assert path.read_bytes() == b''
+    
+    def test_changed_options_start_new_journal(self, source, tmp_path, monkeypatch):
+        """분석 옵션이 다르면 기존 저널을 사용하지 않는지 테스트"""
+        output_dir = str(tmp_path / "out")
+        BatchAnalyzer(OracleComplexityAnalyzer(output_dir=output_dir), max_workers=2,
+                      journal=True).analyze_folder(str(source))
+        
+        pending = self._spy_pending(monkeypatch)
+        BatchAnalyzer(OracleComplexityAnalyzer(output_dir=output_dir, target_database=TargetDatabase.MYSQL),
+                      max_workers=2, resume=True).analyze_folder(str(source))
+        
+        assert sorted(pending) == ["proc.sql", "q1.sql", "q2.sql", "script.sql"]
+    
+    def test_resume_keeps_fingerprint_counts(self, source, tmp_path):
+        """dedupe 형태별 파일 수가 재개 후에도 유지되는지 테스트"""
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "out"), dedupe=True)
+        first = BatchAnalyzer(analyzer, max_workers=2, journal=True).analyze_folder(str(source))
+        
+        resumed = BatchAnalyzer(analyzer, max_workers=2, resume=True).analyze_folder(str(source))
+        
+        assert sorted(first.fingerprint_counts.values()) == [2]
+        assert resumed.fingerprint_counts == first.fingerprint_counts
+        assert resumed.results == first.results
+
+
+class TestStreamingAggregation:
+    """결과 스트리밍 집계 및 디스크 저장(spill_results) 테스트"""
+    
+    @pytest.fixture
+    def source(self, tmp_path):
+        """분석 대상 폴더 (SQL 문, 여러 문장 스크립트, PL/SQL, 배치 PL/SQL)"""
+        folder = tmp_path / "src"
+        folder.mkdir()
+        for i in range(6):
+            (folder / f"q{i}.sql").write_text(
+                f"SELECT NVL(a, {i}) FROM t{i} " + "JOIN u ON u.id = t.id " * i
+            )
+        (folder / "script.sql").write_text("SELECT 1 FROM dual;\nSELECT DECODE(a, 1, 2) FROM t;\n")
+        (folder / "proc.sql").write_text(
+            "CREATE OR REPLACE PROCEDURE p IS\nBEGIN\n  UPDATE t SET a = NVL(a, 0);\nEND;\n/\n"
+        )
+        (folder / "objects.out").write_text("".join(
+            f"-- Owner: HR\n-- Type: PROCEDURE\n-- Name: P{i}\n"
+            f"CREATE OR REPLACE PROCEDURE p{i} IS\nBEGIN\n  NULL;\nEND;\n/\n"
+            for i in range(3)
+        ))
+        return folder
+    
+    @staticmethod
+    def _read_reports(output_dir: Path) -> dict:
+        """생성된 배치 리포트 내용 (분석 시간 제외)"""
+        import json
+        import re
+        
+        reports = {}
+        for path in sorted(output_dir.rglob("*_complexity_*")):
+            text = path.read_text(encoding="utf-8")
+            if path.suffix == ".json":
+                data = json.loads(text)
+                data["summary"].pop("analysis_time")
+                reports[path.relative_to(output_dir).as_posix()] = data
+            else:
+                reports[path.relative_to(output_dir).as_posix()] = re.sub(r"\*\*분석 시간\*\*: \S+", "", text)
+        return reports
+    
+    def test_spilled_results_match_in_memory(self, source, tmp_path):
+        """같은 분석 결과를 디스크에 저장했을 때 집계와 리포트가 메모리 결과와 같은지 테스트"""
+        from src.oracle_complexity_analyzer.batch_analyzer import StoredResults
+        
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "out_memory"))
+        memory_batch = BatchAnalyzer(analyzer, max_workers=2)
+        memory = memory_batch.analyze_folder(str(source))
+        
+        # 완료 순서가 실행마다 다르므로 같은 결과를 같은 순서로 저장소에 다시 집계
+        spill_analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "out_spill"))
+        spill_batch = BatchAnalyzer(spill_analyzer, max_workers=2, spill_results=True)
+        spill_batch.source_folder_name = spill_batch.result_aggregator.source_folder_name = source.name
+        aggregator = spill_batch._create_aggregator([spill_analyzer.target])
+        for file_name, result in memory.results.items():
+            aggregator.add(file_name, result)
+        spilled = aggregator.build(memory.total_files)[spill_analyzer.target]
+        
+        assert isinstance(spilled.results, StoredResults)
+        assert spilled.success_count == memory.success_count == 9
+        assert spilled.complexity_distribution == memory.complexity_distribution
+        assert spilled.average_score == pytest.approx(memory.average_score)
+        assert list(spilled.results.items()) == list(memory.results.items())
+        assert list(spilled.results.values()) == list(memory.results.values())
+        assert len(spilled.results.items()) == len(spilled.results.values()) == 9
+        assert spilled.results[str(source / "q3.sql")] == memory.results[str(source / "q3.sql")]
+        assert (spill_batch.get_top_complex_files(spilled, 3)
+                == memory_batch.get_top_complex_files(memory, 3))
+        
+        for batch, result in ((memory_batch, memory), (spill_batch, spilled)):
+            batch.export_batch_json(result, include_details=True)
+            batch.export_batch_markdown(result, include_details=True)
+        assert self._read_reports(tmp_path / "out_spill") == self._read_reports(tmp_path / "out_memory")
+    
+    def test_spilled_multi_target(self, source, tmp_path):
+        """다중 타겟 결과가 타겟별로 저장되는지 테스트"""
+        from src.oracle_complexity_analyzer.batch_analyzer.result_store import file_max_score
+        
+        targets = [TargetDatabase.POSTGRESQL, TargetDatabase.MYSQL]
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "out"))
+        
+        memory = BatchAnalyzer(analyzer, max_workers=2).analyze_folder_multi(str(source), targets)
+        spilled = BatchAnalyzer(analyzer, max_workers=2, spill_results=True).analyze_folder_multi(
+            str(source), targets
+        )
+        
+        for target in targets:
+            assert dict(spilled[target].results.items()) == memory[target].results
+            assert spilled[target].complexity_distribution == memory[target].complexity_distribution
+            assert ([file_max_score(r) for _, r in spilled[target].results.top_items(2)]
+                    == sorted(map(file_max_score, memory[target].results.values()), reverse=True)[:2])
+    
+    def test_store_file_removed_on_close(self, source, tmp_path):
+        """임시 결과 저장소 파일이 닫을 때 삭제되는지 테스트"""
+        from src.oracle_complexity_analyzer.batch_analyzer.result_store import STORE_PREFIX
+        
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "out"))
+        result = BatchAnalyzer(analyzer, max_workers=2, spill_results=True).analyze_folder(str(source))
+        
+        assert len(list((tmp_path / "out").glob(f"{STORE_PREFIX}*"))) == 1
+        result.results.store.close()
+        assert list((tmp_path / "out").glob(f"{STORE_PREFIX}*")) == []
+
+
+class TestShardedAnalysis:
+    """샤드 분석(--shard) 및 부분 결과 병합 테스트"""
+    
+    @pytest.fixture
+    def source(self, tmp_path):
+        """분석 대상 폴더 (SQL 문, 같은 형태의 SQL 문, 바이너리 파일, PL/SQL, 배치 PL/SQL)"""
+        folder = tmp_path / "src"
+        (folder / "sub").mkdir(parents=True)
+        for i in range(5):
+            (folder / f"q{i}.sql").write_text(
+                f"SELECT NVL(a, {i}) FROM t{i} " + "JOIN u ON u.id = t.id " * i
+            )
+        (folder / "sub" / "same1.sql").write_text("SELECT DECODE(a, 1, 2) FROM t WHERE b = 1")
+        (folder / "sub" / "same2.sql").write_text("SELECT DECODE(a, 1, 2) FROM t WHERE b = 2")
+        (folder / "broken.sql").write_bytes(b"\x00\x01\x02")
+        (folder / "proc.sql").write_text(
+            "CREATE OR REPLACE PROCEDURE p IS\nBEGIN\n  UPDATE t SET a = NVL(a, 0);\nEND;\n/\n"
+        )
+        (folder / "objects.out").write_text("".join(
+            f"-- Owner: HR\n-- Type: PROCEDURE\n-- Name: P{i}\n"
+            f"CREATE OR REPLACE PROCEDURE p{i} IS\nBEGIN\n  NULL;\nEND;\n/\n"
+            for i in range(3)
+        ))
+        return folder
+    
+    def _run_shards(self, source, output_dir, count, targets=None, **options):
+        """모든 샤드를 분석하고 부분 결과 파일 경로 반환"""
+        paths = []
+        for index in range(1, count + 1):
+            analyzer = OracleComplexityAnalyzer(output_dir=str(output_dir), **options)
+            batch = BatchAnalyzer(analyzer, max_workers=2, shard=(index, count))
+            if targets is None:
+                batch.analyze_folder(str(source))
+            else:
+                batch.analyze_folder_multi(str(source), targets)
+            paths.append(batch.partial_path)
+        return paths
+    
+    def test_shards_partition_files(self, source, tmp_path):
+        """샤드들이 전체 파일을 겹치지 않게 나누는지 테스트"""
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "out"))
+        full = BatchAnalyzer(analyzer, max_workers=2).find_sql_files(str(source))
+        
+        shards = [
+            list(BatchAnalyzer(analyzer, shard=(i, 3))._stream_sql_files(str(source)))
+            for i in range(1, 4)
+        ]
+        
+        assert sorted(f for files in shards for f in files) == sorted(full)
+        assert all(files for files in shards)
+    
+    def test_merge_matches_single_run(self, source, tmp_path):
+        """병합 결과와 리포트가 단일 노드 실행과 같은지 테스트"""
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "single"), dedupe=True)
+        single_batch = BatchAnalyzer(analyzer, max_workers=2)
+        single = single_batch.analyze_folder(str(source))
+        
+        paths = self._run_shards(source, tmp_path / "parts", 3, dedupe=True)
+        assert [p.name for p in paths] == [f"src.shard-{i}-of-3.partial.jsonl" for i in (1, 2, 3)]
+        
+        merge_batch = BatchAnalyzer(OracleComplexityAnalyzer(output_dir=str(tmp_path / "merged")))
+        merged = merge_batch.merge_partials(list(reversed(paths)))[analyzer.target]
+        
+        assert merge_batch.source_folder_name == "src"
+        assert merged.total_files == single.total_files == 10
+        assert merged.success_count == single.success_count
+        assert merged.failed_files == single.failed_files
+        assert merged.complexity_distribution == single.complexity_distribution
+        assert merged.average_score == pytest.approx(single.average_score)
+        assert merged.fingerprint_counts == single.fingerprint_counts
+        assert merged.results == single.results
+        
+        # 점수가 같은 파일의 Top N 순서는 완료 순서를 따르므로 점수/파일명 순으로 비교
+        reports = []
+        for batch, result, output_dir in ((single_batch, single, "single"), (merge_batch, merged, "merged")):
+            batch.export_batch_json(result, include_details=True)
+            report = TestStreamingAggregation._read_reports(tmp_path / output_dir)
+            for data in report.values():
+                data["top_complex_files"].sort(key=lambda item: (-item["score"], item["file"]))
+            reports.append(report)
+        assert reports[0] == reports[1]
+    
+    def test_merge_multi_target_low_memory(self, source, tmp_path):
+        """다중 타겟 부분 결과를 임시 저장소로 병합하는 테스트"""
+        targets = [TargetDatabase.POSTGRESQL, TargetDatabase.MYSQL]
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "single"))
+        single = BatchAnalyzer(analyzer, max_workers=2).analyze_folder_multi(str(source), targets)
+        
+        paths = self._run_shards(source, tmp_path / "parts", 2, targets)
+        merge_analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "merged"))
+        merged = BatchAnalyzer(merge_analyzer, spill_results=True).merge_partials(paths)
+        
+        for target in targets:
+            assert dict(merged[target].results.items()) == single[target].results
+            assert merged[target].complexity_distribution == single[target].complexity_distribution
+    
+    def test_merge_rejects_incomplete_set(self, source, tmp_path):
+        """누락/중복 샤드와 설정이 다른 부분 결과를 거부하는지 테스트"""
+        paths = self._run_shards(source, tmp_path / "parts", 2)
+        other = self._run_shards(source, tmp_path / "other", 2, target_database=TargetDatabase.MYSQL)
+        merge_batch = BatchAnalyzer(OracleComplexityAnalyzer(output_dir=str(tmp_path / "merged")))
+        
+        with pytest.raises(ValueError, match="누락"):
+            merge_batch.merge_partials(paths[:1])
+        with pytest.raises(ValueError, match="중복"):
+            merge_batch.merge_partials(paths + paths[:1])
+        with pytest.raises(ValueError, match="설정"):
+            merge_batch.merge_partials([paths[0], other[1]])
+    
+    def test_empty_shard_writes_partial(self, tmp_path):
+        """배정된 파일이 없는 샤드도 빈 부분 결과를 남기는지 테스트"""
+        folder = tmp_path / "src"
+        folder.mkdir()
+        (folder / "only.sql").write_text("SELECT 1 FROM dual")
+        
+        paths = self._run_shards(folder, tmp_path / "parts", 2)
+        merged = BatchAnalyzer(OracleComplexityAnalyzer(output_dir=str(tmp_path / "merged"))
+                               ).merge_partials(paths)[TargetDatabase.POSTGRESQL]
+        
+        assert all(path.exists() for path in paths)
+        assert merged.total_files == merged.success_count == 1
+    
+    def test_interrupted_write_removes_temp_file(self, tmp_path):
+        """기록 중 예외가 나면 부분 결과 임시 파일을 지우는지 테스트"""
+        from src.oracle_complexity_analyzer.batch_analyzer.partial import PartialResultWriter
+        
+        writer = PartialResultWriter(tmp_path / "src.shard-1-of-2.partial.jsonl", {'partial': 1})
+        writer.add("a.sql", None, "에러")
+        assert list(tmp_path.glob("*.tmp"))
+        
+        with pytest.raises(TypeError):
+            writer.add("b.sql", {'result': object()})
+        
+        assert not list(tmp_path.iterdir())
+    
+    def test_cli_shard_and_merge(self, source, tmp_path, capsys):
+        """CLI --shard 실행과 merge 명령 테스트"""
+        from src.oracle_complexity_analyzer import main
+        
+        for index in (1, 2):
+            assert main(["-d", str(source), "--shard", f"{index}/2", "--output-dir", str(tmp_path / "parts"),
+                         "--no-progress", "--no-cache", "-w", "2"]) == 0
+        partials = sorted(str(p) for p in (tmp_path / "parts").glob("*.partial.jsonl"))
+        assert len(partials) == 2
+        assert not list((tmp_path / "parts").rglob("*_complexity_*"))
+        
+        assert main(["merge", *partials, "--output-dir", str(tmp_path / "merged"), "-o", "json"]) == 0
+        assert list((tmp_path / "merged" / "src").rglob("*_complexity_*.json"))
+        assert "10개 파일 병합 완료" in capsys.readouterr().out
+        
+        assert main(["merge", partials[0], "--output-dir", str(tmp_path / "merged")]) == 1
+
+
+class TestWorkerTimeouts:
+    """파일별 분석 시간 제한(--file-timeout)과 워커 교체 테스트
+    
+    워커는 fork 방식으로 생성되므로 테스트에서 바꾼 모듈 함수가 워커에도 적용됩니다.
+    """
+    
+    @pytest.fixture
+    def source(self, tmp_path):
+        """분석 대상 폴더 (일반 SQL 문 4개와 멈추는 파일 하나)"""
+        folder = tmp_path / "src"
+        folder.mkdir()
+        for i in range(4):
+            (folder / f"q{i}.sql").write_text(f"SELECT NVL(a, {i}) FROM t{i}")
+        (folder / "stuck.sql").write_text("SELECT 1 FROM dual")
+        return folder
+    
+    def _patch_file_analysis(self, monkeypatch, name, action):
+        """name 파일 분석 시 action을 실행하도록 워커 작업 함수 교체"""
+        import src.oracle_complexity_analyzer.batch_analyzer as batch_module
+        
+        original = batch_module._analyze_file
+        
+        def patched(analyzer, file_name, targets=None):
+            if Path(file_name).name == name:
+                action()
+            return original(analyzer, file_name, targets)
+        
+        monkeypatch.setattr(batch_module, "_analyze_file", patched)
+    
+    def test_stuck_file_times_out(self, source, tmp_path, monkeypatch):
+        """제한 시간을 넘긴 파일의 워커가 종료되고 시간 초과 실패로 기록되는지 테스트"""
+        import time
+        
+        self._patch_file_analysis(monkeypatch, "stuck.sql", lambda: time.sleep(60))
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "out"))
+        batch = BatchAnalyzer(analyzer, max_workers=2, file_timeout=1)
+        
+        start = time.monotonic()
+        result = batch.analyze_folder(str(source))
+        
+        assert time.monotonic() - start < 30
+        stuck = str(source / "stuck.sql")
+        assert result.total_files == 5
+        assert result.success_count == 4
+        assert list(result.timed_out_files) == [stuck]
+        assert result.failed_files[stuck].startswith("시간 초과: ")
+        assert "(제한 1초)" in result.failed_files[stuck]
+    
+    def test_crashed_worker_is_replaced(self, source, tmp_path, monkeypatch):
+        """워커가 비정상 종료되면 나머지 파일은 다시 분석하고 반복 종료 파일만 실패하는지 테스트"""
+        import os
+        from src.oracle_complexity_analyzer.batch_analyzer.worker_pool import WORKER_CRASH_ERROR
+        
+        self._patch_file_analysis(monkeypatch, "stuck.sql", lambda: os._exit(1))
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "out"))
+        
+        result = BatchAnalyzer(analyzer, max_workers=2).analyze_folder(str(source))
+        
+        assert result.success_count == 4
+        assert result.failed_files == {str(source / "stuck.sql"): WORKER_CRASH_ERROR}
+        assert result.timed_out_files == {}
+    
+    def test_batch_object_times_out(self, tmp_path, monkeypatch):
+        """배치 PL/SQL 객체 하나가 제한 시간을 넘기면 파일이 시간 초과로 기록되고 분석이 계속되는지 테스트"""
+        import time
+        
+        folder = tmp_path / "src"
+        folder.mkdir()
+        (folder / "objects.out").write_text("".join(
+            f"-- Owner: HR\n-- Type: PROCEDURE\n-- Name: P{i}\n"
+            f"CREATE OR REPLACE PROCEDURE p{i} IS\nBEGIN\n  NULL;\nEND;\n/\n"
+            for i in range(3)
+        ))
+        (folder / "q.sql").write_text("SELECT NVL(a, 0) FROM t")
+        original = OracleComplexityAnalyzer._analyze_batch_object
+        
+        def patched(self, obj, targets):
+            if obj.object_name == "P1":
+                time.sleep(60)
+            return original(self, obj, targets)
+        
+        monkeypatch.setattr(OracleComplexityAnalyzer, "_analyze_batch_object", patched)
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "out"))
+        
+        result = BatchAnalyzer(analyzer, max_workers=2, file_timeout=1).analyze_folder(str(folder))
+        
+        assert result.success_count == 1
+        error = result.timed_out_files[str(folder / "objects.out")]
+        assert error.startswith("시간 초과: 객체 HR.P1 ")
+    
+    def test_finished_task_at_deadline_is_not_killed(self):
+        """제한 시간 직전에 끝난 작업의 종료 보고가 대기 중이면 워커를 종료하지 않는지 테스트"""
+        import queue
+        import threading
+        import time
+        from src.oracle_complexity_analyzer.batch_analyzer.worker_pool import WorkerPool
+        
+        class LateQueue:
+            """시작 보고는 바로, 종료 보고는 첫 대기 시간이 끝나는 순간 도착하는 상태 큐"""
+            
+            def __init__(self):
+                self.ready = [(1, "slow.sql")]
+                self.late = [(1, None)]
+            
+            def get(self, timeout):
+                if self.ready:
+                    return self.ready.pop(0)
+                time.sleep(timeout)
+                self.ready, self.late = self.ready + self.late, []
+                raise queue.Empty
+            
+            def get_nowait(self):
+                if self.ready:
+                    return self.ready.pop(0)
+                raise queue.Empty
+        
+        with WorkerPool(max_workers=1) as pool:
+            killed = []
+            pool.task_timeout = 0.1
+            pool._kill = lambda pid, label, elapsed: killed.append(label)
+            stop = threading.Event()
+            watchdog = threading.Thread(target=pool._watch, args=(LateQueue(), stop))
+            watchdog.start()
+            time.sleep(0.5)
+            stop.set()
+            watchdog.join()
+        
+        assert killed == []
+    
+    def test_worker_pool_is_executor(self):
+        """워커 풀이 Executor로서 map()과 컨텍스트 관리자를 지원하는지 테스트"""
+        import concurrent.futures
+        from src.oracle_complexity_analyzer.batch_analyzer.worker_pool import WorkerPool
+        
+        with WorkerPool(max_workers=1, task_timeout=30) as pool:
+            assert isinstance(pool, concurrent.futures.Executor)
+            assert list(pool.map(abs, [-1, 2])) == [1, 2]
+        
+        assert pool._watchdog is None
+    
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason="max_tasks_per_child는 Python 3.11 이상")
+    def test_max_tasks_per_child_matches_default(self, source, tmp_path):
+        """워커 교체 주기를 지정해도 분석 결과가 같은지 테스트"""
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "out"))
+        expected = BatchAnalyzer(analyzer, max_workers=2).analyze_folder(str(source))
+        
+        result = BatchAnalyzer(analyzer, max_workers=2, max_tasks_per_child=1).analyze_folder(str(source))
+        
+        assert result.results == expected.results
+        assert result.failed_files == expected.failed_files
+    
+    def test_rejects_non_positive_limits(self):
+        """시간 제한과 워커당 작업 수가 양수가 아니면 ValueError가 발생하는지 테스트"""
+        analyzer = OracleComplexityAnalyzer()
+        with pytest.raises(ValueError):
+            BatchAnalyzer(analyzer, file_timeout=0)
+        with pytest.raises(ValueError):
+            BatchAnalyzer(analyzer, max_tasks_per_child=-1)
+    
+    def test_cli_options(self):
+        """--file-timeout, --max-tasks-per-child 인자 파싱 테스트"""
+        from src.oracle_complexity_analyzer.cli import create_parser
+        
+        args = create_parser().parse_args(["-d", "src", "--file-timeout", "2.5", "--max-tasks-per-child", "100"])
+        assert args.file_timeout == 2.5
+        assert args.max_tasks_per_child == 100
+        with pytest.raises(SystemExit):
+            create_parser().parse_args(["-d", "src", "--file-timeout", "0"])
+
+
+class TestThroughputMetrics:
+    """처리량 지표(--metrics-out) 기록 테스트"""
+    
+    @pytest.fixture
+    def source(self, tmp_path):
+        """분석 대상 폴더 (SQL 문, 같은 형태의 SQL 문, 바이너리 파일, 배치 PL/SQL)"""
+        folder = tmp_path / "src"
+        folder.mkdir()
+        for i in range(3):
+            (folder / f"q{i}.sql").write_text(f"SELECT NVL(a, {i}) FROM t{i}")
+        (folder / "same1.sql").write_text("SELECT DECODE(a, 1, 2) FROM t WHERE b = 1")
+        (folder / "same2.sql").write_text("SELECT DECODE(a, 1, 2) FROM t WHERE b = 2")
+        (folder / "broken.sql").write_bytes(b"\x00\x01\x02")
+        (folder / "objects.out").write_text("".join(
+            f"-- Owner: HR\n-- Type: PROCEDURE\n-- Name: P{i}\n"
+            f"CREATE OR REPLACE PROCEDURE p{i} IS\nBEGIN\n  NULL;\nEND;\n/\n"
+            for i in range(3)
+        ))
+        return folder
+    
+    @staticmethod
+    def _read_events(path):
+        """지표 파일의 이벤트 목록"""
+        return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    
+    def test_batch_analyzer_records_files(self, source, tmp_path):
+        """파일별 이벤트와 단계별 시간, 요약이 기록되는지 테스트"""
+        from src.utils.metrics import MetricsRecorder
+        
+        path = tmp_path / "metrics.jsonl"
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "out"), dedupe=True)
+        with MetricsRecorder(path, "test") as metrics:
+            result = BatchAnalyzer(analyzer, max_workers=2, metrics=metrics).analyze_folder(str(source))
+        
+        events = self._read_events(path)
+        files = {Path(e["file"]).name: e for e in events if e["event"] == "file"}
+        assert set(files) == {"q0.sql", "q1.sql", "q2.sql", "same1.sql", "same2.sql", "broken.sql", "objects.out"}
+        assert files["q0.sql"]["ok"] and files["q0.sql"]["objects"] == 1
+        assert files["q0.sql"]["bytes"] == (source / "q0.sql").stat().st_size
+        assert {"read", "parse", "score"} <= set(files["q0.sql"]["stages"])
+        assert files["objects.out"]["objects"] == 3
+        assert files["objects.out"]["spool"] is True
+        assert sum(1 for e in files.values() if e.get("deduped")) == 1
+        
+        summary = events[-1]
+        assert summary["event"] == "summary"
+        assert summary["files"] == result.total_files == 7
+        assert summary["failed_files"] == len(result.failed_files)
+        assert summary["objects"] >= 8
+        assert summary["workers"]["count"] == 2
+        assert summary["stages"]["discovery"]["items"] == 7
+        assert summary["latency"]["count"] >= 6
+    
+    def test_cli_metrics_out(self, source, tmp_path):
+        """CLI --metrics-out 실행 시 내보내기 단계까지 기록되는지 테스트"""
+        from src.oracle_complexity_analyzer import main
+        
+        path = tmp_path / "metrics.jsonl"
+        assert main(["-d", str(source), "--output-dir", str(tmp_path / "out"), "-o", "json",
+                     "--no-progress", "--no-cache", "-w", "2", "--metrics-out", str(path)]) == 0
+        
+        events = self._read_events(path)
+        assert events[0]["event"] == "run_start"
+        assert events[0]["tool"] == "oracle-complexity-analyzer"
+        assert events[0]["config"]["workers"] == 2
+        assert any(e["event"] == "stage" and e["stage"] == "export" for e in events)
+        assert events[-1]["event"] == "summary"
+        assert events[-1]["files"] == 7
+        assert "export" in events[-1]["stages"]
+
+
+
+class TestDetectorProfile:
+    """감지기 프로파일링(--profile) 테스트"""
+    
+    @pytest.fixture
+    def source(self, tmp_path):
+        """분석 대상 폴더 (SQL 문, PL/SQL 패키지)"""
+        folder = tmp_path / "src"
+        folder.mkdir()
+        for i in range(3):
+            (folder / f"q{i}.sql").write_text(
+                f"SELECT NVL(a, {i}), DECODE(b, 1, 2) FROM t{i} CONNECT BY PRIOR id = parent_id"
+            )
+        (folder / "pkg.sql").write_text(
+            "CREATE OR REPLACE PACKAGE BODY pkg IS\n"
+            "  PROCEDURE p IS\n  BEGIN\n    EXECUTE IMMEDIATE 'SELECT 1 FROM dual';\n  END;\n"
+            "END pkg;\n/\n"
+        )
+        return folder
+    
+    def test_in_process_profile(self):
+        """블록 안의 감지기 호출만 집계되고 블록을 벗어나면 원래 메서드로 복원되는지 테스트"""
+        from src.parsers.sql_parser import SQLParser
+        from src.oracle_complexity_analyzer.detector_profile import profile_detectors, profile_input
+        
+        original = SQLParser.count_hints
+        analyzer = OracleComplexityAnalyzer()
+        
+        with profile_detectors() as profile:
+            assert SQLParser.count_hints is not original
+            with profile_input("q.sql"):
+                analyzer.analyze_sql("SELECT a FROM t1 JOIN t2 ON t1.id = t2.id")
+        analyzer.analyze_sql("SELECT a FROM t")
+        
+        assert SQLParser.count_hints is original
+        assert profile.processes == 1
+        calls, tottime, cumtime, worst, worst_input = profile.stats["SQLParser.count_hints"]
+        assert calls == 1
+        assert 0 <= tottime <= cumtime and worst > 0
+        assert worst_input == "q.sql"
+        assert "SQLComplexityCalculator._calculate_structural_complexity" in profile.stats
+        assert profile.total_seconds == pytest.approx(sum(entry[1] for entry in profile.stats.values()))
+    
+    def test_worker_stats_are_merged(self, source, tmp_path):
+        """워커 프로세스의 감지기 통계가 부모로 합쳐지는지 테스트"""
+        from src.oracle_complexity_analyzer.detector_profile import profile_detectors
+        
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "out"))
+        with profile_detectors() as profile:
+            result = BatchAnalyzer(analyzer, max_workers=2).analyze_folder(str(source))
+        
+        assert result.success_count == 4
+        assert profile.processes >= 2
+        assert profile.stats["SQLParser.count_hints"][0] >= 3
+        assert any(name.startswith("PLSQLComplexityCalculator._calculate_") for name in profile.stats)
+        worst_inputs = {entry[4] for entry in profile.stats.values()}
+        assert any(label.startswith(str(source)) for label in worst_inputs)
+    
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason="max_tasks_per_child는 Python 3.11 이상")
+    def test_spawned_worker_stats_are_merged(self, source, tmp_path):
+        """워커 재시작(spawn 방식) 시에도 통계가 합쳐지는지 테스트"""
+        from src.oracle_complexity_analyzer.detector_profile import profile_detectors
+        
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "out"))
+        with profile_detectors() as profile:
+            BatchAnalyzer(analyzer, max_workers=2, max_tasks_per_child=2).analyze_folder(str(source))
+        
+        assert profile.stats["SQLParser.count_hints"][0] >= 3
+    
+    def test_format_table_and_dump(self, tmp_path):
+        """순위표 출력과 pstats 호환 덤프 테스트"""
+        import pstats
+        from src.oracle_complexity_analyzer.detector_profile import DetectorProfile
+        
+        profile = DetectorProfile()
+        profile.merge({"SQLParser.count_joins": [4, 0.3, 0.5, 0.2, "a.sql"]})
+        profile.merge({"SQLParser.count_joins": [1, 0.1, 0.1, 0.1, "b.sql"],
+                       "SQLParser.count_hints": [2, 0.2, 0.2, 0.15, "c.sql"]})
+        
+        assert profile.processes == 2
+        assert profile.stats["SQLParser.count_joins"] == [5, pytest.approx(0.4), pytest.approx(0.6), 0.2, "a.sql"]
+        assert [name for name, _ in profile.ranked()] == ["SQLParser.count_joins", "SQLParser.count_hints"]
+        
+        table = profile.format_table(limit=1)
+        assert "SQLParser.count_joins" in table
+        assert "SQLParser.count_hints" not in table
+        assert "외 1개 감지기" in table
+        
+        path = profile.dump_stats(tmp_path / "detector.prof")
+        stats = pstats.Stats(str(path))
+        assert stats.total_calls == 7
+        assert {func[2] for func in stats.stats} == {"SQLParser.count_joins", "SQLParser.count_hints"}
+    
+    def test_cli_profile(self, source, tmp_path, capsys):
+        """CLI --profile 실행 시 순위표를 출력하고 덤프를 저장하는지 테스트"""
+        import pstats
+        from src.oracle_complexity_analyzer import main
+        
+        dump = tmp_path / "run.prof"
+        assert main(["-d", str(source), "--output-dir", str(tmp_path / "out"), "--no-progress",
+                     "-w", "2", "--profile", "--profile-out", str(dump)]) == 0
+        
+        output = capsys.readouterr().out
+        assert "감지기 프로파일" in output
+        assert "SQLParser." in output
+        stats = pstats.Stats(str(dump))
+        assert any(name == "SQLParser.count_hints" for _, _, name in stats.stats)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
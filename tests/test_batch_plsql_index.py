@@ -0,0 +1,155 @@
+"""
+Batch PL/SQL Object Index 테스트
+
+헤더 바이트 오프셋 색인, 사이드카 재사용/무효화, 객체 필터, 필터 분석을 검증합니다.
+"""
+
+import os
+
+from src.oracle_complexity_analyzer import OracleComplexityAnalyzer, TargetDatabase
+from src.oracle_complexity_analyzer.cli import create_object_filter, create_parser
+from src.parsers.batch_plsql_index import BatchPLSQLIndex, PLSQLObjectFilter
+from src.parsers.batch_plsql_parser import BatchPLSQLParser
+
+
+SEPARATOR = "-- ============================================================\n"
+
+
+def _object_block(owner: str, object_type: str, name: str) -> str:
+    """ora_plsql_full 형식의 객체 블록 생성"""
+    return (
+        SEPARATOR
+        + f"-- Owner: {owner}\n-- Type: {object_type}\n-- Name: {name}\n"
+        + SEPARATOR
+        + f"CREATE OR REPLACE {object_type} {name.lower()} IS\n"
+        + "BEGIN\n  -- 한글 주석\n  UPDATE t SET a = NVL(a, 0);\nEND;\n/\n\n"
+    )
+
+
+BATCH_CONTENT = (
+    "-- ora_plsql_full 출력\n"
+    + _object_block("HR", "PROCEDURE", "EMP_P")
+    + _object_block("HR", "FUNCTION", "EMP_F")
+    + _object_block("SCOTT", "PROCEDURE", "DEPT_P")
+    + _object_block("SCOTT", "PACKAGE BODY", "DEPT_PKG")
+)
+
+
+class TestBatchPLSQLIndex:
+    """BatchPLSQLIndex 기본 기능 테스트"""
+
+    def test_build_entries(self, tmp_path):
+        """헤더별 바이트 구간과 줄 번호 색인 테스트"""
+        spool = tmp_path / "objects.out"
+        spool.write_text(BATCH_CONTENT, encoding="utf-8")
+        data = spool.read_bytes()
+
+        index = BatchPLSQLIndex.build(spool)
+
+        assert [(e.owner, e.object_type, e.object_name) for e in index.entries] == [
+            ("HR", "PROCEDURE", "EMP_P"), ("HR", "FUNCTION", "EMP_F"),
+            ("SCOTT", "PROCEDURE", "DEPT_P"), ("SCOTT", "PACKAGE BODY", "DEPT_PKG"),
+        ]
+        assert all(data[e.start:].startswith(b"-- Owner:") for e in index.entries)
+        assert index.entries[0].end == index.entries[1].start
+        assert index.entries[-1].end == len(data)
+        expected = BatchPLSQLParser(BATCH_CONTENT).parse()
+        assert [e.line_start for e in index.entries] == [o.line_start for o in expected]
+
+    def test_iter_objects_matches_parser(self, tmp_path):
+        """색인 기반 객체 추출 결과가 전체 파싱 결과와 같은지 테스트"""
+        spool = tmp_path / "objects.out"
+        spool.write_text(BATCH_CONTENT, encoding="utf-8")
+
+        objects = list(BatchPLSQLIndex.build(spool).iter_objects())
+
+        assert objects == BatchPLSQLParser(BATCH_CONTENT).parse()
+
+    def test_filtered_objects(self, tmp_path):
+        """필터 조건에 맞는 객체 구간만 추출하는지 테스트"""
+        spool = tmp_path / "objects.out"
+        spool.write_text(BATCH_CONTENT, encoding="utf-8")
+        expected = {o.object_name: o for o in BatchPLSQLParser(BATCH_CONTENT).parse()}
+
+        objects = list(BatchPLSQLIndex.build(spool).iter_objects(
+            PLSQLObjectFilter(owners=("scott",), object_types=("PROC*",))
+        ))
+
+        assert objects == [expected["DEPT_P"]]
+
+    def test_sidecar_reused_and_invalidated(self, tmp_path):
+        """사이드카 색인 재사용 및 원본 변경 시 재생성 테스트"""
+        spool = tmp_path / "objects.out"
+        spool.write_text(BATCH_CONTENT, encoding="utf-8")
+
+        BatchPLSQLIndex.load_or_build(spool)
+
+        assert BatchPLSQLIndex.sidecar_path(spool).exists()
+        assert len(BatchPLSQLIndex.load(spool).entries) == 4
+
+        spool.write_text(BATCH_CONTENT + _object_block("HR", "TRIGGER", "EMP_T"), encoding="utf-8")
+        os.utime(spool, ns=(0, 1))
+
+        assert BatchPLSQLIndex.load(spool) is None
+        assert len(BatchPLSQLIndex.load_or_build(spool).entries) == 5
+
+    def test_empty_file(self, tmp_path):
+        """빈 파일 색인 테스트"""
+        spool = tmp_path / "empty.out"
+        spool.write_bytes(b"")
+
+        assert list(BatchPLSQLIndex.build(spool).iter_objects()) == []
+
+
+class TestPLSQLObjectFilter:
+    """PLSQLObjectFilter 테스트"""
+
+    def test_matches(self):
+        """대소문자 무시, glob 패턴, 항목 간 AND 조건 테스트"""
+        object_filter = PLSQLObjectFilter(owners=("hr", "scott"), names=("EMP_*",))
+
+        assert object_filter.matches("HR", "PROCEDURE", "EMP_P")
+        assert not object_filter.matches("HR", "PROCEDURE", "DEPT_P")
+        assert not object_filter.matches("SYS", "PROCEDURE", "EMP_P")
+        assert PLSQLObjectFilter().is_empty
+
+    def test_cli_options(self):
+        """CLI 필터 옵션 파싱 테스트"""
+        args = create_parser().parse_args([
+            "-f", "objects.out", "--owner", "HR", "--object-type", "PACKAGE BODY",
+            "--object-type", "FUNCTION",
+        ])
+
+        object_filter = create_object_filter(args)
+
+        assert object_filter.owners == ("HR",)
+        assert object_filter.object_types == ("PACKAGE BODY", "FUNCTION")
+        assert create_object_filter(create_parser().parse_args(["-f", "a.sql"])) is None
+
+
+class TestFilteredBatchAnalysis:
+    """객체 필터를 적용한 배치 분석 테스트"""
+
+    def test_analyze_selected_objects(self, tmp_path):
+        """필터에 맞는 객체만 분석하고 결과 구조를 유지하는지 테스트"""
+        spool = tmp_path / "objects.out"
+        spool.write_text(BATCH_CONTENT, encoding="utf-8")
+        analyzer = OracleComplexityAnalyzer(object_filter=PLSQLObjectFilter(owners=("HR",)))
+
+        result = analyzer.analyze_file(str(spool))
+
+        assert result['total_objects'] == 2
+        assert result['statistics'] == {"PROCEDURE": 1, "FUNCTION": 1}
+        assert [r['object_name'] for r in result['results']] == ["EMP_P", "EMP_F"]
+        full = OracleComplexityAnalyzer().analyze_file(str(spool))
+        assert result['results'] == full['results'][:2]
+
+    def test_filter_applies_to_in_memory_content(self):
+        """스트리밍하지 않는 내용 기반 분석에도 필터가 적용되는지 테스트"""
+        analyzer = OracleComplexityAnalyzer(
+            object_filter=PLSQLObjectFilter(object_types=("PACKAGE BODY",))
+        )
+
+        results = analyzer._analyze_batch_plsql_content(BATCH_CONTENT, [TargetDatabase.POSTGRESQL])
+
+        assert [r['object_name'] for r in results[TargetDatabase.POSTGRESQL]['results']] == ["DEPT_PKG"]
@@ -0,0 +1,195 @@
+"""
+Batch PL/SQL Parser 테스트
+
+헤더 기반 객체 분리, 줄 범위, 스트리밍(지연) 반환, 파일 단위 분석을 검증합니다.
+"""
+
+import dataclasses
+import weakref
+
+import pytest
+
+from src.oracle_complexity_analyzer import OracleComplexityAnalyzer, TargetDatabase
+from src.parsers.batch_plsql_parser import BatchPLSQLParser, iter_file_objects, iter_objects
+
+
+SEPARATOR = "-- ============================================================\n"
+
+
+def _object_block(owner: str, object_type: str, name: str, body: str) -> str:
+    """ora_plsql_full 형식의 객체 블록 생성"""
+    return (
+        SEPARATOR
+        + f"-- Owner: {owner}\n-- Type: {object_type}\n-- Name: {name}\n"
+        + SEPARATOR
+        + body
+    )
+
+
+BATCH_CONTENT = (
+    _object_block("HR", "PROCEDURE", "P1",
+                  "CREATE OR REPLACE PROCEDURE p1 IS\n"
+                  "BEGIN\n"
+                  "  -- 주석 줄\n"
+                  "  NULL;\n"
+                  "END;\n/\n")
+    + _object_block("HR", "FUNCTION", "F1",
+                    "CREATE OR REPLACE FUNCTION f1 RETURN NUMBER IS\n"
+                    "BEGIN\n"
+                    "  RETURN 1;\n"
+                    "END;\n/\n")
+)
+
+
+class TestBatchPLSQLParser:
+    """BatchPLSQLParser 기본 기능 테스트"""
+
+    def test_parse_objects(self):
+        """헤더 기준 객체 분리 및 주석 줄 제외 테스트"""
+        objects = BatchPLSQLParser(BATCH_CONTENT).parse()
+
+        assert [(o.owner, o.object_type, o.object_name) for o in objects] == [
+            ("HR", "PROCEDURE", "P1"), ("HR", "FUNCTION", "F1")
+        ]
+        assert "-- 주석 줄" not in objects[0].ddl_code
+        assert objects[0].ddl_code.startswith("CREATE OR REPLACE PROCEDURE p1")
+        assert objects[1].ddl_code.endswith("END;\n/")
+
+    def test_line_ranges(self):
+        """객체 줄 범위 테스트 (마지막 객체는 실제 마지막 줄에서 끝남)"""
+        objects = BatchPLSQLParser(BATCH_CONTENT).parse()
+
+        assert (objects[0].line_start, objects[0].line_end) == (2, 12)
+        assert (objects[1].line_start, objects[1].line_end) == (13, 21)
+        assert objects[1].line_end == BATCH_CONTENT.count("\n")
+        # DDL 코드 구간은 헤더와 구분선을 제외
+        assert (objects[0].code_line_start, objects[0].code_line_end) == (6, 11)
+
+    def test_parse_matches_iterator(self):
+        """parse()와 iter_objects() 결과가 같은지 테스트"""
+        parser = BatchPLSQLParser(BATCH_CONTENT)
+
+        assert parser.parse() == list(parser.iter_objects())
+        assert parser.get_statistics() == {"PROCEDURE": 1, "FUNCTION": 1}
+
+    def test_yields_before_input_is_consumed(self):
+        """다음 헤더를 읽는 즉시 앞 객체를 반환하는지 테스트"""
+        lines = BATCH_CONTENT.splitlines(keepends=True)
+        consumed = []
+
+        def source():
+            for line in lines:
+                consumed.append(line)
+                yield line
+
+        first = next(iter_objects(source()))
+
+        assert first.object_name == "P1"
+        # 두 번째 객체 헤더의 첫 줄까지만 읽음
+        assert len(consumed) < len(lines)
+
+    def test_skips_objects_without_code(self):
+        """코드가 없는 객체는 건너뛰는지 테스트"""
+        content = _object_block("HR", "PROCEDURE", "EMPTY", "\n") + BATCH_CONTENT
+
+        objects = BatchPLSQLParser(content).parse()
+
+        assert [o.object_name for o in objects] == ["P1", "F1"]
+
+
+class TestBatchPLSQLFileStreaming:
+    """파일 스트리밍 분석 테스트"""
+
+    def test_iter_file_objects(self, tmp_path):
+        """파일에서 객체를 스트리밍으로 읽는지 테스트"""
+        batch_file = tmp_path / "objects.out"
+        batch_file.write_text(BATCH_CONTENT, encoding="utf-8")
+
+        objects = list(iter_file_objects(str(batch_file)))
+
+        assert objects == BatchPLSQLParser(BATCH_CONTENT).parse()
+
+    def test_streaming_analysis_matches_content_analysis(self, tmp_path):
+        """파일 스트리밍 분석과 내용 기반 분석 결과가 같은지 테스트"""
+        batch_file = tmp_path / "objects.out"
+        batch_file.write_text(BATCH_CONTENT, encoding="utf-8")
+        analyzer = OracleComplexityAnalyzer()
+        targets = [TargetDatabase.POSTGRESQL]
+
+        streamed = analyzer.analyze_batch_plsql_file_multi(str(batch_file), targets)
+        in_memory = analyzer._analyze_batch_plsql_content(BATCH_CONTENT, targets)
+
+        # 파일 분석 결과는 객체 코드 대신 DDL 코드 구간의 원본 참조만 담음 (주석 줄 포함)
+        loaded = []
+        for entry, expected in zip(streamed[TargetDatabase.POSTGRESQL]['results'],
+                                   in_memory[TargetDatabase.POSTGRESQL]['results']):
+            analysis = entry['analysis']
+            assert analysis.code == ""
+            loaded.append(analysis.source_text())
+            entry['analysis'] = dataclasses.replace(analysis, code=expected['analysis'].code,
+                                                    source_ref=None)
+        assert streamed == in_memory
+        assert loaded[0] == "CREATE OR REPLACE PROCEDURE p1 IS\nBEGIN\n  -- 주석 줄\n  NULL;\nEND;\n/"
+        assert loaded[1] == in_memory[TargetDatabase.POSTGRESQL]['results'][1]['analysis'].code
+        assert streamed[TargetDatabase.POSTGRESQL]['total_objects'] == 2
+        assert streamed[TargetDatabase.POSTGRESQL]['statistics'] == {"PROCEDURE": 1, "FUNCTION": 1}
+
+    def test_parallel_matches_sequential(self, tmp_path, monkeypatch):
+        """객체 청크 병렬 분석 결과가 순차 분석과 같은지 테스트"""
+        monkeypatch.setattr("src.oracle_complexity_analyzer.analyzer.BATCH_OBJECT_CHUNK_SIZE", 3)
+        content = "".join(
+            _object_block("HR", "PROCEDURE", f"P{i}",
+                          f"CREATE OR REPLACE PROCEDURE p{i} IS\n"
+                          f"BEGIN\n  UPDATE t SET a = NVL(a, {i});\nEND;\n/\n")
+            for i in range(10)
+        )
+        batch_file = tmp_path / "objects.out"
+        batch_file.write_text(content, encoding="utf-8")
+        analyzer = OracleComplexityAnalyzer()
+
+        sequential = analyzer.analyze_batch_plsql_file_multi(str(batch_file))
+        parallel = analyzer.analyze_batch_plsql_file_multi(str(batch_file), max_workers=2)
+
+        assert parallel == sequential
+        assert [r['object_name'] for r in parallel[TargetDatabase.MYSQL]['results']] == [
+            f"P{i}" for i in range(10)
+        ]
+
+    def test_analyzed_objects_are_released(self):
+        """분석이 끝난 객체를 결과에 더한 뒤 바로 버리는지 테스트"""
+        alive = []
+        peak = []
+
+        def objects():
+            for obj in BatchPLSQLParser(BATCH_CONTENT * 3).iter_objects():
+                peak.append(sum(ref() is not None for ref in alive))
+                alive.append(weakref.ref(obj))
+                yield obj
+
+        results = OracleComplexityAnalyzer()._analyze_plsql_objects(
+            objects(), [TargetDatabase.POSTGRESQL]
+        )
+
+        assert results[TargetDatabase.POSTGRESQL]['analyzed_objects'] == 6
+        # 다음 객체를 읽을 때 살아 있는 객체는 직전 객체 하나뿐
+        assert max(peak) <= 1
+
+    def test_chunks_balanced_by_size(self, monkeypatch):
+        """객체 청크가 소스 크기 기준으로 묶이는지 테스트"""
+        from src.oracle_complexity_analyzer import analyzer as analyzer_module
+
+        monkeypatch.setattr(analyzer_module, "BATCH_OBJECT_CHUNK_CHARS", 100)
+        objects = BatchPLSQLParser(
+            _object_block("HR", "PROCEDURE", "BIG", "BEGIN NULL; END;\n" + "x" * 200 + "\n")
+            + BATCH_CONTENT
+        ).parse()
+
+        chunks = list(analyzer_module._chunk_objects(objects))
+
+        # 큰 객체는 단독 청크, 나머지는 크기 한도까지 함께 묶음
+        assert [[o.object_name for o in chunk] for chunk in chunks] == [["BIG"], ["P1", "F1"]]
+
+    def test_missing_file(self, tmp_path):
+        """존재하지 않는 파일 처리 테스트"""
+        with pytest.raises(FileNotFoundError):
+            OracleComplexityAnalyzer().analyze_batch_plsql_file_multi(str(tmp_path / "missing.out"))
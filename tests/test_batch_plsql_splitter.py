@@ -0,0 +1,129 @@
+"""
+Batch PL/SQL Splitter 테스트
+
+기존 split()과 스트리밍 분리(split_streaming)의 출력 일치, 메모리 내 파일명 충돌 해결,
+아카이브 출력을 검증합니다.
+"""
+
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from src.parsers.batch_plsql_splitter import BatchPLSQLSplitter
+
+
+def _object_block(owner: str, object_type: str, name: str) -> str:
+    """ora_plsql_full 형식의 객체 블록 생성"""
+    return (
+        f"-- Owner: {owner}\n-- Type: {object_type}\n-- Name: {name}\n"
+        f"CREATE OR REPLACE {object_type} {name.lower()} IS\nBEGIN\n  NULL;\nEND;\n/\n"
+    )
+
+
+BATCH_CONTENT = (
+    _object_block("HR", "PROCEDURE", "DUP")
+    + _object_block("HR", "PROCEDURE", "DUP")
+    + _object_block("HR", "PROCEDURE", "DUP_1")
+    + _object_block("HR", "PROCEDURE", "DUP")
+    + _object_block("SCOTT", "FUNCTION", "F$1")
+    + _object_block("SCOTT", "PACKAGE BODY", "PKG")
+)
+
+
+def _read_tree(root: Path) -> dict:
+    """디렉토리 아래 파일 내용 (상대 경로: 내용)"""
+    return {
+        path.relative_to(root).as_posix(): path.read_text(encoding="utf-8")
+        for path in root.rglob("*") if path.is_file()
+    }
+
+
+@pytest.fixture
+def spool(tmp_path):
+    """배치 PL/SQL 입력 파일"""
+    input_file = tmp_path / "objects.out"
+    input_file.write_text(BATCH_CONTENT, encoding="utf-8")
+    return input_file
+
+
+class TestBatchPLSQLSplitterStreaming:
+    """split_streaming 테스트"""
+
+    def test_matches_legacy_split(self, spool, tmp_path):
+        """스트리밍 분리 결과가 기존 split()과 같은지 테스트 (충돌 파일명 포함)"""
+        legacy = BatchPLSQLSplitter(str(spool), str(tmp_path / "legacy"))
+        legacy.parse()
+        legacy_stats = legacy.split()
+
+        streaming = BatchPLSQLSplitter(str(spool), str(tmp_path / "streaming"))
+        stats = streaming.split_streaming(max_workers=4)
+
+        assert stats == legacy_stats
+        assert _read_tree(tmp_path / "streaming") == _read_tree(tmp_path / "legacy")
+        assert sorted(_read_tree(tmp_path / "streaming")) == [
+            "FUNCTION/scott_f_1.sql",
+            "PACKAGE BODY/scott_pkg.sql",
+            "PROCEDURE/hr_dup.sql",
+            "PROCEDURE/hr_dup_1.sql",
+            "PROCEDURE/hr_dup_1_1.sql",
+            "PROCEDURE/hr_dup_2.sql",
+        ]
+        assert streaming.get_statistics() == legacy.get_statistics()
+
+    def test_existing_files_are_kept(self, spool, tmp_path):
+        """출력 디렉토리에 이미 있는 파일명을 피하는지 테스트"""
+        output_dir = tmp_path / "out"
+        (output_dir / "PROCEDURE").mkdir(parents=True)
+        (output_dir / "PROCEDURE" / "hr_dup.sql").write_text("keep", encoding="utf-8")
+
+        BatchPLSQLSplitter(str(spool), str(output_dir)).split_streaming()
+
+        assert (output_dir / "PROCEDURE" / "hr_dup.sql").read_text(encoding="utf-8") == "keep"
+        assert (output_dir / "PROCEDURE" / "hr_dup_3.sql").exists()
+
+    def test_failed_writes_are_not_counted(self, spool, tmp_path, monkeypatch):
+        """쓰기에 실패한 객체는 반환 통계와 get_statistics() 모두에서 빠지는지 테스트"""
+        write_file = BatchPLSQLSplitter._write_file
+
+        def failing_write(output_file, text):
+            if output_file.parent.name == "FUNCTION":
+                raise OSError("disk full")
+            write_file(output_file, text)
+
+        monkeypatch.setattr(BatchPLSQLSplitter, "_write_file", staticmethod(failing_write))
+        splitter = BatchPLSQLSplitter(str(spool), str(tmp_path / "out"))
+
+        stats = splitter.split_streaming(max_workers=2)
+
+        assert stats == {"PROCEDURE": 4, "PACKAGE BODY": 1}
+        assert splitter.get_statistics() == {"PROCEDURE": {"HR": 4}, "PACKAGE BODY": {"SCOTT": 1}}
+
+    @pytest.mark.parametrize("archive", ["zip", "tar", "tar.gz"])
+    def test_archive_output(self, spool, tmp_path, archive):
+        """아카이브 출력 내용이 개별 파일 출력과 같은지 테스트"""
+        BatchPLSQLSplitter(str(spool), str(tmp_path / "files")).split_streaming()
+        splitter = BatchPLSQLSplitter(str(spool), str(tmp_path / "archived"))
+
+        stats = splitter.split_streaming(archive=archive)
+
+        assert splitter.archive_file == tmp_path / f"archived.{archive}"
+        if archive == "zip":
+            with zipfile.ZipFile(splitter.archive_file) as zf:
+                members = {name: zf.read(name).decode("utf-8") for name in zf.namelist()}
+        else:
+            with tarfile.open(splitter.archive_file) as tf:
+                members = {m.name: tf.extractfile(m).read().decode("utf-8") for m in tf.getmembers()}
+        assert members == _read_tree(tmp_path / "files")
+        assert sum(stats.values()) == 6
+
+    def test_invalid_archive_format(self, spool, tmp_path):
+        """지원하지 않는 아카이브 형식 처리 테스트"""
+        with pytest.raises(ValueError):
+            BatchPLSQLSplitter(str(spool), str(tmp_path / "out")).split_streaming(archive="rar")
+
+    def test_missing_input(self, tmp_path):
+        """존재하지 않는 입력 파일 처리 테스트"""
+        with pytest.raises(FileNotFoundError):
+            BatchPLSQLSplitter(str(tmp_path / "missing.out")).split_streaming()
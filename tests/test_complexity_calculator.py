@@ -160,6 +160,21 @@ class TestSQLComplexityCalculation:
         assert result.oracle_specific_features > 0
 
 
+    def test_calculate_with_shared_feature_vector(self):
+        """하나의 지표 벡터로 여러 타겟 점수 계산 시 개별 계산과 동일"""
+        query = "SELECT NVL(a, 0), DECODE(b, 1, 'x') FROM t1, t2 WHERE ROWNUM <= 5"
+        parser = SQLParser(query)
+        features = parser.extract_features()
+        
+        for target in (TargetDatabase.POSTGRESQL, TargetDatabase.MYSQL):
+            calc = ComplexityCalculator(target)
+            shared = calc.calculate_sql_complexity(parser, features)
+            fresh = calc.calculate_sql_complexity(SQLParser(query))
+            
+            assert shared.total_score == fresh.total_score
+            assert shared.detected_oracle_functions == fresh.detected_oracle_functions
+
+
 class TestPLSQLComplexityCalculation:
     """PL/SQL 복잡도 계산 테스트"""
     
@@ -249,7 +264,7 @@ class TestStructuralComplexity:
         parser = SQLParser(query)
         calc = ComplexityCalculator(TargetDatabase.POSTGRESQL)
         
-        score = calc._calculate_structural_complexity(parser)
+        score = calc._calculate_structural_complexity(parser.extract_features())
         assert score >= 0
     
     def test_structural_complexity_with_cte(self):
@@ -263,7 +278,7 @@ class TestStructuralComplexity:
         parser = SQLParser(query)
         calc = ComplexityCalculator(TargetDatabase.POSTGRESQL)
         
-        score = calc._calculate_structural_complexity(parser)
+        score = calc._calculate_structural_complexity(parser.extract_features())
         assert score > 0
 
 
@@ -315,7 +330,7 @@ class TestConversionDifficulty:
         parser = SQLParser(query)
         calc = ComplexityCalculator(TargetDatabase.POSTGRESQL)
         
-        score = calc._calculate_conversion_difficulty(parser)
+        score = calc._calculate_conversion_difficulty(parser.extract_features())
         assert score == 0.0
     
     def test_conversion_difficulty_few_hints(self):
@@ -324,7 +339,7 @@ class TestConversionDifficulty:
         parser = SQLParser(query)
         calc = ComplexityCalculator(TargetDatabase.POSTGRESQL)
         
-        score = calc._calculate_conversion_difficulty(parser)
+        score = calc._calculate_conversion_difficulty(parser.extract_features())
         assert score == 1.0  # 기존 0.5 → 1.0 (SQL_COMPLEXITY_SCORE_IMPROVEMENT.md 반영)
     
     def test_conversion_difficulty_many_hints(self):
@@ -337,7 +352,7 @@ class TestConversionDifficulty:
         parser = SQLParser(query)
         calc = ComplexityCalculator(TargetDatabase.POSTGRESQL)
         
-        score = calc._calculate_conversion_difficulty(parser)
+        score = calc._calculate_conversion_difficulty(parser.extract_features())
         assert score == 2.0  # 기존 1.5 → 2.0 (SQL_COMPLEXITY_SCORE_IMPROVEMENT.md 반영)
     
     def test_conversion_difficulty_with_oracle_features(self):
@@ -346,7 +361,7 @@ class TestConversionDifficulty:
         parser = SQLParser(query)
         calc = ComplexityCalculator(TargetDatabase.POSTGRESQL)
         
-        score = calc._calculate_conversion_difficulty(parser)
+        score = calc._calculate_conversion_difficulty(parser.extract_features())
         # ROWNUM = 0.2점 (기존 0.3 → 0.2, 단순 패턴)
         assert score == 0.2
     
@@ -360,7 +375,7 @@ class TestConversionDifficulty:
         parser = SQLParser(query)
         calc = ComplexityCalculator(TargetDatabase.POSTGRESQL)
         
-        score = calc._calculate_conversion_difficulty(parser)
+        score = calc._calculate_conversion_difficulty(parser.extract_features())
         # CONNECT BY = 1.0, START WITH = 0.5, PRIOR = 0.3 = 1.8점
         assert score >= 1.5
     
@@ -374,7 +389,7 @@ class TestConversionDifficulty:
         parser = SQLParser(query)
         calc = ComplexityCalculator(TargetDatabase.POSTGRESQL)
         
-        score = calc._calculate_conversion_difficulty(parser)
+        score = calc._calculate_conversion_difficulty(parser.extract_features())
         # MODEL = 1.0점
         assert score >= 1.0
 
@@ -422,7 +437,7 @@ class TestOracleFunctionScoreProperty:
         expected_score = len(detected_functions) * 0.5
         
         # 함수/표현식 점수 계산 (Oracle 함수 포함)
-        actual_score = calc._calculate_oracle_function_score(parser)
+        actual_score = calc._calculate_oracle_function_score(parser.extract_features())
         
         # 검증: 각 Oracle 함수당 최소 0.5점 (다른 함수 점수도 포함될 수 있음)
         assert actual_score >= expected_score, \
@@ -469,7 +484,7 @@ class TestOracleFunctionScoreProperty:
         expected_total = base_score + expected_penalty
         
         # 실제 점수 계산
-        actual_score = calc._calculate_oracle_function_score(parser)
+        actual_score = calc._calculate_oracle_function_score(parser.extract_features())
         
         # 검증
         assert actual_score >= base_score, \
@@ -546,7 +561,7 @@ class TestFunctionsExpressionsScoreProperty:
         expected_score = min(expected_score, 2.5)
         
         # 실제 점수 계산
-        actual_score = calc._calculate_functions_score(parser)
+        actual_score = calc._calculate_functions_score(parser.extract_features())
         
         # 검증: 최대 2.5점
         assert actual_score <= 2.5, \
@@ -575,7 +590,7 @@ class TestFunctionsExpressionsScoreProperty:
         calc = ComplexityCalculator(TargetDatabase.MYSQL)
         
         # 실제 점수 계산
-        actual_score = calc._calculate_functions_score(parser)
+        actual_score = calc._calculate_functions_score(parser.extract_features())
         
         # 검증
         if not has_where:
@@ -742,7 +757,7 @@ class TestExecutionComplexityScoreProperty:
         calc = ComplexityCalculator(TargetDatabase.POSTGRESQL)
         
         # 실제 점수 계산
-        actual_score = calc._calculate_execution_complexity(parser)
+        actual_score = calc._calculate_execution_complexity(parser.extract_features())
         
         # 검증: 최대 1.0점 (PostgreSQL)
         assert actual_score <= 1.0, \
@@ -817,7 +832,7 @@ class TestExecutionComplexityScoreProperty:
             expected_score += 0.3
         
         # 실제 점수 계산
-        actual_score = calc._calculate_execution_complexity(parser)
+        actual_score = calc._calculate_execution_complexity(parser.extract_features())
         
         # 검증: 최대 2.5점 (MySQL)
         assert actual_score <= 2.5, \
@@ -854,8 +869,8 @@ class TestExecutionComplexityScoreProperty:
         calc_pg = ComplexityCalculator(TargetDatabase.POSTGRESQL)
         calc_mysql = ComplexityCalculator(TargetDatabase.MYSQL)
         
-        score_pg = calc_pg._calculate_execution_complexity(parser)
-        score_mysql = calc_mysql._calculate_execution_complexity(parser)
+        score_pg = calc_pg._calculate_execution_complexity(parser.extract_features())
+        score_mysql = calc_mysql._calculate_execution_complexity(parser.extract_features())
         
         # MySQL 점수가 PostgreSQL 점수보다 높거나 같아야 함
         assert score_mysql >= score_pg, \
@@ -907,7 +922,7 @@ class TestHintScoreProperty:
             expected_score = 2.0   # 기존 1.5 → 2.0
         
         # 실제 점수 계산
-        actual_score = calc._calculate_conversion_difficulty(parser)
+        actual_score = calc._calculate_conversion_difficulty(parser.extract_features())
         
         # 검증
         assert actual_score == expected_score, \
@@ -947,7 +962,7 @@ class TestHintScoreProperty:
         calc = ComplexityCalculator(TargetDatabase.POSTGRESQL)
         
         # 실제 점수 계산
-        actual_score = calc._calculate_conversion_difficulty(parser)
+        actual_score = calc._calculate_conversion_difficulty(parser.extract_features())
         
         # 검증
         assert actual_score == expected_score, \
@@ -976,7 +991,7 @@ class TestHintScoreProperty:
         calc = ComplexityCalculator(TargetDatabase.POSTGRESQL)
         
         # 실제 점수 계산
-        actual_score = calc._calculate_conversion_difficulty(parser)
+        actual_score = calc._calculate_conversion_difficulty(parser.extract_features())
         
         # 검증: 최대 2.0점 (기존 1.5 → 2.0)
         assert actual_score <= 2.0, \
@@ -391,6 +391,48 @@ INST_ID SGA_SIZE SGA_SIZE_FACTOR ESTD_DB_TIME ESTD_DB_TIME_FACTOR ESTD_PHYSICAL_
         # 추세 분석 결과가 None이어야 함 (파일이 2개 미만)
         assert result.trend_analysis is None
 
+    def test_shard_and_merge_matches_single_run(self, temp_dir, sample_statspack_content):
+        """샤드별 부분 결과를 병합한 결과가 단일 실행과 같은지 테스트"""
+        from src.dbcsi.batch_analyzer import partial_result_path, write_partial_result
+        from src.dbcsi.formatters import StatspackResultFormatter
+        
+        for i in range(5):
+            (Path(temp_dir) / f"statspack{i}.out").write_text(sample_statspack_content * (i + 1))
+        (Path(temp_dir) / "broken.out").write_text("invalid content")
+        single = BatchAnalyzer(temp_dir).analyze_batch(analyze_migration=True, analyze_trends=True)
+        
+        output = Path(temp_dir) / "reports" / "batch_summary.md"
+        paths = []
+        for index in (1, 2, 3):
+            shard_result = BatchAnalyzer(temp_dir, shard=(index, 3)).analyze_batch(analyze_migration=True)
+            paths.append(write_partial_result(
+                partial_result_path(output, (index, 3)), shard_result, temp_dir, (index, 3),
+                options={"analyze_migration": True}
+            ))
+        merged = BatchAnalyzer.merge_partials(paths, analyze_trends=True)
+        
+        assert paths[0].name == "batch_summary.shard-1-of-3.partial.json"
+        assert (merged.total_files, merged.successful_files, merged.failed_files) == \
+            (single.total_files, single.successful_files, single.failed_files) == (6, 5, 1)
+        assert merged.file_results == single.file_results
+        assert merged.trend_analysis == single.trend_analysis
+        merged.analysis_timestamp = single.analysis_timestamp
+        assert (StatspackResultFormatter.batch_to_markdown(merged)
+                == StatspackResultFormatter.batch_to_markdown(single))
+    
+    def test_merge_rejects_missing_shard(self, temp_dir, sample_statspack_content):
+        """누락된 샤드가 있으면 병합하지 않는지 테스트"""
+        from src.dbcsi.batch_analyzer import partial_result_path, write_partial_result
+        
+        (Path(temp_dir) / "statspack1.out").write_text(sample_statspack_content)
+        result = BatchAnalyzer(temp_dir, shard=(1, 2)).analyze_batch()
+        path = write_partial_result(
+            partial_result_path(Path(temp_dir) / "batch_summary.md", (1, 2)), result, temp_dir, (1, 2)
+        )
+        
+        with pytest.raises(ValueError, match="누락"):
+            BatchAnalyzer.merge_partials([path])
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -340,6 +340,46 @@ class TestProcessDirectory:
         
         # 빈 디렉토리는 성공으로 처리
         assert exit_code == 0
+    
+    def test_process_directory_metrics_out(self, tmp_path):
+        """디렉토리 처리 시 처리량 지표(--metrics-out) 기록 테스트"""
+        import json
+        import shutil
+        
+        sample_file = "sample_code/dbcsi_awr/dbcsi_statspack_sample01.out"
+        if not os.path.exists(sample_file):
+            pytest.skip("샘플 파일이 없습니다")
+        
+        shutil.copy(sample_file, tmp_path / "test.out")
+        (tmp_path / "broken.out").write_text("not a report")
+        metrics_file = tmp_path / "metrics" / "run.jsonl"
+        
+        parser = create_parser()
+        args = parser.parse_args(['--directory', str(tmp_path), '--output', str(tmp_path / "batch_summary.md"),
+                                  '--metrics-out', str(metrics_file)])
+        
+        # 실패한 파일이 있으면 종료 코드 1
+        assert process_directory(args) == 1
+        
+        events = [json.loads(line) for line in metrics_file.read_text(encoding="utf-8").splitlines()]
+        assert events[0]["event"] == "run_start"
+        assert events[0]["tool"] == "dbcsi-analyzer"
+        files = {Path(e["file"]).name: e for e in events if e["event"] == "file"}
+        assert files["test.out"]["ok"] is True
+        assert files["test.out"]["objects"] == 1
+        assert "parse" in files["test.out"]["stages"]
+        assert files["broken.out"]["ok"] is False
+        assert events[-1]["event"] == "summary"
+        assert events[-1]["files"] == 2
+        assert {"discovery", "parse", "export"} <= set(events[-1]["stages"])
+    
+    def test_metrics_out_requires_directory(self, tmp_path):
+        """--metrics-out은 --directory와 함께 사용해야 하는지 테스트"""
+        parser = create_parser()
+        args = parser.parse_args(['--file', str(tmp_path / "a.out"), '--metrics-out', str(tmp_path / "m.jsonl")])
+        
+        with pytest.raises(SystemExit):
+            validate_args(args)
 
 
 class TestMainFunction:
@@ -387,6 +427,44 @@ class TestMainFunction:
         
         assert exc_info.value.code == 1
 
+    def test_main_shard_and_merge(self, tmp_path):
+        """--shard 실행 후 merge 명령으로 단일 실행과 같은 리포트 생성"""
+        import json
+        import shutil
+        
+        sample_dir = Path("sample_code/dbcsi_awr")
+        if not sample_dir.exists():
+            pytest.skip("샘플 파일이 없습니다")
+        source = tmp_path / "awr"
+        shutil.copytree(sample_dir, source)
+        (tmp_path / "parts").mkdir()
+        
+        with patch('sys.stdout', new=StringIO()):
+            assert main(['-d', str(source), '--analyze-migration', '--format', 'json',
+                         '--output', str(tmp_path / "single.json")]) == 0
+            for index in (1, 2):
+                assert main(['-d', str(source), '--analyze-migration', '--shard', f'{index}/2',
+                             '--output', str(tmp_path / "parts" / "batch_summary.md")]) == 0
+            partials = sorted(str(p) for p in (tmp_path / "parts").glob("*.partial.json"))
+            assert len(partials) == 2
+            assert main(['merge', *partials, '--format', 'json']) == 0
+        
+        single = json.loads((tmp_path / "single.json").read_text(encoding="utf-8"))
+        merged = json.loads((tmp_path / "parts" / "batch_summary.json").read_text(encoding="utf-8"))
+        single.pop("analysis_timestamp")
+        merged.pop("analysis_timestamp")
+        assert merged == single
+    
+    def test_shard_requires_directory(self, tmp_path):
+        """--shard는 --directory 없이 사용할 수 없음"""
+        sample_file = tmp_path / "test.out"
+        sample_file.write_text("dummy")
+        
+        with pytest.raises(SystemExit) as exc_info:
+            main(['--file', str(sample_file), '--shard', '1/2'])
+        
+        assert exc_info.value.code == 1
+
 
 class TestCLIOptionCombinations:
     """CLI 옵션 조합 테스트"""
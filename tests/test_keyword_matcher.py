@@ -0,0 +1,88 @@
+"""
+KeywordMatcher 테스트
+
+사전 컴파일된 다중 키워드 매처가 키워드별 개별 정규식과 같은 결과를
+반환하는지 검증합니다.
+"""
+
+import re
+
+from hypothesis import given, settings, strategies as st
+
+from src.oracle_complexity_analyzer import (
+    ORACLE_SPECIFIC_SYNTAX,
+    ORACLE_SPECIFIC_FUNCTIONS,
+    ANALYTIC_FUNCTIONS,
+    AGGREGATE_FUNCTIONS,
+    ORACLE_HINTS,
+    ORACLE_SYNTAX_MATCHER,
+    ORACLE_FUNCTION_MATCHER,
+    ANALYTIC_FUNCTION_MATCHER,
+    AGGREGATE_FUNCTION_MATCHER,
+    ORACLE_HINT_MATCHER,
+)
+from src.oracle_complexity_analyzer.keyword_matcher import KeywordMatcher
+
+
+def _syntax_regex(feature: str) -> str:
+    """기존 detect_oracle_features의 개별 패턴"""
+    escaped = re.escape(feature)
+    if feature.isalnum() or ' ' in feature:
+        return r'\b' + escaped + r'\b'
+    return escaped
+
+
+# 키워드와 구분자를 섞어 만든 SQL 유사 텍스트
+_fragments = st.sampled_from(
+    list(ORACLE_SPECIFIC_SYNTAX) + list(ORACLE_SPECIFIC_FUNCTIONS) + ANALYTIC_FUNCTIONS
+    + AGGREGATE_FUNCTIONS + ORACLE_HINTS
+    + [' ', '(', ')', '( ', ') OVER (', ' OVER (', ',', 'X', '_', 'A.', "'", '1']
+)
+_texts = st.lists(_fragments, max_size=30).map(''.join)
+
+
+class TestKeywordMatcher:
+    """KeywordMatcher 기본 기능 테스트"""
+    
+    def test_hits_with_positions(self):
+        """매칭 위치 반환 테스트"""
+        matcher = KeywordMatcher(['NVL', 'NVL2'], suffix=r'\s*\(')
+        
+        hits = matcher.find_all("SELECT NVL(a, 0), NVL2(b, 1, 2) FROM t")
+        
+        assert [(h.keyword, h.start) for h in hits] == [('NVL', 7), ('NVL2', 18)]
+        
+    def test_prefix_keywords_at_same_position(self):
+        """같은 위치에서 시작하는 접두어 키워드도 모두 반환"""
+        matcher = KeywordMatcher(['SAMPLE', 'SAMPLE BLOCK'])
+        
+        assert matcher.detect("FROM T SAMPLE BLOCK (10)") == ['SAMPLE', 'SAMPLE BLOCK']
+        
+    def test_count_per_keyword(self):
+        """키워드별 개수 테스트"""
+        counts = AGGREGATE_FUNCTION_MATCHER.count("SELECT COUNT(*), SUM(A), COUNT(B) FROM T")
+        
+        assert counts == {'COUNT': 2, 'SUM': 1}
+        
+    @settings(max_examples=200, deadline=None)
+    @given(text=_texts)
+    def test_property_matches_individual_patterns(self, text):
+        """매처 결과가 키워드별 개별 정규식 결과와 동일"""
+        expected_features = [f for f in ORACLE_SPECIFIC_SYNTAX if re.search(_syntax_regex(f), text)]
+        expected_functions = [
+            f for f in ORACLE_SPECIFIC_FUNCTIONS if re.search(r'\b' + re.escape(f) + r'\s*\(', text)
+        ]
+        expected_hints = [h for h in ORACLE_HINTS if re.search(r'\b' + re.escape(h) + r'\b', text)]
+        expected_analytic = sum(
+            len(re.findall(r'\b' + re.escape(f) + r'\s*\([^)]*\)\s+OVER\s*\(', text))
+            for f in ANALYTIC_FUNCTIONS
+        )
+        expected_aggregate = sum(
+            len(re.findall(r'\b' + re.escape(f) + r'\s*\(', text)) for f in AGGREGATE_FUNCTIONS
+        )
+        
+        assert ORACLE_SYNTAX_MATCHER.detect(text) == expected_features
+        assert ORACLE_FUNCTION_MATCHER.detect(text) == expected_functions
+        assert ORACLE_HINT_MATCHER.detect(text) == expected_hints
+        assert sum(ANALYTIC_FUNCTION_MATCHER.count(text).values()) == expected_analytic
+        assert sum(AGGREGATE_FUNCTION_MATCHER.count(text).values()) == expected_aggregate
@@ -348,6 +348,38 @@ class TestCLIIntegration:
                     # 예외 발생 허용 (테스트 환경 제약)
                     pass
 
+    
+    def test_main_metrics_out(self, tmp_path):
+        """처리량 지표(--metrics-out) 기록 테스트"""
+        (tmp_path / "sql").mkdir()
+        (tmp_path / "sql" / "a.sql").write_text("SELECT * FROM products WHERE price > 100;")
+        (tmp_path / "sql" / "b.sql").write_text(
+            "CREATE OR REPLACE PROCEDURE p IS\nBEGIN\n  NULL;\nEND;\n/\n"
+        )
+        metrics_file = tmp_path / "metrics.jsonl"
+        
+        test_args = [
+            "migration-recommend",
+            "--legacy",
+            "--sql-dir", str(tmp_path / "sql"),
+            "--format", "json",
+            "--output", str(tmp_path / "recommendation.json"),
+            "--metrics-out", str(metrics_file)
+        ]
+        
+        with patch.object(sys, 'argv', test_args):
+            assert main() == 0
+        
+        events = [json.loads(line) for line in metrics_file.read_text(encoding="utf-8").splitlines()]
+        assert events[0]["event"] == "run_start"
+        assert events[0]["tool"] == "migration-recommend"
+        files = [e for e in events if e["event"] == "file"]
+        assert sorted(Path(e["file"]).name for e in files) == ["a.sql", "b.sql"]
+        assert all(e["ok"] and e["objects"] >= 1 for e in files)
+        stages = events[-1]["stages"]
+        assert {"discovery", "read", "parse", "score", "export"} <= set(stages)
+        assert events[-1]["files"] == 2
+
 
 class TestCLIErrorHandling:
     """CLI 오류 처리 테스트"""
@@ -241,5 +241,288 @@ class TestOracleComplexityAnalyzer:
             analyzer.analyze_file("nonexistent_file.sql")
 
 
+
+class TestMultiTargetAnalysis:
+    """다중 타겟 분석 테스트 (한 번 파싱, 타겟별 점수 계산)"""
+    
+    PLSQL_CODE = """
+    CREATE OR REPLACE PROCEDURE update_salary(p_emp_id NUMBER) IS
+        CURSOR c_emp IS SELECT * FROM employees WHERE emp_id = p_emp_id;
+    BEGIN
+        FOR r IN c_emp LOOP
+            UPDATE employees SET salary = salary * 1.1 WHERE emp_id = r.emp_id;
+        END LOOP;
+        DBMS_OUTPUT.PUT_LINE('done');
+    EXCEPTION
+        WHEN OTHERS THEN
+            RAISE;
+    END;
+    """
+    
+    def test_analyze_sql_multi_matches_single_target(self):
+        """SQL 다중 타겟 결과가 타겟별 단일 분석 결과와 같은지 테스트"""
+        query = """
+        SELECT e.name, NVL(d.dept_name, 'N/A'), ROWNUM
+        FROM employees e, departments d
+        WHERE e.dept_id = d.dept_id(+)
+        CONNECT BY PRIOR e.emp_id = e.manager_id
+        """
+        analyzer = OracleComplexityAnalyzer(TargetDatabase.POSTGRESQL)
+        
+        results = analyzer.analyze_sql_multi(query)
+        
+        assert set(results) == set(TargetDatabase)
+        for target, result in results.items():
+            expected = OracleComplexityAnalyzer(target).analyze_sql(query)
+            assert result.target_database == target
+            assert result.normalized_score == expected.normalized_score
+            assert result.total_score == expected.total_score
+            assert result.conversion_guides == expected.conversion_guides
+    
+    def test_analyze_plsql_multi_matches_single_target(self):
+        """PL/SQL 다중 타겟 결과가 타겟별 단일 분석 결과와 같은지 테스트"""
+        analyzer = OracleComplexityAnalyzer(TargetDatabase.MYSQL)
+        
+        results = analyzer.analyze_plsql_multi(self.PLSQL_CODE)
+        
+        for target, result in results.items():
+            expected = OracleComplexityAnalyzer(target).analyze_plsql(self.PLSQL_CODE)
+            assert result.target_database == target
+            assert result.total_score == expected.total_score
+            assert result.base_score == expected.base_score
+            assert result.app_migration_penalty == expected.app_migration_penalty
+            assert result.conversion_guides == expected.conversion_guides
+    
+    def test_analyze_multi_with_target_subset(self):
+        """지정한 타겟만 분석하는지 테스트"""
+        analyzer = OracleComplexityAnalyzer()
+        
+        results = analyzer.analyze_sql_multi("SELECT 1 FROM DUAL", [TargetDatabase.MYSQL])
+        
+        assert list(results) == [TargetDatabase.MYSQL]
+        assert results[TargetDatabase.MYSQL].target_database == TargetDatabase.MYSQL
+    
+    def test_analyze_multi_empty_input(self):
+        """빈 입력 다중 분석 테스트"""
+        analyzer = OracleComplexityAnalyzer()
+        
+        with pytest.raises(ValueError):
+            analyzer.analyze_sql_multi("   ")
+        with pytest.raises(ValueError):
+            analyzer.analyze_plsql_multi("")
+    
+    def test_analyze_file_multi(self, tmp_path):
+        """파일 다중 타겟 분석 테스트"""
+        file_path = tmp_path / "proc.sql"
+        file_path.write_text(self.PLSQL_CODE, encoding="utf-8")
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path))
+        
+        results = analyzer.analyze_file_multi(str(file_path))
+        
+        for target, result in results.items():
+            assert isinstance(result, PLSQLAnalysisResult)
+            assert result.target_database == target
+        assert analyzer.analyze_file(str(file_path)).total_score == \
+            results[TargetDatabase.POSTGRESQL].total_score
+    
+    def test_for_target_reuses_analyzer(self):
+        """타겟별 분석기 캐시 테스트"""
+        analyzer = OracleComplexityAnalyzer(TargetDatabase.POSTGRESQL)
+        
+        assert analyzer.for_target(TargetDatabase.POSTGRESQL) is analyzer
+        mysql_analyzer = analyzer.for_target(TargetDatabase.MYSQL)
+        assert mysql_analyzer.target == TargetDatabase.MYSQL
+        assert mysql_analyzer.output_dir == analyzer.output_dir
+        assert analyzer.for_target(TargetDatabase.MYSQL) is mysql_analyzer
+
+
+
+class TestSQLScriptAnalysis:
+    """여러 SQL 문이 포함된 스크립트의 문장 단위 분석 테스트"""
+    
+    SCRIPT = """
+    SELECT * FROM employees WHERE ROWNUM <= 10;
+    SELECT NVL(name, 'x'), DECODE(a, 1, 'y', 'z') FROM t CONNECT BY PRIOR id = pid;
+    INSERT INTO log_table VALUES (1, 'a;b')
+    /
+    """
+    
+    def test_per_statement_results(self):
+        """문장별 결과와 파일 단위 집계 테스트"""
+        analyzer = OracleComplexityAnalyzer()
+        
+        result = analyzer.analyze_sql_script(self.SCRIPT)
+        
+        assert result['total_statements'] == 3
+        assert result['analyzed_statements'] == 3
+        assert result['statistics'] == {'SELECT': 2, 'INSERT': 1}
+        assert [r['statement_index'] for r in result['results']] == [1, 2, 3]
+        
+        scores = [r['analysis'].normalized_score for r in result['results']]
+        assert scores[1] == analyzer.analyze_sql(
+            "SELECT NVL(name, 'x'), DECODE(a, 1, 'y', 'z') FROM t CONNECT BY PRIOR id = pid"
+        ).normalized_score
+        assert result['summary']['max_score'] == max(scores)
+        assert result['summary']['average_score'] == pytest.approx(sum(scores) / 3)
+    
+    def test_parallel_matches_sequential(self, monkeypatch):
+        """병렬 청크 분석 결과가 순차 분석과 같은지 테스트"""
+        from src.oracle_complexity_analyzer import analyzer as analyzer_module
+        
+        monkeypatch.setattr(analyzer_module, "STATEMENT_CHUNK_SIZE", 2)
+        analyzer = OracleComplexityAnalyzer()
+        
+        sequential = analyzer.analyze_sql_script_multi(self.SCRIPT)
+        parallel = analyzer.analyze_sql_script_multi(self.SCRIPT, max_workers=2)
+        
+        for target in TargetDatabase:
+            assert [r['statement_index'] for r in parallel[target]['results']] == [1, 2, 3]
+            assert [r['analysis'].normalized_score for r in parallel[target]['results']] == \
+                [r['analysis'].normalized_score for r in sequential[target]['results']]
+    
+    def test_analyze_file_splits_script(self, tmp_path):
+        """여러 문장 파일은 스크립트 결과, 단일 문장 파일은 기존 결과 반환 테스트"""
+        script_file = tmp_path / "script.sql"
+        script_file.write_text(self.SCRIPT, encoding="utf-8")
+        single_file = tmp_path / "single.sql"
+        single_file.write_text("SELECT * FROM employees;", encoding="utf-8")
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path))
+        
+        assert analyzer.analyze_file(str(script_file))['total_statements'] == 3
+        assert isinstance(analyzer.analyze_file(str(single_file)), SQLAnalysisResult)
+
+    def test_analyze_file_streams_large_script(self, tmp_path, monkeypatch):
+        """앞부분보다 큰 스크립트는 전체 텍스트를 만들지 않고 문장 단위로 분석하는지 테스트"""
+        from src.oracle_complexity_analyzer import analyzer as analyzer_module
+        
+        monkeypatch.setattr(analyzer_module, "BATCH_SNIFF_CHARS", 64)
+        script_file = tmp_path / "script.sql"
+        script_file.write_text("".join(f"SELECT NVL(a, {i}) FROM t;\n" for i in range(20)),
+                               encoding="utf-8")
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path))
+        
+        with analyzer.open_source(str(script_file)) as source:
+            result = analyzer.analyze_file_multi(str(script_file), [TargetDatabase.POSTGRESQL],
+                                                 source=source)
+            assert source._text is None
+        
+        assert source.file_type == 'sql'
+        assert result[TargetDatabase.POSTGRESQL]['total_statements'] == 20
+        assert [r['statement_index'] for r in result[TargetDatabase.POSTGRESQL]['results']] == \
+            list(range(1, 21))
+    
+    def test_detect_file_type_lines_matches_detect_file_type(self, monkeypatch):
+        """줄 스트림 유형 판별이 전체 내용 판별과 같은지 테스트 (블록 경계에 걸친 헤더 포함)"""
+        from src.oracle_complexity_analyzer import file_detector
+        
+        monkeypatch.setattr(file_detector, "DETECT_BLOCK_LINES", 2)
+        monkeypatch.setattr(file_detector, "DETECT_CARRY_LINES", 2)
+        batch = "".join(
+            f"-- Owner: HR\n-- Type: PROCEDURE\n-- Name: P{i}\nCREATE PROCEDURE p{i} IS BEGIN NULL; END;\n"
+            for i in range(2)
+        )
+        one_header = "SELECT 1 FROM dual;\n-- Owner: HR\n-- Type: VIEW\n-- Name: V\nSELECT 2 FROM dual;\n"
+        late_plsql = "SELECT 1 FROM dual;\n" * 5 + "BEGIN NULL; END;\n"
+        script = "SELECT 1 FROM dual;\nSELECT 2 FROM dual;\n"
+        
+        for content in (batch, "\n" + batch, one_header, late_plsql, script):
+            assert file_detector.detect_file_type_lines(content.splitlines(keepends=True)) == \
+                file_detector.detect_file_type(content)
+
+
+
+class TestSubProgramAnalysis:
+    """패키지 바디의 서브프로그램 단위 분석 테스트"""
+    
+    PACKAGE_BODY = """CREATE OR REPLACE PACKAGE BODY emp_pkg AS
+    PROCEDURE simple_p IS
+    BEGIN
+        NULL;
+    END simple_p;
+
+    FUNCTION heavy_f(p_id NUMBER) RETURN NUMBER IS
+        v NUMBER;
+    BEGIN
+        SELECT NVL(MAX(sal), 0) INTO v FROM emp CONNECT BY PRIOR id = mgr;
+        EXECUTE IMMEDIATE 'TRUNCATE TABLE tmp';
+        FOR r IN (SELECT * FROM emp) LOOP
+            IF r.sal > 0 THEN
+                v := v + DECODE(r.grade, 1, 10, 0);
+            END IF;
+        END LOOP;
+        RETURN v;
+    EXCEPTION
+        WHEN NO_DATA_FOUND THEN RETURN 0;
+    END heavy_f;
+
+    PROCEDURE log_p(p_msg VARCHAR2) IS
+        PRAGMA AUTONOMOUS_TRANSACTION;
+    BEGIN
+        INSERT INTO log_t VALUES (p_msg);
+        COMMIT;
+    END log_p;
+END emp_pkg;
+"""
+    
+    def test_per_subprogram_results(self):
+        """서브프로그램별 결과와 바디 단위 롤업 테스트"""
+        analyzer = OracleComplexityAnalyzer()
+        
+        result = analyzer.analyze_plsql_subprograms(self.PACKAGE_BODY)
+        
+        assert (result['object_type'], result['object_name']) == ('PACKAGE BODY', 'EMP_PKG')
+        assert result['total_subprograms'] == 3
+        assert result['analyzed_subprograms'] == 3
+        assert result['statistics'] == {'PROCEDURE': 2, 'FUNCTION': 1}
+        assert [r['subprogram_name'] for r in result['results']] == ['SIMPLE_P', 'HEAVY_F', 'LOG_P']
+        assert result['results'][0]['analysis'].code.startswith("PROCEDURE simple_p")
+        
+        summary = result['summary']
+        scores = [r['analysis'].normalized_score for r in result['results']]
+        lines = [r['analysis'].line_count for r in result['results']]
+        assert summary['max_score'] == max(scores)
+        assert summary['total_lines'] == sum(lines)
+        assert summary['weighted_average_score'] == pytest.approx(
+            sum(s * n for s, n in zip(scores, lines)) / sum(lines)
+        )
+        assert summary['hotspots'][0]['subprogram_name'] == 'HEAVY_F'
+    
+    def test_parallel_matches_sequential(self, monkeypatch):
+        """병렬 청크 분석 결과가 순차 분석과 같은지 테스트"""
+        from src.oracle_complexity_analyzer import analyzer as analyzer_module
+        
+        monkeypatch.setattr(analyzer_module, "SUBPROGRAM_CHUNK_SIZE", 1)
+        analyzer = OracleComplexityAnalyzer()
+        
+        sequential = analyzer.analyze_plsql_subprograms_multi(self.PACKAGE_BODY)
+        parallel = analyzer.analyze_plsql_subprograms_multi(self.PACKAGE_BODY, max_workers=2)
+        
+        for target in TargetDatabase:
+            assert [r['subprogram_index'] for r in parallel[target]['results']] == [1, 2, 3]
+            assert [r['analysis'].normalized_score for r in parallel[target]['results']] == \
+                [r['analysis'].normalized_score for r in sequential[target]['results']]
+            assert parallel[target]['summary'] == sequential[target]['summary']
+    
+    def test_no_subprograms_raises(self):
+        """분리할 서브프로그램이 없으면 ValueError 발생 테스트"""
+        analyzer = OracleComplexityAnalyzer()
+        
+        with pytest.raises(ValueError):
+            analyzer.analyze_plsql_subprograms("CREATE OR REPLACE PROCEDURE p IS BEGIN NULL; END;")
+    
+    def test_analyze_file_split_option(self, tmp_path):
+        """split_subprograms 옵션에 따른 파일 분석 결과 테스트"""
+        package_file = tmp_path / "emp_pkg.pkb"
+        package_file.write_text(self.PACKAGE_BODY, encoding="utf-8")
+        
+        whole = OracleComplexityAnalyzer(output_dir=str(tmp_path)).analyze_file(str(package_file))
+        split = OracleComplexityAnalyzer(
+            output_dir=str(tmp_path), split_subprograms=True
+        ).analyze_file(str(package_file))
+        
+        assert isinstance(whole, PLSQLAnalysisResult)
+        assert split['total_subprograms'] == 3
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -507,9 +507,9 @@ class TestPLSQLParserCodeMetrics:
         """
         parser = PLSQLParser(code)
         depth = parser.calculate_nesting_depth()
-        # BEGIN(1) + FOR(2) + LOOP(3) + FOR(4) + LOOP(5) = 최대 깊이 5
-        # FOR와 LOOP이 각각 카운트됨
-        assert depth == 5
+        # BEGIN(1) + FOR LOOP(2) + FOR LOOP(3) = 최대 깊이 3
+        # FOR ... LOOP는 하나의 블록으로 카운트됨
+        assert depth == 3
     
     def test_calculate_nesting_depth_complex(self):
         """복잡한 중첩 구조의 깊이 계산 테스트"""
@@ -2242,3 +2242,196 @@ class TestPLSQLParserSqlcodeSqlerrm:
         result = parser.has_sqlcode_sqlerrm()
         assert result['sqlcode'] is False
         assert result['sqlerrm'] is False
+
+
+class TestPLSQLParserMetricCache:
+    """PL/SQL 파서 감지 결과 캐시 테스트"""
+    
+    CODE = """
+    CREATE OR REPLACE PROCEDURE p IS
+        CURSOR c1 IS SELECT * FROM t;
+    BEGIN
+        UTL_FILE.FOPEN('DIR', 'a.txt', 'W');
+    END;
+    """
+    
+    def test_metric_computed_once(self):
+        """같은 감지 메서드를 반복 호출해도 결과가 캐시되는지 테스트"""
+        parser = PLSQLParser(self.CODE)
+        
+        assert parser.count_cursors() == parser.count_cursors()
+        assert 'count_cursors' in parser._metric_cache
+    
+    def test_cached_list_is_copied(self):
+        """캐시된 리스트를 호출자가 변경해도 캐시가 보호되는지 테스트"""
+        parser = PLSQLParser(self.CODE)
+        
+        deps = parser.detect_external_dependencies()
+        deps.append('MUTATED')
+        
+        assert 'MUTATED' not in parser.detect_external_dependencies()
+
+
+class TestPLSQLParserTokenStream:
+    """토큰 스트림 기반 분석 테스트"""
+    
+    def test_keywords_in_strings_and_comments_ignored(self):
+        """문자열, q-quote, 주석 안의 키워드를 감지하지 않는지 테스트"""
+        code = """
+        CREATE OR REPLACE PROCEDURE p IS
+        BEGIN
+            -- COMMIT; EXECUTE IMMEDIATE 'X'; IF
+            DBMS_OUTPUT.PUT_LINE('ROLLBACK; IF x THEN LOOP');
+            v := q'[END IF; BULK COLLECT INTO ]';
+            /* FORALL i IN 1..10 */
+            NULL;
+        END;
+        """
+        parser = PLSQLParser(code)
+        
+        assert parser.calculate_nesting_depth() == 1
+        assert parser.count_bulk_operations() == 0
+        assert parser.count_dynamic_sql() == 0
+        assert parser.has_transaction_control()['commit'] is False
+        assert parser.has_transaction_control()['rollback'] is False
+    
+    def test_nesting_block_stack(self):
+        """END IF/END LOOP/END CASE와 CASE 식의 END가 올바른 블록을 닫는지 테스트"""
+        code = """
+        CREATE OR REPLACE PROCEDURE p IS
+        BEGIN
+            WHILE x < 10 LOOP
+                v := CASE WHEN x > 1 THEN 1 ELSE 0 END;
+                IF x > 5 THEN
+                    EXIT;
+                END IF;
+            END LOOP;
+            IF y THEN
+                NULL;
+            END IF;
+        END p;
+        """
+        parser = PLSQLParser(code)
+        
+        # BEGIN(1) + WHILE LOOP(2) + IF/CASE(3)
+        assert parser.calculate_nesting_depth() == 3
+    
+    def test_count_lines_multiline_tokens(self):
+        """주석 뒤 코드와 여러 줄 문자열의 라인 수 계산 테스트"""
+        code = (
+            "CREATE PROCEDURE p IS\n"
+            "BEGIN\n"
+            "  /* comment */ NULL;\n"
+            "  v := 'line1\n"
+            "line2';\n"
+            "END;"
+        )
+        
+        assert PLSQLParser(code).count_lines() == 6
+    
+    def test_numeric_for_loop_is_not_cursor(self):
+        """숫자 범위 FOR 루프를 커서로 계산하지 않는지 테스트"""
+        code = """
+        CREATE PROCEDURE p IS
+            CURSOR c (p_id NUMBER) IS SELECT * FROM t WHERE id = p_id;
+        BEGIN
+            FOR i IN 1..10 LOOP NULL; END LOOP;
+            FOR i IN REVERSE lo..hi LOOP NULL; END LOOP;
+            FOR r IN c(1) LOOP NULL; END LOOP;
+        END;
+        """
+        
+        assert PLSQLParser(code).count_cursors() == 1
+    
+    def test_dynamic_ddl_from_string_literal(self):
+        """EXECUTE IMMEDIATE 문자열 리터럴과 문자열 연결의 DDL 감지 테스트"""
+        code = """
+        CREATE PROCEDURE p IS
+        BEGIN
+            EXECUTE IMMEDIATE 'TRUNCATE TABLE t';
+            EXECUTE IMMEDIATE v_prefix || 'CREATE INDEX i ON t(a)';
+            EXECUTE IMMEDIATE 'SELECT 1 FROM dual' INTO v;
+        END;
+        """
+        
+        assert PLSQLParser(code).count_dynamic_ddl() == 2
+
+
+class TestPLSQLParserSubPrograms:
+    """패키지/타입 바디 서브프로그램 분리 테스트"""
+    
+    PACKAGE_BODY = """CREATE OR REPLACE PACKAGE BODY hr.emp_pkg AS
+    g_count NUMBER := 0;
+    PROCEDURE fwd(p NUMBER);
+    FUNCTION ext_fn RETURN NUMBER AS LANGUAGE C NAME "ext" LIBRARY extlib;
+
+    PROCEDURE outer_p(p_id NUMBER) IS
+        CURSOR c IS SELECT CASE WHEN a > 0 THEN 1 ELSE 0 END v FROM t;
+        PROCEDURE inner_p IS
+        BEGIN
+            NULL;
+        END inner_p;
+    BEGIN
+        IF p_id > 0 THEN
+            inner_p;
+        END IF;
+    END outer_p;
+
+    FUNCTION get_count RETURN NUMBER IS
+    BEGIN
+        FOR i IN 1..10 LOOP
+            g_count := g_count + 1;
+        END LOOP;
+        RETURN g_count;
+    END;
+    PROCEDURE fwd(p NUMBER) IS BEGIN NULL; END fwd;
+BEGIN
+    g_count := 1;
+END emp_pkg;
+"""
+    
+    def test_split_package_body(self):
+        """전방 선언, 외부 호출 명세, 중첩 서브프로그램을 제외한 분리 테스트"""
+        parser = PLSQLParser(self.PACKAGE_BODY)
+        subprograms = parser.split_subprograms()
+        
+        assert [(s.name, s.subprogram_type) for s in subprograms] == [
+            ('OUTER_P', 'PROCEDURE'), ('GET_COUNT', 'FUNCTION'), ('FWD', 'PROCEDURE')
+        ]
+        assert [s.index for s in subprograms] == [1, 2, 3]
+        assert (subprograms[0].line_start, subprograms[0].line_end) == (6, 16)
+        assert subprograms[0].code.startswith("PROCEDURE outer_p")
+        assert subprograms[0].code.endswith("END outer_p;")
+        assert "inner_p" in subprograms[0].code
+        assert parser.subprogram_container() == ('PACKAGE BODY', 'HR.EMP_PKG')
+    
+    def test_split_type_body(self):
+        """타입 바디의 MEMBER/CONSTRUCTOR 함수 분리 테스트"""
+        code = """
+        CREATE OR REPLACE TYPE BODY point_t AS
+            CONSTRUCTOR FUNCTION point_t RETURN SELF AS RESULT IS
+            BEGIN
+                RETURN;
+            END;
+            MEMBER FUNCTION dist RETURN NUMBER IS
+            BEGIN
+                RETURN SQRT(x * x + y * y);
+            END dist;
+        END;
+        """
+        parser = PLSQLParser(code)
+        
+        assert [s.name for s in parser.split_subprograms()] == ['POINT_T', 'DIST']
+        assert parser.subprogram_container() == ('TYPE BODY', 'POINT_T')
+    
+    def test_standalone_procedure_not_split(self):
+        """패키지 바디가 아닌 코드는 분리하지 않는지 테스트"""
+        code = """
+        CREATE OR REPLACE PROCEDURE p IS
+            PROCEDURE inner_p IS BEGIN NULL; END;
+        BEGIN
+            inner_p;
+        END;
+        """
+        
+        assert PLSQLParser(code).split_subprograms() == []
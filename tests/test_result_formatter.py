@@ -471,3 +471,87 @@ class TestResultFormatterEdgeCases:
         # Round-trip 테스트
         restored = ResultFormatter.from_json(json_str, 'sql')
         assert restored.query == result.query
+
+
+class TestResultFormatterScript:
+    """SQL 스크립트 문장 단위 결과 포맷 테스트"""
+    
+    @pytest.fixture
+    def script_result(self):
+        """스크립트 분석 결과 생성"""
+        from src.oracle_complexity_analyzer import OracleComplexityAnalyzer
+        
+        analyzer = OracleComplexityAnalyzer()
+        return analyzer.analyze_sql_script(
+            "SELECT NVL(a, 1) FROM t;\nSELECT * FROM t CONNECT BY PRIOR id = pid;"
+        )
+    
+    def test_script_to_json(self, script_result):
+        """스크립트 결과 JSON 변환 테스트 (batch_to_json 위임 포함)"""
+        data = json.loads(ResultFormatter.batch_to_json(script_result))
+        
+        assert data['result_type'] == 'sql_script'
+        assert data['total_statements'] == 2
+        assert data['results'][1]['line_range'] == '2-2'
+        assert data['results'][0]['analysis']['result_type'] == 'sql'
+    
+    def test_script_to_markdown(self, script_result):
+        """스크립트 결과 Markdown 변환 테스트"""
+        md = ResultFormatter.batch_to_markdown(script_result, "postgresql")
+        
+        assert "# SQL 스크립트 분석 리포트" in md
+        assert "**전체 문장 수**: 2" in md
+        assert "CONNECT BY" in md
+    
+    def test_script_fingerprints(self):
+        """중복 제거 스크립트 결과의 형태별 출현 횟수 출력 테스트"""
+        from src.oracle_complexity_analyzer import OracleComplexityAnalyzer
+        
+        script_result = OracleComplexityAnalyzer(dedupe=True).analyze_sql_script(
+            "SELECT a FROM t WHERE id = 1;\nSELECT a FROM t WHERE id = 2;\nSELECT b FROM u;"
+        )
+        data = json.loads(ResultFormatter.script_to_json(script_result))
+        md = ResultFormatter.script_to_markdown(script_result)
+        
+        assert data['distinct_statements'] == 2
+        assert data['fingerprints'][0]['occurrences'] == 2
+        assert data['results'][0]['fingerprint'] == data['results'][1]['fingerprint']
+        assert "## 🔁 반복 SQL 형태" in md
+        assert "**고유 SQL 형태 수**: 2" in md
+
+
+class TestResultFormatterSubPrograms:
+    """패키지 바디 서브프로그램 단위 결과 포맷 테스트"""
+    
+    @pytest.fixture
+    def subprogram_result(self):
+        """서브프로그램 분석 결과 생성"""
+        from src.oracle_complexity_analyzer import OracleComplexityAnalyzer
+        
+        return OracleComplexityAnalyzer().analyze_plsql_subprograms(
+            "CREATE OR REPLACE PACKAGE BODY pkg AS\n"
+            "  PROCEDURE a IS BEGIN NULL; END a;\n"
+            "  FUNCTION b RETURN NUMBER IS BEGIN RETURN NVL(NULL, 1); END b;\n"
+            "END pkg;"
+        )
+    
+    def test_subprograms_to_json(self, subprogram_result):
+        """서브프로그램 결과 JSON 변환 테스트 (batch_to_json 위임 포함)"""
+        data = json.loads(ResultFormatter.batch_to_json(subprogram_result))
+        
+        assert data['result_type'] == 'plsql_subprograms'
+        assert data['object_name'] == 'PKG'
+        assert data['total_subprograms'] == 2
+        assert data['results'][1]['subprogram_name'] == 'B'
+        assert data['results'][1]['line_range'] == '3-3'
+        assert data['results'][0]['analysis']['result_type'] == 'plsql'
+        assert len(data['summary']['hotspots']) == 2
+    
+    def test_subprograms_to_markdown(self, subprogram_result):
+        """서브프로그램 결과 Markdown 변환 테스트"""
+        md = ResultFormatter.batch_to_markdown(subprogram_result, "postgresql")
+        
+        assert "# PACKAGE BODY 서브프로그램 분석 리포트" in md
+        assert "**전체 서브프로그램 수**: 2" in md
+        assert "라인 가중 평균 복잡도" in md
+        assert "### 🔥 복잡도 상위 서브프로그램" in md
@@ -0,0 +1,99 @@
+"""
+Detector Scan Budget 테스트
+
+선형 스캔 도우미가 기존 `.*?` (DOTALL) 정규식과 같은 결과를 내는지, 예산을 넘긴
+감지기가 분석 결과에 표시되는지 검증합니다.
+"""
+
+import re
+import time
+
+from src.formatters.result_formatter import ResultFormatter
+from src.oracle_complexity_analyzer import OracleComplexityAnalyzer
+from src.parsers.plsql import PLSQLParser
+from src.parsers.scan_budget import (
+    ScanBudget,
+    compile_sequence,
+    count_sequence,
+    has_sequence,
+    strip_block_comments,
+)
+
+
+class TestSequenceScan:
+    """선형 스캔 도우미 테스트"""
+
+    def test_count_matches_findall(self):
+        """count_sequence가 re.findall 개수와 같은지 테스트"""
+        sequence = compile_sequence(r'\bRETURNING\b', r'\bINTO\b')
+        texts = [
+            "UPDATE T SET A = 1 RETURNING A INTO X; DELETE T RETURNING B INTO Y;",
+            "RETURNING RETURNING INTO INTO",
+            "RETURNING A; SELECT 1 FROM DUAL",
+            "",
+        ]
+        for text in texts:
+            expected = len(re.findall(r'\bRETURNING\b.*?\bINTO\b', text, re.DOTALL))
+            assert count_sequence(text, sequence) == expected
+
+    def test_has_sequence(self):
+        """has_sequence가 re.search 결과와 같은지 테스트"""
+        sequence = compile_sequence(r'ROWNUM\s+\w', r'WHERE\s+\w+\s*[>]')
+        assert has_sequence("SELECT ROWNUM RN FROM T) WHERE RN > 10", sequence)
+        assert not has_sequence("WHERE RN > 10 AND ROWNUM RN", sequence)
+
+    def test_strip_block_comments(self):
+        """여러 줄 주석 제거가 기존 정규식 치환과 같은지 테스트"""
+        for text in ["A /* x */ B /* y\n */ C", "A /* open", "/*/ A */ B", "A */ B /* C */"]:
+            assert strip_block_comments(text) == re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
+
+    def test_pathological_input_is_fast(self):
+        """닫는 키워드가 없는 큰 입력도 빠르게 처리되는지 테스트"""
+        code = "CREATE OR REPLACE PACKAGE P IS\n" + "  X_LIST NUMBER; -- RETURNING A IS B\n" * 5000
+
+        start = time.perf_counter()
+        parser = PLSQLParser(code)
+        parser.count_returning_into()
+        parser.analyze_local_variables()
+        parser.count_dynamic_ddl()
+
+        assert time.perf_counter() - start < 5.0
+
+
+class TestScanBudget:
+    """감지기 예산 테스트"""
+
+    def test_size_budget_flags_detector(self):
+        """입력 크기 예산 초과 시 앞부분만 스캔하고 표시되는지 테스트"""
+        budget = ScanBudget(max_chars=20)
+        sequence = compile_sequence(r'\bRETURNING\b', r'\bINTO\b')
+        text = "RETURNING A INTO B; " * 3
+
+        assert count_sequence(text, sequence, budget, 'returning_into') == 1
+        assert budget.degraded_detectors == ['returning_into:size']
+
+    def test_time_budget_flags_detector(self):
+        """시간 예산 초과 시 부분 결과를 반환하고 표시되는지 테스트"""
+        budget = ScanBudget(time_limit=-1)
+        sequence = compile_sequence(r'\bRETURNING\b', r'\bINTO\b')
+
+        assert count_sequence("RETURNING A INTO B; " * 3, sequence, budget, 'returning_into') == 1
+        assert budget.degraded_detectors == ['returning_into:time']
+
+    def test_degraded_detectors_in_result(self, monkeypatch):
+        """예산을 넘긴 감지기가 분석 결과에 표시되는지 테스트"""
+        assert OracleComplexityAnalyzer().analyze_sql("SELECT 1 FROM DUAL").degraded_detectors == []
+
+        monkeypatch.setattr("src.oracle_complexity_analyzer.DETECTOR_MAX_SCAN_CHARS", 10)
+        analyzer = OracleComplexityAnalyzer()
+
+        sql_result = analyzer.analyze_sql(
+            "SELECT * FROM (SELECT ROWNUM RN, A FROM T) WHERE RN > 10"
+        )
+        plsql_result = analyzer.analyze_plsql(
+            "CREATE OR REPLACE PACKAGE P IS G_COUNT NUMBER; PROCEDURE RUN; END P;"
+        )
+
+        assert 'complex_rownum_paging:size' in sql_result.degraded_detectors
+        assert 'package_variables:size' in plsql_result.degraded_detectors
+        assert "부분 분석된 감지기" in ResultFormatter.to_markdown(plsql_result)
@@ -0,0 +1,173 @@
+"""
+SourceRef 테스트
+
+원본 소스 참조 생성/로드, 결과 슬림화, 배치 분석 결과와 리포트 연동을 검증합니다.
+"""
+
+import json
+
+import pytest
+
+from src.formatters.result_formatter import ResultFormatter
+from src.oracle_complexity_analyzer import (
+    BatchAnalyzer,
+    OracleComplexityAnalyzer,
+    SourceIndex,
+    slim_result,
+)
+from src.parsers.plsql import PLSQLParser
+from src.parsers.sql_parser import SQLParser
+
+
+QUERY = "SELECT NVL(name, '한글'), ROWNUM FROM employees CONNECT BY PRIOR id = manager_id"
+
+SCRIPT = "SELECT 1 FROM dual;\r\nSELECT NVL(a, 1)\r\nFROM t;\r\n"
+
+
+class TestSourceIndex:
+    """SourceIndex/SourceRef 기본 기능 테스트"""
+    
+    def test_whole_file_ref(self, tmp_path):
+        """파일 전체 참조의 바이트 구간과 로드 결과 테스트"""
+        path = tmp_path / "q.sql"
+        path.write_bytes(f"\n  {QUERY}\n\n".encode("utf-8"))
+        
+        ref = SourceIndex.from_file(path).whole()
+        
+        assert (ref.start, ref.end) == (3, 3 + len(QUERY.encode("utf-8")))
+        assert ref.load() == QUERY
+    
+    def test_line_range_ref_with_crlf(self, tmp_path):
+        """CRLF 파일의 줄 범위 참조 테스트"""
+        path = tmp_path / "script.sql"
+        path.write_bytes(SCRIPT.encode("utf-8"))
+        index = SourceIndex.from_file(path)
+        
+        assert index.lines(2, 3).load() == "SELECT NVL(a, 1)\nFROM t;"
+        assert index.lines(1, 1).load() == "SELECT 1 FROM dual;"
+        assert index.lines(3, 10).load() == "FROM t;"
+    
+    def test_changed_file_detected(self, tmp_path):
+        """분석 이후 파일이 바뀌면 로드 시 ValueError 발생 테스트"""
+        path = tmp_path / "q.sql"
+        path.write_text(QUERY, encoding="utf-8")
+        ref = SourceIndex.from_file(path).whole()
+        
+        path.write_text(QUERY.replace("NVL", "NVX"), encoding="utf-8")
+        
+        with pytest.raises(ValueError):
+            ref.load()
+
+
+class TestSlimResult:
+    """분석 결과 슬림화 테스트"""
+    
+    def test_slim_single_result(self, tmp_path):
+        """단일 결과의 원본 텍스트가 참조로 대체되고 리포트에서 복원되는지 테스트"""
+        path = tmp_path / "q.sql"
+        path.write_text(QUERY, encoding="utf-8")
+        result = OracleComplexityAnalyzer().analyze_file(str(path))
+        
+        slim = slim_result(result, SourceIndex.from_file(path))
+        
+        assert slim.query == ""
+        assert slim.source_text() == result.query
+        assert slim.normalized_score == result.normalized_score
+        assert QUERY in ResultFormatter.to_markdown(slim)
+        
+        data = json.loads(ResultFormatter.to_json(slim))
+        assert data["query"] == QUERY
+        restored = ResultFormatter.from_json(ResultFormatter.to_json(slim), "sql")
+        assert restored.source_ref == slim.source_ref
+    
+    def test_slim_script_entries(self, tmp_path):
+        """스크립트 결과의 문장별 참조 테스트"""
+        path = tmp_path / "script.sql"
+        path.write_bytes(SCRIPT.encode("utf-8"))
+        result = OracleComplexityAnalyzer().analyze_file(str(path))
+        
+        slim = slim_result(result, SourceIndex.from_file(path))
+        
+        assert [r["analysis"].query for r in slim["results"]] == ["", ""]
+        assert slim["results"][1]["analysis"].source_text() == "SELECT NVL(a, 1)\nFROM t;"
+        # 입력 결과는 변경하지 않음
+        assert result["results"][1]["analysis"].query == "SELECT NVL(a, 1)\nFROM t"
+    
+    def test_batch_objects_keep_analysis_refs(self, tmp_path):
+        """배치 객체 결과는 분석 중 채운 DDL 코드 참조를 유지하는지 테스트"""
+        path = tmp_path / "objects.out"
+        path.write_text(
+            "-- Owner: HR\n-- Type: PROCEDURE\n-- Name: P\n-- ====\n"
+            "CREATE OR REPLACE PROCEDURE p IS\nBEGIN\n  NULL;\nEND;\n/\n",
+            encoding="utf-8",
+        )
+        result = OracleComplexityAnalyzer().analyze_batch_plsql_file(str(path))
+        analysis = result["results"][0]["analysis"]
+        
+        slim = slim_result(result, SourceIndex.from_file(path))
+        
+        assert analysis.code == ""
+        assert slim["results"][0]["analysis"] is analysis
+        assert analysis.source_text() == "CREATE OR REPLACE PROCEDURE p IS\nBEGIN\n  NULL;\nEND;\n/"
+
+
+class TestSlimBatchResults:
+    """배치 분석 결과 슬림화 테스트"""
+    
+    def test_folder_results_hold_references(self, tmp_path):
+        """폴더 분석 결과가 원본 텍스트 대신 참조를 담는지 테스트"""
+        source_dir = tmp_path / "src"
+        source_dir.mkdir()
+        (source_dir / "a.sql").write_text(QUERY, encoding="utf-8")
+        (source_dir / "b.sql").write_text(
+            "CREATE OR REPLACE PROCEDURE p IS\nBEGIN\n  NULL;\nEND;\n", encoding="utf-8"
+        )
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "reports"))
+        batch_analyzer = BatchAnalyzer(analyzer, max_workers=2)
+        
+        batch_result = batch_analyzer.analyze_folder(str(source_dir))
+        
+        sql_result = batch_result.results[str(source_dir / "a.sql")]
+        plsql_result = batch_result.results[str(source_dir / "b.sql")]
+        assert (sql_result.query, plsql_result.code) == ("", "")
+        assert sql_result.source_text() == QUERY
+        assert plsql_result.source_text().startswith("CREATE OR REPLACE PROCEDURE p")
+        
+        reports = batch_analyzer.export_individual_reports(batch_result)
+        markdown = [r for r in reports if r.endswith("a.md")][0]
+        with open(markdown, encoding="utf-8") as f:
+            assert QUERY in f.read()
+    
+    def test_dedupe_followers_reference_own_file(self, tmp_path):
+        """중복 제거로 복제된 결과가 자기 파일을 참조하는지 테스트"""
+        source_dir = tmp_path / "src"
+        source_dir.mkdir()
+        (source_dir / "a.sql").write_text("SELECT a FROM t WHERE id = 1", encoding="utf-8")
+        (source_dir / "b.sql").write_text("SELECT a FROM t WHERE id = 2", encoding="utf-8")
+        analyzer = OracleComplexityAnalyzer(output_dir=str(tmp_path / "reports"), dedupe=True)
+        
+        batch_result = BatchAnalyzer(analyzer, max_workers=2).analyze_folder(str(source_dir))
+        
+        assert {r.source_text() for r in batch_result.results.values()} == {
+            "SELECT a FROM t WHERE id = 1", "SELECT a FROM t WHERE id = 2"
+        }
+
+
+class TestParserSourceBuffer:
+    """파서가 원본 버퍼 하나만 보관하는지 테스트"""
+    
+    def test_plsql_parser_derives_views(self):
+        """PL/SQL 파서의 대문자/정규화 텍스트가 필요할 때 생성되는지 테스트"""
+        code = "\n  CREATE OR REPLACE PROCEDURE p IS BEGIN NULL; END;  \n"
+        parser = PLSQLParser(code)
+        
+        assert not {'code', 'upper_code', '_normalized_code'} & set(vars(parser))
+        assert parser.code == code.strip()
+        assert parser.upper_code == code.upper()
+    
+    def test_sql_parser_derives_upper_query(self):
+        """SQL 파서의 대문자 쿼리가 필요할 때 생성되는지 테스트"""
+        parser = SQLParser("select 1 from dual")
+        
+        assert 'upper_query' not in vars(parser)
+        assert parser.upper_query == "SELECT 1 FROM DUAL"
@@ -0,0 +1,66 @@
+"""
+SQL Fingerprint 테스트
+
+리터럴/바인드 변수/IN 목록 정규화와 점수에 영향을 주는 리터럴 형태 보존을 검증합니다.
+"""
+
+from src.oracle_complexity_analyzer import OracleComplexityAnalyzer
+from src.parsers.sql_fingerprint import fingerprint, fingerprint_hash
+
+
+class TestFingerprint:
+    """fingerprint 기본 기능 테스트"""
+
+    def test_literals_and_binds(self):
+        """숫자, 문자열, 바인드 변수가 자리표시자로 바뀌는지 테스트"""
+        assert fingerprint("select a from t where id = 1 and name = 'x' and b = :b1") == (
+            "SELECT A FROM T WHERE ID = ? AND NAME = ? AND B = ?"
+        )
+        assert fingerprint_hash("SELECT a FROM t WHERE id = 1") == fingerprint_hash(
+            "select a\n  from t -- comment\n where id = :id"
+        )
+
+    def test_in_list_collapsed(self):
+        """리터럴로만 구성된 IN 목록은 길이와 무관하게 같은 형태인지 테스트"""
+        assert fingerprint("SELECT a FROM t WHERE id IN (1)") == fingerprint(
+            "SELECT a FROM t WHERE id IN (1, 2, 3, :x)"
+        )
+        assert "IN ( SELECT" in fingerprint("SELECT a FROM t WHERE id IN (SELECT id FROM u)")
+
+    def test_score_relevant_literals_preserved(self):
+        """빈 문자열과 '%...%' 패턴, 힌트는 구분되는지 테스트"""
+        assert fingerprint("SELECT a FROM t WHERE b = ''") != fingerprint(
+            "SELECT a FROM t WHERE b = 'x'"
+        )
+        assert fingerprint("SELECT a FROM t WHERE b LIKE '%x%'") != fingerprint(
+            "SELECT a FROM t WHERE b LIKE 'x%'"
+        )
+        assert fingerprint("SELECT /*+ FULL(t) */ a FROM t") != fingerprint("SELECT a FROM t")
+
+
+class TestScriptDedupe:
+    """스크립트 문장 중복 제거 분석 테스트"""
+
+    SCRIPT = "\n".join(
+        f"SELECT NVL(a, 'v{i}') FROM t WHERE id IN ({i}, {i + 1}) AND ROWNUM < {i};"
+        for i in range(10)
+    ) + "\nSELECT a FROM t WHERE b = '';\nSELECT a FROM t WHERE b = 'z';\n"
+
+    def test_results_match_per_statement_analysis(self):
+        """중복 제거 결과가 문장별 개별 분석과 같은지 테스트"""
+        expected = OracleComplexityAnalyzer().analyze_sql_script(self.SCRIPT)
+        result = OracleComplexityAnalyzer(dedupe=True).analyze_sql_script(self.SCRIPT)
+
+        assert [r['analysis'] for r in result['results']] == [
+            r['analysis'] for r in expected['results']
+        ]
+        assert result['summary'] == expected['summary']
+
+    def test_fingerprint_occurrences(self):
+        """형태별 출현 횟수 집계 테스트"""
+        result = OracleComplexityAnalyzer(dedupe=True).analyze_sql_script(self.SCRIPT)
+
+        assert result['distinct_statements'] == 3
+        assert [fp['occurrences'] for fp in result['fingerprints']] == [10, 1, 1]
+        assert result['fingerprints'][0]['first_statement_index'] == 1
+        assert len({r['fingerprint'] for r in result['results'][:10]}) == 1
@@ -0,0 +1,79 @@
+"""
+SQL Lexer 테스트
+
+토큰 스트림 생성(문자열, 주석, 힌트, 괄호 깊이, 줄 번호)을 검증합니다.
+"""
+
+from src.parsers.sql_lexer import TokenType, tokenize, code_tokens
+
+
+class TestTokenize:
+    """tokenize 기본 기능 테스트"""
+    
+    def test_keywords_and_identifiers(self):
+        """키워드/식별자 분류 및 대문자 정규화 테스트"""
+        tokens = tokenize("select name from users")
+        
+        assert [t.type for t in tokens] == [
+            TokenType.KEYWORD, TokenType.IDENTIFIER, TokenType.KEYWORD, TokenType.IDENTIFIER
+        ]
+        assert [t.value for t in tokens] == ['SELECT', 'NAME', 'FROM', 'USERS']
+        
+    def test_string_with_escaped_quote(self):
+        """'' 이스케이프가 포함된 문자열 리터럴 테스트"""
+        tokens = tokenize("SELECT 'it''s -- not a comment' FROM dual")
+        
+        strings = [t for t in tokens if t.type is TokenType.STRING]
+        assert len(strings) == 1
+        assert strings[0].value == "'IT''S -- NOT A COMMENT'"
+        assert not any(t.type is TokenType.COMMENT for t in tokens)
+        
+    def test_q_quote_literal(self):
+        """q-quote 리터럴 테스트"""
+        for literal in ("q'[a ' b]'", "q'{a ' b}'", "q'<a ' b>'", "q'(a ' b)'", "q'!a ' b!'"):
+            tokens = tokenize(f"SELECT {literal} FROM dual")
+            
+            assert tokens[1].type is TokenType.STRING
+            assert tokens[1].end - tokens[1].start == len(literal)
+            assert tokens[2].value == 'FROM'
+        
+    def test_comments_and_hints(self):
+        """주석과 힌트 구분 테스트"""
+        tokens = tokenize("SELECT /*+ FULL(t) */ * /* note */ FROM t -- tail")
+        
+        assert tokens[1].type is TokenType.HINT
+        assert [t.type for t in tokens].count(TokenType.COMMENT) == 2
+        assert [t.value for t in code_tokens(tokens)] == ['SELECT', '*', 'FROM', 'T']
+        
+    def test_quoted_identifier(self):
+        """인용 식별자는 키워드로 분류하지 않음"""
+        tokens = tokenize('SELECT "FROM" FROM dual')
+        
+        assert tokens[1].type is TokenType.QUOTED_IDENTIFIER
+        assert tokens[2].type is TokenType.KEYWORD
+        
+    def test_paren_depth(self):
+        """괄호 깊이 테스트"""
+        tokens = tokenize("SELECT (SELECT 1 FROM dual) FROM t")
+        
+        depths = [(t.value, t.depth) for t in tokens]
+        assert depths[1] == ('(', 0)
+        assert depths[2] == ('SELECT', 1)
+        assert depths[6] == (')', 0)
+        assert depths[7] == ('FROM', 0)
+        
+    def test_line_numbers(self):
+        """줄 번호 테스트 (여러 줄 주석/문자열 포함)"""
+        tokens = tokenize("SELECT\n/* a\nb */ 'x\ny'\nFROM t")
+        
+        assert tokens[0].line == 1
+        assert tokens[1].line == 2
+        assert tokens[2].line == 3
+        assert tokens[3].line == 5
+        
+    def test_unterminated_literal(self):
+        """닫히지 않은 문자열은 입력 끝까지 하나의 토큰"""
+        tokens = tokenize("SELECT 'abc FROM t")
+        
+        assert len(tokens) == 2
+        assert tokens[1].type is TokenType.STRING
@@ -478,3 +478,129 @@ class TestPerformancePenalties:
         
         penalties = parser.has_performance_penalties()
         assert penalties['like_pattern'] is True
+
+
+class TestTokenBasedStructure:
+    """토큰 기반 구조 분석 테스트"""
+    
+    def test_keywords_in_string_literal_ignored(self):
+        """문자열 리터럴 내부의 키워드는 카운팅하지 않음"""
+        query = "SELECT 'a JOIN b UNION SELECT (SELECT 1)' AS txt FROM users WHERE id = 1"
+        parser = SQLParser(query)
+        
+        assert parser.count_joins() == 0
+        assert parser.count_set_operators() == 0
+        assert parser.calculate_subquery_depth() == 0
+        
+    def test_keywords_in_comments_ignored(self):
+        """주석 내부의 키워드는 카운팅하지 않음"""
+        query = """
+        SELECT id -- CASE WHEN x JOIN y
+        FROM users /* UNION SELECT * FROM t1, t2 */
+        WHERE id = 1
+        """
+        parser = SQLParser(query)
+        
+        assert parser.count_joins() == 0
+        assert parser.count_set_operators() == 0
+        assert parser.count_case_expressions() == 0
+        
+    def test_comment_marker_inside_string_kept(self):
+        """문자열 내부의 '--'는 주석으로 처리하지 않음"""
+        query = "SELECT '--' || name FROM users, orders"
+        parser = SQLParser(query)
+        
+        assert "'--'" in parser.normalized_query
+        assert parser.count_joins() == 1
+        
+    def test_extract_from_is_not_implicit_join(self):
+        """함수 내부의 FROM은 FROM 절로 보지 않음"""
+        query = "SELECT EXTRACT(YEAR FROM hire_date), a, b FROM employees WHERE id = 1"
+        parser = SQLParser(query)
+        
+        assert parser.count_joins() == 0
+        
+    def test_implicit_join_in_subquery(self):
+        """서브쿼리 FROM 절의 쉼표도 암시적 JOIN으로 카운팅"""
+        query = "SELECT * FROM (SELECT a.id FROM a, b WHERE a.id = b.id) x, c"
+        parser = SQLParser(query)
+        
+        assert parser.count_joins() == 2
+        assert parser.count_derived_tables() == 1
+        
+    def test_start_with_is_not_cte(self):
+        """START WITH 절은 CTE로 보지 않음"""
+        query = "SELECT id FROM emp START WITH mgr IS NULL CONNECT BY PRIOR id = mgr"
+        parser = SQLParser(query)
+        
+        assert parser.count_ctes() == 0
+        
+    def test_cte_body_is_not_subquery(self):
+        """CTE 본문은 서브쿼리 깊이에 포함하지 않음"""
+        query = "WITH t AS (SELECT id FROM users) SELECT * FROM t WHERE id IN (SELECT id FROM t)"
+        parser = SQLParser(query)
+        
+        assert parser.count_ctes() == 1
+        assert parser.calculate_subquery_depth() == 1
+        
+    def test_subquery_after_function_call(self):
+        """함수 호출 뒤의 서브쿼리 깊이 계산"""
+        query = "SELECT COUNT(*) FROM (SELECT NVL(a, 0) FROM (SELECT a FROM t))"
+        parser = SQLParser(query)
+        
+        assert parser.calculate_subquery_depth() == 2
+        assert parser.count_derived_tables() == 2
+        
+    def test_union_not_counted_as_subquery(self):
+        """집합 연산자로 연결된 SELECT는 서브쿼리가 아님"""
+        query = "SELECT a FROM t1 UNION ALL SELECT a FROM t2"
+        parser = SQLParser(query)
+        
+        assert parser.calculate_subquery_depth() == 0
+        assert parser.count_set_operators() == 1
+        
+    def test_hint_inside_string_ignored(self):
+        """문자열 내부의 힌트 형태는 힌트로 감지하지 않음"""
+        query = "SELECT 'INSERT /*+ PARALLEL(4) */ INTO t' FROM dual"
+        parser = SQLParser(query)
+        
+        assert parser.count_hints() == []
+
+
+class TestFeatureVector:
+    """SQLFeatureVector 추출 테스트"""
+    
+    def test_extract_features_values(self):
+        """추출된 지표가 개별 감지 메서드 결과와 일치"""
+        query = """
+        SELECT /*+ INDEX(e) */ e.id, NVL(e.name, 'x'), COUNT(*),
+               ROW_NUMBER() OVER (ORDER BY e.id)
+        FROM emp e, dept d
+        WHERE e.dept_id = d.id AND ROWNUM <= 10
+        GROUP BY e.id, e.name
+        """
+        parser = SQLParser(query)
+        
+        features = parser.extract_features()
+        
+        assert features.query_length == len(parser.query)
+        assert features.join_count == parser.count_joins() == 1
+        assert features.oracle_features == tuple(parser.detect_oracle_features())
+        assert features.oracle_functions == tuple(parser.detect_oracle_functions())
+        assert features.hints == ('INDEX',)
+        assert features.analytic_function_count == 1
+        assert features.has_where is True
+        assert features.has_group_by is True
+        assert features.has_order_by is True
+        
+    def test_feature_vector_is_immutable_and_cached(self):
+        """지표 벡터는 불변이며 한 번만 생성됨"""
+        import dataclasses
+        
+        parser = SQLParser("SELECT * FROM users")
+        
+        features = parser.extract_features()
+        
+        assert parser.extract_features() is features
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            features.join_count = 10
@@ -0,0 +1,84 @@
+"""
+SQL Statement Splitter 테스트
+
+';' 및 단독 '/' 구분자, 문자열/q-quote/주석 내부 구분자 무시, 줄 번호를 검증합니다.
+"""
+
+from src.parsers.sql_splitter import iter_file_statements, split_statements
+
+
+class TestSplitStatements:
+    """split_statements 기본 기능 테스트"""
+
+    def test_semicolon_terminator(self):
+        """세미콜론 구분 테스트"""
+        statements = split_statements("SELECT 1 FROM dual; SELECT 2 FROM dual;\nDELETE FROM t;")
+
+        assert [s.text for s in statements] == [
+            "SELECT 1 FROM dual", "SELECT 2 FROM dual", "DELETE FROM t"
+        ]
+        assert [s.index for s in statements] == [1, 2, 3]
+        assert [s.statement_type for s in statements] == ['SELECT', 'SELECT', 'DELETE']
+
+    def test_slash_terminator(self):
+        """단독 '/' 줄 구분 테스트"""
+        statements = split_statements("UPDATE t SET a = 1\n/\nSELECT a FROM t\n/\n")
+
+        assert [s.text for s in statements] == ["UPDATE t SET a = 1", "SELECT a FROM t"]
+
+    def test_ignores_terminators_in_strings_and_comments(self):
+        """문자열, q-quote, 인용 식별자, 주석 내부 구분자 무시 테스트"""
+        sql = (
+            "SELECT 'a;b', q'[c;d]', Q'{e;}', \"f;g\" FROM t -- x;y\n"
+            "WHERE s = 'it''s;' /* ;\n/\n */ AND n = nq'!;!';\n"
+            "SELECT 2 FROM dual;"
+        )
+        statements = split_statements(sql)
+
+        assert len(statements) == 2
+        assert statements[0].text.endswith("nq'!;!'")
+        assert statements[1].text == "SELECT 2 FROM dual"
+
+    def test_plsql_block_ends_with_slash(self):
+        """PL/SQL 블록은 내부 세미콜론이 아닌 '/'로 종료되는지 테스트"""
+        sql = (
+            "CREATE OR REPLACE PROCEDURE p IS\n"
+            "BEGIN\n"
+            "  NULL;\n"
+            "END;\n"
+            "/\n"
+            "BEGIN p; END;\n"
+            "/\n"
+            "SELECT 1 FROM dual;\n"
+        )
+        statements = split_statements(sql)
+
+        assert [s.statement_type for s in statements] == ['CREATE', 'BEGIN', 'SELECT']
+        assert statements[0].text.endswith("END;")
+        assert (statements[0].line_start, statements[0].line_end) == (1, 4)
+        assert statements[1].text == "BEGIN p; END;"
+
+    def test_line_numbers_and_leading_comments(self):
+        """줄 번호와 주석만 있는 구간 처리 테스트"""
+        sql = "-- header\n\nSELECT a\nFROM t;\n\n-- trailing comment\n"
+        statements = split_statements(sql)
+
+        assert len(statements) == 1
+        assert (statements[0].line_start, statements[0].line_end) == (3, 4)
+        assert statements[0].statement_type == 'SELECT'
+
+    def test_last_statement_without_terminator(self):
+        """구분자 없이 끝나는 마지막 문장 테스트"""
+        statements = split_statements("SELECT 1 FROM dual;\nSELECT 2\nFROM dual")
+
+        assert statements[-1].text == "SELECT 2\nFROM dual"
+        assert (statements[-1].line_start, statements[-1].line_end) == (2, 3)
+
+    def test_iter_file_statements(self, tmp_path):
+        """파일 스트리밍 분리 테스트"""
+        file_path = tmp_path / "script.sql"
+        file_path.write_text("SELECT 1 FROM dual;\nSELECT 2 FROM dual;\n", encoding="utf-8")
+
+        statements = list(iter_file_statements(str(file_path)))
+
+        assert [s.text for s in statements] == ["SELECT 1 FROM dual", "SELECT 2 FROM dual"]
@@ -8,9 +8,17 @@ import pytest
 import tempfile
 from pathlib import Path
 
+from src.utils import file_utils
 from src.utils.file_utils import (
+    IgnorePatterns,
+    SourceFile,
+    detect_encoding,
     find_files_by_extension,
-    read_file_with_encoding
+    iter_files,
+    parse_shard,
+    read_file_with_encoding,
+    read_head,
+    select_shard
 )
 
 
@@ -184,6 +192,107 @@ class TestFindFilesByExtension:
         assert len(result) == 2
 
 
+class TestIgnorePatterns:
+    """gitignore 형식 제외 패턴 테스트"""
+    
+    @pytest.mark.parametrize("patterns, path, is_dir, expected", [
+        (["*.bak"], "a/b/q.bak", False, True),
+        (["build/"], "src/build", True, True),
+        (["build/"], "src/build", False, False),
+        (["/top.sql"], "top.sql", False, True),
+        (["/top.sql"], "sub/top.sql", False, False),
+        (["doc/*.sql"], "doc/a.sql", False, True),
+        (["doc/*.sql"], "doc/x/a.sql", False, False),
+        (["a/**/z.sql"], "a/z.sql", False, True),
+        (["a/**/z.sql"], "a/b/c/z.sql", False, True),
+        (["**/tmp"], "x/y/tmp", True, True),
+        (["logs/**"], "logs/x/y.sql", False, True),
+        (["q?.sql"], "q1.sql", False, True),
+        (["[!a]b.sql"], "ab.sql", False, False),
+        (["*.sql", "!keep.sql"], "d/keep.sql", False, False),
+        (["!keep.sql", "*.sql"], "d/keep.sql", False, True),
+        (["# comment", "", "\\#x.sql"], "#x.sql", False, True),
+    ])
+    def test_matches(self, patterns, path, is_dir, expected):
+        """패턴 일치 규칙 (앵커, 디렉토리 전용, **, 부정, 마지막 패턴 우선)"""
+        assert IgnorePatterns(patterns).matches(path, is_dir) is expected
+    
+    def test_add_file(self, tmp_path):
+        """패턴 파일에서 패턴 읽기"""
+        ignore_file = tmp_path / ".gitignore"
+        ignore_file.write_text("# 빌드 산출물\nbuild/\n\n*.tmp.sql\n", encoding="utf-8")
+        
+        excludes = IgnorePatterns()
+        assert not excludes
+        excludes.add_file(ignore_file)
+        
+        assert excludes
+        assert excludes.matches("build", is_dir=True)
+        assert excludes.matches("x/a.tmp.sql")
+        assert not excludes.matches("x/a.sql")
+
+
+class TestIterFiles:
+    """단일 순회 파일 검색 테스트"""
+    
+    @pytest.fixture
+    def tree(self, tmp_path):
+        """여러 단계 디렉토리 구조"""
+        for rel in ["a.sql", "b.PLS", "a/x.sql", "a/y.txt", "a.sql.d/z.sql",
+                    "build/out.sql", "src/build/gen.sql", "src/keep.sql", "src/skip.bak.sql"]:
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("SELECT 1 FROM dual;")
+        return tmp_path
+    
+    def test_sorted_order_matches_rglob(self, tree):
+        """반환 순서가 rglob 결과를 정렬한 순서와 같은지 테스트"""
+        expected = sorted(p for p in tree.rglob("*") if p.is_file() and p.suffix.lower() in (".sql", ".pls"))
+        
+        assert list(iter_files(tree, [".sql", ".pls"])) == expected
+    
+    def test_case_sensitive(self, tree):
+        """확장자 대소문자 구분 검색"""
+        names = [p.name for p in iter_files(tree, [".pls", ".PLS"], case_sensitive=True)]
+        
+        assert names == ["b.PLS"]
+    
+    def test_excluded_directories_are_not_scanned(self, tree, monkeypatch):
+        """제외된 디렉토리는 탐색하지 않고 각 디렉토리는 한 번만 읽는지 테스트"""
+        import os
+        
+        scanned = []
+        original = os.scandir
+        
+        def spy(path):
+            scanned.append(Path(path).relative_to(tree).as_posix())
+            return original(path)
+        
+        monkeypatch.setattr(os, "scandir", spy)
+        excludes = IgnorePatterns(["build/", "*.bak.sql", "!src/build/"])
+        
+        found = [p.relative_to(tree).as_posix() for p in iter_files(tree, [".sql"], excludes)]
+        
+        assert found == ["a/x.sql", "a.sql", "a.sql.d/z.sql", "src/build/gen.sql", "src/keep.sql"]
+        assert sorted(scanned) == [".", "a", "a.sql.d", "src", "src/build"]
+    
+    def test_streams_before_walk_finishes(self, tree, monkeypatch):
+        """전체 순회가 끝나기 전에 첫 파일을 반환하는지 테스트"""
+        import os
+        
+        scanned = []
+        original = os.scandir
+        
+        def spy(path):
+            scanned.append(Path(path).name)
+            return original(path)
+        
+        monkeypatch.setattr(os, "scandir", spy)
+        files = iter_files(tree, [".sql"])
+        
+        assert next(files) == tree / "a" / "x.sql"
+        assert "src" not in scanned
+
 class TestReadFileWithEncoding:
     """여러 인코딩으로 파일 읽기 테스트"""
     
@@ -366,6 +475,190 @@ English: Hello World
         assert content in result or result.strip('\ufeff') == content
 
 
+class TestDetectEncoding:
+    """앞부분 바이트 인코딩 판별 테스트"""
+    
+    @pytest.mark.parametrize("data, expected", [
+        ("SELECT '한글' FROM dual;".encode('utf-8'), 'utf-8'),
+        (b'\xef\xbb\xbfSELECT 1 FROM dual;', 'utf-8-sig'),
+        ("SELECT '한글' FROM dual;".encode('cp949'), 'cp949'),
+        ("SELECT 'café' FROM dual;".encode('latin-1'), 'latin-1'),
+        (b'', 'utf-8'),
+    ])
+    def test_detect(self, data, expected):
+        """BOM, UTF-8, CP949, Latin-1 판별"""
+        assert detect_encoding(data) == expected
+    
+    def test_truncated_multibyte_prefix(self):
+        """앞부분 끝에서 잘린 멀티바이트 문자는 UTF-8로 판별"""
+        data = "SELECT '한글' FROM dual;".encode('utf-8')
+        
+        assert detect_encoding(data[:9]) == 'utf-8'
+
+
+class TestSourceFile:
+    """한 번만 읽는 소스 파일 테스트"""
+    
+    def test_text_matches_text_mode_read(self, tmp_path):
+        """줄바꿈 통일 및 인코딩 판별 결과가 텍스트 모드 읽기와 같은지 테스트"""
+        content = "SELECT '한글'\r\nFROM dual;\rEND;"
+        file_path = tmp_path / "test.sql"
+        file_path.write_bytes(content.encode('cp949'))
+        
+        with SourceFile.open(file_path) as source:
+            assert source.encoding == 'cp949'
+            assert source.text == file_path.read_text(encoding='cp949')
+            assert list(source.iter_lines()) == ["SELECT '한글'\n", "FROM dual;\n", "END;"]
+    
+    def test_head_does_not_decode_whole_file(self, tmp_path):
+        """앞부분은 전체를 디코딩하지 않고 반환"""
+        file_path = tmp_path / "test.sql"
+        file_path.write_text("가" * 1000, encoding='utf-8')
+        
+        with SourceFile.open(file_path) as source:
+            assert source.head(10) == "가" * 10
+            assert source._text is None
+    
+    def test_fallback_when_sniffed_encoding_fails(self, tmp_path, monkeypatch):
+        """판별 구간 뒤에서 디코딩이 실패하면 다음 인코딩으로 재시도"""
+        monkeypatch.setattr(file_utils, 'ENCODING_SNIFF_BYTES', 8)
+        file_path = tmp_path / "test.sql"
+        file_path.write_bytes(b"SELECT 1 -- " + "한글".encode('cp949'))
+        
+        with SourceFile.open(file_path) as source:
+            assert source.encoding == 'utf-8'
+            assert source.text == "SELECT 1 -- 한글"
+            assert source.encoding == 'cp949'
+    
+    def test_iter_lines_falls_back_without_repeating_lines(self, tmp_path, monkeypatch):
+        """줄 스트림도 디코딩이 실패하면 다음 인코딩으로 이어 읽고 이미 내보낸 줄은 반복하지 않음"""
+        monkeypatch.setattr(file_utils, 'ENCODING_SNIFF_BYTES', 8)
+        monkeypatch.setattr(file_utils, 'LINE_BLOCK_BYTES', 9)
+        lines = ["SELECT 1\n", "FROM dual;\n", "-- 한글\n", "END;"]
+        file_path = tmp_path / "test.sql"
+        file_path.write_bytes("".join(lines).encode('cp949'))
+        
+        with SourceFile.open(file_path) as source:
+            assert source.encoding == 'utf-8'
+            assert list(source.iter_lines()) == lines
+            assert source.encoding == 'cp949'
+    
+    def test_large_file_uses_mmap(self, tmp_path, monkeypatch):
+        """큰 파일은 메모리 맵으로 읽고 블록 경계의 줄과 문자를 이어 붙임"""
+        monkeypatch.setattr(file_utils, 'MMAP_THRESHOLD', 64)
+        monkeypatch.setattr(file_utils, 'LINE_BLOCK_BYTES', 7)
+        lines = [f"-- 줄 {i}\r\n" for i in range(20)]
+        file_path = tmp_path / "big.sql"
+        file_path.write_bytes("".join(lines).encode('utf-8'))
+        
+        with SourceFile.open(file_path) as source:
+            assert not isinstance(source.data, bytes)
+            assert list(source.iter_lines()) == [line.replace('\r\n', '\n') for line in lines]
+            assert source.text == "".join(lines).replace('\r\n', '\n')
+    
+    def test_reads_file_once(self, tmp_path, monkeypatch):
+        """head, text, iter_lines가 파일을 다시 열지 않는지 테스트"""
+        file_path = tmp_path / "test.sql"
+        file_path.write_text("SELECT 1\nFROM dual;\n", encoding='utf-8')
+        opened = []
+        real_open = open
+        
+        def spy_open(path, *args, **kwargs):
+            opened.append(path)
+            return real_open(path, *args, **kwargs)
+        
+        monkeypatch.setattr('builtins.open', spy_open)
+        with SourceFile.open(file_path) as source:
+            source.head(5)
+            list(source.iter_lines())
+            source.text
+        
+        assert opened == [file_path]
+    
+    def test_read_head_reads_prefix_only(self, tmp_path, monkeypatch):
+        """read_head가 앞부분 바이트만 읽고 SourceFile.head()와 같은 텍스트를 반환하는지 테스트"""
+        file_path = tmp_path / "test.out"
+        file_path.write_bytes(("-- 한글\r\n" * 1000).encode('cp949'))
+        reads = []
+        real_open = open
+        
+        def spy_open(path, *args, **kwargs):
+            f = real_open(path, *args, **kwargs)
+            read = f.read
+            
+            def spy_read(size=-1):
+                reads.append(size)
+                return read(size)
+            
+            f.read = spy_read
+            return f
+        
+        monkeypatch.setattr('builtins.open', spy_open)
+        head = read_head(file_path, 10)
+        
+        assert reads == [40]
+        with SourceFile.open(file_path) as source:
+            assert head == source.head(10) == "-- 한글\n-- 한"
+
+
+class TestShard:
+    """샤드 지정 파싱 및 파일 분배 테스트"""
+    
+    @pytest.mark.parametrize("value, expected", [("1/1", (1, 1)), ("2/8", (2, 8)), (" 3 / 4 ", (3, 4))])
+    def test_parse_shard(self, value, expected):
+        """'i/N' 형식 파싱"""
+        assert parse_shard(value) == expected
+    
+    @pytest.mark.parametrize("value", ["", "1", "0/2", "3/2", "1/0", "a/b", "-1/2"])
+    def test_parse_shard_invalid(self, value):
+        """잘못된 형식 또는 범위"""
+        with pytest.raises(ValueError):
+            parse_shard(value)
+    
+    def _make_files(self, root):
+        """크기가 다른 파일 목록 생성"""
+        files = []
+        for i, size in enumerate([50000, 40000, 100, 100, 100, 30000, 2000, 10, 0, 20000]):
+            path = root / f"d{i % 3}" / f"f{i}.sql"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"x" * size)
+            files.append(path)
+        return files
+    
+    def test_shards_partition_and_balance(self, tmp_path):
+        """샤드들이 파일을 겹치지 않게 나누고 크기를 고르게 분배하는지 테스트"""
+        files = self._make_files(tmp_path)
+        
+        shards = [select_shard(files, (i, 3), tmp_path) for i in (1, 2, 3)]
+        
+        assert sorted(f for shard in shards for f in shard) == sorted(files)
+        for shard in shards:
+            # 샤드 안에서는 입력 순서 유지
+            assert shard == [f for f in files if f in shard]
+        loads = [sum(f.stat().st_size for f in shard) for shard in shards]
+        assert max(loads) - min(loads) <= 30000
+    
+    def test_assignment_independent_of_order_and_root(self, tmp_path):
+        """입력 순서나 마운트 경로가 달라도 같은 파일이 같은 샤드에 배정되는지 테스트"""
+        import shutil
+        
+        files = self._make_files(tmp_path / "node1")
+        shutil.copytree(tmp_path / "node1", tmp_path / "node2")
+        other = [tmp_path / "node2" / f.relative_to(tmp_path / "node1") for f in reversed(files)]
+        
+        for index in (1, 2, 3, 4):
+            first = select_shard(files, (index, 4), tmp_path / "node1")
+            second = select_shard(other, (index, 4), tmp_path / "node2")
+            assert sorted(f.relative_to(tmp_path / "node1") for f in first) == \
+                sorted(f.relative_to(tmp_path / "node2") for f in second)
+    
+    def test_single_shard_keeps_all(self, tmp_path):
+        """샤드가 하나면 전체 파일 반환"""
+        files = self._make_files(tmp_path)
+        
+        assert select_shard(files, (1, 1), tmp_path) == files
+
+
 class TestFileUtilsIntegration:
     """파일 유틸리티 통합 테스트"""
     
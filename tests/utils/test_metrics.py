@@ -0,0 +1,137 @@
+"""
+처리량 지표 모듈 단위 테스트
+
+src/utils/metrics.py의 지표 기록기와 단계 시간 측정을 테스트합니다.
+"""
+
+import json
+
+import pytest
+
+from src.utils.metrics import (
+    LATENCY_BUCKETS,
+    MetricsRecorder,
+    collect_stages,
+    metrics_stage,
+    peak_rss_bytes,
+    stage_timer
+)
+
+
+def read_events(path):
+    """지표 파일의 이벤트 목록"""
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestStageTimer:
+    """단계 시간 측정 테스트"""
+    
+    def test_collects_only_inside_block(self):
+        """collect_stages() 안에서만 단계 시간이 모이는지 테스트"""
+        with stage_timer("parse"):
+            pass
+        
+        with collect_stages() as stages:
+            with stage_timer("parse"):
+                pass
+            with stage_timer("parse"):
+                pass
+            with stage_timer("score"):
+                pass
+        
+        with stage_timer("read"):
+            pass
+        
+        assert sorted(stages) == ["parse", "score"]
+        assert all(seconds >= 0 for seconds in stages.values())
+    
+    def test_nested_collection_restores_outer(self):
+        """중첩된 collect_stages()가 바깥 수집을 복원하는지 테스트"""
+        with collect_stages() as outer:
+            with collect_stages() as inner:
+                with stage_timer("parse"):
+                    pass
+            with stage_timer("score"):
+                pass
+        
+        assert list(inner) == ["parse"]
+        assert list(outer) == ["score"]
+    
+    def test_metrics_stage_without_recorder(self):
+        """지표 기록기가 없으면 아무것도 하지 않는지 테스트"""
+        with metrics_stage(None, "export") as fields:
+            assert fields is None
+
+
+class TestMetricsRecorder:
+    """지표 기록기 테스트"""
+    
+    def test_event_stream(self, tmp_path):
+        """run_start, stage, file, summary 이벤트가 순서대로 기록되는지 테스트"""
+        path = tmp_path / "nested" / "metrics.jsonl"
+        with MetricsRecorder(path, "test-tool", workers=2, config={"workers": 2}) as metrics:
+            with metrics.stage("discovery") as fields:
+                fields["items"] = 3
+            assert list(metrics.timed_iter("scan", iter("ab"))) == ["a", "b"]
+            metrics.sample_queue(4)
+            metrics.record_file("a.sql", 0.002, size=100, objects=2,
+                                stages={"parse": 0.001, "score": 0.001}, worker=11, rss=2048)
+            metrics.sample_queue(2)
+            metrics.record_file("b.sql", 0.2, size=50, objects=1, error="실패", worker=12, rss=1024)
+            metrics.record_file("c.sql", None, deduped=True)
+        
+        events = read_events(path)
+        assert [e["event"] for e in events] == ["run_start", "stage", "stage", "file", "file", "file", "summary"]
+        assert events[0]["tool"] == "test-tool"
+        assert events[0]["config"] == {"workers": 2}
+        assert events[1]["items"] == 3
+        assert events[2] == {**events[2], "stage": "scan", "items": 2}
+        assert events[3]["queue_depth"] == 4
+        assert events[3]["stages"] == {"parse": 0.001, "score": 0.001}
+        assert events[4]["ok"] is False and events[4]["error"] == "실패"
+        assert events[5]["seconds"] is None and events[5]["deduped"] is True
+        
+        summary = events[-1]
+        assert summary["files"] == 3
+        assert summary["failed_files"] == 1
+        assert summary["bytes"] == 150
+        assert summary["objects"] == 3
+        assert summary["files_per_second"] > 0
+        assert summary["stages"]["discovery"]["items"] == 3
+        assert summary["stages"]["parse"] == {"seconds": 0.001, "items": 1}
+        assert summary["queue_depth"] == {"max": 4, "mean": 3.0}
+        assert summary["workers"]["count"] == 2
+        assert summary["workers"]["busy_seconds"] == pytest.approx(0.202)
+        assert summary["workers"]["peak_rss_bytes"] == {"11": 2048, "12": 1024}
+    
+    def test_latency_histogram(self, tmp_path):
+        """처리 시간 히스토그램과 백분위수 계산 테스트"""
+        metrics = MetricsRecorder(tmp_path / "metrics.jsonl", "test-tool")
+        for seconds in [0.0005] * 8 + [0.3, 1000.0]:
+            metrics.record_file("f.sql", seconds)
+        
+        latency = metrics.close()["latency"]
+        
+        assert latency["count"] == 10
+        assert latency["p50"] == 0.0005
+        assert latency["max"] == 1000.0
+        assert latency["histogram"]["le"] == list(LATENCY_BUCKETS) + [None]
+        counts = latency["histogram"]["counts"]
+        assert sum(counts) == 10
+        assert counts[0] == 8
+        assert counts[LATENCY_BUCKETS.index(0.5)] == 1
+        assert counts[-1] == 1
+    
+    def test_close_writes_summary_once(self, tmp_path):
+        """close()를 여러 번 호출해도 요약이 한 번만 기록되는지 테스트"""
+        path = tmp_path / "metrics.jsonl"
+        metrics = MetricsRecorder(path, "test-tool")
+        
+        assert metrics.close()["files"] == 0
+        assert metrics.close() == {}
+        assert [e["event"] for e in read_events(path)] == ["run_start", "summary"]
+    
+    def test_peak_rss(self):
+        """최대 상주 메모리 측정 테스트"""
+        rss = peak_rss_bytes()
+        assert rss is None or rss > 0